@@ -1,7 +1,9 @@
-from flask import Flask, jsonify, request, send_file
+from flask import Flask, jsonify, request, send_file, Response, stream_with_context
 from flask_cors import CORS
 import re
 import os
+import json
+import logging
 from werkzeug.utils import secure_filename
 import PyPDF2
 from docx import Document
@@ -11,7 +13,9 @@ from scrapers.indeed_scraper import IndeedScraper
 from scrapers.glassdoor_scraper import GlassdoorScraper
 from scrapers.indeed_selenium_scraper import IndeedSeleniumScraper
 from scrapers.glassdoor_selenium_scraper import GlassdoorSeleniumScraper
-from storage_manager import JobStorageManager
+from storage_manager import JobStorageManager, get_storage_manager
+from job_filters import compile_filters, parse_query_filters
+from sqlite_storage import SQLiteJobStorageManager
 from data_processor import DataProcessor, clean_job_data, filter_jobs
 from keyword_extractor import get_keyword_extractor
 from job_scorer import get_job_scorer
@@ -21,6 +25,10 @@ from csv_pdf_exporter import export_jobs_to_csv, export_jobs_to_pdf
 from excel_uploader import ExcelUploader, ExcelUploadError
 import requests
 
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
 app = Flask(__name__)
 CORS(app)  # Enable CORS for frontend communication
 
@@ -28,6 +36,8 @@ CORS(app)  # Enable CORS for frontend communication
 UPLOAD_FOLDER = 'uploads'
 ALLOWED_EXTENSIONS = {'pdf', 'docx'}
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
+# Job storage engine: 'json' (data/jobs.json) or 'sqlite' (data/jobs.db)
+STORAGE_BACKEND = os.environ.get('JOB_STORAGE_BACKEND', 'json').lower()
 
 # Create uploads directory if it doesn't exist
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
@@ -42,8 +52,11 @@ resume_store = {}
 # Store scraped jobs in memory
 scraped_jobs_store = {}
 
-# Initialize storage manager for persistent job storage
-storage_manager = JobStorageManager(storage_dir='data')
+# Initialize storage manager for persistent job storage (the process-wide
+# instance from get_storage_manager; every endpoint uses it directly)
+STORAGE_DIR = 'data'
+STORAGE_CLASS = SQLiteJobStorageManager if STORAGE_BACKEND == 'sqlite' else JobStorageManager
+storage_manager = get_storage_manager(STORAGE_DIR, STORAGE_CLASS)
 
 def allowed_file(filename):
     """Check if the file extension is allowed"""
@@ -648,6 +661,40 @@ def scrape_jobs_dynamic():
 
 # ==================== Storage Management Endpoints ====================
 
+def _read_page_args():
+    """
+    Read limit/cursor/fields/offset query parameters for paged job listings
+    
+    Returns:
+        Dict of keyword arguments for storage_manager.get_jobs_page
+    """
+    limit = request.args.get('limit', type=int)
+    fields = request.args.get('fields')
+    return {
+        "limit": limit if limit and limit > 0 else None,
+        "cursor": request.args.get('cursor') or None,
+        "fields": [f.strip() for f in fields.split(',') if f.strip()] if fields else None,
+        "offset": max(request.args.get('offset', type=int, default=0), 0)
+    }
+
+def _read_job_filters():
+    """
+    Read job filters from the query string
+    
+    source and location are equality filters; any field (including nested
+    score.* fields) can be filtered with field[op]=value, where op is one of
+    eq, in (comma-separated), gt, gte, lt, lte, prefix or exists.
+    
+    Returns:
+        Filter dictionary, or None when no filters are given
+        
+    Raises:
+        ValueError: If a filter is invalid
+    """
+    filters = parse_query_filters(request.args, plain_fields=('source', 'location'))
+    compile_filters(filters)
+    return filters or None
+
 @app.route('/api/storage/jobs', methods=['GET'])
 def get_stored_jobs():
     """
@@ -655,60 +702,116 @@ def get_stored_jobs():
     Query parameters:
     - source: Filter by source (e.g., 'indeed', 'glassdoor')
     - location: Filter by location
+    - <field>[<op>]: Filter operators, e.g. source[in]=indeed,glassdoor,
+      score.overall_score[gte]=70, title[prefix]=Senior, applied_date[exists]=true
     - limit: Maximum number of jobs to return
     - offset: Number of jobs to skip
+    - cursor: next_cursor from the previous page (takes precedence over offset)
+    - fields: Comma-separated list of fields to return (id is always included)
     """
     try:
-        # Get query parameters
-        source = request.args.get('source')
-        location = request.args.get('location')
-        limit = request.args.get('limit', type=int)
-        offset = request.args.get('offset', type=int, default=0)
+        page_args = _read_page_args()
         
-        # Build filters
-        filters = {}
-        if source:
-            filters['source'] = source
-        if location:
-            filters['location'] = location
+        # Only the requested page is read and copied
+        try:
+            filters = _read_job_filters()
+            page = storage_manager.get_jobs_page(filters=filters, **page_args)
+        except ValueError as e:
+            return jsonify({
+                "success": False,
+                "message": str(e)
+            }), 400
         
-        # Get jobs
-        jobs = storage_manager.get_all_jobs(filters if filters else None)
+        return jsonify({
+            "success": True,
+            "total": page["total"],
+            "count": page["count"],
+            "offset": page_args["offset"],
+            "next_cursor": page["next_cursor"],
+            "jobs": page["jobs"]
+        }), 200
         
-        # Apply pagination
-        total = len(jobs)
-        if limit:
-            jobs = jobs[offset:offset + limit]
-        else:
-            jobs = jobs[offset:]
+    except Exception as e:
+        return jsonify({
+            "success": False,
+            "message": f"Error retrieving jobs: {str(e)}"
+        }), 500
+
+@app.route('/api/jobs/search', methods=['GET'])
+def search_jobs():
+    """
+    Endpoint for full-text search over stored jobs
+    Query parameters:
+    - q: Search terms, matched against title, company and description (required)
+    - limit: Maximum number of jobs to return (default 20)
+    - offset: Number of ranked jobs to skip
+    - fields: Comma-separated list of fields to return (id is always included)
+    - source, location, <field>[<op>]: Filters, as for /api/storage/jobs
+    """
+    try:
+        query = request.args.get('q', '').strip()
+        if not query:
+            return jsonify({
+                "success": False,
+                "message": "q is required"
+            }), 400
+        fields = request.args.get('fields')
+        offset = request.args.get('offset', type=int, default=0)
+        
+        try:
+            result = storage_manager.search_jobs(
+                query,
+                limit=request.args.get('limit', type=int, default=20),
+                offset=offset,
+                fields=[f.strip() for f in fields.split(',') if f.strip()] if fields else None,
+                filters=_read_job_filters()
+            )
+        except ValueError as e:
+            return jsonify({
+                "success": False,
+                "message": str(e)
+            }), 400
         
         return jsonify({
             "success": True,
-            "total": total,
-            "count": len(jobs),
+            "query": query,
+            "total": result["total"],
+            "count": result["count"],
             "offset": offset,
-            "jobs": jobs
+            "jobs": result["jobs"]
         }), 200
         
     except Exception as e:
         return jsonify({
             "success": False,
-            "message": f"Error retrieving jobs: {str(e)}"
+            "message": f"Error searching jobs: {str(e)}"
         }), 500
 
 @app.route('/api/jobs/stored/<user_id>', methods=['GET'])
 def get_user_stored_jobs(user_id):
     """
     Endpoint to retrieve all stored jobs for a specific user
+    Query parameters:
+    - limit: Maximum number of jobs to return (all jobs if omitted)
+    - cursor: next_cursor from the previous page
+    - fields: Comma-separated list of fields to return (id is always included)
     """
     try:
-        # Get all jobs (user_id not used for filtering in current implementation)
-        jobs = storage_manager.get_all_jobs()
+        # user_id not used for filtering in current implementation
+        try:
+            page = storage_manager.get_jobs_page(**_read_page_args())
+        except ValueError as e:
+            return jsonify({
+                "success": False,
+                "message": str(e)
+            }), 400
         
         return jsonify({
             "success": True,
-            "total": len(jobs),
-            "jobs": jobs
+            "total": page["total"],
+            "count": page["count"],
+            "next_cursor": page["next_cursor"],
+            "jobs": page["jobs"]
         }), 200
         
     except Exception as e:
@@ -858,6 +961,13 @@ def export_stored_jobs():
         
         output_file = data['output_file']
         filters = data.get('filters')
+        try:
+            compile_filters(filters)
+        except ValueError as e:
+            return jsonify({
+                "success": False,
+                "message": f"Invalid filters: {str(e)}"
+            }), 400
         
         # Ensure output file is in data directory for security
         output_path = os.path.join('data', os.path.basename(output_file))
@@ -882,6 +992,87 @@ def export_stored_jobs():
             "message": f"Error exporting jobs: {str(e)}"
         }), 500
 
+@app.route('/api/storage/export/ndjson', methods=['GET'])
+def export_stored_jobs_ndjson():
+    """
+    Endpoint to stream stored jobs as NDJSON (one JSON object per line)
+    Query parameters:
+    - source: Filter by source (e.g., 'indeed', 'glassdoor')
+    - location: Filter by location
+    - <field>[<op>]: Filter operators, as in GET /api/storage/jobs
+    
+    The response is sent in chunks as jobs are read, so memory use does not
+    depend on the size of the store. If reading fails partway through, the
+    stream ends with a {"error": "..."} line instead of a job, so clients
+    can tell an incomplete export from a complete one.
+    """
+    try:
+        filters = _read_job_filters()
+    except ValueError as e:
+        return jsonify({
+            "success": False,
+            "message": str(e)
+        }), 400
+    
+    def generate():
+        try:
+            yield from storage_manager.iter_ndjson(filters)
+        except Exception as e:
+            # Headers are already sent; report the failure in the stream itself
+            logger.exception("NDJSON export interrupted")
+            yield json.dumps({"error": f"Export interrupted: {str(e)}"}) + "\n"
+    
+    return Response(
+        stream_with_context(generate()),
+        mimetype='application/x-ndjson',
+        headers={'Content-Disposition': 'attachment; filename=jobs.ndjson'}
+    )
+
+@app.route('/api/storage/import/ndjson', methods=['POST'])
+def import_stored_jobs_ndjson():
+    """
+    Endpoint to bulk-import jobs from NDJSON
+    Body: NDJSON (one job object per line), either as the raw request body
+    or as a multipart upload in the 'file' field
+    Query parameters:
+    - source: Source to record for every job (default: each job's own 'source')
+    - batch_size: Jobs per save batch (default: 1000)
+    - skip_duplicates: 'false' to keep duplicates (default: true)
+    """
+    try:
+        batch_size = request.args.get('batch_size', default=1000, type=int)
+        if batch_size < 1:
+            return jsonify({
+                "success": False,
+                "message": "batch_size must be a positive integer"
+            }), 400
+        
+        if request.mimetype == 'multipart/form-data':
+            upload = request.files.get('file')
+            if upload is None:
+                return jsonify({
+                    "success": False,
+                    "message": "file is required"
+                }), 400
+            stream = upload.stream
+        else:
+            stream = request.stream
+        
+        result = storage_manager.import_ndjson(
+            stream,
+            source=request.args.get('source'),
+            batch_size=batch_size,
+            skip_duplicates=request.args.get('skip_duplicates', 'true').lower() != 'false'
+        )
+        
+        return jsonify(result), 200 if result["success"] else 500
+        
+    except Exception as e:
+        return jsonify({
+            "success": False,
+            "message": f"Error importing jobs: {str(e)}"
+        }), 500
+
 
 @app.route('/api/clean-data', methods=['POST'])
 def clean_data():
@@ -1333,9 +1524,7 @@ def match_keywords():
             resume_id = data['resume_id']
             
             # Get job from storage
-            storage = JobStorageManager()
-            all_jobs = storage.get_all_jobs()
-            job = next((j for j in all_jobs if j.get('id') == job_id), None)
+            job = storage_manager.get_job_by_id(job_id)
             
             if not job:
                 return jsonify({
@@ -1378,6 +1567,24 @@ def match_keywords():
         }), 500
 
 
+@app.route('/api/extract-keywords/cache-stats', methods=['GET'])
+def get_keyword_cache_stats():
+    """
+    Get size and hit-rate statistics of the keyword extraction cache.
+    """
+    try:
+        return jsonify({
+            "success": True,
+            "cache": get_keyword_extractor().cache_stats()
+        }), 200
+        
+    except Exception as e:
+        return jsonify({
+            "success": False,
+            "message": f"Error getting keyword cache statistics: {str(e)}"
+        }), 500
+
+
 @app.route('/api/batch-extract-keywords/jobs', methods=['POST'])
 def batch_extract_job_keywords():
     """
@@ -1394,16 +1601,18 @@ def batch_extract_job_keywords():
     try:
         data = request.get_json() or {}
         
-        # Get jobs from storage
-        storage = JobStorageManager()
-        all_jobs = storage.get_all_jobs()
+        # Get jobs from storage, only the requested ones if job_ids is given
+        job_ids = data.get('job_ids') or []
+        if not isinstance(job_ids, list) or not all(isinstance(job_id, str) for job_id in job_ids):
+            return jsonify({
+                "success": False,
+                "message": "job_ids must be a list of job id strings"
+            }), 400
         
-        # Filter by job_ids if provided
-        job_ids = data.get('job_ids', [])
         if job_ids:
-            jobs_to_process = [j for j in all_jobs if j.get('id') in job_ids]
+            jobs_to_process = storage_manager.get_all_jobs({'id': {'$in': job_ids}})
         else:
-            jobs_to_process = all_jobs
+            jobs_to_process = storage_manager.get_all_jobs()
         
         # Apply limit if provided
         limit = data.get('limit')
@@ -1419,11 +1628,17 @@ def batch_extract_job_keywords():
         # Get keyword extractor
         extractor = get_keyword_extractor()
         
-        # Extract keywords for each job
+        # Extract keywords for all jobs in one batched pass
+        try:
+            extracted = extractor.extract_job_keywords_many(jobs_to_process)
+        except Exception:
+            # A malformed job fails the whole batch; redo it job by job to report which
+            extracted = None
+        
         results = []
-        for job in jobs_to_process:
+        for index, job in enumerate(jobs_to_process):
             try:
-                keywords = extractor.extract_job_keywords(job)
+                keywords = extracted[index] if extracted is not None else extractor.extract_job_keywords(job)
                 results.append({
                     "job_id": job.get('id'),
                     "job_title": job.get('title'),
@@ -1559,9 +1774,8 @@ def score_multiple_jobs():
         
         # Optionally save scores to storage
         if save_to_storage:
-            storage = JobStorageManager()
             job_scores = {job['id']: job['score'] for job in scored_jobs if 'id' in job and 'score' in job}
-            update_result = storage.update_jobs_scores(job_scores)
+            update_result = storage_manager.update_jobs_scores(job_scores)
             
             return jsonify({
                 "success": True,
@@ -1618,9 +1832,8 @@ def score_stored_jobs(user_id):
                 resume_keywords = extractor.extract_resume_keywords(resume_text)
         
         # Get jobs from storage
-        storage = JobStorageManager()
         filters = data.get('filters')
-        jobs = storage.get_all_jobs(filters)
+        jobs = storage_manager.get_all_jobs(filters)
         
         if not jobs:
             return jsonify({
@@ -1636,7 +1849,7 @@ def score_stored_jobs(user_id):
         
         # Save scores to storage
         job_scores = {job['id']: job['score'] for job in scored_jobs if 'id' in job and 'score' in job}
-        update_result = storage.update_jobs_scores(job_scores)
+        update_result = storage_manager.update_jobs_scores(job_scores)
         
         # Calculate statistics
         stats = scorer.calculate_statistics(scored_jobs)
@@ -1761,8 +1974,7 @@ def get_jobs_by_highlight(highlight):
                 "message": "Invalid highlight. Must be 'red', 'yellow', or 'white'"
             }), 400
         
-        storage = JobStorageManager()
-        jobs = storage.get_jobs_by_highlight(highlight)
+        jobs = storage_manager.get_jobs_by_highlight(highlight)
         
         return jsonify({
             "success": True,
@@ -1787,18 +1999,26 @@ def get_jobs_by_score():
     Query parameters:
         min_score: Minimum score (optional)
         max_score: Maximum score (optional)
+        top_k: Return only the K highest-scoring jobs, best first (optional)
     """
     try:
         min_score = request.args.get('min_score', type=float)
         max_score = request.args.get('max_score', type=float)
+        top_k = request.args.get('top_k', type=int)
+        
+        if top_k is not None and top_k < 1:
+            return jsonify({
+                "success": False,
+                "message": "top_k must be a positive integer"
+            }), 400
         
-        storage = JobStorageManager()
-        jobs = storage.get_scored_jobs(min_score, max_score)
+        jobs = storage_manager.get_scored_jobs(min_score, max_score, top_k=top_k)
         
         return jsonify({
             "success": True,
             "min_score": min_score,
             "max_score": max_score,
+            "top_k": top_k,
             "total_jobs": len(jobs),
             "jobs": jobs,
             "message": f"Found {len(jobs)} jobs in score range"
@@ -2011,8 +2231,7 @@ def compare_resume_with_job():
             resume_text = resume_store[resume_id].get('extracted_text', '')
             
             # Get job from storage
-            storage = JobStorageManager()
-            job = storage.get_job_by_id(job_id)
+            job = storage_manager.get_job_by_id(job_id)
             
             if not job:
                 return jsonify({
@@ -2100,6 +2319,16 @@ def batch_analyze_resumes():
         analyzer = get_resume_analyzer()
         results = []
         
+        # Analyze the stored resumes in one batched pass
+        found_ids = [resume_id for resume_id in resume_ids if resume_id in resume_store]
+        try:
+            analyses = dict(zip(found_ids, analyzer.extract_resume_keywords_many(
+                [resume_store[resume_id].get('extracted_text', '') for resume_id in found_ids]
+            )))
+        except Exception:
+            # Redo the batch resume by resume to report which one failed
+            analyses = {}
+        
         for resume_id in resume_ids:
             try:
                 if resume_id not in resume_store:
@@ -2111,9 +2340,11 @@ def batch_analyze_resumes():
                     continue
                 
                 resume_data = resume_store[resume_id]
-                resume_text = resume_data.get('extracted_text', '')
-                
-                analysis = analyzer.extract_resume_keywords(resume_text)
+                analysis = analyses.get(resume_id)
+                if analysis is None:
+                    analysis = analyzer.extract_resume_keywords(resume_data.get('extracted_text', ''))
+                elif 'error' in analysis:
+                    raise ValueError(analysis['error'])
                 
                 results.append({
                     "resume_id": resume_id,
@@ -2178,6 +2409,12 @@ def generate_resume_job_match_report():
                 "message": "resume_id is required"
             }), 400
         
+        if not isinstance(job_ids, list) or not all(isinstance(job_id, str) for job_id in job_ids):
+            return jsonify({
+                "success": False,
+                "message": "job_ids must be a list of job id strings"
+            }), 400
+        
         # Get resume from storage
         if resume_id not in resume_store:
             return jsonify({
@@ -2188,13 +2425,12 @@ def generate_resume_job_match_report():
         resume_text = resume_store[resume_id].get('extracted_text', '')
         
         # Get jobs from storage
-        storage = JobStorageManager()
-        
         if job_ids:
-            jobs = [storage.get_job_by_id(job_id) for job_id in job_ids]
-            jobs = [j for j in jobs if j is not None]
+            # One lookup for all ids, then back into the order they were requested in
+            jobs_by_id = {job['id']: job for job in storage_manager.get_all_jobs({'id': {'$in': job_ids}})}
+            jobs = [jobs_by_id[job_id] for job_id in job_ids if job_id in jobs_by_id]
         else:
-            jobs = storage.get_all_jobs()
+            jobs = storage_manager.get_all_jobs()
         
         if not jobs:
             return jsonify({
@@ -3030,11 +3266,8 @@ def quick_export_excel(user_id):
         Excel file download without resume tips
     """
     try:
-        # Get storage manager
-        storage = JobStorageManager()
-        
         # Get all scored jobs
-        jobs = storage.get_scored_jobs(user_id)
+        jobs = storage_manager.get_scored_jobs(user_id)
         
         if not jobs:
             return jsonify({'error': 'No jobs found for this user'}), 404
@@ -3186,11 +3419,8 @@ def quick_export_csv(user_id):
         CSV file download
     """
     try:
-        # Get storage manager
-        storage = JobStorageManager()
-        
         # Get all scored jobs
-        jobs = storage.get_scored_jobs(user_id)
+        jobs = storage_manager.get_scored_jobs(user_id)
         
         if not jobs:
             return jsonify({'error': 'No jobs found for this user'}), 404
@@ -3415,11 +3645,8 @@ def quick_export_pdf(user_id):
         PDF file download without resume tips
     """
     try:
-        # Get storage manager
-        storage = JobStorageManager()
-        
         # Get all scored jobs
-        jobs = storage.get_scored_jobs(user_id)
+        jobs = storage_manager.get_scored_jobs(user_id)
         
         if not jobs:
             return jsonify({'error': 'No jobs found for this user'}), 404
@@ -3995,9 +4222,21 @@ def get_status_timeline(job_id):
     Get timeline of status changes for a job
     
     GET /api/jobs/status-timeline/<job_id>
+    Query params:
+        - since: only changes at or after this ISO timestamp (optional)
+        - until: only changes at or before this ISO timestamp (optional)
     """
     try:
-        timeline = storage_manager.get_status_timeline(job_id)
+        bounds = {}
+        for name in ('since', 'until'):
+            value = request.args.get(name)
+            if value:
+                try:
+                    bounds[name] = datetime.fromisoformat(value)
+                except ValueError:
+                    return jsonify({'error': f'Invalid {name} timestamp: {value}'}), 400
+        
+        timeline = storage_manager.get_status_timeline(job_id, **bounds)
         
         return jsonify({
             'success': True,
@@ -14,12 +14,22 @@ Version: 1.0.0
 """
 
 from enum import Enum
-from typing import List, Dict, Optional, Any, Tuple
-from datetime import datetime
+from typing import List, Dict, Optional, Any, Tuple, Callable, Iterator
+from datetime import datetime, timedelta
+from collections.abc import MutableMapping, Sequence
+from array import array
+import bisect
 import json
-from dataclasses import dataclass, field, asdict
+import sys
+import threading
+import time
 import logging
 
+try:
+    from status_aggregates import HistoryAggregates, SECONDS_PER_DAY
+except ImportError:
+    from backend.status_aggregates import HistoryAggregates, SECONDS_PER_DAY
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -91,7 +101,64 @@ class ApplicationStatus(Enum):
         return self.value
 
 
-@dataclass
+# Compact encoding shared by StatusTransition and StatusHistory: statuses are
+# stored as small ints (their position in ApplicationStatus) and timestamps as
+# integer microseconds since 1970-01-01 in the same naive local time the
+# datetimes carry, so they convert back exactly. Timezone-aware timestamps are
+# encoded in local time for ordering and also kept as given, so they come
+# back with their original tzinfo.
+_STATUSES: Tuple[ApplicationStatus, ...] = tuple(ApplicationStatus)
+_STATUS_CODES: Dict[ApplicationStatus, int] = {status: code for code, status in enumerate(_STATUSES)}
+_CODES_BY_VALUE: Dict[str, int] = {status.value: code for code, status in enumerate(_STATUSES)}
+_NO_STATUS = -1
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _status_code(status: Optional[ApplicationStatus]) -> int:
+    """Encode a status (None for no status)"""
+    return _NO_STATUS if status is None else _STATUS_CODES[status]
+
+
+def _status_code_from_string(value: Optional[str]) -> int:
+    """Encode a serialized status value"""
+    if not value:
+        return _NO_STATUS
+    code = _CODES_BY_VALUE.get(value)
+    return code if code is not None else _STATUS_CODES[ApplicationStatus.from_string(value)]
+
+
+def _to_micros(value: Any) -> int:
+    """Encode a datetime (or ISO string) as microseconds since the epoch"""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is not None:
+        value = value.astimezone().replace(tzinfo=None)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _from_micros(micros: int) -> datetime:
+    """Decode microseconds since the epoch to a datetime"""
+    return _EPOCH + timedelta(microseconds=micros)
+
+
+def _encode_time(value: Any) -> Tuple[int, Optional[datetime]]:
+    """Encode a datetime (or ISO string) as (microseconds, the datetime itself if timezone-aware)"""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return _to_micros(value), value if value.tzinfo is not None else None
+
+
+def _decode_time(micros: int, zoned: Optional[datetime]) -> datetime:
+    """Decode a timestamp encoded by _encode_time"""
+    return zoned if zoned is not None else _from_micros(micros)
+
+
+def _intern(text: Optional[str]) -> Optional[str]:
+    """Share one copy of repeated notes / user ids"""
+    return sys.intern(text) if type(text) is str else text
+
+
 class StatusTransition:
     """
     Represents a single status transition/change
@@ -102,12 +169,120 @@ class StatusTransition:
         timestamp: When the transition occurred
         notes: Optional notes about the transition
         user_id: Optional user who made the change
+    
+    Statuses and the timestamp are stored encoded (see _STATUSES / _encode_time);
+    notes and user ids are interned, since most are repeated. Transitions
+    read from a StatusHistory are views: setting one of their fields
+    updates the history too.
     """
-    from_status: Optional[ApplicationStatus]
-    to_status: ApplicationStatus
-    timestamp: datetime = field(default_factory=datetime.now)
-    notes: Optional[str] = None
-    user_id: Optional[str] = None
+    __slots__ = ("_from", "_to", "_ts", "_zoned", "_notes", "_user_id",
+                 "_history", "_index", "_generation")
+    __hash__ = None
+    
+    def __init__(
+        self,
+        from_status: Optional[ApplicationStatus],
+        to_status: ApplicationStatus,
+        timestamp: Optional[datetime] = None,
+        notes: Optional[str] = None,
+        user_id: Optional[str] = None
+    ):
+        self._from = _status_code(from_status)
+        self._to = _STATUS_CODES[to_status]
+        self._ts, self._zoned = _encode_time(timestamp if timestamp is not None else datetime.now())
+        self._notes = _intern(notes)
+        self._user_id = _intern(user_id)
+        self._history = None
+    
+    @classmethod
+    def _from_encoded(cls, from_code: int, to_code: int, micros: int,
+                      notes: Optional[str], user_id: Optional[str],
+                      zoned: Optional[datetime] = None) -> 'StatusTransition':
+        """Build a transition from already encoded fields"""
+        transition = cls.__new__(cls)
+        transition._from = from_code
+        transition._to = to_code
+        transition._ts = micros
+        transition._zoned = zoned
+        transition._notes = notes
+        transition._user_id = user_id
+        transition._history = None
+        return transition
+    
+    def _bound_history(self) -> Optional['StatusHistory']:
+        """The history this transition is a view of (None if detached)"""
+        history = self._history
+        if history is not None and history._generation != self._generation:
+            # The history's transitions were replaced or reordered since
+            self._history = history = None
+        return history
+    
+    def _write_back(self):
+        """Store the fields of a view in its history"""
+        history = self._bound_history()
+        if history is not None:
+            history._store(self._index, self._encoded())
+    
+    @property
+    def from_status(self) -> Optional[ApplicationStatus]:
+        return None if self._from == _NO_STATUS else _STATUSES[self._from]
+    
+    @from_status.setter
+    def from_status(self, status: Optional[ApplicationStatus]):
+        self._from = _status_code(status)
+        self._write_back()
+    
+    @property
+    def to_status(self) -> ApplicationStatus:
+        return _STATUSES[self._to]
+    
+    @to_status.setter
+    def to_status(self, status: ApplicationStatus):
+        self._to = _STATUS_CODES[status]
+        self._write_back()
+    
+    @property
+    def timestamp(self) -> datetime:
+        return _decode_time(self._ts, self._zoned)
+    
+    @timestamp.setter
+    def timestamp(self, value: datetime):
+        micros, zoned = _encode_time(value)
+        history = self._bound_history()
+        if history is not None:
+            history._check_order(self._index, micros)
+        self._ts, self._zoned = micros, zoned
+        self._write_back()
+    
+    @property
+    def notes(self) -> Optional[str]:
+        return self._notes
+    
+    @notes.setter
+    def notes(self, value: Optional[str]):
+        self._notes = _intern(value)
+        self._write_back()
+    
+    @property
+    def user_id(self) -> Optional[str]:
+        return self._user_id
+    
+    @user_id.setter
+    def user_id(self, value: Optional[str]):
+        self._user_id = _intern(value)
+        self._write_back()
+    
+    def _encoded(self) -> Tuple[int, int, int, Optional[str], Optional[str], Optional[datetime]]:
+        return (self._from, self._to, self._ts, self._notes, self._user_id, self._zoned)
+    
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, StatusTransition):
+            return NotImplemented
+        return self._encoded() == other._encoded()
+    
+    def __repr__(self) -> str:
+        return (f"StatusTransition(from_status={self.from_status!r}, to_status={self.to_status!r}, "
+                f"timestamp={self.timestamp!r}, notes={self.notes!r}, user_id={self.user_id!r})")
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
@@ -122,12 +297,14 @@ class StatusTransition:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'StatusTransition':
         """Create StatusTransition from dictionary"""
-        return cls(
-            from_status=ApplicationStatus.from_string(data["from_status"]) if data.get("from_status") else None,
-            to_status=ApplicationStatus.from_string(data["to_status"]),
-            timestamp=datetime.fromisoformat(data["timestamp"]) if isinstance(data["timestamp"], str) else data["timestamp"],
-            notes=data.get("notes"),
-            user_id=data.get("user_id")
+        micros, zoned = _encode_time(data["timestamp"])
+        return cls._from_encoded(
+            _status_code_from_string(data.get("from_status")),
+            _status_code_from_string(data["to_status"]),
+            micros,
+            _intern(data.get("notes")),
+            _intern(data.get("user_id")),
+            zoned
         )
     
     def is_valid_transition(self) -> bool:
@@ -165,7 +342,51 @@ class StatusTransition:
         return self.to_status in valid_transitions.get(self.from_status, [])
 
 
-@dataclass
+class StatusTransitions(Sequence):
+    """
+    List view of the transitions stored in a StatusHistory
+    
+    Supports len(), indexing, slicing, iteration and append(). Items are
+    StatusTransition views built on access: setting a field of one updates
+    the history (a timestamp that would put it out of time order raises
+    ValueError). append() keeps the transitions in time order.
+    """
+    __slots__ = ("_history",)
+    
+    def __init__(self, history: 'StatusHistory'):
+        self._history = history
+    
+    def __len__(self) -> int:
+        return len(self._history._codes) >> 1
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._history._transition(n) for n in range(*index.indices(len(self)))]
+        count = len(self)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("transition index out of range")
+        return self._history._transition(index)
+    
+    def __iter__(self) -> Iterator[StatusTransition]:
+        history = self._history
+        for n in range(len(self)):
+            yield history._transition(n)
+    
+    def append(self, transition: StatusTransition):
+        """Add a transition (after any with the same or an earlier timestamp)"""
+        self._history._append(*transition._encoded())
+    
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (StatusTransitions, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+    
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
 class StatusHistory:
     """
     Manages the complete history of status changes for a job application
@@ -176,12 +397,209 @@ class StatusHistory:
         current_status: Current application status
         created_at: When the tracking started
         updated_at: Last update timestamp
+    
+    Transitions are stored column-wise rather than as one object each:
+    status codes in a bytearray (from, to per transition), timestamps in an
+    int64 array (created_at, updated_at, then one per transition) and notes /
+    user ids, only once any are set, in one interned-string list. Timezone-
+    aware timestamps, once there are any, are also kept in a list aligned
+    with the timestamp array. Transitions are kept in time order.
+    
+    Every change is reported to the observers (see _observe), which is how
+    ApplicationStatusManager keeps its statistics current.
     """
-    job_id: str
-    transitions: List[StatusTransition] = field(default_factory=list)
-    current_status: ApplicationStatus = ApplicationStatus.PENDING
-    created_at: datetime = field(default_factory=datetime.now)
-    updated_at: datetime = field(default_factory=datetime.now)
+    __slots__ = ("job_id", "_current", "_codes", "_times", "_zoned", "_text", "_generation", "_observers")
+    __hash__ = None
+    
+    def __init__(
+        self,
+        job_id: str,
+        transitions: Optional[List[StatusTransition]] = None,
+        current_status: ApplicationStatus = ApplicationStatus.PENDING,
+        created_at: Optional[datetime] = None,
+        updated_at: Optional[datetime] = None
+    ):
+        now = datetime.now() if created_at is None or updated_at is None else None
+        self.job_id = job_id
+        self._current = _STATUS_CODES[current_status]
+        self._codes = bytearray()
+        self._times = array("q")
+        self._zoned: Optional[List[Optional[datetime]]] = None
+        self._text: Optional[List[Optional[str]]] = None
+        self._generation = 0
+        self._observers: Optional[List[Callable[[str], None]]] = None
+        self._append_time(*_encode_time(created_at or now))
+        self._append_time(*_encode_time(updated_at or now))
+        for transition in transitions or ():
+            self._append(*transition._encoded())
+    
+    def _observe(self, callback: Callable[[str], None]):
+        """Call callback(job_id) after every change to this history"""
+        if self._observers is None:
+            self._observers = []
+        if callback not in self._observers:
+            self._observers.append(callback)
+    
+    def _unobserve(self, callback: Callable[[str], None]):
+        """Stop calling a callback registered with _observe()"""
+        if self._observers and callback in self._observers:
+            self._observers.remove(callback)
+    
+    def _changed(self):
+        """Report a change to the observers"""
+        if self._observers:
+            for callback in list(self._observers):
+                callback(self.job_id)
+    
+    def _append_time(self, micros: int, zoned: Optional[datetime]):
+        """Add an encoded timestamp at the end of the timestamp columns"""
+        if self._zoned is None and zoned is not None:
+            self._zoned = [None] * len(self._times)
+        self._times.append(micros)
+        if self._zoned is not None:
+            self._zoned.append(zoned)
+    
+    def _set_time(self, position: int, micros: int, zoned: Optional[datetime]):
+        """Replace an encoded timestamp (position in the timestamp columns)"""
+        if self._zoned is None and zoned is not None:
+            self._zoned = [None] * len(self._times)
+        self._times[position] = micros
+        if self._zoned is not None:
+            self._zoned[position] = zoned
+    
+    def _time(self, position: int) -> datetime:
+        """Decode the timestamp at a position in the timestamp columns"""
+        return _decode_time(self._times[position], self._zoned[position] if self._zoned else None)
+    
+    def _append(self, from_code: int, to_code: int, micros: int,
+                notes: Optional[str], user_id: Optional[str],
+                zoned: Optional[datetime] = None):
+        """Store one encoded transition, keeping the transitions in time order"""
+        if self._text is None and (notes is not None or user_id is not None):
+            self._text = [None] * len(self._codes)
+        # bytearray holds 0..255; "no status" is stored as 255
+        from_code &= 0xFF
+        count = len(self._codes) >> 1
+        if not count or micros >= self._times[-1]:
+            self._codes.append(from_code)
+            self._codes.append(to_code)
+            self._append_time(micros, zoned)
+            if self._text is not None:
+                self._text.append(notes)
+                self._text.append(user_id)
+            self._changed()
+            return
+        
+        # Earlier than the last transition: insert it in its place
+        index = self._transitions_until(micros)
+        self._codes[2 * index:2 * index] = bytes((from_code, to_code))
+        if self._zoned is None and zoned is not None:
+            self._zoned = [None] * len(self._times)
+        self._times.insert(index + 2, micros)
+        if self._zoned is not None:
+            self._zoned.insert(index + 2, zoned)
+        if self._text is not None:
+            self._text[2 * index:2 * index] = [notes, user_id]
+        # Views of the transitions after it now point at the wrong position
+        self._generation += 1
+        self._changed()
+    
+    def _store(self, index: int, fields: Tuple):
+        """Overwrite the encoded transition at a position (written back by a view)"""
+        from_code, to_code, micros, notes, user_id, zoned = fields
+        if self._text is None and (notes is not None or user_id is not None):
+            self._text = [None] * len(self._codes)
+        self._codes[2 * index] = from_code & 0xFF
+        self._codes[2 * index + 1] = to_code
+        self._set_time(index + 2, micros, zoned)
+        if self._text is not None:
+            self._text[2 * index] = notes
+            self._text[2 * index + 1] = user_id
+        self._changed()
+    
+    def _check_order(self, index: int, micros: int):
+        """
+        Check that a new timestamp for the transition at a position keeps the order
+        
+        Raises:
+            ValueError: If it would be earlier than the previous or later than the next transition
+        """
+        count = len(self._codes) >> 1
+        if (index > 0 and micros < self._times[index + 1]) or (index + 1 < count and micros > self._times[index + 3]):
+            raise ValueError(f"Timestamp would put transition {index} of job {self.job_id} out of time order")
+    
+    def _transition(self, index: int) -> StatusTransition:
+        """Build a view of the StatusTransition at a position"""
+        from_code = self._codes[2 * index]
+        text = self._text
+        transition = StatusTransition._from_encoded(
+            _NO_STATUS if from_code == 0xFF else from_code,
+            self._codes[2 * index + 1],
+            self._times[index + 2],
+            text[2 * index] if text else None,
+            text[2 * index + 1] if text else None,
+            self._zoned[index + 2] if self._zoned else None
+        )
+        transition._history = self
+        transition._index = index
+        transition._generation = self._generation
+        return transition
+    
+    @property
+    def transitions(self) -> StatusTransitions:
+        return StatusTransitions(self)
+    
+    @transitions.setter
+    def transitions(self, transitions: List[StatusTransition]):
+        encoded = [transition._encoded() for transition in transitions]
+        del self._codes[:]
+        del self._times[2:]
+        if self._zoned is not None:
+            del self._zoned[2:]
+        self._text = None
+        self._generation += 1
+        for fields in encoded:
+            self._append(*fields)
+        self._changed()
+    
+    @property
+    def current_status(self) -> ApplicationStatus:
+        return _STATUSES[self._current]
+    
+    @current_status.setter
+    def current_status(self, status: ApplicationStatus):
+        self._current = _STATUS_CODES[status]
+        self._changed()
+    
+    @property
+    def created_at(self) -> datetime:
+        return self._time(0)
+    
+    @created_at.setter
+    def created_at(self, value: datetime):
+        self._set_time(0, *_encode_time(value))
+        self._changed()
+    
+    @property
+    def updated_at(self) -> datetime:
+        return self._time(1)
+    
+    @updated_at.setter
+    def updated_at(self, value: datetime):
+        self._set_time(1, *_encode_time(value))
+        self._changed()
+    
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, StatusHistory):
+            return NotImplemented
+        return (self.job_id == other.job_id and self._current == other._current
+                and self._codes == other._codes and self._times == other._times
+                and list(self.transitions) == list(other.transitions))
+    
+    def __repr__(self) -> str:
+        return (f"StatusHistory(job_id={self.job_id!r}, transitions={self.transitions!r}, "
+                f"current_status={self.current_status!r}, created_at={self.created_at!r}, "
+                f"updated_at={self.updated_at!r})")
     
     def add_transition(
         self,
@@ -202,10 +620,14 @@ class StatusHistory:
         Returns:
             True if transition was added, False if invalid
         """
+        now = datetime.now()
+        if self._codes and _to_micros(now) < self._times[-1]:
+            # The clock went back: keep the transitions in time order
+            now = _from_micros(self._times[-1])
         transition = StatusTransition(
             from_status=self.current_status,
             to_status=new_status,
-            timestamp=datetime.now(),
+            timestamp=now,
             notes=notes,
             user_id=user_id
         )
@@ -228,32 +650,47 @@ class StatusHistory:
         
         return True
     
+    def _transitions_until(self, target: int) -> int:
+        """Number of transitions at or before an encoded time (transitions are in time order)"""
+        return bisect.bisect_right(self._times, target, 2) - 2
+    
     def get_status_at_date(self, target_date: datetime) -> Optional[ApplicationStatus]:
         """Get the status that was active at a specific date"""
-        if target_date < self.created_at:
+        target = _to_micros(target_date)
+        if target < self._times[0]:
             return None
         
-        current = ApplicationStatus.PENDING
-        for transition in self.transitions:
-            if transition.timestamp <= target_date:
-                current = transition.to_status
-            else:
-                break
+        count = self._transitions_until(target)
+        if not count:
+            return ApplicationStatus.PENDING
+        return _STATUSES[self._codes[2 * count - 1]]
+    
+    def get_transitions_between(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> List[StatusTransition]:
+        """
+        Get the transitions made within a time range
         
-        return current
+        Args:
+            start: Earliest timestamp to include (inclusive, open if None)
+            end: Latest timestamp to include (inclusive, open if None)
+            
+        Returns:
+            Transitions in time order
+        """
+        first = 0 if start is None else bisect.bisect_left(self._times, _to_micros(start), 2) - 2
+        last = self.get_transition_count() if end is None else self._transitions_until(_to_micros(end))
+        return [self._transition(index) for index in range(first, last)]
     
     def get_transition_count(self) -> int:
         """Get the total number of status transitions"""
-        return len(self.transitions)
+        return len(self._codes) >> 1
     
     def get_days_in_current_status(self) -> int:
         """Get the number of days in the current status"""
-        if not self.transitions:
-            delta = datetime.now() - self.created_at
-        else:
-            last_transition = self.transitions[-1]
-            delta = datetime.now() - last_transition.timestamp
-        
+        delta = datetime.now() - _from_micros(self._times[-1] if self._codes else self._times[0])
         return delta.days
     
     def get_status_duration(self, status: ApplicationStatus) -> int:
@@ -266,22 +703,23 @@ class StatusHistory:
         Returns:
             Total days spent in that status
         """
+        code = _STATUS_CODES[status]
         total_days = 0
-        start_time = None
+        start = None
         
-        for i, transition in enumerate(self.transitions):
-            if transition.to_status == status:
-                start_time = transition.timestamp
-            elif start_time:
+        # Encoded times, so naive and timezone-aware timestamps can be mixed
+        for index in range(self.get_transition_count()):
+            micros = self._times[index + 2]
+            if self._codes[2 * index + 1] == code:
+                start = micros
+            elif start is not None:
                 # Status changed from target status
-                duration = transition.timestamp - start_time
-                total_days += duration.days
-                start_time = None
+                total_days += timedelta(microseconds=micros - start).days
+                start = None
         
         # If still in the status
-        if start_time and self.current_status == status:
-            duration = datetime.now() - start_time
-            total_days += duration.days
+        if start is not None and self._current == code:
+            total_days += timedelta(microseconds=_to_micros(datetime.now()) - start).days
         
         return total_days
     
@@ -298,13 +736,251 @@ class StatusHistory:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'StatusHistory':
         """Create StatusHistory from dictionary"""
-        return cls(
+        history = cls(
             job_id=data["job_id"],
-            transitions=[StatusTransition.from_dict(t) for t in data.get("transitions", [])],
-            current_status=ApplicationStatus.from_string(data["current_status"]),
+            current_status=_STATUSES[_status_code_from_string(data["current_status"])],
             created_at=datetime.fromisoformat(data["created_at"]) if isinstance(data["created_at"], str) else data["created_at"],
             updated_at=datetime.fromisoformat(data["updated_at"]) if isinstance(data["updated_at"], str) else data["updated_at"]
         )
+        for t in data.get("transitions", []):
+            micros, zoned = _encode_time(t["timestamp"])
+            history._append(
+                _status_code_from_string(t.get("from_status")),
+                _status_code_from_string(t["to_status"]),
+                micros,
+                _intern(t.get("notes")),
+                _intern(t.get("user_id")),
+                zoned
+            )
+        return history
+
+
+# Precomputed per-job summary used by aggregate queries:
+# (current status value, transition count, epoch seconds the current status
+# started, updated_at ISO string)
+HistorySummary = Tuple[str, int, float, str]
+
+
+def summarize_history(history: StatusHistory) -> HistorySummary:
+    """Build the aggregate summary of a StatusHistory"""
+    since = history.transitions[-1].timestamp if history.transitions else history.created_at
+    return (history.current_status.value, len(history.transitions),
+            since.timestamp(), history.updated_at.isoformat())
+
+
+def summarize_history_dict(data: Dict[str, Any]) -> HistorySummary:
+    """Build the aggregate summary of a serialized StatusHistory (parses one timestamp)"""
+    transitions = data.get("transitions", [])
+    since = transitions[-1]["timestamp"] if transitions else data["created_at"]
+    updated_at = data["updated_at"]
+    return (ApplicationStatus.from_string(data["current_status"]).value, len(transitions),
+            datetime.fromisoformat(since).timestamp() if isinstance(since, str) else since.timestamp(),
+            updated_at if isinstance(updated_at, str) else updated_at.isoformat())
+
+
+def days_since(epoch: float) -> int:
+    """Whole days elapsed since an epoch timestamp (like timedelta.days)"""
+    return int((time.time() - epoch) // 86400)
+
+
+class StatusHistoryMap(MutableMapping):
+    """
+    job_id -> StatusHistory mapping that reports changes to its histories
+    
+    Wraps a dict (without copying it). Once observe() is called, the
+    callback gets the job_id whenever a history is added, replaced or
+    removed, or a history in the mapping changes.
+    """
+    
+    def __init__(self, histories: Optional[Dict[str, StatusHistory]] = None):
+        """
+        Initialize the mapping
+        
+        Args:
+            histories: Dict to wrap (a new one if None)
+        """
+        self._histories = histories if histories is not None else {}
+        self._observer: Optional[Callable[[str], None]] = None
+    
+    def observe(self, callback: Optional[Callable[[str], None]]):
+        """Report changes to callback(job_id) (None stops reporting)"""
+        for history in self._histories.values():
+            if self._observer is not None:
+                history._unobserve(self._observer)
+            if callback is not None:
+                history._observe(callback)
+        self._observer = callback
+    
+    def __getitem__(self, job_id: str) -> StatusHistory:
+        return self._histories[job_id]
+    
+    def __setitem__(self, job_id: str, history: StatusHistory):
+        old = self._histories.get(job_id)
+        self._histories[job_id] = history
+        if self._observer is not None:
+            if old is not None and old is not history:
+                old._unobserve(self._observer)
+            history._observe(self._observer)
+            self._observer(job_id)
+    
+    def __delitem__(self, job_id: str):
+        history = self._histories.pop(job_id)
+        if self._observer is not None:
+            history._unobserve(self._observer)
+            self._observer(job_id)
+    
+    def __contains__(self, job_id) -> bool:
+        return job_id in self._histories
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._histories)
+    
+    def __len__(self) -> int:
+        return len(self._histories)
+    
+    def __repr__(self) -> str:
+        return repr(self._histories)
+
+
+class LazyStatusHistories(MutableMapping):
+    """
+    job_id -> StatusHistory mapping that materializes histories on access
+    
+    Stored histories are kept serialized (or left in the snapshot file) and
+    only turned into StatusHistory objects when a caller asks for one.
+    Aggregates run from a per-job summary (see HistorySummary) that is
+    loaded with the snapshot, so they never need the full objects. Like
+    StatusHistoryMap, it reports changes to an observe() callback.
+    """
+    
+    def __init__(self, summaries: Dict[str, HistorySummary],
+                 load: Callable[[str], Optional[Dict[str, Any]]]):
+        """
+        Initialize the mapping
+        
+        Args:
+            summaries: Summary of every stored history, keyed by job_id
+            load: Callable returning the serialized history for a job_id
+        """
+        self._summaries = summaries
+        self._load = load
+        self._histories: Dict[str, StatusHistory] = {}
+        # Serialized histories changed by replayed events since the snapshot
+        self._replayed: Dict[str, Dict[str, Any]] = {}
+        self._observer: Optional[Callable[[str], None]] = None
+    
+    def observe(self, callback: Optional[Callable[[str], None]]):
+        """Report changes to callback(job_id) (None stops reporting; replay() does not report)"""
+        for history in list(self._histories.values()):
+            if self._observer is not None:
+                history._unobserve(self._observer)
+            if callback is not None:
+                history._observe(callback)
+        self._observer = callback
+    
+    def _serialized(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get the serialized form of a history that is not materialized"""
+        data = self._replayed.get(job_id)
+        return data if data is not None else self._load(job_id)
+    
+    def __getitem__(self, job_id: str) -> StatusHistory:
+        history = self._histories.get(job_id)
+        if history is not None:
+            return history
+        if job_id not in self._summaries:
+            raise KeyError(job_id)
+        data = self._serialized(job_id)
+        if data is None:
+            raise KeyError(job_id)
+        # First one wins if two threads materialize the same history
+        history = self._histories.setdefault(job_id, StatusHistory.from_dict(data))
+        if self._observer is not None:
+            history._observe(self._observer)
+        return history
+    
+    def __setitem__(self, job_id: str, history: StatusHistory):
+        old = self._histories.get(job_id)
+        self._histories[job_id] = history
+        self._summaries[job_id] = summarize_history(history)
+        if self._observer is not None:
+            if old is not None and old is not history:
+                old._unobserve(self._observer)
+            history._observe(self._observer)
+            self._observer(job_id)
+    
+    def __delitem__(self, job_id: str):
+        del self._summaries[job_id]
+        history = self._histories.pop(job_id, None)
+        self._replayed.pop(job_id, None)
+        if self._observer is not None:
+            if history is not None:
+                history._unobserve(self._observer)
+            self._observer(job_id)
+    
+    def __contains__(self, job_id) -> bool:
+        return job_id in self._summaries
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._summaries)
+    
+    def __len__(self) -> int:
+        return len(self._summaries)
+    
+    @property
+    def materialized(self) -> int:
+        """Number of histories turned into objects so far"""
+        return len(self._histories)
+    
+    def summary(self, job_id: str) -> HistorySummary:
+        """Get the summary of one history (current for materialized ones)"""
+        history = self._histories.get(job_id)
+        if history is not None:
+            return summarize_history(history)
+        return self._summaries[job_id]
+    
+    def iter_summaries(self) -> Iterator[Tuple[str, HistorySummary]]:
+        """Iterate (job_id, summary) for every history without materializing them"""
+        for job_id, summary in self._summaries.items():
+            history = self._histories.get(job_id)
+            yield job_id, summarize_history(history) if history is not None else summary
+    
+    def iter_serialized(self) -> Iterator[Dict[str, Any]]:
+        """Iterate every history in serialized form (for writing a snapshot)"""
+        for job_id in self._summaries:
+            history = self._histories.get(job_id)
+            yield history.to_dict() if history is not None else self._serialized(job_id)
+    
+    def replay(self, event: Dict[str, Any]) -> bool:
+        """
+        Apply a change event to a history without materializing it
+        
+        Args:
+            event: 'create' or 'transition' event (see ApplicationStatusManager)
+            
+        Returns:
+            True if applied, False if the caller must apply it to the object
+        """
+        op = event.get("op")
+        if op == "create":
+            data = event["history"]
+            job_id = data["job_id"]
+            history = self._histories.pop(job_id, None)
+            if history is not None and self._observer is not None:
+                history._unobserve(self._observer)
+        elif op == "transition":
+            job_id = event["job_id"]
+            if job_id in self._histories or job_id not in self._summaries:
+                return False
+            data = dict(self._serialized(job_id))
+            transition = event["transition"]
+            data["transitions"] = list(data.get("transitions", [])) + [transition]
+            data["current_status"] = transition["to_status"]
+            data["updated_at"] = event.get("updated_at") or transition["timestamp"]
+        else:
+            return False
+        self._replayed[job_id] = data
+        self._summaries[job_id] = summarize_history_dict(data)
+        return True
 
 
 class ApplicationStatusManager:
@@ -316,11 +992,121 @@ class ApplicationStatusManager:
     - Bulk status updates
     - Statistics and reporting
     - Validation
+    - Change events for append-only persistence
+    
+    Statistics come from running aggregates, rebuilt when `histories` is
+    replaced. `histories` is wrapped in an observed mapping, so any change
+    to it or to a history in it (including changes made directly on a
+    StatusHistory) marks that job's aggregates out of date; they are
+    brought up to date on the next statistics call.
     """
     
-    def __init__(self):
-        """Initialize the status manager"""
-        self.histories: Dict[str, StatusHistory] = {}
+    def __init__(self, record_events: bool = False):
+        """
+        Initialize the status manager
+        
+        Args:
+            record_events: Queue a change event for every created history and
+                           applied transition (collected with drain_events())
+        """
+        self._aggregates_lock = threading.Lock()
+        self.histories = {}
+        self.record_events = record_events
+        self.pending_events: List[Dict[str, Any]] = []
+    
+    @property
+    def histories(self) -> MutableMapping:
+        """job_id -> StatusHistory mapping"""
+        return self._histories
+    
+    @histories.setter
+    def histories(self, histories: MutableMapping):
+        if not isinstance(histories, (StatusHistoryMap, LazyStatusHistories)):
+            histories = StatusHistoryMap(histories)
+        old = getattr(self, "_histories", None)
+        if old is not None and old is not histories:
+            old.observe(None)
+        histories.observe(self._history_changed)
+        with self._aggregates_lock:
+            self._histories = histories
+            self._aggregates: Optional[HistoryAggregates] = None
+            self._stale: set = set()
+    
+    def _summary(self, job_id: str) -> Optional[HistorySummary]:
+        """Get the current summary of one history (None if not tracked)"""
+        if isinstance(self._histories, LazyStatusHistories):
+            return self._histories.summary(job_id) if job_id in self._histories else None
+        history = self._histories.get(job_id)
+        return summarize_history(history) if history is not None else None
+    
+    def _ensure_aggregates(self) -> HistoryAggregates:
+        """Get the running aggregates, building or updating them if needed (caller holds _aggregates_lock)"""
+        if self._aggregates is None:
+            aggregates = HistoryAggregates()
+            for job_id, summary in self.iter_summaries():
+                aggregates.set(job_id, summary)
+            self._aggregates = aggregates
+            self._stale.clear()
+        elif self._stale:
+            for job_id in self._stale:
+                summary = self._summary(job_id)
+                if summary is None:
+                    self._aggregates.discard(job_id)
+                else:
+                    self._aggregates.set(job_id, summary)
+            self._stale.clear()
+        return self._aggregates
+    
+    def _history_changed(self, job_id: str):
+        """Mark the running aggregates of one history out of date"""
+        with self._aggregates_lock:
+            if self._aggregates is not None:
+                self._stale.add(job_id)
+    
+    def _record_event(self, event: Dict[str, Any]):
+        """Queue a change event if event recording is enabled"""
+        if self.record_events:
+            self.pending_events.append(event)
+    
+    def drain_events(self) -> List[Dict[str, Any]]:
+        """
+        Take the queued change events
+        
+        Returns:
+            Events in the order the changes were made
+        """
+        events = self.pending_events
+        self.pending_events = []
+        return events
+    
+    def apply_event(self, event: Dict[str, Any]):
+        """
+        Apply a change event produced by drain_events() (used for replay)
+        
+        Args:
+            event: 'create' event (full history) or 'transition' event
+        """
+        if isinstance(self.histories, LazyStatusHistories) and self.histories.replay(event):
+            # Replayed without a history object, so nothing else reports it
+            self._history_changed(event["history"]["job_id"] if event.get("op") == "create" else event["job_id"])
+            return
+        
+        op = event.get("op")
+        if op == "create":
+            history = StatusHistory.from_dict(event["history"])
+            self.histories[history.job_id] = history
+        elif op == "transition":
+            job_id = event["job_id"]
+            history = self.histories.get(job_id)
+            if history is None:
+                history = StatusHistory(job_id=job_id)
+                self.histories[job_id] = history
+            transition = StatusTransition.from_dict(event["transition"])
+            history.transitions.append(transition)
+            history.current_status = transition.to_status
+            history.updated_at = datetime.fromisoformat(event.get("updated_at") or event["transition"]["timestamp"])
+        else:
+            logger.warning(f"Unknown status event: {op}")
     
     def create_history(self, job_id: str, initial_status: ApplicationStatus = ApplicationStatus.PENDING) -> StatusHistory:
         """
@@ -344,6 +1130,7 @@ class ApplicationStatusManager:
             history.add_transition(initial_status, notes="Initial status", validate=False)
         
         self.histories[job_id] = history
+        self._record_event({"op": "create", "history": history.to_dict()})
         logger.info(f"Created status history for job {job_id} with initial status {initial_status.value}")
         
         return history
@@ -382,7 +1169,16 @@ class ApplicationStatusManager:
                 logger.error(f"No history found for job {job_id}")
                 return False
         
-        return history.add_transition(new_status, notes, user_id)
+        if not history.add_transition(new_status, notes, user_id):
+            return False
+        
+        self._record_event({
+            "op": "transition",
+            "job_id": job_id,
+            "transition": history.transitions[-1].to_dict(),
+            "updated_at": history.updated_at.isoformat()
+        })
+        return True
     
     def bulk_update(self, updates: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -440,40 +1236,45 @@ class ApplicationStatusManager:
         
         return results
     
-    def get_statistics(self) -> Dict[str, Any]:
-        """Get overall statistics about application statuses"""
-        if not self.histories:
-            return {
-                "total_jobs": 0,
-                "status_counts": {},
-                "average_transitions": 0,
-                "average_days_in_current_status": 0
-            }
-        
-        status_counts = {}
-        total_transitions = 0
-        total_days = 0
+    def iter_summaries(self) -> Iterator[Tuple[str, HistorySummary]]:
+        """
+        Iterate (job_id, summary) for every history
         
-        for history in self.histories.values():
-            status = history.current_status.value
-            status_counts[status] = status_counts.get(status, 0) + 1
-            total_transitions += history.get_transition_count()
-            total_days += history.get_days_in_current_status()
+        Lazily loaded histories answer from their precomputed summaries.
+        """
+        if isinstance(self.histories, LazyStatusHistories):
+            return self.histories.iter_summaries()
+        return ((job_id, summarize_history(history)) for job_id, history in self.histories.items())
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get overall statistics about application statuses
         
-        num_jobs = len(self.histories)
+        Answered from the running aggregates; only the first call after
+        `histories` is replaced visits every history, later ones only the
+        histories changed since.
+        """
+        with self._aggregates_lock:
+            return self._ensure_aggregates().statistics()
+    
+    def get_stale_histories(self, days_threshold: int) -> List[Tuple[str, HistorySummary]]:
+        """
+        Get the histories that have been in their current status for a while
         
-        return {
-            "total_jobs": num_jobs,
-            "status_counts": status_counts,
-            "average_transitions": round(total_transitions / num_jobs, 2),
-            "average_days_in_current_status": round(total_days / num_jobs, 2)
-        }
+        Args:
+            days_threshold: Minimum whole days in the current status
+            
+        Returns:
+            (job_id, summary) pairs, longest in their status first
+        """
+        with self._aggregates_lock:
+            return self._ensure_aggregates().started_before(time.time() - days_threshold * SECONDS_PER_DAY)
     
     def get_jobs_by_status(self, status: ApplicationStatus) -> List[str]:
         """Get list of job IDs with a specific status"""
         return [
-            job_id for job_id, history in self.histories.items()
-            if history.current_status == status
+            job_id for job_id, summary in self.iter_summaries()
+            if summary[0] == status.value
         ]
     
     def export_to_json(self, filepath: str) -> bool:
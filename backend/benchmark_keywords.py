@@ -0,0 +1,221 @@
+"""
+Keyword Extraction Benchmarks
+Measures KeywordExtractor throughput on a synthetic job corpus.
+
+Usage:
+    python benchmark_keywords.py batch [--jobs 5000] [--batch-size 64] [--n-process 1]
+    python benchmark_keywords.py tiers [--jobs 5000] [--batch-size 64] [--model PATH]
+    python benchmark_keywords.py skills [--jobs 2000] [--sizes 80,1000,10000]
+
+batch
+    Extracts keywords from N synthetic job postings one at a time with
+    extract_job_keywords() (what the batch endpoints used to do), then
+    with extract_job_keywords_many(), which streams the texts through
+    nlp.pipe, and reports docs/sec for each. Both must give the same
+    results.
+
+tiers
+    For the full pipeline (every component of the model, as it used to
+    be loaded) and each extraction tier, in a fresh process: the time to
+    load the pipeline, the resident memory it adds, and docs/sec of
+    extract_job_keywords_many() with the result cache off. --model loads
+    the given model name or package directory for every tier instead of
+    the tier's usual models.
+
+skills
+    Finds the skill phrases in N preprocessed synthetic jobs by testing
+    every phrase as a substring of the text (how skills used to be found)
+    and with SkillMatcher, for the built-in taxonomy padded with made-up
+    phrases to each size, and reports texts/sec for each.
+"""
+
+import argparse
+import logging
+import multiprocessing
+import random
+import time
+from typing import Dict, List, Optional
+
+from keyword_extractor import KeywordExtractor
+from skill_matcher import SkillMatcher
+
+_TITLES = ["Software Engineer", "Senior Python Developer", "Data Scientist", "Backend Developer",
+           "Frontend Engineer", "DevOps Engineer", "Machine Learning Engineer", "Data Analyst"]
+_SKILLS = ["Python", "Java", "JavaScript", "React", "Django", "Flask", "SQL", "PostgreSQL", "MongoDB",
+           "AWS", "Azure", "Docker", "Kubernetes", "Git", "machine learning", "data analysis",
+           "REST API", "microservices", "Linux", "Tableau"]
+_SENTENCES = [
+    "We are looking for a {title} to join our growing product team.",
+    "You will design, build and maintain services using {a} and {b}.",
+    "Experience with {a}, {b} and {c} is required.",
+    "Familiarity with {c} and modern CI/CD practices is a plus.",
+    "Strong communication and problem solving skills, leadership and teamwork.",
+    "You will collaborate with designers and analysts on customer-focused features.",
+    "We offer flexible hours, remote work and a generous learning budget.",
+]
+
+
+def synthetic_jobs(count: int, seed: int = 1) -> List[Dict]:
+    """Build `count` job postings of a few hundred words each"""
+    rng = random.Random(seed)
+    jobs = []
+    for index in range(count):
+        title = rng.choice(_TITLES)
+        sentences = []
+        for _ in range(12):
+            a, b, c = rng.sample(_SKILLS, 3)
+            sentences.append(rng.choice(_SENTENCES).format(title=title, a=a, b=b, c=c))
+        jobs.append({"id": f"job_{index}", "title": title, "description": " ".join(sentences)})
+    return jobs
+
+
+def run_batch(count: int, batch_size: int, n_process: int):
+    """Compare per-job and batched keyword extraction throughput"""
+    extractor = KeywordExtractor()
+    jobs = synthetic_jobs(count)
+    pipeline = "spaCy " + "+".join(extractor.nlp.pipe_names) if extractor.nlp else "regex fallback"
+
+    start = time.perf_counter()
+    single = [extractor.extract_job_keywords(job) for job in jobs]
+    single_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batched = extractor.extract_job_keywords_many(jobs, batch_size=batch_size, n_process=n_process)
+    batch_elapsed = time.perf_counter() - start
+
+    print("=" * 60)
+    print(f"KEYWORD EXTRACTION: {count} jobs ({pipeline})")
+    print("=" * 60)
+    print(f"{'method':<46} {'time':>8} {'docs/sec':>9}")
+    print(f"{'extract_job_keywords (one at a time)':<46} {single_elapsed:>7.2f}s {count / single_elapsed:>9.1f}")
+    label = f"extract_job_keywords_many (batch {batch_size}, {n_process} proc)"
+    print(f"{label:<46} {batch_elapsed:>7.2f}s {count / batch_elapsed:>9.1f}")
+    print(f"speedup: {single_elapsed / batch_elapsed:.2f}x, identical results: {single == batched}")
+
+
+def _resident_kb() -> int:
+    """Current resident set size in KiB (0 where /proc is not available)"""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+def _measure_tier(tier: Optional[str], count: int, batch_size: int, model: Optional[str]) -> Dict:
+    """Load one pipeline and time extraction with it (run in a fresh process)"""
+    logging.disable(logging.INFO)
+    if model:
+        KeywordExtractor.PIPELINE_TIERS = {name: (model,) for name in KeywordExtractor.PIPELINE_TIERS}
+    if tier is None:
+        # Everything the model ships with, nothing excluded
+        KeywordExtractor.UNUSED_COMPONENTS = ()
+    jobs = synthetic_jobs(count)
+    base_rss = _resident_kb()
+
+    start = time.perf_counter()
+    extractor = KeywordExtractor(tier=tier or KeywordExtractor.DEFAULT_TIER, cache_size=0)
+    load = time.perf_counter() - start
+    rss = _resident_kb() - base_rss
+
+    start = time.perf_counter()
+    extractor.extract_job_keywords_many(jobs, batch_size=batch_size)
+    elapsed = time.perf_counter() - start
+    return {
+        "model": extractor.model_name or "regex fallback",
+        "components": list(extractor.nlp.pipe_names) if extractor.nlp else [],
+        "load": load,
+        "rss_kb": rss,
+        "docs_per_sec": count / elapsed
+    }
+
+
+def run_tiers(count: int, batch_size: int, model: Optional[str]):
+    """Compare load time, memory and throughput of the full pipeline and each tier"""
+    context = multiprocessing.get_context("spawn")
+    rows = []
+    for label, tier in [("full pipeline", None)] + [(name, name) for name in KeywordExtractor.PIPELINE_TIERS]:
+        with context.Pool(1) as pool:
+            rows.append((label, pool.apply(_measure_tier, (tier, count, batch_size, model))))
+
+    print("=" * 60)
+    print(f"EXTRACTION TIERS: {count} jobs, batches of {batch_size}")
+    print("=" * 60)
+    print(f"{'tier':<14} {'load':>7} {'memory':>10} {'docs/sec':>9}  model / components")
+    for label, row in rows:
+        print(f"{label:<14} {row['load']:>6.2f}s {row['rss_kb'] / 1024:>6.1f} MiB {row['docs_per_sec']:>9.1f}  "
+              f"{row['model']} ({', '.join(row['components'])})")
+
+
+def _taxonomy(size: int) -> Dict[str, set]:
+    """The built-in skills padded with made-up one- and two-word phrases to `size` phrases"""
+    technical = set(KeywordExtractor.TECH_SKILLS)
+    soft = set(KeywordExtractor.SOFT_SKILLS)
+    index = 0
+    while len(technical) + len(soft) < size:
+        technical.add(f"tool{index}" if index % 2 else f"framework{index} platform")
+        index += 1
+    return {'technical': technical, 'soft_skill': soft}
+
+
+def run_skills(count: int, sizes: List[int]):
+    """Compare substring scanning and SkillMatcher as the taxonomy grows"""
+    extractor = KeywordExtractor(cache_size=0)
+    texts = [extractor.preprocess_text(f"{job['title']} {job['description']}") for job in synthetic_jobs(count)]
+
+    print("=" * 60)
+    print(f"SKILL MATCHING: {count} jobs")
+    print("=" * 60)
+    print(f"{'phrases':>8} {'substring texts/sec':>20} {'matcher texts/sec':>18} {'speedup':>8}")
+    for size in sizes:
+        taxonomy = _taxonomy(size)
+        phrases = [(phrase, category) for category, group in taxonomy.items() for phrase in group]
+
+        start = time.perf_counter()
+        for text in texts:
+            [phrase for phrase, _ in phrases if phrase in text]
+        substring = time.perf_counter() - start
+
+        matcher = SkillMatcher(taxonomy)
+        start = time.perf_counter()
+        for text in texts:
+            matcher.find(text)
+        compiled = time.perf_counter() - start
+        print(f"{matcher.size:>8} {count / substring:>20.1f} {count / compiled:>18.1f} {substring / compiled:>7.1f}x")
+
+
+def main():
+    """Parse arguments and run the selected benchmark"""
+    parser = argparse.ArgumentParser(description="Keyword extraction benchmarks")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    batch = subparsers.add_parser("batch", help="Per-job vs batched extraction throughput")
+    batch.add_argument("--jobs", type=int, default=5000)
+    batch.add_argument("--batch-size", type=int, default=KeywordExtractor.DEFAULT_BATCH_SIZE)
+    batch.add_argument("--n-process", type=int, default=1)
+
+    tiers = subparsers.add_parser("tiers", help="Load time, memory and throughput per pipeline tier")
+    tiers.add_argument("--jobs", type=int, default=5000)
+    tiers.add_argument("--batch-size", type=int, default=KeywordExtractor.DEFAULT_BATCH_SIZE)
+    tiers.add_argument("--model", help="Model name or directory to load for every tier")
+
+    skills = subparsers.add_parser("skills", help="Substring scanning vs compiled skill matching")
+    skills.add_argument("--jobs", type=int, default=2000)
+    skills.add_argument("--sizes", default="80,1000,10000",
+                        help="Comma-separated taxonomy sizes")
+
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+    if args.benchmark == "batch":
+        run_batch(args.jobs, args.batch_size, args.n_process)
+    elif args.benchmark == "tiers":
+        run_tiers(args.jobs, args.batch_size, args.model)
+    elif args.benchmark == "skills":
+        run_skills(args.jobs, [int(size) for size in args.sizes.split(",")])
+
+
+if __name__ == "__main__":
+    main()
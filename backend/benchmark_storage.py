@@ -0,0 +1,440 @@
+"""
+Storage Benchmarks
+Measures storage-layer costs that should not grow with the number of jobs.
+
+Usage:
+    python benchmark_storage.py status-history [--sizes 1000 10000 100000] [--transitions 500] [--snapshot-format binary]
+    python benchmark_storage.py group-commit [--writers 1 8 32] [--updates 200] [--no-fsync]
+    python benchmark_storage.py status-memory [--histories 100000] [--transitions 4]
+    python benchmark_storage.py ndjson [--jobs 500000] [--batch-size 1000]
+    python benchmark_storage.py search [--jobs 100000] [--rounds 10]
+
+status-history
+    Seeds status_history.json with N tracked jobs, then times
+    update_job_status_with_history() one transition at a time. Transitions
+    are appended to the status event log, so the mean and p95 latency per
+    transition should stay flat as N grows; the time to rewrite the whole
+    history file (the previous per-transition cost) is shown for comparison.
+
+group-commit
+    Runs concurrent update_job_status() / update_job_score() callers with
+    fsync'd writes and reports updates per second, plus how many log
+    appends (commits) the updates were grouped into, with and without the
+    group commit window.
+
+status-memory
+    Builds N status histories in memory (from their JSON form, as loading
+    a snapshot does) and reports the memory they hold: Python allocations
+    (tracemalloc) and the process's resident set size.
+
+ndjson
+    Imports N jobs from an NDJSON file with import_ndjson(), then exports
+    them with export_to_ndjson() and export_to_json(), reporting the time
+    and the peak of memory allocated on top of the loaded store for each.
+    Building the whole list with get_all_jobs() (what the JSON export used
+    to do) is shown for comparison.
+
+search
+    Seeds N synthetic jobs (descriptions drawn from a skewed vocabulary),
+    then times search_jobs(): the first query, which builds the index, the
+    first use of each query (per-term weights are computed lazily) and
+    repeated queries over successive pages, reporting p50/p95/max.
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import tempfile
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+from statistics import mean, median
+from typing import Dict, List
+
+from storage_manager import JobStorageManager
+from application_status import ApplicationStatus, StatusHistory
+
+
+def _percentile(samples: List[float], fraction: float) -> float:
+    """Get a percentile of a list of samples"""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def seed_status_histories(storage_dir: str, count: int, snapshot_format: str = "json"):
+    """
+    Write a status history snapshot with `count` tracked jobs
+
+    Args:
+        storage_dir: Storage directory to seed
+        count: Number of tracked jobs
+        snapshot_format: Snapshot format to write
+    """
+    storage = JobStorageManager(storage_dir=storage_dir, background_compaction=False,
+                                snapshot_format=snapshot_format)
+    histories = {}
+    for index in range(count):
+        history = StatusHistory(job_id=f"job_{index}")
+        history.add_transition(ApplicationStatus.PENDING, notes="Initial status", validate=False)
+        histories[history.job_id] = history
+    storage.status_manager.histories = histories
+    with storage._status_lock, storage._status_file_lock.exclusive():
+        storage._save_status_histories()
+
+
+def benchmark_status_history(size: int, transitions: int, snapshot_format: str = "json") -> Dict:
+    """
+    Time status transitions against a store with `size` tracked jobs
+
+    Args:
+        size: Number of tracked jobs
+        transitions: Number of transitions to time
+        snapshot_format: Snapshot format of the store
+
+    Returns:
+        Timing results in milliseconds
+    """
+    storage_dir = tempfile.mkdtemp(prefix="status_bench_")
+    try:
+        seed_status_histories(storage_dir, size, snapshot_format)
+
+        start = time.perf_counter()
+        storage = JobStorageManager(storage_dir=storage_dir, background_compaction=False,
+                                    snapshot_format=snapshot_format)
+        load_ms = (time.perf_counter() - start) * 1000
+
+        cycle = ["Applied", "Interview", "Offer", "Accepted"]
+        samples = []
+        for n in range(transitions):
+            job_id = f"job_{(n * 7919) % size}"
+            history = storage.status_manager.get_history(job_id)
+            if history.current_status.value != "Pending":
+                # Every job moves forward at most once per run; use a fresh one
+                job_id = f"bench_{n}"
+            started = time.perf_counter()
+            result = storage.update_job_status_with_history(
+                job_id, cycle[0], notes=f"transition {n}", update_job_record=False
+            )
+            samples.append((time.perf_counter() - started) * 1000)
+            if not result["success"]:
+                raise RuntimeError(f"Transition failed: {result}")
+
+        # What every transition used to cost: rewriting the whole history file
+        start = time.perf_counter()
+        storage.status_manager.export_to_json(os.path.join(storage_dir, "full_rewrite.json"))
+        full_rewrite_ms = (time.perf_counter() - start) * 1000
+
+        return {
+            "size": size,
+            "load_ms": load_ms,
+            "mean_ms": mean(samples),
+            "p50_ms": median(samples),
+            "p95_ms": _percentile(samples, 0.95),
+            "max_ms": max(samples),
+            "full_rewrite_ms": full_rewrite_ms,
+            "snapshots": storage.get_statistics().get("status_events", {}).get("snapshots", 0)
+        }
+    finally:
+        shutil.rmtree(storage_dir, ignore_errors=True)
+
+
+def run_status_history(sizes: List[int], transitions: int, snapshot_format: str = "json"):
+    """Run the status history benchmark for each size and print a table"""
+    print("=" * 86)
+    print(f"STATUS HISTORY: per-transition latency ({transitions} transitions, {snapshot_format} snapshots, "
+          f"{datetime.now():%Y-%m-%d %H:%M})")
+    print("=" * 86)
+    print(f"{'jobs':>8} {'load':>10} {'mean':>9} {'p50':>9} {'p95':>9} {'max':>9} {'snapshots':>10} {'full rewrite':>13}")
+    for size in sizes:
+        r = benchmark_status_history(size, transitions, snapshot_format)
+        print(f"{r['size']:>8} {r['load_ms']:>8.1f}ms {r['mean_ms']:>7.3f}ms {r['p50_ms']:>7.3f}ms "
+              f"{r['p95_ms']:>7.3f}ms {r['max_ms']:>7.1f}ms {r['snapshots']:>10} {r['full_rewrite_ms']:>11.1f}ms")
+    print()
+    print("mean/p50/p95 should stay flat across sizes; max includes the occasional snapshot.")
+
+
+def benchmark_group_commit(writers: int, updates: int, window: float, fsync: bool) -> Dict:
+    """
+    Time concurrent single-job updates
+
+    Args:
+        writers: Number of concurrent writer threads
+        updates: Updates per writer
+        window: group_commit_window for the manager
+        fsync: Whether log appends are fsync'd (sync_writes)
+
+    Returns:
+        Throughput and group commit statistics
+    """
+    storage_dir = tempfile.mkdtemp(prefix="group_commit_bench_")
+    try:
+        storage = JobStorageManager(storage_dir=storage_dir, sync_writes=fsync,
+                                    group_commit_window=window, wal_compact_bytes=1 << 30)
+        storage.save_jobs([
+            {"job_id": f"job_{n}", "title": f"Engineer {n}", "company": f"Company {n}",
+             "location": "Remote", "link": f"https://example.com/{n}"}
+            for n in range(writers * 4)
+        ], source="benchmark")
+        ids = {job["job_id"]: job["id"] for job in storage.get_all_jobs()}
+
+        def writer(index: int):
+            for n in range(updates):
+                job_id = f"job_{(index * 4 + n) % (writers * 4)}"
+                if n % 2:
+                    storage.update_job_score(ids[job_id], {"overall_score": n % 100, "highlight": "white"})
+                else:
+                    storage.update_job_status(job_id, "Applied", notes=f"{index}-{n}")
+
+        threads = [threading.Thread(target=writer, args=(index,)) for index in range(writers)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        group = storage.get_lock_statistics()["group_commit"]
+        return {
+            "writers": writers,
+            "updates": writers * updates,
+            "per_second": writers * updates / elapsed,
+            "commits": group["commits"],
+            "avg_batch": group["avg_batch"]
+        }
+    finally:
+        shutil.rmtree(storage_dir, ignore_errors=True)
+
+
+def run_group_commit(writer_counts: List[int], updates: int, fsync: bool):
+    """Run the group commit benchmark for each writer count and print a table"""
+    print("=" * 78)
+    print(f"GROUP COMMIT: concurrent single-job updates ({'fsync' if fsync else 'no fsync'}, {updates} per writer)")
+    print("=" * 78)
+    print(f"{'writers':>8} {'window':>8} {'updates':>8} {'updates/s':>11} {'commits':>8} {'avg batch':>10}")
+    for writers in writer_counts:
+        for window in (0.0, 0.001):
+            r = benchmark_group_commit(writers, updates, window, fsync)
+            print(f"{r['writers']:>8} {window * 1000:>6.1f}ms {r['updates']:>8} {r['per_second']:>11.0f} "
+                  f"{r['commits']:>8} {r['avg_batch']:>10}")
+    print()
+    print("window 0 still groups updates that queue up behind a running append.")
+
+
+def _resident_kb() -> int:
+    """Current resident set size in KiB (0 where /proc is not available)"""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+def run_status_memory(count: int, transitions: int):
+    """Measure the memory held by `count` status histories and print it"""
+    cycle = ["Applied", "Interview", "Offer", "Rejected", "Applied"]
+    notes = ["Applied via company website", "Phone screen scheduled", "Recruiter follow-up", None]
+    serialized = []
+    for index in range(count):
+        history = {"job_id": f"job_{index}", "current_status": "Pending",
+                   "created_at": "2025-11-01T09:00:00.000001", "updated_at": "2025-11-01T09:00:00.000001",
+                   "transitions": []}
+        previous = "Pending"
+        for n in range(transitions):
+            status = cycle[n % len(cycle)]
+            history["transitions"].append({
+                "from_status": previous, "to_status": status,
+                "timestamp": f"2025-11-{n + 2:02d}T10:{index % 60:02d}:00.{index:06d}"[:26],
+                "notes": notes[(index + n) % len(notes)], "user_id": f"user_{index % 10}"
+            })
+            previous = status
+        history["current_status"] = previous
+        serialized.append(history)
+
+    # Resident size first: tracemalloc's own bookkeeping would inflate it
+    base_rss = _resident_kb()
+    histories = {data["job_id"]: StatusHistory.from_dict(data) for data in serialized}
+    rss = _resident_kb() - base_rss
+    del histories
+
+    tracemalloc.start()
+    histories = {data["job_id"]: StatusHistory.from_dict(data) for data in serialized}
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print("=" * 60)
+    print(f"STATUS MEMORY: {len(histories)} histories x {transitions} transitions")
+    print("=" * 60)
+    print(f"python allocations: {held / 1024 / 1024:8.1f} MiB ({held / len(histories):.0f} bytes per history)")
+    print(f"resident set size:  {rss / 1024:8.1f} MiB")
+
+
+def _ndjson_job(index: int) -> Dict:
+    """A job record as found in an NDJSON export"""
+    return {
+        "job_id": f"job_{index}", "title": f"Software Engineer {index % 500}",
+        "company": f"Company {index % 2000}", "location": ["Remote", "Toronto, ON", "Berlin"][index % 3],
+        "link": f"https://example.com/jobs/{index}",
+        "description": "Build and maintain backend services in Python. " * 4
+    }
+
+
+def _measure(action):
+    """Run an action and return (result, seconds, peak bytes allocated during it)"""
+    tracemalloc.reset_peak()
+    base, _ = tracemalloc.get_traced_memory()
+    start = time.perf_counter()
+    result = action()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    return result, elapsed, peak - base
+
+
+def run_ndjson(count: int, batch_size: int):
+    """Time NDJSON import/export of `count` jobs and print their transient memory"""
+    storage_dir = tempfile.mkdtemp(prefix="ndjson_bench_")
+    try:
+        source_file = os.path.join(storage_dir, "input.ndjson")
+        with open(source_file, "w", encoding="utf-8") as f:
+            for index in range(count):
+                f.write(json.dumps(_ndjson_job(index)) + "\n")
+
+        storage = JobStorageManager(storage_dir=storage_dir, background_compaction=False,
+                                    wal_compact_bytes=1 << 40)
+        tracemalloc.start()
+        rows = []
+
+        with open(source_file, "r", encoding="utf-8") as f:
+            result, elapsed, _ = _measure(lambda: storage.import_ndjson(f, source="benchmark",
+                                                                        batch_size=batch_size))
+        if result["added"] != count:
+            raise RuntimeError(f"Import failed: {result}")
+        rows.append(("import_ndjson", elapsed, None))
+
+        _, elapsed, peak = _measure(lambda: storage.export_to_ndjson(os.path.join(storage_dir, "out.ndjson")))
+        rows.append(("export_to_ndjson", elapsed, peak))
+        _, elapsed, peak = _measure(lambda: storage.export_to_json(os.path.join(storage_dir, "out.json")))
+        rows.append(("export_to_json", elapsed, peak))
+        _, elapsed, peak = _measure(lambda: len(storage.get_all_jobs()))
+        rows.append(("get_all_jobs (full list)", elapsed, peak))
+        tracemalloc.stop()
+
+        print("=" * 60)
+        print(f"NDJSON: {count} jobs, batches of {batch_size}")
+        print("=" * 60)
+        print(f"{'operation':<26} {'time':>10} {'peak transient':>16}")
+        for name, elapsed, peak in rows:
+            transient = "-" if peak is None else f"{peak / 1024 / 1024:.1f} MiB"
+            print(f"{name:<26} {elapsed:>9.2f}s {transient:>16}")
+        print()
+        print("Export transients should not grow with the number of jobs; the full list does.")
+    finally:
+        shutil.rmtree(storage_dir, ignore_errors=True)
+
+
+_SEARCH_TITLES = ["Software Engineer", "Senior Software Engineer", "Data Scientist", "Backend Developer",
+                  "Frontend Developer", "DevOps Engineer", "Machine Learning Engineer", "Data Engineer"]
+_SEARCH_SKILLS = ["python", "java", "aws", "docker", "kubernetes", "react", "sql", "golang",
+                  "c++", "rust", "terraform", "spark", "django", "node"]
+_SEARCH_QUERIES = ["python", "senior software engineer", "data scientist python", "aws docker kubernetes",
+                   "machine learning engineer spark", "react frontend developer", "company 42", "rust",
+                   "golang backend developer", "w1 w2"]
+
+
+def run_search(count: int, rounds: int):
+    """Time full-text searches over `count` synthetic jobs"""
+    rng = random.Random(1)
+    vocabulary = [f"w{index}" for index in range(8000)]
+    frequencies = [1 / (rank + 1) for rank in range(len(vocabulary))]
+
+    def search_job(index):
+        words = rng.choices(vocabulary, frequencies, k=120) + rng.sample(_SEARCH_SKILLS, 4)
+        rng.shuffle(words)
+        return {"job_id": f"job_{index}", "title": rng.choice(_SEARCH_TITLES),
+                "company": f"Company {index % 500}", "location": "Remote",
+                "link": f"https://example.com/jobs/{index}", "description": " ".join(words)}
+
+    storage_dir = tempfile.mkdtemp(prefix="search_bench_")
+    try:
+        storage = JobStorageManager(storage_dir=storage_dir, background_compaction=False,
+                                    wal_compact_bytes=1 << 40)
+        for start in range(0, count, 10000):
+            storage.save_jobs([search_job(index) for index in range(start, min(count, start + 10000))],
+                              source="benchmark")
+
+        start = time.perf_counter()
+        storage.search_jobs("python")
+        build = time.perf_counter() - start
+
+        first = []
+        for query in _SEARCH_QUERIES:
+            start = time.perf_counter()
+            storage.search_jobs(query)
+            first.append((time.perf_counter() - start) * 1000)
+
+        latencies = []
+        for page in range(rounds):
+            for query in _SEARCH_QUERIES:
+                start = time.perf_counter()
+                storage.search_jobs(query, limit=20, offset=page * 20)
+                latencies.append((time.perf_counter() - start) * 1000)
+        latencies.sort()
+
+        print("=" * 60)
+        print(f"SEARCH: {count} jobs, {len(_SEARCH_QUERIES)} queries x {rounds} pages")
+        print("=" * 60)
+        print(f"index build (first search): {build:8.2f}s")
+        print(f"first use of each query:    {mean(first):8.2f} ms mean, {max(first):.2f} ms max")
+        print(f"repeated queries:           {median(latencies):8.2f} ms p50, "
+              f"{latencies[int(len(latencies) * 0.95)]:.2f} ms p95, {latencies[-1]:.2f} ms max")
+    finally:
+        shutil.rmtree(storage_dir, ignore_errors=True)
+
+
+def main():
+    """Parse arguments and run the selected benchmark"""
+    parser = argparse.ArgumentParser(description="Storage layer benchmarks")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    status = subparsers.add_parser("status-history", help="Per-transition status history latency")
+    status.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    status.add_argument("--transitions", type=int, default=500)
+    status.add_argument("--snapshot-format", choices=["json", "binary"], default="json")
+
+    group = subparsers.add_parser("group-commit", help="Concurrent update throughput")
+    group.add_argument("--writers", type=int, nargs="+", default=[1, 8, 32])
+    group.add_argument("--updates", type=int, default=200)
+    group.add_argument("--no-fsync", action="store_true", help="Do not fsync log appends")
+
+    memory = subparsers.add_parser("status-memory", help="Memory held by status histories")
+    memory.add_argument("--histories", type=int, default=100000)
+    memory.add_argument("--transitions", type=int, default=4)
+
+    ndjson = subparsers.add_parser("ndjson", help="Streaming NDJSON import/export")
+    ndjson.add_argument("--jobs", type=int, default=500000)
+    ndjson.add_argument("--batch-size", type=int, default=1000)
+
+    search = subparsers.add_parser("search", help="Full-text search latency")
+    search.add_argument("--jobs", type=int, default=100000)
+    search.add_argument("--rounds", type=int, default=10)
+
+    args = parser.parse_args()
+    if args.benchmark == "status-history":
+        run_status_history(args.sizes, args.transitions, args.snapshot_format)
+    elif args.benchmark == "group-commit":
+        run_group_commit(args.writers, args.updates, not args.no_fsync)
+    elif args.benchmark == "status-memory":
+        run_status_memory(args.histories, args.transitions)
+    elif args.benchmark == "ndjson":
+        run_ndjson(args.jobs, args.batch_size)
+    elif args.benchmark == "search":
+        run_search(args.jobs, args.rounds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+"""
+Extraction Cache
+Bounded cache of keyword extraction results, keyed by content hash.
+
+The same job descriptions are extracted again and again: by every scoring
+run, by /api/match-keywords, by compare_resume_with_job and by each
+optimization-tips call. ExtractionCache keeps recent results in memory
+(least recently used entries are evicted once max_entries is reached) and,
+when given a disk_path, also in an SQLite file, so results survive
+restarts. The disk tier is bounded by max_disk_entries; the oldest entries
+are dropped first.
+
+Keys are SHA-256 hashes of the preprocessed text together with what
+produced the result (pipeline, extraction kind and options, see make_key),
+so a changed text, option or model never returns a stale result. Values
+must be JSON-serializable; they are stored serialized and every get()
+returns a fresh copy, so callers may modify what they receive.
+
+Usage:
+    cache = ExtractionCache(max_entries=4096, disk_path='data/keyword_cache.db')
+    key = ExtractionCache.make_key("regex", "skills", (), cleaned_text)
+    result = cache.get(key)
+    if result is None:
+        result = compute(cleaned_text)
+        cache.put(key, result)
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+import logging
+
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 4096
+DEFAULT_MAX_DISK_ENTRIES = 100000
+
+_DISK_SCHEMA = """
+CREATE TABLE IF NOT EXISTS extraction_cache (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    key TEXT NOT NULL UNIQUE,
+    value TEXT NOT NULL
+);
+"""
+
+
+class ExtractionCache:
+    """Thread-safe LRU cache of extraction results with an optional SQLite tier"""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, disk_path: Optional[str] = None,
+                 max_disk_entries: int = DEFAULT_MAX_DISK_ENTRIES):
+        """
+        Create the cache
+
+        Args:
+            max_entries: Maximum number of results held in memory
+            disk_path: Optional SQLite file for the persistent tier
+            max_disk_entries: Maximum number of results kept on disk
+        """
+        if max_entries < 0 or max_disk_entries < 1:
+            raise ValueError("Cache sizes must be positive")
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self.disk_path = disk_path
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._conn = None
+        self._disk_entries = 0
+        if disk_path:
+            directory = os.path.dirname(disk_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(disk_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_DISK_SCHEMA)
+            self._conn.commit()
+            self._disk_entries = self._conn.execute("SELECT COUNT(*) FROM extraction_cache").fetchone()[0]
+
+    @staticmethod
+    def make_key(namespace: str, kind: str, options: Any, text: str) -> str:
+        """
+        Build the cache key of an extraction result
+
+        Args:
+            namespace: What produced the result (extractor version and pipeline)
+            kind: Kind of extraction ('keywords', 'skills', 'job', ...)
+            options: Options the result depends on (must have a stable repr)
+            text: Preprocessed input text
+
+        Returns:
+            Hex digest identifying the result
+        """
+        digest = hashlib.sha256(f"{namespace}\x00{kind}\x00{options!r}\x00".encode("utf-8"))
+        digest.update(text.encode("utf-8", "surrogatepass"))
+        return digest.hexdigest()
+
+    def __len__(self) -> int:
+        """Number of results held in memory"""
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a result
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            A copy of the cached result, or None on a miss
+        """
+        with self._lock:
+            encoded = self._entries.get(key)
+            if encoded is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            elif self._conn is not None:
+                row = self._conn.execute("SELECT value FROM extraction_cache WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    encoded = row[0]
+                    self.disk_hits += 1
+                    self._remember(key, encoded)
+            if encoded is None:
+                self.misses += 1
+                return None
+        return json.loads(encoded)
+
+    def put(self, key: str, value: Any):
+        """
+        Store a result
+
+        Args:
+            key: Key from make_key()
+            value: JSON-serializable result
+        """
+        encoded = json.dumps(value, separators=(",", ":"))
+        with self._lock:
+            self._remember(key, encoded)
+            if self._conn is not None:
+                try:
+                    cursor = self._conn.execute(
+                        "INSERT OR IGNORE INTO extraction_cache (key, value) VALUES (?, ?)", (key, encoded)
+                    )
+                    disk_entries = self._disk_entries + max(cursor.rowcount, 0)
+                    if disk_entries > self.max_disk_entries:
+                        disk_entries = self._prune_disk()
+                    self._conn.commit()
+                    self._disk_entries = disk_entries
+                except sqlite3.Error as e:
+                    # Drop the half-done insert/prune so the next commit doesn't pick it up
+                    self._conn.rollback()
+                    logger.warning(f"Could not write to extraction cache {self.disk_path}: {e}")
+
+    def _remember(self, key: str, encoded: str):
+        """Insert into the memory tier, evicting the least recently used entries (lock held)"""
+        if not self.max_entries:
+            return
+        self._entries[key] = encoded
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _prune_disk(self) -> int:
+        """Drop the oldest disk entries, down to 90% of max_disk_entries (lock held); returns the count left"""
+        keep = int(self.max_disk_entries * 0.9)
+        self._conn.execute(
+            "DELETE FROM extraction_cache WHERE seq <= "
+            "(SELECT seq FROM extraction_cache ORDER BY seq DESC LIMIT 1 OFFSET ?)",
+            (keep,)
+        )
+        return self._conn.execute("SELECT COUNT(*) FROM extraction_cache").fetchone()[0]
+
+    def clear(self):
+        """Remove every cached result (both tiers) and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.disk_hits = self.misses = self.evictions = 0
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM extraction_cache")
+                self._conn.commit()
+                self._disk_entries = 0
+
+    def stats(self) -> Dict:
+        """
+        Get cache size and hit-rate statistics
+
+        Returns:
+            Dict with entries, max_entries, hits, disk_hits, misses,
+            hit_rate, evictions and (with a disk tier) disk_entries
+        """
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            stats = {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": round((self.hits + self.disk_hits) / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions
+            }
+            if self._conn is not None:
+                stats["disk_path"] = self.disk_path
+                stats["disk_entries"] = self._disk_entries
+                stats["max_disk_entries"] = self.max_disk_entries
+            return stats
+
+    def close(self):
+        """Close the disk tier"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,353 @@
+"""
+Job Filters
+Filter expressions over job records, compiled once into a predicate.
+
+A filter maps a field to a condition; all conditions must hold. Fields may
+be dotted paths into nested records ('score.overall_score'). A condition is
+either a plain value (equality, as get_all_jobs has always done) or a dict
+of operators:
+
+    {
+        "source": {"$in": ["indeed", "linkedin"]},
+        "title": {"$prefix": "Senior"},
+        "score.overall_score": {"$gte": 70, "$lt": 90},
+        "applied_date": {"$exists": True}
+    }
+
+Operators: $eq, $in, $gt, $gte, $lt, $lte, $prefix and $exists. Range
+operators only match values of a comparable type (numbers with numbers,
+strings with strings), so a missing or malformed field never matches a
+range instead of raising. compile_filters() validates a filter and turns it
+into a JobFilter, whose clauses the storage backends inspect to answer a
+query from an index when one covers a field.
+"""
+
+from numbers import Real
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+OPERATORS = ("$eq", "$in", "$gt", "$gte", "$lt", "$lte", "$prefix", "$exists")
+
+# Query-string form: field[op]=value, e.g. score.overall_score[gte]=70
+_QUERY_OPERATORS = {op[1:]: op for op in OPERATORS}
+
+_MISSING = object()
+
+
+def _comparable(value, bound) -> bool:
+    """Check that a value can be ordered against a range bound"""
+    if isinstance(bound, str):
+        return isinstance(value, str)
+    return isinstance(value, Real) and value == value
+
+
+def _lookup(path: Tuple[str, ...]) -> Callable[[Dict], Any]:
+    """Build a getter for a (possibly nested) field that returns _MISSING when absent"""
+    if len(path) == 1:
+        key = path[0]
+        return lambda job: job.get(key, _MISSING)
+
+    def get(job):
+        value = job
+        for key in path:
+            if not isinstance(value, dict):
+                return _MISSING
+            value = value.get(key, _MISSING)
+            if value is _MISSING:
+                return _MISSING
+        return value
+    return get
+
+
+class FilterClause:
+    """The conditions on one field of a filter"""
+
+    __slots__ = ("field", "path", "eq", "values", "lower", "lower_inclusive",
+                 "upper", "upper_inclusive", "prefix", "exists")
+
+    def __init__(self, field: str, condition: Any):
+        """
+        Parse the condition on a field
+
+        Args:
+            field: Field name or dotted path
+            condition: Plain value (equality) or dict of operators
+
+        Raises:
+            ValueError: If an operator is unknown or has an invalid operand
+        """
+        self.field = field
+        self.path = tuple(field.split("."))
+        self.eq = _MISSING
+        self.values = None
+        self.lower = self.upper = None
+        self.lower_inclusive = self.upper_inclusive = True
+        self.prefix = None
+        self.exists = None
+
+        if not (isinstance(condition, dict) and condition
+                and any(str(key).startswith("$") for key in condition)):
+            self.eq = condition
+            return
+
+        for op, operand in condition.items():
+            if op not in OPERATORS:
+                raise ValueError(f"Unknown filter operator {op!r} for field {field!r}")
+            if op == "$eq":
+                self.eq = operand
+            elif op == "$in":
+                if isinstance(operand, (str, bytes, dict)) or not hasattr(operand, "__iter__"):
+                    raise ValueError(f"$in for field {field!r} needs a list of values")
+                self.values = list(operand)
+            elif op == "$prefix":
+                if not isinstance(operand, str):
+                    raise ValueError(f"$prefix for field {field!r} needs a string")
+                self.prefix = operand
+            elif op == "$exists":
+                self.exists = bool(operand)
+            else:
+                if isinstance(operand, bool) or not (isinstance(operand, str) or _comparable(operand, 0)):
+                    raise ValueError(f"{op} for field {field!r} needs a number or a string")
+                if op in ("$gt", "$gte"):
+                    self.lower, self.lower_inclusive = operand, op == "$gte"
+                else:
+                    self.upper, self.upper_inclusive = operand, op == "$lte"
+        if (self.lower is not None and self.upper is not None
+                and isinstance(self.lower, str) != isinstance(self.upper, str)):
+            raise ValueError(f"Range bounds for field {field!r} must both be numbers or both strings")
+
+    @property
+    def has_range(self) -> bool:
+        """Whether the clause bounds the field from below or above"""
+        return self.lower is not None or self.upper is not None
+
+    @property
+    def operators(self) -> Tuple[str, ...]:
+        """The kinds of condition the clause has ('eq', 'in', 'range', 'prefix', 'exists')"""
+        kinds = []
+        if self.eq is not _MISSING:
+            kinds.append("eq")
+        if self.values is not None:
+            kinds.append("in")
+        if self.has_range:
+            kinds.append("range")
+        if self.prefix is not None:
+            kinds.append("prefix")
+        if self.exists is not None:
+            kinds.append("exists")
+        return tuple(kinds)
+
+    def candidate_values(self) -> Optional[list]:
+        """
+        Get the values the field is restricted to by $eq / $in
+
+        Returns:
+            List of values, or None when the clause allows any value
+        """
+        if self.eq is not _MISSING:
+            return [self.eq]
+        return self.values
+
+    def compile(self) -> Callable[[Dict], bool]:
+        """Build the predicate for this clause"""
+        get = _lookup(self.path)
+        checks = []
+
+        if self.exists is not None:
+            exists = self.exists
+            checks.append(lambda value: (value is not _MISSING) == exists)
+        if self.eq is not _MISSING:
+            expected = self.eq
+            checks.append(lambda value: value is not _MISSING and value == expected)
+        if self.values is not None:
+            members = self.values
+            try:
+                lookup = frozenset(members)
+            except TypeError:
+                lookup = members
+
+            def check_in(value):
+                try:
+                    return value in lookup
+                except TypeError:
+                    # Unhashable value against a set of members
+                    return value in members
+            checks.append(check_in)
+        if self.prefix is not None:
+            prefix = self.prefix
+            checks.append(lambda value: isinstance(value, str) and value.startswith(prefix))
+        if self.lower is not None:
+            lower = self.lower
+            if self.lower_inclusive:
+                checks.append(lambda value: _comparable(value, lower) and value >= lower)
+            else:
+                checks.append(lambda value: _comparable(value, lower) and value > lower)
+        if self.upper is not None:
+            upper = self.upper
+            if self.upper_inclusive:
+                checks.append(lambda value: _comparable(value, upper) and value <= upper)
+            else:
+                checks.append(lambda value: _comparable(value, upper) and value < upper)
+
+        if len(self.path) == 1 and self.eq is not _MISSING and len(checks) == 1:
+            # The common case: a single top-level equality
+            key, expected = self.path[0], self.eq
+            return lambda job: key in job and job[key] == expected
+        if len(checks) == 1:
+            check = checks[0]
+            return lambda job: check(get(job))
+
+        def matches(job):
+            value = get(job)
+            for check in checks:
+                if not check(value):
+                    return False
+            return True
+        return matches
+
+
+class JobFilter:
+    """A validated filter and the predicate compiled from it"""
+
+    def __init__(self, filters: Mapping[str, Any]):
+        """
+        Compile a filter
+
+        Args:
+            filters: Mapping of field (or dotted path) to condition
+
+        Raises:
+            ValueError: If the filter is malformed
+        """
+        if not isinstance(filters, Mapping):
+            raise ValueError("Filters must be an object mapping fields to conditions")
+        self.filters = dict(filters)
+        self.clauses: Dict[str, FilterClause] = {
+            str(field): FilterClause(str(field), condition) for field, condition in filters.items()
+        }
+        checks = tuple(clause.compile() for clause in self.clauses.values())
+        if len(checks) == 1:
+            self._match = checks[0]
+        else:
+            def match(job):
+                for check in checks:
+                    if not check(job):
+                        return False
+                return True
+            self._match = match
+
+    def __call__(self, job: Dict) -> bool:
+        """Check whether a job matches the filter"""
+        return self._match(job)
+
+    def __bool__(self) -> bool:
+        """Whether the filter has any conditions"""
+        return bool(self.clauses)
+
+    def __repr__(self) -> str:
+        return f"JobFilter({self.filters!r})"
+
+    def clause(self, field: str) -> Optional[FilterClause]:
+        """Get the clause on a field, if the filter has one"""
+        return self.clauses.get(field)
+
+
+def compile_filters(filters: Optional[Any]) -> Optional[JobFilter]:
+    """
+    Compile a filter (or pass through an already compiled one)
+
+    Args:
+        filters: Mapping of field to condition, a JobFilter, or None
+
+    Returns:
+        JobFilter, or None when there is nothing to filter on
+
+    Raises:
+        ValueError: If the filter is malformed
+    """
+    if isinstance(filters, JobFilter):
+        return filters if filters else None
+    if not filters:
+        return None
+    return JobFilter(filters)
+
+
+def _parse_scalar(text: str):
+    """Read a query-string operand as a number when it looks like one"""
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        number = float(text)
+    except ValueError:
+        return text
+    return number if number == number else text
+
+
+def _equal_operands(text: str) -> list:
+    """Values an $eq/$in query operand matches: the string, and the number it reads as"""
+    number = _parse_scalar(text)
+    return [text] if number is text else [text, number]
+
+
+def parse_query_filters(args: Mapping[str, str], plain_fields=()) -> Dict[str, Any]:
+    """
+    Build a filter from query-string arguments
+
+    Operator arguments have the form field[op]=value, e.g.
+    ?source[in]=indeed,linkedin&score.overall_score[gte]=70&title[prefix]=Senior.
+    $in takes a comma-separated list and $exists takes true/false. Range
+    operands are read as numbers when they parse as one; an $eq or $in
+    operand that parses as a number matches either the number or the raw
+    string (so '123' finds both a numeric field and a string of digits).
+    Arguments named in plain_fields are equality filters on the raw string.
+
+    Args:
+        args: Query arguments (e.g. request.args)
+        plain_fields: Names accepted as plain equality filters
+
+    Returns:
+        Filter dictionary (empty when no filter arguments are present)
+
+    Raises:
+        ValueError: If an operator is unknown
+    """
+    filters: Dict[str, Any] = {}
+    for name, value in args.items():
+        if name in plain_fields:
+            if value:
+                if isinstance(filters.get(name), dict):
+                    filters[name]["$eq"] = value
+                else:
+                    filters[name] = value
+            continue
+        if not name.endswith("]") or "[" not in name:
+            continue
+        field, op = name[:-1].split("[", 1)
+        if op not in _QUERY_OPERATORS:
+            raise ValueError(f"Unknown filter operator {op!r} in {name!r}")
+        op = _QUERY_OPERATORS[op]
+        if op == "$eq":
+            operand: Any = _equal_operands(value)
+            if len(operand) == 1:
+                operand = operand[0]
+            else:
+                op = "$in"
+        elif op == "$in":
+            operand = [item for text in value.split(",") if text for item in _equal_operands(text)]
+        elif op == "$exists":
+            operand = value.lower() not in ("0", "false", "no", "")
+        elif op == "$prefix":
+            operand = value
+        else:
+            operand = _parse_scalar(value)
+        condition = filters.get(field)
+        if not isinstance(condition, dict):
+            condition = {} if condition is None else {"$eq": condition}
+            filters[field] = condition
+        if op == "$in" and "$in" in condition:
+            # [eq] and [in] on the same field: both have to hold
+            operand = [item for item in condition["$in"] if item in operand]
+        condition[op] = operand
+    return filters
+
@@ -57,7 +57,8 @@ class JobScorer:
             raise ValueError(f"Weights must sum to 1.0, got {total}")
     
     def score_job(self, job: Dict, user_preferences: Dict, 
-                  resume_keywords: Optional[Dict] = None) -> Dict[str, any]:
+                  resume_keywords: Optional[Dict] = None,
+                  job_keywords: Optional[Dict] = None) -> Dict[str, any]:
         """
         Calculate comprehensive match score for a job.
         
@@ -65,6 +66,7 @@ class JobScorer:
             job: Job data dictionary with title, description, location, salary, job_type
             user_preferences: User preferences with location, salary_min/max, job_titles, job_types
             resume_keywords: Optional pre-extracted keywords from resume
+            job_keywords: Optional pre-extracted keywords of the job
             
         Returns:
             Dictionary with overall score, component scores, and color highlight
@@ -74,7 +76,7 @@ class JobScorer:
             return self._create_empty_score()
         
         # Calculate individual component scores
-        keyword_score = self._score_keywords(job, user_preferences, resume_keywords)
+        keyword_score = self._score_keywords(job, user_preferences, resume_keywords, job_keywords)
         salary_score = self._score_salary(job, user_preferences)
         location_score = self._score_location(job, user_preferences)
         job_type_score = self._score_job_type(job, user_preferences)
@@ -104,7 +106,8 @@ class JobScorer:
         }
     
     def _score_keywords(self, job: Dict, user_preferences: Dict, 
-                       resume_keywords: Optional[Dict] = None) -> float:
+                       resume_keywords: Optional[Dict] = None,
+                       job_keywords: Optional[Dict] = None) -> float:
         """
         Score based on keyword match between job and resume/user preferences.
         
@@ -112,8 +115,9 @@ class JobScorer:
             Score from 0-100
         """
         try:
-            # Extract job keywords
-            job_keywords = self.keyword_extractor.extract_job_keywords(job)
+            # Extract job keywords (unless extracted with a batch)
+            if job_keywords is None:
+                job_keywords = self.keyword_extractor.extract_job_keywords(job)
             
             # If resume keywords provided, use them for matching
             if resume_keywords:
@@ -374,9 +378,17 @@ class JobScorer:
         """
         scored_jobs = []
         
-        for job in jobs:
+        # Extract keywords for all jobs in one batched pass
+        extracted = [None] * len(jobs)
+        if user_preferences:
             try:
-                score_result = self.score_job(job, user_preferences, resume_keywords)
+                extracted = self.keyword_extractor.extract_job_keywords_many(jobs)
+            except Exception as e:
+                logger.warning(f"Batch keyword extraction failed, extracting per job: {e}")
+        
+        for job, job_keywords in zip(jobs, extracted):
+            try:
+                score_result = self.score_job(job, user_preferences, resume_keywords, job_keywords)
                 
                 # Add score to job data
                 job_with_score = job.copy()
@@ -10,11 +10,15 @@ except Exception:
     spacy = None
     SPACY_AVAILABLE = False
 
-from typing import List, Dict, Set, Tuple
+from typing import Any, Callable, Iterable, List, Dict, Optional, Set, Tuple
 from collections import Counter
+import os
 import re
 import logging
 
+from extraction_cache import ExtractionCache, DEFAULT_MAX_ENTRIES
+from skill_matcher import SkillMatcher
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -48,6 +52,25 @@ class KeywordExtractor:
         'collaborative', 'innovative', 'strategic', 'customer-focused'
     }
     
+    # Documents handed to nlp.pipe at a time by the batch methods
+    DEFAULT_BATCH_SIZE = 64
+    
+    # Part of every cache key: bump when extraction results change shape or meaning
+    EXTRACTION_VERSION = 2
+    
+    # spaCy models per extraction tier, in order of preference. 'fast' is the
+    # small model; 'accurate' prefers a larger model (better tags and lemmas)
+    # when one is installed.
+    PIPELINE_TIERS = {
+        'fast': ('en_core_web_sm',),
+        'accurate': ('en_core_web_lg', 'en_core_web_md', 'en_core_web_sm'),
+    }
+    DEFAULT_TIER = 'fast'
+    
+    # Extraction only reads POS tags, lemmas and is_stop (tok2vec, tagger,
+    # attribute_ruler, lemmatizer), so these components are never loaded
+    UNUSED_COMPONENTS = ('parser', 'senter', 'ner')
+    
     # Common job-related terms to filter out
     STOPWORDS_CUSTOM = {
         'job', 'work', 'company', 'team', 'position', 'role', 'opportunity',
@@ -55,17 +78,40 @@ class KeywordExtractor:
         'experience', 'year', 'years', 'day', 'days', 'week', 'weeks', 'month', 'months'
     }
     
-    def __init__(self):
-        """Initialize the KeywordExtractor with spaCy model."""
+    def __init__(self, tier: str = DEFAULT_TIER, cache_size: int = DEFAULT_MAX_ENTRIES,
+                 cache_path: Optional[str] = None):
+        """
+        Initialize the KeywordExtractor with spaCy model.
+        
+        Args:
+            tier: Pipeline tier, 'fast' or 'accurate' (see PIPELINE_TIERS)
+            cache_size: Number of extraction results cached in memory (0 disables the memory tier)
+            cache_path: Optional SQLite file caching results across restarts
+            
+        Raises:
+            ValueError: If the tier is unknown
+        """
+        if tier not in self.PIPELINE_TIERS:
+            raise ValueError(f"Unknown extraction tier {tier!r}; expected one of {sorted(self.PIPELINE_TIERS)}")
+        self.tier = tier
+        self.model_name = None
+        self.cache = ExtractionCache(cache_size, cache_path) if cache_size or cache_path else None
+        # Skill phrases compiled once; matched on word boundaries in a single pass
+        self.skill_matcher = SkillMatcher({'technical': self.TECH_SKILLS, 'soft_skill': self.SOFT_SKILLS})
+        self.nlp = None
         if SPACY_AVAILABLE:
-            try:
-                # Load spaCy English model
-                self.nlp = spacy.load("en_core_web_sm")
-                logger.info("spaCy model loaded successfully")
-            except Exception:
-                # If model not available, set to None and continue with fallback
+            for model in self.PIPELINE_TIERS[tier]:
+                try:
+                    # Load spaCy English model without the components extraction never reads
+                    self.nlp = spacy.load(model, exclude=list(self.UNUSED_COMPONENTS))
+                except Exception:
+                    continue
+                self.model_name = model
+                logger.info(f"spaCy model {model} loaded for the {tier} tier ({', '.join(self.nlp.pipe_names)})")
+                break
+            else:
+                # If model not available, continue with fallback
                 logger.warning("spaCy model not available at runtime; falling back to lightweight extractor")
-                self.nlp = None
         else:
             logger.info("spaCy not available; using lightweight keyword extractor")
             self.nlp = None
@@ -118,12 +164,118 @@ class KeywordExtractor:
         
         # Preprocess text
         cleaned_text = self.preprocess_text(text)
-
-        keywords = []
-
-        # Prefer spaCy if available and model loaded
+        return self._cached('keywords', (top_n, include_bigrams), cleaned_text,
+                            lambda: self._keywords_from_doc(cleaned_text, self._parse(cleaned_text),
+                                                            top_n, include_bigrams))
+    
+    def _cache_namespace(self) -> str:
+        """Identify the extraction code and pipeline that produce cached results"""
         if self.nlp:
-            doc = self.nlp(cleaned_text)
+            meta = getattr(self.nlp, 'meta', None) or {}
+            pipeline = f"{meta.get('lang', '')}_{meta.get('name', '')}-{meta.get('version', '')}"
+        else:
+            pipeline = 'regex'
+        return f"v{self.EXTRACTION_VERSION}:{pipeline}"
+    
+    def _cache_key(self, kind: str, options: Any, cleaned_text: str) -> Optional[str]:
+        """Cache key of an extraction result, or None when caching is disabled"""
+        if self.cache is None:
+            return None
+        return ExtractionCache.make_key(self._cache_namespace(), kind, options, cleaned_text)
+    
+    def _cached(self, kind: str, options: Any, cleaned_text: str, compute: Callable[[], Any]) -> Any:
+        """
+        Return a cached extraction result, computing and caching it on a miss.
+        
+        Args:
+            kind: Kind of extraction
+            options: Options the result depends on
+            cleaned_text: Preprocessed input text
+            compute: Produces the result on a miss
+            
+        Returns:
+            The extraction result
+        """
+        key = self._cache_key(kind, options, cleaned_text)
+        if key is None:
+            return compute()
+        result = self.cache.get(key)
+        if result is None:
+            result = compute()
+            self.cache.put(key, result)
+        return result
+    
+    def _cached_many(self, kind: str, cleaned_texts: List[str], compute_many: Callable) -> List[Any]:
+        """
+        Batch version of _cached(): only the texts missing from the cache are computed.
+        
+        Args:
+            kind: Kind of extraction
+            cleaned_texts: Preprocessed input texts
+            compute_many: Produces the results for a list of indexes into cleaned_texts
+            
+        Returns:
+            The extraction results, in the order of the texts
+        """
+        if self.cache is None:
+            return compute_many(list(range(len(cleaned_texts))))
+        keys = [self._cache_key(kind, (), text) for text in cleaned_texts]
+        results = [self.cache.get(key) for key in keys]
+        missing = [index for index, result in enumerate(results) if result is None]
+        if missing:
+            for index, result in zip(missing, compute_many(missing)):
+                results[index] = result
+                self.cache.put(keys[index], result)
+        return results
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """
+        Get extraction cache statistics.
+        
+        Returns:
+            Dictionary with cache size and hit-rate figures (enabled: False when caching is off)
+        """
+        if self.cache is None:
+            return {'enabled': False}
+        return {'enabled': True, **self.cache.stats()}
+    
+    def _parse(self, cleaned_text: str):
+        """
+        Run the spaCy pipeline over preprocessed text.
+        
+        Returns:
+            spaCy Doc, or None when spaCy is not available
+        """
+        return self.nlp(cleaned_text) if self.nlp else None
+    
+    def _parse_many(self, cleaned_texts: List[str], batch_size: int, n_process: int) -> Iterable:
+        """
+        Run the spaCy pipeline over several preprocessed texts with nlp.pipe.
+        
+        Returns:
+            Iterable of spaCy Docs (or of None when spaCy is not available)
+        """
+        if not self.nlp:
+            return [None] * len(cleaned_texts)
+        return self.nlp.pipe(cleaned_texts, batch_size=batch_size, n_process=n_process)
+    
+    def _keywords_from_doc(self, cleaned_text: str, doc, top_n: int = 20,
+                           include_bigrams: bool = True) -> List[Dict[str, any]]:
+        """
+        Extract keywords from preprocessed text and its parse.
+        
+        Args:
+            cleaned_text: Preprocessed text
+            doc: spaCy Doc (or Span) of cleaned_text, or None to use the regex fallback
+            top_n: Number of top keywords to return
+            include_bigrams: Whether to include two-word phrases
+            
+        Returns:
+            List of keyword dictionaries with keyword, count, and type
+        """
+        keywords = []
+        
+        if doc is not None:
             # Single word keywords (nouns, proper nouns, adjectives)
             for token in doc:
                 if (token.pos_ in ['NOUN', 'PROPN', 'ADJ'] and 
@@ -131,7 +283,7 @@ class KeywordExtractor:
                     len(token.text) > 2 and
                     token.text not in self.STOPWORDS_CUSTOM):
                     keywords.append(token.lemma_)
-
+            
             # Bigrams (two-word phrases)
             if include_bigrams:
                 for i in range(len(doc) - 1):
@@ -150,17 +302,29 @@ class KeywordExtractor:
             for i, tok in enumerate(tokens):
                 t = tok.lower()
                 if len(t) > 2 and t not in self.STOPWORDS_CUSTOM:
-                    # match against known tech/soft skills
-                    if any(t == s or t in s for s in self.TECH_SKILLS):
-                        keywords.append(t)
-                    elif any(t == s or t in s for s in self.SOFT_SKILLS):
+                    # match against known tech/soft skills (a skill or a word of one)
+                    if self.skill_matcher.is_fragment(t):
                         keywords.append(t)
                 # bigram fallback
                 if include_bigrams and i < len(tokens) - 1:
                     bigram = f"{tokens[i].lower()} {tokens[i+1].lower()}"
-                    if bigram not in self.STOPWORDS_CUSTOM and any(bigram == s for s in self.TECH_SKILLS):
+                    if (bigram not in self.STOPWORDS_CUSTOM and
+                            self.skill_matcher.phrase_category(bigram) == 'technical'):
                         keywords.append(bigram)
         
+        return self._rank_keywords(keywords, top_n)
+    
+    def _rank_keywords(self, keywords: List[str], top_n: int) -> List[Dict[str, any]]:
+        """
+        Count keyword occurrences and format the most frequent ones.
+        
+        Args:
+            keywords: Keyword occurrences, in text order
+            top_n: Number of top keywords to return
+            
+        Returns:
+            List of keyword dictionaries with keyword, count, and type
+        """
         # Count keyword frequencies
         keyword_counts = Counter(keywords)
         
@@ -186,17 +350,14 @@ class KeywordExtractor:
         Returns:
             Category string
         """
-        keyword_lower = keyword.lower()
+        category = self.skill_matcher.phrase_category(keyword)
+        if category:
+            return category
         
-        if keyword_lower in self.TECH_SKILLS:
+        # Check if it contains a technical skill or is part of one
+        if (self.skill_matcher.is_fragment(keyword, 'technical') or
+                any(match[3] == 'technical' for match in self.skill_matcher.find(keyword))):
             return 'technical'
-        elif keyword_lower in self.SOFT_SKILLS:
-            return 'soft_skill'
-        
-        # Check if it contains technical terms
-        for tech in self.TECH_SKILLS:
-            if tech in keyword_lower or keyword_lower in tech:
-                return 'technical'
         
         return 'general'
     
@@ -214,32 +375,35 @@ class KeywordExtractor:
             return {'technical_skills': [], 'soft_skills': []}
         
         cleaned_text = self.preprocess_text(text)
-        doc = self.nlp(cleaned_text)
-        
-        technical_skills = set()
-        soft_skills = set()
+        return self._cached('skills', (), cleaned_text,
+                            lambda: self._skills_from_doc(cleaned_text, self._parse(cleaned_text)))
+    
+    def _skills_from_doc(self, cleaned_text: str, doc) -> Dict[str, List[str]]:
+        """
+        Extract technical and soft skills from preprocessed text and its parse.
         
-        # Check for exact matches and partial matches
-        text_lower = cleaned_text.lower()
+        Args:
+            cleaned_text: Preprocessed text
+            doc: spaCy Doc of cleaned_text, or None without spaCy
+            
+        Returns:
+            Dictionary with technical_skills and soft_skills lists
+        """
+        found = {'technical': set(), 'soft_skill': set()}
         
-        # Technical skills
-        for skill in self.TECH_SKILLS:
-            if skill in text_lower:
-                technical_skills.add(skill)
+        # Whole-word matches of every skill phrase
+        matches = self.skill_matcher.find(cleaned_text)
         
-        # Soft skills
-        for skill in self.SOFT_SKILLS:
-            if skill in text_lower:
-                soft_skills.add(skill)
+        # Also match the lemmas of the non-stopword tokens
+        if doc is not None:
+            lemmas = [word for token in doc if not token.is_stop
+                      for word in self.skill_matcher.tokenize(token.lemma_)]
+            matches.extend(self.skill_matcher.find_words(lemmas))
         
-        # Also check tokens and bigrams
-        tokens = [token.lemma_ for token in doc if not token.is_stop]
-        for i in range(len(tokens) - 1):
-            bigram = f"{tokens[i]} {tokens[i+1]}"
-            if bigram in self.TECH_SKILLS:
-                technical_skills.add(bigram)
-            if bigram in self.SOFT_SKILLS:
-                soft_skills.add(bigram)
+        for _, _, skill, category in matches:
+            found[category].add(skill)
+        technical_skills = found['technical']
+        soft_skills = found['soft_skill']
         
         return {
             'technical_skills': sorted(list(technical_skills)),
@@ -256,19 +420,61 @@ class KeywordExtractor:
         Returns:
             Dictionary with extracted keywords and skills
         """
-        # Combine title and description
-        title = job_data.get('title', '')
-        description = job_data.get('description', '')
-        combined_text = f"{title} {description}"
+        cleaned_title, cleaned_text = self._job_texts(job_data)
+        return self._cached('job', (), self._job_cache_text(cleaned_title, cleaned_text),
+                            lambda: self._job_keywords_from_doc(cleaned_title, cleaned_text,
+                                                                self._parse(cleaned_text)))
+    
+    @staticmethod
+    def _job_cache_text(cleaned_title: str, cleaned_text: str) -> str:
+        """Cache key text of a job (the title boundary matters for the title keywords)"""
+        return f"{len(cleaned_title)}:{cleaned_text}"
+    
+    def _job_texts(self, job_data: Dict) -> Tuple[str, str]:
+        """
+        Preprocess a job posting.
+        
+        Args:
+            job_data: Dictionary containing job information
+            
+        Returns:
+            Tuple of the preprocessed title and the preprocessed title + description
+        """
+        cleaned_title = self.preprocess_text(job_data.get('title', ''))
+        cleaned_description = self.preprocess_text(job_data.get('description', ''))
+        return cleaned_title, f"{cleaned_title} {cleaned_description}".strip()
+    
+    def _job_keywords_from_doc(self, cleaned_title: str, cleaned_text: str, doc) -> Dict[str, any]:
+        """
+        Derive every job keyword output from one parse of the combined text.
         
+        Args:
+            cleaned_title: Preprocessed title (the start of cleaned_text)
+            cleaned_text: Preprocessed title + description
+            doc: spaCy Doc of cleaned_text, or None without spaCy
+            
+        Returns:
+            Dictionary with extracted keywords and skills
+        """
         # Extract keywords
-        keywords = self.extract_keywords(combined_text, top_n=30)
+        keywords = self._keywords_from_doc(cleaned_text, doc, top_n=30)
         
         # Extract skills
-        skills = self.extract_skills(combined_text)
+        skills = self._skills_from_doc(cleaned_text, doc)
         
-        # Extract title-specific keywords (often most important)
-        title_keywords = self.extract_keywords(title, top_n=10, include_bigrams=False)
+        # Extract title-specific keywords (often most important) from the
+        # leading tokens of the combined parse
+        title_doc = None
+        if doc is not None:
+            title_end = len(doc)
+            for token in doc:
+                if token.idx >= len(cleaned_title):
+                    title_end = token.i
+                    break
+            title_doc = doc[:title_end]
+        title_keywords = []
+        if cleaned_title:
+            title_keywords = self._keywords_from_doc(cleaned_title, title_doc, top_n=10, include_bigrams=False)
         
         return {
             'all_keywords': keywords,
@@ -278,6 +484,30 @@ class KeywordExtractor:
             'keyword_count': len(keywords)
         }
     
+    def extract_job_keywords_many(self, jobs: Iterable[Dict], batch_size: int = DEFAULT_BATCH_SIZE,
+                                  n_process: int = 1) -> List[Dict[str, any]]:
+        """
+        Extract keywords from many job postings, parsing them in batches.
+        
+        Gives the same results as calling extract_job_keywords() on each job,
+        but the texts go through spaCy's nlp.pipe.
+        
+        Args:
+            jobs: Job dictionaries (a plain string is taken as a description)
+            batch_size: Number of texts spaCy processes at a time
+            n_process: Number of worker processes for nlp.pipe
+            
+        Returns:
+            List of keyword dictionaries, in the order of the jobs
+        """
+        texts = [self._job_texts(job if isinstance(job, dict) else {'description': job}) for job in jobs]
+        
+        def compute_many(indexes):
+            docs = self._parse_many([texts[index][1] for index in indexes], batch_size, n_process)
+            return [self._job_keywords_from_doc(*texts[index], doc) for index, doc in zip(indexes, docs)]
+        
+        return self._cached_many('job', [self._job_cache_text(*pair) for pair in texts], compute_many)
+    
     def extract_resume_keywords(self, resume_text: str) -> Dict[str, any]:
         """
         Extract keywords from resume text.
@@ -285,14 +515,29 @@ class KeywordExtractor:
         Args:
             resume_text: Full text of the resume
             
+        Returns:
+            Dictionary with extracted keywords and skills
+        """
+        cleaned_text = self.preprocess_text(resume_text)
+        return self._cached('resume', (), cleaned_text,
+                            lambda: self._resume_keywords_from_doc(cleaned_text, self._parse(cleaned_text)))
+    
+    def _resume_keywords_from_doc(self, cleaned_text: str, doc) -> Dict[str, any]:
+        """
+        Derive the resume keyword outputs from one parse of the preprocessed text.
+        
+        Args:
+            cleaned_text: Preprocessed resume text
+            doc: spaCy Doc of cleaned_text, or None without spaCy
+            
         Returns:
             Dictionary with extracted keywords and skills
         """
         # Extract keywords
-        keywords = self.extract_keywords(resume_text, top_n=50)
+        keywords = self._keywords_from_doc(cleaned_text, doc, top_n=50)
         
         # Extract skills
-        skills = self.extract_skills(resume_text)
+        skills = self._skills_from_doc(cleaned_text, doc)
         
         return {
             'all_keywords': keywords,
@@ -301,6 +546,28 @@ class KeywordExtractor:
             'keyword_count': len(keywords)
         }
     
+    def extract_resume_keywords_many(self, resume_texts: Iterable[str],
+                                     batch_size: int = DEFAULT_BATCH_SIZE,
+                                     n_process: int = 1) -> List[Dict[str, any]]:
+        """
+        Extract keywords from many resumes, parsing them in batches.
+        
+        Args:
+            resume_texts: Full texts of the resumes
+            batch_size: Number of texts spaCy processes at a time
+            n_process: Number of worker processes for nlp.pipe
+            
+        Returns:
+            List of keyword dictionaries, in the order of the texts
+        """
+        texts = [self.preprocess_text(text) for text in resume_texts]
+        
+        def compute_many(indexes):
+            docs = self._parse_many([texts[index] for index in indexes], batch_size, n_process)
+            return [self._resume_keywords_from_doc(texts[index], doc) for index, doc in zip(indexes, docs)]
+        
+        return self._cached_many('resume', texts, compute_many)
+    
     def calculate_keyword_match(self, job_keywords: Dict, resume_keywords: Dict) -> Dict[str, any]:
         """
         Calculate keyword match score between job and resume.
@@ -361,8 +628,19 @@ class KeywordExtractor:
 _extractor_instance = None
 
 def get_keyword_extractor() -> KeywordExtractor:
-    """Get or create singleton KeywordExtractor instance."""
+    """
+    Get or create singleton KeywordExtractor instance.
+    
+    The spaCy pipeline tier is read from KEYWORD_EXTRACTION_TIER ('fast' by
+    default, or 'accurate') and the result cache from KEYWORD_CACHE_SIZE
+    (results kept in memory, default 4096) and KEYWORD_CACHE_PATH (SQLite
+    file that keeps results across restarts; unset for memory only).
+    """
     global _extractor_instance
     if _extractor_instance is None:
-        _extractor_instance = KeywordExtractor()
+        _extractor_instance = KeywordExtractor(
+            tier=os.environ.get('KEYWORD_EXTRACTION_TIER', KeywordExtractor.DEFAULT_TIER),
+            cache_size=int(os.environ.get('KEYWORD_CACHE_SIZE', DEFAULT_MAX_ENTRIES)),
+            cache_path=os.environ.get('KEYWORD_CACHE_PATH') or None
+        )
     return _extractor_instance
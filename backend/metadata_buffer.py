@@ -0,0 +1,288 @@
+"""
+Buffered Metadata Writer
+In-memory scrape counters and error log for the storage layer.
+
+save_jobs() used to read and rewrite metadata.json (and scraping_errors.json
+on failure) on every call. MetadataBuffer keeps both in memory and writes
+them out according to a durability mode:
+
+- "sync":     write through on every change (the previous behavior)
+- "interval": flush from a background thread every flush_interval seconds
+              and at interpreter exit (default)
+- "shutdown": flush only when flush() is called or at interpreter exit
+
+Flushing merges the pending counter deltas and new errors into the files
+as they are on disk, under an inter-process lock, so several worker
+processes sharing one storage directory do not lose each other's updates.
+"""
+
+import atexit
+import os
+import threading
+import weakref
+from collections import deque
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+import logging
+
+try:
+    from storage_locks import InterProcessLock
+except ImportError:
+    from backend.storage_locks import InterProcessLock
+
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DURABILITY_MODES = ("sync", "interval", "shutdown")
+MAX_ERRORS = 100
+
+# Buffers that still need a final flush when the interpreter exits
+_live_buffers: "weakref.WeakSet[MetadataBuffer]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_all_buffers():
+    """Flush every live buffer at interpreter exit"""
+    for buffer in list(_live_buffers):
+        try:
+            buffer.flush()
+        except Exception as e:
+            logger.error(f"Error flushing {buffer.metadata_file} at exit: {e}")
+
+
+class MetadataBuffer:
+    """Scrape counters and the last MAX_ERRORS errors, flushed in the background"""
+
+    def __init__(self, metadata_file: str, errors_file: str, lock_file: str,
+                 write_json: Callable[[str, Dict], bool],
+                 read_json: Callable[[str], Optional[Dict]],
+                 durability: str = "interval", flush_interval: float = 5.0):
+        """
+        Initialize the buffer from the files on disk
+
+        Args:
+            metadata_file: Path of metadata.json
+            errors_file: Path of scraping_errors.json
+            lock_file: Lock file serializing flushes across processes
+            write_json: Atomic JSON writer (returns True on success)
+            read_json: JSON reader (returns None on failure)
+            durability: One of DURABILITY_MODES
+            flush_interval: Seconds between background flushes ("interval" mode)
+        """
+        if durability not in DURABILITY_MODES:
+            raise ValueError(f"Unknown metadata durability mode: {durability}")
+
+        self.metadata_file = metadata_file
+        self.errors_file = errors_file
+        self.durability = durability
+        self.flush_interval = flush_interval
+        self._write_json = write_json
+        self._read_json = read_json
+        self._file_lock = InterProcessLock(lock_file)
+
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._metadata: Dict = {}
+        self._errors: deque = deque(maxlen=MAX_ERRORS)
+        self._pending_counts: Dict[str, int] = {}
+        self._pending_errors: List[Dict] = []
+        self._dirty = False
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._thread_pid: Optional[int] = None
+        self.flushes = 0
+
+        self._load()
+        _live_buffers.add(self)
+
+    def _load(self):
+        """Read the current files into memory"""
+        metadata = self._read_json(self.metadata_file) or {}
+        errors = self._read_json(self.errors_file) or {}
+        with self._lock:
+            self._metadata = metadata
+            self._errors = deque(errors.get("errors", []), maxlen=MAX_ERRORS)
+
+    def record_scrape(self, success: bool):
+        """
+        Count one save_jobs() call
+
+        Args:
+            success: Whether the operation was successful
+        """
+        counter = "successful_scrapes" if success else "failed_scrapes"
+        now = datetime.now().isoformat()
+        with self._lock:
+            for key in ("total_scrapes", counter):
+                self._metadata[key] = self._metadata.get(key, 0) + 1
+                self._pending_counts[key] = self._pending_counts.get(key, 0) + 1
+            self._metadata["last_updated"] = now
+            self._dirty = True
+        self._changed()
+
+    def record_error(self, operation: str, error_message: str):
+        """
+        Add an entry to the error log
+
+        Args:
+            operation: Operation that failed
+            error_message: Error message
+        """
+        error_entry = {
+            "timestamp": datetime.now().isoformat(),
+            "operation": operation,
+            "error": error_message
+        }
+        with self._lock:
+            self._errors.append(error_entry)
+            self._pending_errors.append(error_entry)
+            del self._pending_errors[:-MAX_ERRORS]
+            self._dirty = True
+        self._changed()
+
+    def metadata(self) -> Dict:
+        """Get the current metadata (including unflushed counts)"""
+        with self._lock:
+            return dict(self._metadata)
+
+    def errors(self, limit: Optional[int] = None) -> List[Dict]:
+        """
+        Get the most recent errors, oldest first
+
+        Args:
+            limit: Maximum number of errors to return (all if None)
+        """
+        with self._lock:
+            errors = list(self._errors)
+        if limit is None:
+            return errors
+        return errors[-limit:] if limit > 0 else []
+
+    def error_count(self) -> int:
+        """Number of errors currently in the log"""
+        with self._lock:
+            return len(self._errors)
+
+    def _changed(self):
+        """Write through or make sure a flush is scheduled"""
+        if self.durability == "sync":
+            self.flush()
+        elif self.durability == "interval":
+            self._ensure_flusher()
+
+    def _ensure_flusher(self):
+        """Start the background flush thread (again, after a fork)"""
+        pid = os.getpid()
+        if self._thread is not None and self._thread_pid == pid:
+            return
+        with self._flush_lock:
+            if self._thread is not None and self._thread_pid == pid:
+                return
+            self._wakeup = threading.Event()
+            self._thread = threading.Thread(
+                target=self._run_flusher, args=(weakref.ref(self), self._wakeup, self.flush_interval),
+                name="metadata-flush", daemon=True
+            )
+            self._thread_pid = pid
+            self._thread.start()
+
+    @staticmethod
+    def _run_flusher(buffer_ref, wakeup: threading.Event, interval: float):
+        """Flush thread body (holds only a weak reference to the buffer)"""
+        while not wakeup.wait(interval):
+            buffer = buffer_ref()
+            if buffer is None:
+                return
+            try:
+                buffer.flush()
+            except Exception as e:
+                logger.error(f"Error flushing metadata: {e}")
+            del buffer
+
+    def flush(self) -> bool:
+        """
+        Merge pending changes into metadata.json and scraping_errors.json
+
+        Returns:
+            True if successful (or nothing was pending), False otherwise
+        """
+        with self._flush_lock:
+            with self._lock:
+                if not self._dirty:
+                    return True
+                counts, self._pending_counts = self._pending_counts, {}
+                new_errors, self._pending_errors = self._pending_errors, []
+                last_updated = self._metadata.get("last_updated")
+                self._dirty = False
+
+            if not os.path.isdir(os.path.dirname(self.metadata_file) or "."):
+                # Storage directory was removed: nothing to write back to
+                logger.warning(f"Dropping buffered metadata for removed {self.metadata_file}")
+                return False
+
+            metadata = errors = None
+            try:
+                with self._file_lock.exclusive():
+                    metadata = self._merge_metadata(counts, last_updated)
+                    errors = self._merge_errors(new_errors)
+            except Exception as e:
+                logger.error(f"Error flushing metadata: {e}")
+
+            with self._lock:
+                # Keep whatever was not written for the next attempt
+                if metadata is None:
+                    for key, count in counts.items():
+                        self._pending_counts[key] = self._pending_counts.get(key, 0) + count
+                    self._dirty = True
+                if errors is None:
+                    self._pending_errors[:0] = new_errors
+                    del self._pending_errors[:-MAX_ERRORS]
+                    self._dirty = True
+                if metadata is None or errors is None:
+                    return False
+
+                # Adopt the merged view (other processes' changes included)
+                for key, count in self._pending_counts.items():
+                    metadata[key] = metadata.get(key, 0) + count
+                if self._pending_counts:
+                    metadata["last_updated"] = self._metadata.get("last_updated")
+                self._metadata = metadata
+                self._errors = deque(errors + self._pending_errors, maxlen=MAX_ERRORS)
+                self.flushes += 1
+                return True
+
+    def _merge_metadata(self, counts: Dict[str, int], last_updated: Optional[str]) -> Optional[Dict]:
+        """Add counter deltas to metadata.json (caller holds the file lock)"""
+        metadata = self._read_json(self.metadata_file) or {}
+        if not counts:
+            return metadata
+        for key, count in counts.items():
+            metadata[key] = metadata.get(key, 0) + count
+        if last_updated:
+            metadata["last_updated"] = last_updated
+        return metadata if self._write_json(self.metadata_file, metadata) else None
+
+    def _merge_errors(self, new_errors: List[Dict]) -> Optional[List[Dict]]:
+        """Append new errors to scraping_errors.json (caller holds the file lock)"""
+        errors = (self._read_json(self.errors_file) or {}).get("errors", [])
+        if not new_errors:
+            return errors
+        errors = (errors + new_errors)[-MAX_ERRORS:]
+        return errors if self._write_json(self.errors_file, {"errors": errors}) else None
+
+    def close(self):
+        """Flush pending changes and stop the background thread"""
+        self._wakeup.set()
+        self.flush()
+        _live_buffers.discard(self)
+
+    def stats(self) -> Dict:
+        """Get buffer state for get_statistics()"""
+        with self._lock:
+            return {
+                "durability": self.durability,
+                "pending_scrapes": self._pending_counts.get("total_scrapes", 0),
+                "pending_errors": len(self._pending_errors),
+                "flushes": self.flushes
+            }
@@ -0,0 +1,141 @@
+"""
+Append-Only Mutation Log
+JSON Lines write-ahead log used by the storage layer to record changes
+without rewriting the full snapshot file on every update.
+
+Each record is one compact JSON object per line. A record is only considered
+written once its trailing newline is on disk, so a torn write at the end of
+the file (crash mid-append) is ignored when the log is read back, and cut
+off before the next append so later records do not run into it.
+"""
+
+import json
+import os
+from threading import Lock
+from typing import List, Dict, Tuple, Optional
+import logging
+
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class MutationLog:
+    """Append-only JSONL log with offset-based incremental reads"""
+
+    def __init__(self, path: str, fsync: bool = False):
+        """
+        Initialize the log
+
+        Args:
+            path: Path to the .jsonl log file (created on first append)
+            fsync: Whether to fsync after every append for crash durability
+        """
+        self.path = path
+        self.fsync = fsync
+        self._append_lock = Lock()
+
+    def append(self, records: List[Dict]) -> int:
+        """
+        Append records to the log
+
+        Args:
+            records: Records to append (written in order, in one write call)
+
+        Returns:
+            File size after the append
+        """
+        if not records:
+            return self.size()
+
+        payload = ''.join(
+            json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n'
+            for record in records
+        ).encode('utf-8')
+
+        with self._append_lock:
+            with open(self.path, 'a+b') as f:
+                self._truncate_torn_tail(f)
+                f.write(payload)
+                f.flush()
+                if self.fsync:
+                    os.fsync(f.fileno())
+                return f.tell()
+
+    @staticmethod
+    def _truncate_torn_tail(f):
+        """Cut an incomplete last record off the log so the next append starts a fresh line"""
+        end = f.seek(0, os.SEEK_END)
+        if end == 0:
+            return
+        f.seek(end - 1)
+        if f.read(1) == b'\n':
+            return
+
+        # Find the newline ending the last complete record
+        pos = end
+        while pos > 0:
+            start = max(0, pos - 65536)
+            f.seek(start)
+            chunk = f.read(pos - start)
+            newline = chunk.rfind(b'\n')
+            if newline >= 0:
+                pos = start + newline + 1
+                break
+            pos = start
+        logger.warning(f"Discarding {end - pos} bytes of incomplete record at the end of {f.name}")
+        f.truncate(pos)
+        f.seek(pos)
+
+    def read(self, offset: int = 0) -> Tuple[List[Dict], int]:
+        """
+        Read complete records starting at a byte offset
+
+        Args:
+            offset: Byte offset to start reading from
+
+        Returns:
+            Tuple of (records, offset just past the last complete record)
+        """
+        records = []
+        try:
+            with open(self.path, 'rb') as f:
+                f.seek(offset)
+                for line in f:
+                    if not line.endswith(b'\n'):
+                        # Incomplete trailing record from an interrupted append
+                        break
+                    offset += len(line)
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        records.append(json.loads(line))
+                    except json.JSONDecodeError as e:
+                        logger.error(f"Skipping corrupt record in {self.path}: {e}")
+        except FileNotFoundError:
+            pass
+        return records, offset
+
+    def size(self) -> int:
+        """Get the current log size in bytes (0 if missing)"""
+        try:
+            return os.path.getsize(self.path)
+        except OSError:
+            return 0
+
+    def stamp(self) -> Optional[tuple]:
+        """Get (inode, size) for change detection, or None if missing"""
+        try:
+            st = os.stat(self.path)
+            return (st.st_ino, st.st_size)
+        except OSError:
+            return None
+
+    def reset(self):
+        """Truncate the log (after its records were folded into a snapshot)"""
+        with self._append_lock:
+            with open(self.path, 'wb') as f:
+                f.flush()
+                if self.fsync:
+                    os.fsync(f.fileno())
@@ -50,7 +50,45 @@ class ResumeAnalyzer:
         
         # Use keyword extractor for basic extraction
         keywords = self.extractor.extract_resume_keywords(resume_text)
+        return self._resume_analysis(resume_text, keywords, top_n)
+    
+    def extract_resume_keywords_many(self, resume_texts: List[str], top_n: int = 50) -> List[Dict[str, any]]:
+        """
+        Extract keywords from several resumes, parsing them in one batch.
+        
+        Args:
+            resume_texts: Full texts of the resumes
+            top_n: Number of top keywords to extract per resume
+            
+        Returns:
+            List with, per resume, the analysis of extract_resume_keywords()
+            or a dictionary with an 'error' message for texts that are too short
+        """
+        long_enough = [bool(text) and len(text.strip()) >= 50 for text in resume_texts]
+        extracted = iter(self.extractor.extract_resume_keywords_many(
+            [text for text, ok in zip(resume_texts, long_enough) if ok]
+        ))
+        
+        results = []
+        for resume_text, ok in zip(resume_texts, long_enough):
+            if ok:
+                results.append(self._resume_analysis(resume_text, next(extracted), top_n))
+            else:
+                results.append({'error': "Resume text must be at least 50 characters"})
+        return results
+    
+    def _resume_analysis(self, resume_text: str, keywords: Dict, top_n: int) -> Dict[str, any]:
+        """
+        Combine extracted keywords with the section, contact and experience analysis.
         
+        Args:
+            resume_text: Full text of the resume
+            keywords: Output of KeywordExtractor.extract_resume_keywords()
+            top_n: Number of top keywords to keep
+            
+        Returns:
+            Dictionary with comprehensive keyword analysis
+        """
         # Extract sections
         sections = self._identify_sections(resume_text)
         
@@ -386,9 +424,8 @@ class ResumeAnalyzer:
         soft_keywords_counter = Counter()
         general_keywords_counter = Counter()
         
-        for job_desc in job_descriptions:
-            # Extract keywords from this job description
-            job_kw = self.extractor.extract_job_keywords(job_desc)
+        # Extract keywords from all job descriptions in one batch
+        for job_kw in self.extractor.extract_job_keywords_many(job_descriptions):
             all_job_keywords.append(job_kw)
             
             # Count technical skills
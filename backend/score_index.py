@@ -0,0 +1,170 @@
+"""
+Score Index
+In-memory secondary index over job scores used by the storage layer.
+
+Jobs are identified by their table sequence number, so results can be
+returned in storage order. Scored jobs with a numeric overall_score are kept
+in a list sorted by (overall_score, seq); range queries and top-K reads are
+answered with bisect and never look at unscored jobs. Scored jobs without a
+numeric overall_score are tracked separately, and every scored job is also
+filed under its highlight color.
+"""
+
+import bisect
+from numbers import Real
+from typing import Dict, List, Optional, Set
+
+
+class ScoreIndex:
+    """Sorted (overall_score, seq) index plus per-highlight seq sets"""
+
+    def __init__(self):
+        """Initialize an empty index"""
+        self._sorted: List[tuple] = []
+        self._entries: Dict[int, tuple] = {}
+        self._unranked: Set[int] = set()
+        self._highlights: Dict[str, Set[int]] = {}
+
+    def __len__(self) -> int:
+        """Number of scored jobs in the index"""
+        return len(self._entries)
+
+    def add(self, seq: int, score_data) -> None:
+        """
+        Index (or re-index) a scored job
+
+        Args:
+            seq: Table sequence number of the job
+            score_data: The job's 'score' value
+        """
+        if seq in self._entries:
+            self.remove(seq)
+
+        overall = None
+        highlight = None
+        if isinstance(score_data, dict):
+            overall = score_data.get('overall_score')
+            highlight = score_data.get('highlight')
+        if not isinstance(overall, Real) or overall != overall:
+            overall = None
+
+        if overall is None:
+            self._unranked.add(seq)
+        else:
+            bisect.insort(self._sorted, (overall, seq))
+        if isinstance(highlight, str):
+            self._highlights.setdefault(highlight, set()).add(seq)
+        self._entries[seq] = (overall, highlight)
+
+    def remove(self, seq: int) -> None:
+        """
+        Drop a job from the index (no-op if it is not indexed)
+
+        Args:
+            seq: Table sequence number of the job
+        """
+        entry = self._entries.pop(seq, None)
+        if entry is None:
+            return
+        overall, highlight = entry
+
+        if overall is None:
+            self._unranked.discard(seq)
+        else:
+            position = bisect.bisect_left(self._sorted, (overall, seq))
+            if position < len(self._sorted) and self._sorted[position] == (overall, seq):
+                del self._sorted[position]
+        if isinstance(highlight, str):
+            members = self._highlights.get(highlight)
+            if members is not None:
+                members.discard(seq)
+                if not members:
+                    del self._highlights[highlight]
+
+    def range(self, min_score: Optional[float] = None,
+              max_score: Optional[float] = None) -> List[int]:
+        """
+        Get the jobs within a score range, in storage order
+
+        Jobs without a numeric overall_score count as 0 for the lower bound
+        and 100 for the upper bound.
+
+        Args:
+            min_score: Minimum score (inclusive)
+            max_score: Maximum score (inclusive)
+
+        Returns:
+            Sorted list of sequence numbers
+        """
+        seqs = [seq for _, seq in self._slice(min_score, max_score)]
+        if (min_score is None or min_score <= 0) and (max_score is None or max_score >= 100):
+            seqs.extend(self._unranked)
+        seqs.sort()
+        return seqs
+
+    def between(self, min_score: Optional[float] = None,
+                max_score: Optional[float] = None) -> List[int]:
+        """
+        Get the jobs with a numeric overall_score within a range, in storage order
+
+        Unlike range(), jobs without a numeric overall_score never match.
+
+        Args:
+            min_score: Minimum score (inclusive)
+            max_score: Maximum score (inclusive)
+
+        Returns:
+            Sorted list of sequence numbers
+        """
+        return sorted(seq for _, seq in self._slice(min_score, max_score))
+
+    def top_k(self, k: int, min_score: Optional[float] = None,
+              max_score: Optional[float] = None) -> List[int]:
+        """
+        Get the k highest-scoring jobs within a score range
+
+        Only jobs with a numeric overall_score are ranked. Ties keep storage order.
+
+        Args:
+            k: Number of jobs to return
+            min_score: Minimum score (inclusive)
+            max_score: Maximum score (inclusive)
+
+        Returns:
+            List of sequence numbers, best first
+        """
+        if k <= 0:
+            return []
+        lo, hi = self._bounds(min_score, max_score)
+        top = []
+        position = hi
+        while position > lo and len(top) < k:
+            # Walk one score value at a time so ties come out in storage order
+            score = self._sorted[position - 1][0]
+            start = max(bisect.bisect_left(self._sorted, (score,), lo, position), lo)
+            top.extend(seq for _, seq in self._sorted[start:position])
+            position = start
+        return top[:k]
+
+    def highlight(self, highlight: str) -> List[int]:
+        """
+        Get the jobs with a highlight color, in storage order
+
+        Args:
+            highlight: Highlight color ('red', 'yellow', 'white')
+
+        Returns:
+            Sorted list of sequence numbers
+        """
+        return sorted(self._highlights.get(highlight, ()))
+
+    def _bounds(self, min_score: Optional[float], max_score: Optional[float]) -> tuple:
+        """Get the [lo, hi) slice of the sorted list for a score range"""
+        lo = 0 if min_score is None else bisect.bisect_left(self._sorted, (min_score,))
+        hi = len(self._sorted) if max_score is None else bisect.bisect_right(self._sorted, (max_score, float('inf')))
+        return lo, max(lo, hi)
+
+    def _slice(self, min_score: Optional[float], max_score: Optional[float]) -> List[tuple]:
+        """Get the sorted entries within a score range"""
+        lo, hi = self._bounds(min_score, max_score)
+        return self._sorted[lo:hi]
@@ -0,0 +1,383 @@
+"""
+Search Index
+In-memory inverted index for ranked full-text search over stored jobs.
+
+Like ScoreIndex, jobs are identified by their table sequence number. The
+title, company and description of a job are tokenized (lower-cased words
+with the diacritics of Latin letters removed, as SQLite's unicode61
+tokenizer does; c++, c# and the like keep their symbols) into one bag of words in which a
+title occurrence counts three times and a company occurrence twice, and
+jobs are ranked by BM25 (k1=1.2, b=0.75) over those weighted bags.
+
+Postings are stored column-wise per term (document numbers in an
+array('i'), weighted term frequencies in an array('H') and BM25 term
+weights in an array('f')), about 10 bytes per posting instead of a Python
+object each. Every job added gets a new document number, so postings stay
+in append order; removing or re-indexing a job only marks its old document
+dead. Dead documents still count towards document frequencies (as in
+Lucene) and the index asks to be rebuilt once they outnumber live ones.
+
+BM25 term weights depend on the average document length. They are
+computed with the average at the time, and a term's weights are recomputed
+when it is next searched after the average has drifted by more than 10%.
+"""
+
+import bisect
+import heapq
+import math
+import operator
+import re
+import unicodedata
+from array import array
+from collections import Counter
+from itertools import compress, repeat
+from operator import itemgetter
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Job fields searched and how much an occurrence in each counts
+FIELD_WEIGHTS = (("title", 3), ("company", 2), ("description", 1))
+SEARCH_FIELDS = tuple(field for field, _ in FIELD_WEIGHTS)
+
+K1 = 1.2
+B = 0.75
+
+_TOKEN = re.compile(r"[^\W_]+[+#]*")
+
+# Combining diacritical marks following a Latin letter (Latin-1, Extended-A/B
+# and Extended Additional), the ones unicode61's remove_diacritics drops
+_LATIN_DIACRITICS = re.compile(r"([\u0041-\u024f\u1e00-\u1eff])[\u0300-\u036f]+")
+
+STOP_WORDS = frozenset("""
+a an and are as at be but by for from has have in is it its of on or our that
+the their this to was we were will with you your
+""".split())
+
+_MAX_TF = 0xFFFF
+
+# Queries whose posting lists add up to half the documents are scored in a
+# list indexed by document number; terms in at least 1/DENSE_FRACTION of
+# the documents are then added from a dense column (4 bytes per document,
+# at most MAX_DENSE_TERMS kept)
+DENSE_FRACTION = 4
+MAX_DENSE_TERMS = 32
+
+
+def tokenize(text) -> List[str]:
+    """
+    Split text into search terms
+
+    Args:
+        text: Text to tokenize (non-strings are converted)
+
+    Returns:
+        Lower-cased terms, stop words removed
+    """
+    if not text:
+        return []
+    if not isinstance(text, str):
+        text = str(text)
+    text = text.lower()
+    if not text.isascii():
+        text = unicodedata.normalize(
+            "NFC", _LATIN_DIACRITICS.sub(r"\1", unicodedata.normalize("NFD", text)))
+    return [token for token in _TOKEN.findall(text) if token not in STOP_WORDS]
+
+
+def _term_frequencies(job: Dict) -> Counter:
+    """Weighted term frequencies of a job's searchable fields"""
+    tokens = []
+    for field, weight in FIELD_WEIGHTS:
+        tokens.extend(tokenize(job.get(field)) * weight)
+    return Counter(tokens)
+
+
+class _Postings:
+    """The documents containing one term"""
+
+    __slots__ = ("docs", "tfs", "weights", "epoch", "dense", "dense_epoch")
+
+    def __init__(self):
+        self.docs = array("i")
+        self.tfs = array("H")
+        self.weights = array("f")
+        self.epoch = -1
+        self.dense = None
+        self.dense_epoch = -1
+
+
+class SearchIndex:
+    """BM25-ranked inverted index over job title, company and description"""
+
+    def __init__(self):
+        """Initialize an empty index"""
+        self._postings: Dict[str, _Postings] = {}
+        self._doc_seqs = array("q")
+        self._lengths = array("f")
+        self._doc_by_seq: Dict[int, int] = {}
+        self._dead = set()
+        self._length_total = 0.0
+        # Average document length the stored term weights were computed with
+        self._norm_length = 0.0
+        self._epoch = 0
+        self._dense_terms: Dict[int, _Postings] = {}
+        self._norms: Optional[array] = None
+        self._norms_epoch = -1
+
+    def __len__(self) -> int:
+        """Number of jobs indexed"""
+        return len(self._doc_by_seq)
+
+    @property
+    def needs_rebuild(self) -> bool:
+        """Whether dead documents outnumber live ones"""
+        return len(self._dead) > max(len(self._doc_by_seq), 1000)
+
+    @classmethod
+    def build(cls, jobs) -> "SearchIndex":
+        """
+        Build an index in one pass
+
+        Args:
+            jobs: Iterable of (seq, job) pairs
+
+        Returns:
+            SearchIndex
+        """
+        index = cls()
+        columns: Dict[str, tuple] = {}
+        for doc, (seq, job) in enumerate(jobs):
+            frequencies = _term_frequencies(job)
+            length = sum(frequencies.values())
+            index._doc_seqs.append(seq)
+            index._lengths.append(length)
+            index._doc_by_seq[seq] = doc
+            index._length_total += length
+            for term, tf in frequencies.items():
+                column = columns.get(term)
+                if column is None:
+                    column = columns[term] = ([], [])
+                column[0].append(doc)
+                column[1].append(tf if tf <= _MAX_TF else _MAX_TF)
+
+        index._norm_length = index._length_total / len(index._doc_seqs) if index._doc_seqs else 0.0
+        index._epoch = 1
+        for term, (docs, tfs) in columns.items():
+            # Weights are computed on the term's first search
+            postings = index._postings[term] = _Postings()
+            postings.docs = array("i", docs)
+            postings.tfs = array("H", tfs)
+        return index
+
+    def add(self, seq: int, job: Dict) -> None:
+        """
+        Index (or re-index) a job
+
+        Args:
+            seq: Table sequence number of the job
+            job: The job record
+        """
+        self.remove(seq)
+        self._add(seq, _term_frequencies(job))
+
+    def _add(self, seq: int, frequencies: Counter) -> None:
+        """Append a document for a job's term frequencies"""
+        doc = len(self._doc_seqs)
+        length = float(sum(frequencies.values()))
+        self._doc_seqs.append(seq)
+        self._lengths.append(length)
+        self._doc_by_seq[seq] = doc
+        self._length_total += length
+        self._check_norm()
+
+        norm = K1 * (1 - B + B * length / self._norm_length) if self._norm_length else K1 * (1 - B)
+        postings_by_term = self._postings
+        for term, tf in frequencies.items():
+            postings = postings_by_term.get(term)
+            if postings is None:
+                postings = postings_by_term[term] = _Postings()
+                postings.epoch = self._epoch
+            if tf > _MAX_TF:
+                tf = _MAX_TF
+            postings.docs.append(doc)
+            postings.tfs.append(tf)
+            postings.weights.append(tf * (K1 + 1) / (tf + norm))
+
+    def remove(self, seq: int) -> None:
+        """
+        Drop a job from the index (no-op if it is not indexed)
+
+        Args:
+            seq: Table sequence number of the job
+        """
+        doc = self._doc_by_seq.pop(seq, None)
+        if doc is None:
+            return
+        self._dead.add(doc)
+        self._length_total -= self._lengths[doc]
+        self._check_norm()
+
+    def _check_norm(self) -> None:
+        """Start a new weight epoch if the average length drifted by more than 10%"""
+        live = len(self._doc_by_seq)
+        average = self._length_total / live if live else 0.0
+        if not self._norm_length or abs(average - self._norm_length) > 0.1 * self._norm_length:
+            self._norm_length = average
+            self._epoch += 1
+
+    def _weights(self, postings: _Postings) -> array:
+        """Get a term's BM25 weights, recomputing them if they are stale"""
+        if postings.epoch != self._epoch:
+            norms = self._document_norms()
+            postings.weights = array("f", map(
+                operator.truediv,
+                map(operator.mul, postings.tfs, repeat(K1 + 1)),
+                map(operator.add, postings.tfs, map(norms.__getitem__, postings.docs))
+            ))
+            postings.epoch = self._epoch
+        return postings.weights
+
+    def _document_norms(self) -> array:
+        """BM25 length normalization k1 * (1 - b + b * length / average) per document"""
+        norms = self._norms
+        if norms is None or self._norms_epoch != self._epoch:
+            norms = None
+        elif len(norms) < len(self._lengths):
+            norms.extend(self._norms_for(self._lengths[len(norms):]))
+        if norms is None:
+            norms = self._norms = array("f", self._norms_for(self._lengths))
+            self._norms_epoch = self._epoch
+        return norms
+
+    def _norms_for(self, lengths) -> map:
+        """Length normalization for a run of document lengths"""
+        scale = K1 * B / self._norm_length if self._norm_length else 0.0
+        return map(operator.add, repeat(K1 * (1 - B)), map(operator.mul, lengths, repeat(scale)))
+
+    def _dense(self, postings: _Postings) -> array:
+        """Get a frequent term's weights as a column indexed by document number"""
+        weights = self._weights(postings)
+        documents = len(self._doc_seqs)
+        column = postings.dense
+        if column is None or postings.dense_epoch != self._epoch:
+            column = array("f", [0.0]) * documents
+            start = 0
+        else:
+            # Documents added since the column was built are at the end
+            start = bisect.bisect_left(postings.docs, len(column))
+            column.extend(array("f", [0.0]) * (documents - len(column)))
+        for doc, weight in zip(postings.docs[start:], weights[start:]):
+            column[doc] = weight
+        postings.dense = column
+        postings.dense_epoch = self._epoch
+
+        # Keep the most recently used columns only
+        self._dense_terms.pop(id(postings), None)
+        self._dense_terms[id(postings)] = postings
+        while len(self._dense_terms) > MAX_DENSE_TERMS:
+            oldest = self._dense_terms.pop(next(iter(self._dense_terms)))
+            oldest.dense = None
+        return column
+
+    def search(self, query: str, limit: int = 20, offset: int = 0,
+               accept: Optional[Callable[[int], bool]] = None) -> Tuple[List[Tuple[int, float]], int]:
+        """
+        Rank the jobs matching any term of a query
+
+        Args:
+            query: Free-text query
+            limit: Number of results to return
+            offset: Number of results to skip
+            accept: Optional check on a job's sequence number (e.g. a filter);
+                    rejected jobs are not counted
+
+        Returns:
+            Tuple of ((seq, score) pairs, best first; total number of matches)
+        """
+        terms = [term for term in dict.fromkeys(tokenize(query)) if term in self._postings]
+        if not terms:
+            return [], 0
+
+        documents = len(self._doc_seqs)
+        weighted = []
+        for term in terms:
+            postings = self._postings[term]
+            frequency = len(postings.docs)
+            idf = math.log(1 + (documents - frequency + 0.5) / (frequency + 0.5))
+            weighted.append((idf, postings))
+        # Longest list first; scores are kept relative to its idf and scaled
+        # back for the page returned
+        weighted.sort(key=lambda item: len(item[1].docs), reverse=True)
+        base_idf = weighted[0][0]
+        wanted = offset + limit
+
+        if sum(len(postings.docs) for _, postings in weighted) * 2 >= documents:
+            ranked, total = self._rank_dense(weighted, base_idf, wanted, accept)
+        else:
+            ranked, total = self._rank_sparse(weighted, base_idf, wanted, accept)
+        seqs = self._doc_seqs
+        return [(seqs[doc], score * base_idf) for doc, score in ranked[offset:wanted]], total
+
+    def _rank_sparse(self, weighted: list, base_idf: float, wanted: int,
+                     accept: Optional[Callable[[int], bool]]) -> tuple:
+        """Accumulate scores in a dict keyed by document number"""
+        _, postings = weighted[0]
+        scores = dict(zip(postings.docs, self._weights(postings)))
+        for idf, postings in weighted[1:]:
+            factor = idf / base_idf
+            get = scores.get
+            for doc, weight in zip(postings.docs, self._weights(postings)):
+                scores[doc] = get(doc, 0.0) + factor * weight
+
+        dead = self._dead
+        if accept is not None:
+            seqs = self._doc_seqs
+            matches = [(doc, score) for doc, score in scores.items()
+                       if doc not in dead and accept(seqs[doc])]
+            return heapq.nlargest(wanted, matches, key=itemgetter(1)), len(matches)
+
+        dead_matches = scores.keys() & dead if dead else ()
+        ranked = heapq.nlargest(wanted + len(dead_matches), scores.items(), key=itemgetter(1))
+        if dead_matches:
+            ranked = [(doc, score) for doc, score in ranked if doc not in dead]
+        return ranked, len(scores) - len(dead_matches)
+
+    def _rank_dense(self, weighted: list, base_idf: float, wanted: int,
+                    accept: Optional[Callable[[int], bool]]) -> tuple:
+        """
+        Accumulate scores in a list indexed by document number
+
+        Used when the longest posting list covers a large share of the
+        index: frequent terms are added column by column with map(), and
+        the top of the list is found with one nlargest() over the values.
+        """
+        scores = None
+        for idf, postings in weighted:
+            factor = idf / base_idf
+            if scores is None:
+                if len(postings.docs) * DENSE_FRACTION >= len(self._doc_seqs):
+                    scores = self._dense(postings).tolist()
+                    continue
+                scores = [0.0] * len(self._doc_seqs)
+            if len(postings.docs) * DENSE_FRACTION >= len(self._doc_seqs):
+                column = self._dense(postings)
+                scores = list(map(operator.add, scores, map(operator.mul, column, repeat(factor))))
+            else:
+                for doc, weight in zip(postings.docs, self._weights(postings)):
+                    scores[doc] += factor * weight
+        for doc in self._dead:
+            scores[doc] = 0.0
+
+        documents = range(len(scores))
+        if accept is not None:
+            seqs = self._doc_seqs
+            matches = [(doc, scores[doc]) for doc in compress(documents, scores) if accept(seqs[doc])]
+            return heapq.nlargest(wanted, matches, key=itemgetter(1)), len(matches)
+
+        total = len(scores) - scores.count(0.0)
+        if total > wanted:
+            threshold = heapq.nlargest(wanted, scores)[-1]
+            candidates = compress(documents, map(operator.ge, scores, repeat(threshold)))
+        else:
+            candidates = compress(documents, scores)
+        ranked = sorted(((doc, scores[doc]) for doc in candidates), key=itemgetter(1), reverse=True)
+        return ranked[:wanted], total
@@ -0,0 +1,146 @@
+"""
+Skill Matcher
+Finds the phrases of a fixed skill taxonomy in text, on word boundaries.
+
+Phrases and text are split into the same lower-cased words (c++, c# and
+the like keep their symbols; hyphens, dots and slashes separate words, so
+'scikit-learn' also matches "scikit learn" and 'node.js' matches
+"node js"), and the phrases are compiled once into a trie of words. A
+text is matched by walking the trie from every word, which stops after at
+most as many words as the longest phrase has, so matching is linear in the
+length of the text and independent of the number of phrases. A phrase only
+matches whole words: 'ai' is not found in "maintain", nor 'java' in
+"javascript".
+
+Usage:
+    matcher = SkillMatcher({'technical': TECH_SKILLS, 'soft_skill': SOFT_SKILLS})
+    for start, end, phrase, category in matcher.find(text):
+        ...
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+_TOKEN = re.compile(r"[^\W_]+[+#]*")
+
+# Trie key holding the (phrase, category) pairs that end at a node
+_END = None
+
+
+class SkillMatcher:
+    """Word trie matching every phrase of a taxonomy in one pass over the text"""
+
+    def __init__(self, taxonomy: Dict[str, Iterable[str]]):
+        """
+        Compile the taxonomy
+
+        Args:
+            taxonomy: Phrases per category; when a phrase is listed under
+                several categories, the first one takes precedence
+        """
+        self._trie: Dict = {}
+        self._fragments: Dict[Tuple[str, ...], Set[str]] = {}
+        self.max_words = 0
+        self.size = 0
+        for category, phrases in taxonomy.items():
+            for phrase in sorted(phrases):
+                words = self.tokenize(phrase)
+                if not words:
+                    continue
+                node = self._trie
+                for word in words:
+                    node = node.setdefault(word, {})
+                node.setdefault(_END, []).append((phrase, category))
+                self.max_words = max(self.max_words, len(words))
+                self.size += 1
+
+                # Every run of consecutive words, e.g. 'machine' of 'machine learning'
+                for start in range(len(words)):
+                    for end in range(start + 1, len(words) + 1):
+                        self._fragments.setdefault(tuple(words[start:end]), set()).add(category)
+
+    @staticmethod
+    def tokenize(text: str) -> List[str]:
+        """
+        Split text into the lower-cased words phrases are matched on
+
+        Args:
+            text: Text to split
+
+        Returns:
+            List of words
+        """
+        return _TOKEN.findall(text.lower()) if text else []
+
+    def find(self, text: str) -> List[Tuple[int, int, str, str]]:
+        """
+        Find every taxonomy phrase in text
+
+        Args:
+            text: Text to search
+
+        Returns:
+            List of (start, end, phrase, category) in text order, where
+            start and end delimit the matched words of tokenize(text)
+        """
+        return self.find_words(self.tokenize(text))
+
+    def find_words(self, words: List[str]) -> List[Tuple[int, int, str, str]]:
+        """
+        Find every taxonomy phrase in a sequence of words
+
+        Args:
+            words: Lower-cased words, as returned by tokenize()
+
+        Returns:
+            List of (start, end, phrase, category) in word order
+        """
+        trie = self._trie
+        max_words = self.max_words
+        count = len(words)
+        matches = []
+        for start in range(count):
+            node = trie.get(words[start])
+            end = start + 1
+            while node is not None:
+                for phrase, category in node.get(_END, ()):
+                    matches.append((start, end, phrase, category))
+                if end == count or end - start == max_words:
+                    break
+                node = node.get(words[end])
+                end += 1
+        return matches
+
+    def phrase_category(self, text: str) -> Optional[str]:
+        """
+        Get the category of text that is exactly one taxonomy phrase
+
+        Args:
+            text: Text to look up (e.g. 'Node.js', 'machine learning')
+
+        Returns:
+            Category of the phrase, or None if text is not a phrase
+        """
+        node = self._trie
+        for word in self.tokenize(text):
+            node = node.get(word)
+            if node is None:
+                return None
+        entries = node.get(_END) if node is not self._trie else None
+        return entries[0][1] if entries else None
+
+    def is_fragment(self, text: str, category: Optional[str] = None) -> bool:
+        """
+        Check whether text is a phrase or a run of consecutive words of one
+
+        Args:
+            text: Text to look up (e.g. 'learning' for 'machine learning')
+            category: Only consider phrases of this category
+
+        Returns:
+            True if text is (part of) a taxonomy phrase
+        """
+        categories = self._fragments.get(tuple(self.tokenize(text)))
+        if not categories:
+            return False
+        return category is None or category in categories
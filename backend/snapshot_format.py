@@ -0,0 +1,327 @@
+"""
+Binary Snapshot Format
+Compact alternative to the indented JSON snapshots (jobs.json,
+status_history.json) written by the storage layer.
+
+A snapshot is a list of records (jobs or status histories) plus a small
+metadata dictionary. On disk:
+
+    MAGIC
+    u32 header length, header (JSON: metadata, record count, compression)
+    blocks:  u32 length + payload (compact JSON array of up to
+             BLOCK_SIZE records, zlib-compressed)
+    index:   u64 offset + u32 length per block, then u32 length + the
+             record keys (compressed JSON list)
+    trailer: u64 index offset, MAGIC
+
+Records are grouped into blocks so compression and parsing work on large
+inputs, while a single record can still be read by decoding only its
+block. SnapshotReader loads only the header and index; blocks are decoded
+when records are asked for.
+
+JSON stays available as an export format:
+
+    python snapshot_format.py to-binary data/jobs.json data/jobs.snap
+    python snapshot_format.py to-json data/jobs.snap data/jobs.json
+"""
+
+import copy
+import json
+import mmap
+import os
+import struct
+import sys
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import logging
+
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+MAGIC = b"JASNAP01"
+BLOCK_SIZE = 256
+COMPRESSION_LEVEL = 3
+
+# List field holding the records, and the field used as record key, per snapshot type
+RECORD_FIELDS = {"jobs": "id", "histories": "job_id"}
+
+_U32 = struct.Struct("<I")
+_BLOCK_ENTRY = struct.Struct("<QI")
+_TRAILER = struct.Struct("<Q8s")
+
+
+class SnapshotError(ValueError):
+    """Raised when a file is not a readable binary snapshot"""
+
+
+def is_snapshot(path: str) -> bool:
+    """Check whether a file starts with the binary snapshot magic"""
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def _encode(value: Any) -> bytes:
+    """Serialize a value as compact JSON"""
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def write_snapshot(path: str, data: Dict, compress: bool = True) -> None:
+    """
+    Write a snapshot dictionary in the binary format
+
+    The records list ('jobs' or 'histories') is stored in blocks; every
+    other top-level field goes into the header.
+
+    Args:
+        path: Destination file (written in place; callers rename atomically)
+        data: Snapshot dictionary, e.g. {"jobs": [...], "count": n, "wal_seq": s}
+        compress: Compress blocks with zlib
+    """
+    records_field = next((field for field in RECORD_FIELDS if isinstance(data.get(field), list)), None)
+    records = data.get(records_field, []) if records_field else []
+    key_field = RECORD_FIELDS.get(records_field)
+    meta = {key: value for key, value in data.items() if key != records_field}
+    pack = (lambda payload: zlib.compress(payload, COMPRESSION_LEVEL)) if compress else (lambda payload: payload)
+
+    header = _encode({
+        "format": 1,
+        "records_field": records_field,
+        "key_field": key_field,
+        "count": len(records),
+        "block_size": BLOCK_SIZE,
+        "compression": "zlib" if compress else "none",
+        "meta": meta
+    })
+
+    with open(path, "wb") as f:
+        f.write(MAGIC)
+        f.write(_U32.pack(len(header)))
+        f.write(header)
+
+        blocks = []
+        for start in range(0, len(records), BLOCK_SIZE):
+            payload = pack(_encode(records[start:start + BLOCK_SIZE]))
+            blocks.append((f.tell(), len(payload)))
+            f.write(_U32.pack(len(payload)))
+            f.write(payload)
+
+        index_offset = f.tell()
+        f.write(b"".join(_BLOCK_ENTRY.pack(offset, length) for offset, length in blocks))
+        keys = pack(_encode([
+            record.get(key_field) if isinstance(record, dict) and key_field else None
+            for record in records
+        ]))
+        f.write(_U32.pack(len(keys)))
+        f.write(keys)
+        f.write(_TRAILER.pack(index_offset, MAGIC))
+
+
+class SnapshotReader:
+    """Random access to the records of a binary snapshot"""
+
+    def __init__(self, path: str, cached_blocks: int = 8):
+        """
+        Open a snapshot and read its header and index
+
+        Args:
+            path: Snapshot file
+            cached_blocks: Number of decoded blocks kept for repeated lookups
+
+        Raises:
+            SnapshotError: If the file is not a complete binary snapshot
+        """
+        self.path = path
+        self.cached_blocks = cached_blocks
+        self._lock = threading.Lock()
+        self._cache: "OrderedDict[int, List]" = OrderedDict()
+        self._positions: Optional[Dict[str, int]] = None
+        self._file = open(path, "rb")
+        try:
+            size = os.fstat(self._file.fileno()).st_size
+            if size < len(MAGIC) + _TRAILER.size:
+                raise SnapshotError(f"{path} is too short to be a snapshot")
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._parse(size)
+        except Exception:
+            self._file.close()
+            raise
+
+    def _parse(self, size: int):
+        """Read header and index"""
+        view = self._map
+        if view[:len(MAGIC)] != MAGIC:
+            raise SnapshotError(f"{self.path} is not a binary snapshot")
+        index_offset, magic = _TRAILER.unpack_from(view, size - _TRAILER.size)
+        if magic != MAGIC:
+            raise SnapshotError(f"{self.path} is truncated")
+
+        (header_length,) = _U32.unpack_from(view, len(MAGIC))
+        start = len(MAGIC) + _U32.size
+        header = json.loads(view[start:start + header_length])
+
+        self.count: int = header["count"]
+        self.block_size: int = header.get("block_size", BLOCK_SIZE)
+        self.meta: Dict = header.get("meta", {})
+        self.records_field: Optional[str] = header.get("records_field")
+        self.key_field: Optional[str] = header.get("key_field")
+        self.compressed = header.get("compression") == "zlib"
+
+        block_count = -(-self.count // self.block_size)
+        self._blocks: List[Tuple[int, int]] = [
+            _BLOCK_ENTRY.unpack_from(view, index_offset + n * _BLOCK_ENTRY.size)
+            for n in range(block_count)
+        ]
+        keys_offset = index_offset + block_count * _BLOCK_ENTRY.size
+        (keys_length,) = _U32.unpack_from(view, keys_offset)
+        start = keys_offset + _U32.size
+        self.keys: List[Optional[str]] = json.loads(self._unpack(view[start:start + keys_length]))
+
+    def _unpack(self, payload: bytes) -> bytes:
+        """Decompress a stored payload"""
+        return zlib.decompress(payload) if self.compressed else payload
+
+    def __len__(self) -> int:
+        """Number of records"""
+        return self.count
+
+    def _decode_block(self, number: int) -> List:
+        """Decode block `number` (no caching)"""
+        offset, length = self._blocks[number]
+        start = offset + _U32.size
+        return json.loads(self._unpack(self._map[start:start + length]))
+
+    def _block(self, number: int) -> List:
+        """Get a decoded block, through the small block cache"""
+        with self._lock:
+            block = self._cache.get(number)
+            if block is not None:
+                self._cache.move_to_end(number)
+                return block
+        block = self._decode_block(number)
+        with self._lock:
+            self._cache[number] = block
+            while len(self._cache) > self.cached_blocks:
+                self._cache.popitem(last=False)
+        return block
+
+    def record(self, position: int) -> Any:
+        """
+        Get a record by position (a fresh copy of the stored record)
+
+        Args:
+            position: Record number (0-based)
+        """
+        if not 0 <= position < self.count:
+            raise IndexError(position)
+        block = self._block(position // self.block_size)
+        return copy.deepcopy(block[position % self.block_size])
+
+    def position(self, key: str) -> Optional[int]:
+        """
+        Find the position of the record with a key
+
+        Args:
+            key: Value of the record's key field (job 'id' / history 'job_id')
+        """
+        if self._positions is None:
+            positions = {k: n for n, k in enumerate(self.keys) if k is not None}
+            with self._lock:
+                if self._positions is None:
+                    self._positions = positions
+        return self._positions.get(key)
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get the record with a key
+
+        Args:
+            key: Value of the record's key field
+
+        Returns:
+            The record, or None if there is none
+        """
+        position = self.position(key)
+        return None if position is None else self.record(position)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Decode all records in order (bypasses the block cache)"""
+        for number in range(len(self._blocks)):
+            yield from self._decode_block(number)
+
+    def to_dict(self) -> Dict:
+        """Rebuild the full snapshot dictionary (as stored in the JSON format)"""
+        data = dict(self.meta)
+        if self.records_field:
+            data[self.records_field] = list(self)
+        return data
+
+    def close(self):
+        """Release the file"""
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+def read_snapshot(path: str) -> Dict:
+    """
+    Read a whole binary snapshot
+
+    Args:
+        path: Snapshot file
+
+    Returns:
+        Snapshot dictionary in the same shape as the JSON format
+    """
+    with SnapshotReader(path) as reader:
+        return reader.to_dict()
+
+
+def json_to_snapshot(json_path: str, snapshot_path: str, compress: bool = True) -> int:
+    """
+    Convert a JSON snapshot (jobs.json / status_history.json) to the binary format
+
+    Returns:
+        Number of records written
+    """
+    with open(json_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    temp_path = f"{snapshot_path}.{os.getpid()}.tmp"
+    write_snapshot(temp_path, data, compress=compress)
+    os.replace(temp_path, snapshot_path)
+    return sum(len(data[field]) for field in RECORD_FIELDS if isinstance(data.get(field), list))
+
+
+def snapshot_to_json(snapshot_path: str, json_path: str) -> int:
+    """
+    Convert a binary snapshot back to indented JSON
+
+    Returns:
+        Number of records written
+    """
+    data = read_snapshot(snapshot_path)
+    temp_path = f"{json_path}.{os.getpid()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    os.replace(temp_path, json_path)
+    return sum(len(data[field]) for field in RECORD_FIELDS if isinstance(data.get(field), list))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == "to-binary":
+        print(f"Wrote {json_to_snapshot(sys.argv[2], sys.argv[3])} records to {sys.argv[3]}")
+    elif len(sys.argv) == 4 and sys.argv[1] == "to-json":
+        print(f"Wrote {snapshot_to_json(sys.argv[2], sys.argv[3])} records to {sys.argv[3]}")
+    else:
+        print("Usage: python snapshot_format.py to-binary|to-json <source> <destination>")
@@ -0,0 +1,1284 @@
+"""
+SQLite Job Storage Backend
+Optional SQLite engine for JobStorageManager with indexed lookups and partial writes.
+
+The JSON backend re-reads and rewrites the whole jobs.json file on every call.
+This backend keeps each job in its own row (the full record as a JSON blob) and
+mirrors the fields used for lookups into indexed columns, so single-job reads
+and updates no longer scale with the size of the store. Status histories,
+metadata and the error log keep using the JSON files of the base manager.
+
+Usage:
+    storage = SQLiteJobStorageManager(storage_dir='data')
+
+    # One-shot migration of an existing data/jobs.json
+    python sqlite_storage.py migrate data
+"""
+
+import json
+import os
+import sqlite3
+import sys
+from typing import List, Dict, Optional, Any, Iterable, Iterator
+from datetime import datetime
+import logging
+
+try:
+    from storage_manager import JobStorageManager, encode_cursor, decode_cursor, project_job
+    from job_filters import compile_filters
+    from search_index import FIELD_WEIGHTS, SearchIndex, tokenize
+except ImportError:
+    from backend.storage_manager import JobStorageManager, encode_cursor, decode_cursor, project_job
+    from backend.job_filters import compile_filters
+    from backend.search_index import FIELD_WEIGHTS, SearchIndex, tokenize
+
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+SCHEMA_VERSION = 2
+
+# Job fields mirrored into indexed columns (column name -> job key)
+INDEXED_FIELDS = {
+    'job_id': 'job_id',
+    'source': 'source',
+    'location': 'location',
+    'application_status': 'application_status',
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL UNIQUE,
+    job_id TEXT,
+    source TEXT,
+    location TEXT,
+    application_status TEXT,
+    has_score INTEGER NOT NULL DEFAULT 0,
+    overall_score REAL,
+    highlight TEXT,
+    untyped INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_job_id ON jobs(job_id);
+CREATE INDEX IF NOT EXISTS idx_jobs_source ON jobs(source);
+CREATE INDEX IF NOT EXISTS idx_jobs_location ON jobs(location);
+CREATE INDEX IF NOT EXISTS idx_jobs_application_status ON jobs(application_status);
+CREATE INDEX IF NOT EXISTS idx_jobs_overall_score ON jobs(overall_score);
+CREATE INDEX IF NOT EXISTS idx_jobs_highlight ON jobs(highlight);
+CREATE TABLE IF NOT EXISTS schema_info (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# Full-text index over title/company/description, kept in step with the
+# jobs table by triggers (recursive_triggers makes INSERT OR REPLACE fire
+# the delete trigger for the replaced row)
+_SEARCH_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+    title, company, description, tokenize = "unicode61 tokenchars '+#'"
+);
+CREATE TRIGGER IF NOT EXISTS jobs_fts_insert AFTER INSERT ON jobs BEGIN
+    INSERT INTO jobs_fts (rowid, title, company, description)
+    VALUES (new.seq, json_extract(new.data, '$.title'), json_extract(new.data, '$.company'),
+            json_extract(new.data, '$.description'));
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_fts_delete AFTER DELETE ON jobs BEGIN
+    DELETE FROM jobs_fts WHERE rowid = old.seq;
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_fts_update AFTER UPDATE OF data ON jobs
+WHEN json_extract(old.data, '$.title') IS NOT json_extract(new.data, '$.title')
+  OR json_extract(old.data, '$.company') IS NOT json_extract(new.data, '$.company')
+  OR json_extract(old.data, '$.description') IS NOT json_extract(new.data, '$.description')
+BEGIN
+    DELETE FROM jobs_fts WHERE rowid = old.seq;
+    INSERT INTO jobs_fts (rowid, title, company, description)
+    VALUES (new.seq, json_extract(new.data, '$.title'), json_extract(new.data, '$.company'),
+            json_extract(new.data, '$.description'));
+END;
+"""
+
+# Rows with a mirrored field that is not a string (its column is NULL then)
+_UNTYPED_INDEX = "CREATE INDEX IF NOT EXISTS idx_jobs_untyped ON jobs(untyped) WHERE untyped = 1"
+
+# bm25() column weights, as in search_index.FIELD_WEIGHTS
+_SEARCH_RANK = "bm25(jobs_fts, " + ", ".join(f"{float(weight)}" for _, weight in FIELD_WEIGHTS) + ")"
+
+
+def _row_values(job: Dict) -> Dict[str, Any]:
+    """
+    Build the column values for a job record
+
+    Text columns only mirror string values, so that SQL comparisons give
+    the same answers as comparing the record itself; a field holding any
+    other value leaves its column NULL and sets the row's untyped flag.
+
+    Args:
+        job: Job dictionary
+
+    Returns:
+        Dictionary mapping column names to values
+    """
+    values = {}
+    untyped = False
+    for column, key in INDEXED_FIELDS.items():
+        value = job.get(key)
+        if value is not None and not isinstance(value, str):
+            untyped = True
+            value = None
+        values[column] = value
+
+    score = job.get('score')
+    has_score = 'score' in job
+    overall_score = None
+    highlight = None
+    if isinstance(score, dict):
+        overall_score = score.get('overall_score')
+        highlight = score.get('highlight')
+
+    values['id'] = job.get('id')
+    values['has_score'] = 1 if has_score else 0
+    values['overall_score'] = overall_score if isinstance(overall_score, (int, float)) else None
+    values['highlight'] = highlight if isinstance(highlight, str) else None
+    values['untyped'] = 1 if untyped else 0
+    values['data'] = json.dumps(job, ensure_ascii=False)
+    return values
+
+
+class SQLiteJobStore:
+    """Low-level access to the SQLite jobs table"""
+
+    def __init__(self, db_path: str):
+        """
+        Open (and create if needed) the jobs database
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = db_path
+        # A single connection shared between threads; JobStorageManager
+        # serializes access through its own lock.
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA recursive_triggers=ON")
+        self.conn.executescript(_SCHEMA)
+        self._migrate()
+        self.conn.execute(_UNTYPED_INDEX)
+        self.conn.execute(
+            "INSERT OR REPLACE INTO schema_info (key, value) VALUES ('version', ?)",
+            (str(SCHEMA_VERSION),)
+        )
+        self.searchable = self._create_search_index()
+        self.conn.commit()
+
+    def _migrate(self):
+        """Bring a database written by an older schema version up to date"""
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(jobs)")}
+        if 'untyped' in columns:
+            return
+        # Version 1 stored str() of non-string values in the text columns
+        self.conn.execute("ALTER TABLE jobs ADD COLUMN untyped INTEGER NOT NULL DEFAULT 0")
+        untyped = " OR ".join(f"json_type(data, '$.{key}') NOT IN ('text', 'null')"
+                              for key in INDEXED_FIELDS.values())
+        assignments = ", ".join(f"{column} = CASE json_type(data, '$.{key}') WHEN 'text' THEN {column} END"
+                                for column, key in INDEXED_FIELDS.items())
+        self.conn.execute(f"UPDATE jobs SET {assignments}, untyped = 1 WHERE {untyped}")
+        self.conn.execute("UPDATE jobs SET highlight = NULL "
+                          "WHERE highlight IS NOT NULL AND json_type(data, '$.score.highlight') IS NOT 'text'")
+
+    def _create_search_index(self) -> bool:
+        """Create the full-text index (filling it from existing rows); False if FTS5 is unavailable"""
+        try:
+            self.conn.executescript(_SEARCH_SCHEMA)
+        except sqlite3.OperationalError as e:
+            logger.warning(f"Full-text search unavailable: {e}")
+            return False
+        filled = self.conn.execute("SELECT value FROM schema_info WHERE key = 'search_index'").fetchone()
+        if filled is None:
+            self.conn.execute(
+                """INSERT INTO jobs_fts (rowid, title, company, description)
+                   SELECT seq, json_extract(data, '$.title'), json_extract(data, '$.company'),
+                          json_extract(data, '$.description')
+                   FROM jobs WHERE seq NOT IN (SELECT rowid FROM jobs_fts)"""
+            )
+            self.conn.execute("INSERT INTO schema_info (key, value) VALUES ('search_index', '1')")
+        return True
+
+    def close(self):
+        """Close the database connection"""
+        self.conn.close()
+
+    def count(self, where: str = "", params: Iterable = ()) -> int:
+        """Get the number of stored jobs, optionally matching a SQL condition"""
+        sql = "SELECT COUNT(*) FROM jobs"
+        if where:
+            sql += f" WHERE {where}"
+        return self.conn.execute(sql, tuple(params)).fetchone()[0]
+
+    def existing_ids(self, ids: Iterable[str]) -> set:
+        """
+        Get the subset of the given job IDs that are already stored
+
+        Args:
+            ids: Job IDs (hashes) to look up
+
+        Returns:
+            Set of IDs present in the table
+        """
+        ids = list(ids)
+        found = set()
+        # Stay well below SQLITE_MAX_VARIABLE_NUMBER
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            placeholders = ','.join('?' * len(chunk))
+            rows = self.conn.execute(
+                f"SELECT id FROM jobs WHERE id IN ({placeholders})", chunk
+            )
+            found.update(row[0] for row in rows)
+        return found
+
+    def fetch_by_ids(self, ids: Iterable[str]) -> Dict[str, Dict]:
+        """
+        Fetch decoded job records by id
+
+        Args:
+            ids: Job IDs (hashes) to look up
+
+        Returns:
+            Dictionary mapping each stored id to its job
+        """
+        ids = list(ids)
+        found = {}
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            placeholders = ','.join('?' * len(chunk))
+            for job in self.fetch(f"id IN ({placeholders})", chunk):
+                found[job['id']] = job
+        return found
+
+    def insert_jobs(self, jobs: List[Dict], ignore_duplicates: bool = False) -> int:
+        """
+        Insert job records
+
+        Args:
+            jobs: Job dictionaries (must carry an 'id')
+            ignore_duplicates: Skip rows whose id already exists; otherwise an
+                existing id raises sqlite3.IntegrityError (rows are never replaced)
+
+        Returns:
+            Number of rows written
+        """
+        verb = "INSERT OR IGNORE" if ignore_duplicates else "INSERT"
+        # rowcount, unlike total_changes, leaves out rows written by triggers
+        cursor = self.conn.executemany(
+            f"""{verb} INTO jobs
+                (id, job_id, source, location, application_status,
+                 has_score, overall_score, highlight, untyped, data)
+                VALUES (:id, :job_id, :source, :location, :application_status,
+                        :has_score, :overall_score, :highlight, :untyped, :data)""",
+            [_row_values(job) for job in jobs]
+        )
+        return max(cursor.rowcount, 0)
+
+    def update_job(self, job: Dict):
+        """
+        Rewrite a single job row (matched by its 'id')
+
+        Args:
+            job: Full job dictionary
+        """
+        values = _row_values(job)
+        self.conn.execute(
+            """UPDATE jobs SET job_id = :job_id, source = :source, location = :location,
+                   application_status = :application_status, has_score = :has_score,
+                   overall_score = :overall_score, highlight = :highlight, untyped = :untyped,
+                   data = :data
+               WHERE id = :id""",
+            values
+        )
+
+    def fetch(self, where: str = "", params: Iterable = (), limit: Optional[int] = None,
+              order_by: str = "seq") -> List[Dict]:
+        """
+        Fetch decoded job records (in insertion order by default)
+
+        Args:
+            where: Optional SQL condition (without the WHERE keyword)
+            params: Parameters for the condition
+            limit: Optional maximum number of rows
+            order_by: SQL ORDER BY expression
+
+        Returns:
+            List of job dictionaries
+        """
+        sql = "SELECT data FROM jobs"
+        if where:
+            sql += f" WHERE {where}"
+        sql += f" ORDER BY {order_by}"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        return [json.loads(row[0]) for row in self.conn.execute(sql, tuple(params))]
+
+    def fetch_after(self, after_seq: int, where: str = "", params: Iterable = (),
+                    limit: Optional[int] = None) -> List[tuple]:
+        """
+        Fetch (seq, job) pairs with seq greater than after_seq, in insertion order
+
+        Args:
+            after_seq: Row sequence number to resume after
+            where: Optional SQL condition (without the WHERE keyword)
+            params: Parameters for the condition
+            limit: Optional maximum number of rows
+
+        Returns:
+            List of (seq, job dictionary) tuples
+        """
+        sql = "SELECT seq, data FROM jobs WHERE seq > ?"
+        if where:
+            sql += f" AND ({where})"
+        sql += " ORDER BY seq"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        rows = self.conn.execute(sql, (after_seq,) + tuple(params))
+        return [(row[0], json.loads(row[1])) for row in rows]
+
+    def search(self, match: str, where: str = "", params: Iterable = (),
+               limit: Optional[int] = None, offset: int = 0) -> List[tuple]:
+        """
+        Rank the jobs matching a full-text query
+
+        Args:
+            match: FTS5 query
+            where: Optional SQL condition on the jobs table
+            params: Parameters for the condition
+            limit: Optional maximum number of rows
+            offset: Number of ranked rows to skip
+
+        Returns:
+            List of (job dictionary, score) tuples, best first
+        """
+        sql = (f"SELECT jobs.data, -{_SEARCH_RANK} AS score FROM jobs_fts "
+               "JOIN jobs ON jobs.seq = jobs_fts.rowid WHERE jobs_fts MATCH ?")
+        if where:
+            sql += f" AND ({where})"
+        sql += " ORDER BY score DESC, jobs.seq"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)} OFFSET {int(offset)}"
+        rows = self.conn.execute(sql, (match,) + tuple(params))
+        return [(json.loads(row[0]), row[1]) for row in rows]
+
+    def count_matches(self, match: str, where: str = "", params: Iterable = ()) -> int:
+        """Get the number of jobs matching a full-text query (and optional SQL condition)"""
+        sql = "SELECT COUNT(*) FROM jobs_fts JOIN jobs ON jobs.seq = jobs_fts.rowid WHERE jobs_fts MATCH ?"
+        if where:
+            sql += f" AND ({where})"
+        return self.conn.execute(sql, (match,) + tuple(params)).fetchone()[0]
+
+    def delete(self, job_id: str) -> bool:
+        """Delete a job row by id; returns True if a row was removed"""
+        cursor = self.conn.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+        return cursor.rowcount > 0
+
+    def clear(self):
+        """Remove all job rows"""
+        self.conn.execute("DELETE FROM jobs")
+
+    def commit(self):
+        """Commit the current transaction"""
+        self.conn.commit()
+
+    def rollback(self):
+        """Roll back the current transaction"""
+        self.conn.rollback()
+
+
+class SQLiteJobStorageManager(JobStorageManager):
+    """
+    JobStorageManager backed by SQLite instead of jobs.json
+
+    Same public API as JobStorageManager. Jobs live in data/jobs.db; status
+    histories, metadata and error logs are still kept in the JSON files.
+
+    Job ids are unique in the table, so save_jobs(skip_duplicates=False)
+    refreshes an already stored job in place (keeping its USER_FIELDS and
+    position) where the JSON backend would append a second copy.
+    """
+
+    # Job fields set by the user or by scoring rather than by the scraper
+    USER_FIELDS = JobStorageManager.STATUS_FIELDS + ("score", "scored_at")
+
+    def __init__(self, storage_dir: str = 'data', db_filename: str = 'jobs.db',
+                 migrate_json: bool = True):
+        """
+        Initialize the SQLite storage manager
+
+        Args:
+            storage_dir: Directory to store the database and JSON files
+            db_filename: Name of the SQLite database file
+            migrate_json: Import an existing jobs.json when the database is empty
+        """
+        self.db_path = os.path.join(storage_dir, db_filename)
+        self.migrate_json = migrate_json
+        self.store: Optional[SQLiteJobStore] = None
+        super().__init__(storage_dir)
+
+    def _initialize_job_store(self):
+        """Open the SQLite database and migrate jobs.json on first use"""
+        self.store = SQLiteJobStore(self.db_path)
+
+        if self.migrate_json and self.store.count() == 0 and os.path.exists(self.jobs_file):
+            jobs = self._read_json_jobs()
+            if jobs:
+                migrated = self._import_jobs(jobs)
+                logger.info(f"Migrated {migrated} jobs from {self.jobs_file} to {self.db_path} "
+                            f"({len(jobs) - migrated} skipped)")
+
+    def _read_json_jobs(self) -> Optional[List[Dict]]:
+        """Load the JSON backend's jobs (jobs.json plus its mutation log)"""
+        jobs = self._job_table()
+        if self._jobs is None:
+            return None
+        jobs = list(jobs)
+        # The JSON job table is not used by this backend afterwards
+        self._invalidate_job_table()
+        return jobs
+
+    def _import_jobs(self, jobs: List[Dict]) -> int:
+        """Insert already-stored job records, keeping their ids (the first record per id wins)"""
+        records = []
+        for job in jobs:
+            if not job.get('id'):
+                job['id'] = self._generate_job_hash(job)
+            records.append(job)
+        existing = self.store.existing_ids(job['id'] for job in records)
+        written = self.store.insert_jobs(records, ignore_duplicates=True)
+        self.store.commit()
+
+        if written < len(records):
+            seen = set(existing)
+            skipped_ids = []
+            for job in records:
+                if job['id'] in seen:
+                    skipped_ids.append(job['id'])
+                seen.add(job['id'])
+            logger.warning(f"Skipped {len(records) - written} jobs whose id was already stored "
+                           f"(already in the database: {len(existing)}): {', '.join(skipped_ids[:20])}"
+                           f"{' ...' if len(skipped_ids) > 20 else ''}")
+        return written
+
+    def _find_by_job_id(self, job_id: str) -> Optional[Dict]:
+        """Find the first job whose 'job_id' field matches (compared as strings)"""
+        job_id = str(job_id)
+        # A non-string job_id leaves the column NULL, so untyped rows are compared here
+        for job in self.store.fetch("job_id = ? OR untyped = 1", (job_id,)):
+            if str(job.get('job_id')) == job_id:
+                return job
+        return None
+
+    def save_jobs(self, jobs: List[Dict], source: str = "unknown",
+                  skip_duplicates: bool = True) -> Dict:
+        """
+        Save scraped jobs to storage with duplicate detection
+
+        Args:
+            jobs: List of job dictionaries
+            source: Source of the jobs (e.g., 'indeed', 'glassdoor')
+            skip_duplicates: Whether to skip duplicate jobs (otherwise a
+                duplicate refreshes the stored job and counts as updated)
+
+        Returns:
+            Dictionary with save results
+        """
+        with self.lock:
+            try:
+                added_count = 0
+                updated_count = 0
+                skipped_count = 0
+                invalid_count = 0
+
+                candidates = []
+                for job in jobs:
+                    is_valid, error_msg = self._validate_job(job)
+                    if not is_valid:
+                        invalid_count += 1
+                        logger.warning(f"Invalid job data: {error_msg}")
+                        continue
+                    candidates.append((self._generate_job_hash(job), job))
+
+                # Only the incoming hashes are looked up, via the primary key index
+                existing_hashes = self.store.existing_ids(h for h, _ in candidates)
+
+                new_jobs = {}
+                refreshed_jobs = {}
+                for job_hash, job in candidates:
+                    duplicate = job_hash in existing_hashes or job_hash in new_jobs
+                    if skip_duplicates and duplicate:
+                        skipped_count += 1
+                        continue
+
+                    job['source'] = source
+                    job['scraped_at'] = datetime.now().isoformat()
+                    job['id'] = job_hash
+
+                    if job_hash in existing_hashes:
+                        refreshed_jobs[job_hash] = job
+                    else:
+                        new_jobs[job_hash] = job
+                    if duplicate:
+                        updated_count += 1
+                    else:
+                        added_count += 1
+
+                self.store.insert_jobs(list(new_jobs.values()))
+                self._refresh_jobs(list(refreshed_jobs.values()))
+                self.store.commit()
+
+                self._update_metadata(success=True)
+
+                total = self.store.count()
+                logger.info(f"Saved jobs: {added_count} added, {updated_count} updated, "
+                            f"{skipped_count} skipped, {invalid_count} invalid")
+
+                return {
+                    "success": True,
+                    "added": added_count,
+                    "updated": updated_count,
+                    "skipped": skipped_count,
+                    "invalid": invalid_count,
+                    "total": total
+                }
+
+            except Exception as e:
+                logger.error(f"Error saving jobs: {e}")
+                self.store.rollback()
+                self._update_metadata(success=False)
+                self._log_error("save_jobs", str(e))
+                return {
+                    "success": False,
+                    "error": str(e),
+                    "added": 0,
+                    "updated": 0,
+                    "skipped": 0,
+                    "invalid": 0
+                }
+
+    def _refresh_jobs(self, jobs: List[Dict]):
+        """Rewrite stored jobs with newly scraped data, keeping their USER_FIELDS (lock held)"""
+        stored = self.store.fetch_by_ids(job['id'] for job in jobs)
+        for job in jobs:
+            current = stored[job['id']]
+            for field in self.USER_FIELDS:
+                if field in current:
+                    job[field] = current[field]
+                else:
+                    job.pop(field, None)
+            self.store.update_job(job)
+
+    def get_all_jobs(self, filters: Optional[Dict] = None) -> List[Dict]:
+        """
+        Retrieve all stored jobs with optional filtering
+
+        Conditions on indexed columns are evaluated in SQL; any other
+        conditions are checked against the decoded records.
+
+        Args:
+            filters: Optional dictionary with filter criteria
+
+        Returns:
+            List of job dictionaries
+        """
+        with self.lock:
+            try:
+                where, params, remaining = self._split_filters(filters)
+                jobs = self.store.fetch(where, params)
+
+                if remaining:
+                    jobs = [job for job in jobs if self._matches(job, remaining)]
+                return jobs
+
+            except Exception as e:
+                logger.error(f"Error retrieving jobs: {e}")
+                return []
+
+    def get_jobs_page(self, limit: Optional[int] = 50, cursor: Optional[str] = None,
+                      fields: Optional[List[str]] = None,
+                      filters: Optional[Dict] = None, offset: int = 0) -> Dict:
+        """
+        Retrieve one page of stored jobs
+
+        Cursors carry the row sequence number, so resuming is an indexed
+        range scan (WHERE seq > ?) and stays valid across writes.
+
+        Args:
+            limit: Maximum number of jobs to return (None for all remaining)
+            cursor: Token from a previous page's next_cursor
+            fields: Optional list of top-level fields to return ('id' is always kept)
+            filters: Optional filters, as in get_all_jobs
+            offset: Number of matching jobs to skip (ignored when a cursor is given)
+
+        Returns:
+            Dict with jobs, count, total and next_cursor (None on the last page)
+
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        if limit is not None and limit < 1:
+            raise ValueError("limit must be a positive integer")
+        after_seq = 0
+        if cursor:
+            position = decode_cursor(cursor)
+            if not isinstance(position.get("s"), int):
+                raise ValueError(f"Invalid cursor: {cursor!r}")
+            after_seq = position["s"]
+
+        with self.lock:
+            where, params, remaining = self._split_filters(filters)
+            skip = offset if not cursor else 0
+            wanted = None if limit is None else limit + 1
+
+            matched = []
+            if not remaining:
+                total = self.store.count(where, params)
+                fetch_limit = None if wanted is None else wanted + skip
+                matched = self.store.fetch_after(after_seq, where, params, fetch_limit)[skip:]
+            else:
+                total = sum(1 for job in self.store.fetch(where, params) if self._matches(job, remaining))
+                # Filter the rest in Python, reading rows in bounded chunks
+                chunk_size = max(wanted or 0, 500)
+                last_seq = after_seq
+                while wanted is None or len(matched) < wanted:
+                    rows = self.store.fetch_after(last_seq, where, params, chunk_size)
+                    if not rows:
+                        break
+                    for seq, job in rows:
+                        if not self._matches(job, remaining):
+                            continue
+                        if skip:
+                            skip -= 1
+                            continue
+                        matched.append((seq, job))
+                    last_seq = rows[-1][0]
+
+            next_cursor = None
+            if limit is not None and len(matched) > limit:
+                matched = matched[:limit]
+                next_cursor = encode_cursor({"s": matched[-1][0]}) if matched else None
+
+            page = [project_job(job, fields) for _, job in matched]
+            return {
+                "jobs": page,
+                "count": len(page),
+                "total": total,
+                "next_cursor": next_cursor
+            }
+
+    def iter_jobs(self, filters: Optional[Dict] = None, batch_size: int = 1000) -> Iterator[Dict]:
+        """
+        Iterate over stored jobs in insertion order, one batch of rows at a time
+
+        Args:
+            filters: Optional filters, as in get_all_jobs
+            batch_size: Number of rows read per query
+
+        Yields:
+            Job dictionaries
+        """
+        last_seq = 0
+        while True:
+            with self.lock:
+                where, params, remaining = self._split_filters(filters)
+                rows = self.store.fetch_after(last_seq, where, params, batch_size)
+            if not rows:
+                return
+            for _, job in rows:
+                if not remaining or self._matches(job, remaining):
+                    yield job
+            last_seq = rows[-1][0]
+
+    def _split_filters(self, filters: Optional[Any]) -> tuple:
+        """
+        Split filters into a SQL condition and Python-side checks
+
+        Conditions on the mirrored columns (id, job_id, source, location,
+        application_status, score.overall_score, score.highlight) are
+        evaluated in SQL when the operands are of the column's type (text
+        columns only mirror string values, see _row_values); any other
+        condition is checked against the decoded records.
+
+        Args:
+            filters: Optional filter criteria, as in get_all_jobs
+
+        Returns:
+            Tuple of (where, params, remaining JobFilter or None)
+
+        Raises:
+            ValueError: If the filters are invalid
+        """
+        job_filter = compile_filters(filters)
+        if job_filter is None:
+            return "", [], None
+
+        clauses = []
+        params = []
+        remaining = {}
+        for field, clause in job_filter.clauses.items():
+            sql = self._clause_sql(field, clause)
+            if sql is None:
+                remaining[field] = job_filter.filters[field]
+            else:
+                clauses.append(sql[0])
+                params.extend(sql[1])
+        return " AND ".join(clauses), params, compile_filters(remaining)
+
+    @staticmethod
+    def _clause_sql(field: str, clause) -> Optional[tuple]:
+        """
+        Translate one filter clause to SQL over the mirrored columns
+
+        Returns:
+            Tuple of (condition, params), or None if the clause has to be
+            checked in Python
+        """
+        if field in INDEXED_FIELDS or field == 'id':
+            column, kind = field, str
+        elif field == 'score.overall_score':
+            column, kind = 'overall_score', (int, float)
+        elif field == 'score.highlight':
+            column, kind = 'highlight', str
+        elif field == 'score' and clause.operators == ("exists",):
+            return ("has_score = ?", [1 if clause.exists else 0])
+        else:
+            return None
+
+        def fits(value):
+            return isinstance(value, kind) and (kind is not str or value != "")
+
+        conditions = []
+        params = []
+        for operator in clause.operators:
+            if operator in ("eq", "in"):
+                values = clause.candidate_values()
+                if not all(fits(value) for value in values):
+                    return None
+                if not values:
+                    conditions.append("0")
+                else:
+                    conditions.append(f"{column} IN ({', '.join('?' for _ in values)})")
+                    params.extend(values)
+            elif operator == "range":
+                for bound, op in ((clause.lower, ">=" if clause.lower_inclusive else ">"),
+                                  (clause.upper, "<=" if clause.upper_inclusive else "<")):
+                    if bound is None:
+                        continue
+                    if not fits(bound):
+                        return None
+                    conditions.append(f"{column} {op} ?")
+                    params.append(bound)
+            elif operator == "prefix" and kind is str and clause.prefix:
+                # A range on the column, so the index can be used
+                conditions.append(f"{column} >= ? AND {column} < ?")
+                params.extend([clause.prefix, clause.prefix + "\U0010ffff"])
+            else:
+                return None
+        return " AND ".join(conditions), params
+
+    @staticmethod
+    def _matches(job: Dict, remaining) -> bool:
+        """Check a decoded job against the filter conditions left to Python"""
+        return remaining(job)
+
+    def get_job_by_id(self, job_id: str) -> Optional[Dict]:
+        """
+        Retrieve a specific job by ID
+
+        Args:
+            job_id: Job ID (hash)
+
+        Returns:
+            Job dictionary or None if not found
+        """
+        with self.lock:
+            try:
+                rows = self.store.fetch("id = ?", (job_id,), limit=1)
+                return rows[0] if rows else None
+            except Exception as e:
+                logger.error(f"Error retrieving job {job_id}: {e}")
+                return None
+
+    def delete_job(self, job_id: str) -> bool:
+        """
+        Delete a job by ID
+
+        Args:
+            job_id: Job ID to delete
+
+        Returns:
+            True if successful, False otherwise
+        """
+        with self.lock:
+            try:
+                deleted = self.store.delete(job_id)
+                self.store.commit()
+                if not deleted:
+                    logger.warning(f"Job {job_id} not found")
+                return deleted
+            except Exception as e:
+                logger.error(f"Error deleting job: {e}")
+                self.store.rollback()
+                return False
+
+    def clear_all_jobs(self) -> bool:
+        """
+        Clear all stored jobs
+
+        Returns:
+            True if successful, False otherwise
+        """
+        with self.lock:
+            try:
+                self.store.clear()
+                self.store.commit()
+                return True
+            except Exception as e:
+                logger.error(f"Error clearing jobs: {e}")
+                self.store.rollback()
+                return False
+
+    def get_statistics(self) -> Dict:
+        """
+        Get storage statistics
+
+        Returns:
+            Dictionary with statistics
+        """
+        with self.lock:
+            try:
+                sources = {
+                    (source if source is not None else 'unknown'): count
+                    for source, count in self.store.conn.execute(
+                        "SELECT source, COUNT(*) FROM jobs GROUP BY source"
+                    )
+                }
+
+                return {
+                    "total_jobs": self.store.count(),
+                    "jobs_by_source": sources,
+                    "metadata": self.metadata_buffer.metadata(),
+                    "error_count": self.metadata_buffer.error_count(),
+                    "storage_size_bytes": os.path.getsize(self.db_path) if os.path.exists(self.db_path) else 0,
+                    "backend": "sqlite",
+                    "metadata_buffer": self.metadata_buffer.stats(),
+                    "locks": self.get_lock_statistics()
+                }
+
+            except Exception as e:
+                logger.error(f"Error getting statistics: {e}")
+                return {}
+
+    def update_job_score(self, job_id: str, score_data: Dict) -> bool:
+        """
+        Update the score and highlight for a specific job.
+
+        Args:
+            job_id: Job ID to update
+            score_data: Dictionary with score information
+
+        Returns:
+            True if successful, False otherwise
+        """
+        with self.lock:
+            try:
+                rows = self.store.fetch("id = ?", (job_id,), limit=1)
+                if not rows:
+                    logger.warning(f"Job {job_id} not found for score update")
+                    return False
+
+                job = rows[0]
+                job['score'] = score_data
+                job['scored_at'] = datetime.now().isoformat()
+                self.store.update_job(job)
+                self.store.commit()
+
+                logger.info(f"Updated score for job {job_id}")
+                return True
+
+            except Exception as e:
+                logger.error(f"Error updating job score: {e}")
+                self.store.rollback()
+                return False
+
+    def update_jobs_scores(self, job_scores: Dict[str, Dict]) -> Dict:
+        """
+        Update scores for multiple jobs at once.
+
+        Args:
+            job_scores: Dictionary mapping job_id to score_data
+
+        Returns:
+            Dictionary with update results
+        """
+        with self.lock:
+            try:
+                ids = list(job_scores)
+                found = self.store.existing_ids(ids)
+
+                updated_count = 0
+                for start in range(0, len(ids), 500):
+                    chunk = [job_id for job_id in ids[start:start + 500] if job_id in found]
+                    if not chunk:
+                        continue
+                    placeholders = ','.join('?' * len(chunk))
+                    for job in self.store.fetch(f"id IN ({placeholders})", chunk):
+                        job['score'] = job_scores[job['id']]
+                        job['scored_at'] = datetime.now().isoformat()
+                        self.store.update_job(job)
+                        updated_count += 1
+                self.store.commit()
+
+                not_found_count = len(ids) - len(found)
+                logger.info(f"Updated scores for {updated_count} jobs, {not_found_count} not found")
+
+                return {
+                    "success": True,
+                    "updated": updated_count,
+                    "not_found": not_found_count,
+                    "total_requested": len(job_scores)
+                }
+
+            except Exception as e:
+                logger.error(f"Error updating job scores: {e}")
+                self.store.rollback()
+                return {
+                    "success": False,
+                    "error": str(e),
+                    "updated": 0,
+                    "not_found": 0
+                }
+
+    def get_jobs_by_highlight(self, highlight: str) -> List[Dict]:
+        """
+        Get all jobs with a specific highlight color.
+
+        Args:
+            highlight: Highlight color ('red', 'yellow', 'white')
+
+        Returns:
+            List of jobs with the specified highlight
+        """
+        with self.lock:
+            try:
+                return self.store.fetch("highlight = ?", (highlight,))
+            except Exception as e:
+                logger.error(f"Error getting jobs by highlight: {e}")
+                return []
+
+    def get_scored_jobs(self, min_score: Optional[float] = None,
+                        max_score: Optional[float] = None,
+                        top_k: Optional[int] = None) -> List[Dict]:
+        """
+        Get jobs filtered by score range.
+
+        Args:
+            min_score: Minimum score (inclusive)
+            max_score: Maximum score (inclusive)
+            top_k: If given, return only the top_k highest-scoring jobs
+                   (best first; jobs without an overall_score are not ranked)
+
+        Returns:
+            List of jobs within the score range (in storage order unless top_k is given)
+        """
+        with self.lock:
+            try:
+                # Scored jobs without an overall_score count as 0 for the
+                # lower bound and 100 for the upper bound, as in the JSON backend.
+                clauses = ["has_score = 1"]
+                params: List[Any] = []
+                if min_score is not None:
+                    clauses.append("(overall_score >= ? OR (overall_score IS NULL AND ? <= 0))")
+                    params.extend([min_score, min_score])
+                if max_score is not None:
+                    clauses.append("(overall_score <= ? OR (overall_score IS NULL AND ? >= 100))")
+                    params.extend([max_score, max_score])
+                if top_k is not None:
+                    if top_k <= 0:
+                        return []
+                    clauses.append("overall_score IS NOT NULL")
+                    return self.store.fetch(" AND ".join(clauses), params, limit=top_k,
+                                            order_by="overall_score DESC, seq")
+                return self.store.fetch(" AND ".join(clauses), params)
+            except Exception as e:
+                logger.error(f"Error getting scored jobs: {e}")
+                return []
+
+    def search_jobs(self, query: str, limit: int = 20, offset: int = 0,
+                    fields: Optional[List[str]] = None, filters: Optional[Dict] = None) -> Dict:
+        """
+        Full-text search over job title, company and description
+
+        Uses the FTS5 index (ranked by bm25() with the same field weights as
+        the in-memory index); conditions on indexed columns join the query
+        in SQL. Falls back to ranking in memory when SQLite lacks FTS5.
+
+        Args:
+            query: Free-text query
+            limit: Maximum number of jobs to return
+            offset: Number of ranked jobs to skip
+            fields: Optional list of top-level fields to return ('id' is always kept)
+            filters: Optional filters, as in get_all_jobs
+
+        Returns:
+            Dict with jobs (best first, each with a search_score), count and total
+
+        Raises:
+            ValueError: If limit, offset or the filters are invalid
+        """
+        if limit < 1:
+            raise ValueError("limit must be a positive integer")
+        if offset < 0:
+            raise ValueError("offset must not be negative")
+        terms = list(dict.fromkeys(tokenize(query)))
+
+        with self.lock:
+            where, params, remaining = self._split_filters(filters)
+            if not terms:
+                ranked, total = [], 0
+            elif not self.store.searchable:
+                rows = self.store.fetch_after(0, where, params)
+                jobs_by_seq = dict(rows)
+                accept = None
+                if remaining:
+                    accept = lambda seq: self._matches(jobs_by_seq[seq], remaining)
+                hits, total = SearchIndex.build(rows).search(query, limit, offset, accept)
+                ranked = [(jobs_by_seq[seq], score) for seq, score in hits]
+            else:
+                match = " OR ".join(f'"{term}"' for term in terms)
+                if not remaining:
+                    total = self.store.count_matches(match, where, params)
+                    ranked = self.store.search(match, where, params, limit, offset)
+                else:
+                    ranked = [(job, score) for job, score in self.store.search(match, where, params)
+                              if self._matches(job, remaining)]
+                    total = len(ranked)
+                    ranked = ranked[offset:offset + limit]
+
+        page = []
+        for job, score in ranked:
+            job = project_job(job, fields)
+            job['search_score'] = round(score, 4)
+            page.append(job)
+        return {
+            "jobs": page,
+            "count": len(page),
+            "total": total
+        }
+
+    def update_job_status(self, job_id: str, status: str,
+                         applied_date: Optional[str] = None,
+                         notes: Optional[str] = None) -> Dict:
+        """
+        Update application status for a job
+
+        Args:
+            job_id: Job identifier
+            status: Application status (Applied, Interview, Offer, Rejected, Pending)
+            applied_date: Date when applied (ISO format)
+            notes: Additional notes about the application
+
+        Returns:
+            Dict with success status and details
+        """
+        with self.lock:
+            try:
+                job = self._find_by_job_id(job_id)
+                if job is None:
+                    return {
+                        "success": False,
+                        "error": f"Job not found: {job_id}"
+                    }
+
+                self._apply_status_update(job, status, applied_date, notes)
+                self.store.update_job(job)
+                self.store.commit()
+
+                return {
+                    "success": True,
+                    "job_id": job_id,
+                    "status": status,
+                    "message": "Status updated successfully"
+                }
+
+            except Exception as e:
+                logger.error(f"Error updating job status: {e}")
+                self.store.rollback()
+                return {
+                    "success": False,
+                    "error": str(e)
+                }
+
+    def batch_update_job_statuses(self, status_updates: List[Dict]) -> Dict:
+        """
+        Update application statuses for multiple jobs
+
+        Args:
+            status_updates: List of dicts with job_id, status, applied_date, notes
+
+        Returns:
+            Dict with batch update results
+        """
+        with self.lock:
+            try:
+                updated_count = 0
+                not_found = []
+
+                for update in status_updates:
+                    job_id = str(update.get("job_id"))
+                    job = self._find_by_job_id(job_id)
+                    if job is None:
+                        not_found.append(job_id)
+                        continue
+
+                    self._apply_status_update(
+                        job,
+                        update.get("new_status") or update.get("status"),
+                        update.get("applied_date"),
+                        update.get("notes"),
+                        timestamp=update.get("timestamp")
+                    )
+                    self.store.update_job(job)
+                    updated_count += 1
+
+                self.store.commit()
+
+                return {
+                    "success": True,
+                    "updated": updated_count,
+                    "not_found": len(not_found),
+                    "not_found_ids": not_found,
+                    "total_requested": len(status_updates)
+                }
+
+            except Exception as e:
+                logger.error(f"Error in batch status update: {e}")
+                self.store.rollback()
+                return {
+                    "success": False,
+                    "error": str(e),
+                    "updated": 0
+                }
+
+    def get_status_summary(self) -> Dict:
+        """
+        Get summary of application statuses across all jobs
+
+        Counts come from the indexed application_status column; only the
+        ten most recent applications are decoded.
+
+        Returns:
+            Dict with status counts and statistics
+        """
+        with self.lock:
+            try:
+                status_counts = dict(self.store.conn.execute(
+                    "SELECT application_status, COUNT(*) FROM jobs "
+                    "WHERE application_status IS NOT NULL AND application_status != '' "
+                    "GROUP BY application_status"
+                ).fetchall())
+                total_jobs = self.store.count()
+                recent_jobs = self.store.fetch(
+                    "json_extract(data, '$.applied_date') IS NOT NULL "
+                    "AND json_extract(data, '$.applied_date') != ''",
+                    limit=10, order_by="json_extract(data, '$.applied_date') DESC, seq"
+                )
+            except Exception as e:
+                logger.error(f"Error getting status summary: {e}")
+                return {
+                    "total_jobs": 0,
+                    "status_counts": {},
+                    "error": str(e)
+                }
+
+        jobs_with_status = sum(status_counts.values())
+        return {
+            "total_jobs": total_jobs,
+            "status_counts": status_counts,
+            "jobs_with_status": jobs_with_status,
+            "jobs_without_status": total_jobs - jobs_with_status,
+            "recent_applications": [
+                {
+                    "job_id": job.get("job_id"),
+                    "title": job.get("title"),
+                    "company": job.get("company"),
+                    "status": job.get("application_status"),
+                    "applied_date": job.get("applied_date")
+                }
+                for job in recent_jobs
+            ]
+        }
+
+    def get_jobs_by_status(self, status: str) -> List[Dict]:
+        """
+        Get all jobs with a specific application status
+
+        Args:
+            status: Application status to filter by
+
+        Returns:
+            List of jobs with the specified status
+        """
+        with self.lock:
+            try:
+                return self.store.fetch("application_status = ?", (status,))
+            except Exception as e:
+                logger.error(f"Error getting jobs by status: {e}")
+                return []
+
+
+def migrate_json_to_sqlite(storage_dir: str = 'data', db_filename: str = 'jobs.db') -> Dict:
+    """
+    One-shot migration of data/jobs.json (plus its mutation log) into the SQLite backend
+
+    Jobs already present in the database (same id) are left untouched, so the
+    migration can safely be re-run.
+
+    Args:
+        storage_dir: Directory holding jobs.json
+        db_filename: Name of the SQLite database file to create/fill
+
+    Returns:
+        Dictionary with migration results
+    """
+    jobs_file = os.path.join(storage_dir, 'jobs.json')
+    if not os.path.exists(jobs_file):
+        return {"success": False, "error": f"File not found: {jobs_file}", "migrated": 0}
+
+    storage = SQLiteJobStorageManager(storage_dir, db_filename=db_filename, migrate_json=False)
+    try:
+        with storage.lock:
+            jobs = storage._read_json_jobs()
+        if jobs is None:
+            return {"success": False, "error": f"Could not parse {jobs_file}", "migrated": 0}
+
+        with storage.lock:
+            migrated = storage._import_jobs(jobs)
+
+        logger.info(f"Migrated {migrated} of {len(jobs)} jobs into {storage.db_path}")
+        return {
+            "success": True,
+            "migrated": migrated,
+            "skipped": len(jobs) - migrated,
+            "total": storage.store.count(),
+            "db_path": storage.db_path
+        }
+    finally:
+        storage.store.close()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) >= 2 and sys.argv[1] == "migrate":
+        target_dir = sys.argv[2] if len(sys.argv) > 2 else 'data'
+        print(json.dumps(migrate_json_to_sqlite(target_dir), indent=2))
+    else:
+        print("Usage: python sqlite_storage.py migrate [storage_dir]")
@@ -0,0 +1,242 @@
+"""
+Status Aggregates
+Running totals behind the status summary endpoints.
+
+JobStatusAggregates follows the job table (like ScoreIndex, jobs are
+identified by table sequence number): the jobs in each status (so counts
+are set sizes and status filters need not scan the table) plus the jobs
+with an applied_date, kept sorted so the most recent applications are read
+from the end of a list.
+
+HistoryAggregates follows the status history summaries (see
+application_status.HistorySummary): per-status counts, the transition total
+and what is needed to average whole days in the current status without
+visiting every history. For a status that started at epoch s, days elapsed
+at time now is floor((now - s) / 86400). Splitting s into whole days d and
+an offset o (and now into N and r) gives N - d - (1 if o > r else 0), so
+the sum over all histories is n * N - sum(d) minus the number of offsets
+greater than r, counted with bisect over the sorted offsets. Histories are
+also kept sorted by the time their current status started, so the ones
+that have been waiting longest are a prefix of that list.
+"""
+
+import bisect
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+# Job fields the job-side aggregates depend on
+AGGREGATE_FIELDS = ("application_status", "applied_date")
+
+SECONDS_PER_DAY = 86400
+
+
+class JobStatusAggregates:
+    """Status counts and applied-date order over the job table"""
+
+    def __init__(self):
+        """Initialize empty aggregates"""
+        self._entries: Dict[int, Tuple[Any, Optional[str]]] = {}
+        self._members: Dict[Any, Set[int]] = {}
+        # (applied_date, -seq): the end of the list is the most recent
+        # application, ties in table order
+        self._applied: List[tuple] = []
+
+    def add(self, seq: int, job: Dict) -> None:
+        """
+        Count (or re-count) a job
+
+        Args:
+            seq: Table sequence number of the job
+            job: The job record
+        """
+        if seq in self._entries:
+            self.remove(seq)
+
+        status = job.get("application_status") or None
+        applied_date = job.get("applied_date") or None
+        if status is None and applied_date is None:
+            return
+        if applied_date is not None and not isinstance(applied_date, str):
+            applied_date = str(applied_date)
+
+        if status is not None:
+            self._members.setdefault(status, set()).add(seq)
+        if applied_date is not None:
+            bisect.insort(self._applied, (applied_date, -seq))
+        self._entries[seq] = (status, applied_date)
+
+    def remove(self, seq: int) -> None:
+        """
+        Stop counting a job (no-op if it is not counted)
+
+        Args:
+            seq: Table sequence number of the job
+        """
+        entry = self._entries.pop(seq, None)
+        if entry is None:
+            return
+        status, applied_date = entry
+
+        if status is not None:
+            members = self._members[status]
+            members.discard(seq)
+            if not members:
+                del self._members[status]
+        if applied_date is not None:
+            position = bisect.bisect_left(self._applied, (applied_date, -seq))
+            if position < len(self._applied) and self._applied[position] == (applied_date, -seq):
+                del self._applied[position]
+
+    def status_counts(self) -> Dict[Any, int]:
+        """Number of jobs per application status"""
+        return {status: len(members) for status, members in self._members.items()}
+
+    def with_status(self) -> int:
+        """Number of jobs that have an application status"""
+        return sum(len(members) for members in self._members.values())
+
+    def jobs_with_status(self, status: Any) -> List[int]:
+        """
+        Get the jobs in an application status, in storage order
+
+        Args:
+            status: Application status
+
+        Returns:
+            Sorted list of sequence numbers
+        """
+        try:
+            return sorted(self._members.get(status, ()))
+        except TypeError:
+            # Unhashable status: no job can be filed under it
+            return []
+
+    def recent(self, limit: int = 10) -> List[int]:
+        """
+        Get the most recently applied jobs
+
+        Args:
+            limit: Maximum number of jobs
+
+        Returns:
+            Sequence numbers, latest applied_date first
+        """
+        if limit <= 0:
+            return []
+        return [-negated for _, negated in reversed(self._applied[-limit:])]
+
+
+class HistoryAggregates:
+    """Status counts, transition total and day sums over history summaries"""
+
+    def __init__(self):
+        """Initialize empty aggregates"""
+        self._entries: Dict[str, tuple] = {}
+        self._counts: Dict[str, int] = {}
+        self._transitions = 0
+        self._day_total = 0
+        self._offsets: List[float] = []
+        # (since, job_id), oldest current status first
+        self._by_since: List[Tuple[float, str]] = []
+
+    def __len__(self) -> int:
+        """Number of histories counted"""
+        return len(self._entries)
+
+    def set(self, job_id: str, summary: tuple) -> None:
+        """
+        Count (or re-count) a history
+
+        Args:
+            job_id: Job identifier
+            summary: The history's HistorySummary
+        """
+        self.discard(job_id)
+        status, transitions, since = summary[0], summary[1], summary[2]
+        day, offset = divmod(since, SECONDS_PER_DAY)
+        day = int(day)
+
+        self._counts[status] = self._counts.get(status, 0) + 1
+        self._transitions += transitions
+        self._day_total += day
+        bisect.insort(self._offsets, offset)
+        bisect.insort(self._by_since, (since, job_id))
+        self._entries[job_id] = (summary, day, offset)
+
+    def discard(self, job_id: str) -> None:
+        """
+        Stop counting a history (no-op if it is not counted)
+
+        Args:
+            job_id: Job identifier
+        """
+        entry = self._entries.pop(job_id, None)
+        if entry is None:
+            return
+        summary, day, offset = entry
+        status, transitions, since = summary[0], summary[1], summary[2]
+
+        remaining = self._counts[status] - 1
+        if remaining:
+            self._counts[status] = remaining
+        else:
+            del self._counts[status]
+        self._transitions -= transitions
+        self._day_total -= day
+        position = bisect.bisect_left(self._offsets, offset)
+        if position < len(self._offsets) and self._offsets[position] == offset:
+            del self._offsets[position]
+        position = bisect.bisect_left(self._by_since, (since, job_id))
+        if position < len(self._by_since) and self._by_since[position] == (since, job_id):
+            del self._by_since[position]
+
+    def started_before(self, cutoff: float) -> List[tuple]:
+        """
+        Get the histories whose current status started at or before a time
+
+        Args:
+            cutoff: Epoch seconds
+
+        Returns:
+            (job_id, summary) pairs, oldest current status first
+        """
+        end = bisect.bisect_left(self._by_since, (cutoff,))
+        while end < len(self._by_since) and self._by_since[end][0] <= cutoff:
+            end += 1
+        return [(job_id, self._entries[job_id][0]) for _, job_id in self._by_since[:end]]
+
+    def total_days(self, now: Optional[float] = None) -> int:
+        """
+        Sum of whole days every history has spent in its current status
+
+        Args:
+            now: Epoch seconds to measure at (default: current time)
+        """
+        count = len(self._entries)
+        if not count:
+            return 0
+        day, offset = divmod(time.time() if now is None else now, SECONDS_PER_DAY)
+        later = count - bisect.bisect_right(self._offsets, offset)
+        return count * int(day) - self._day_total - later
+
+    def statistics(self, now: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Get the totals in ApplicationStatusManager.get_statistics() form
+
+        Args:
+            now: Epoch seconds to measure at (default: current time)
+        """
+        count = len(self._entries)
+        if not count:
+            return {
+                "total_jobs": 0,
+                "status_counts": {},
+                "average_transitions": 0,
+                "average_days_in_current_status": 0
+            }
+        return {
+            "total_jobs": count,
+            "status_counts": dict(self._counts),
+            "average_transitions": round(self._transitions / count, 2),
+            "average_days_in_current_status": round(self.total_days(now) / count, 2)
+        }
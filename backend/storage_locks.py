@@ -0,0 +1,325 @@
+"""
+Storage Locks
+Locking primitives used by the storage layer.
+
+ReadWriteLock lets any number of readers share the job table while writers
+get exclusive access; StripedLock serializes mutations of the same job
+without blocking mutations of other jobs. InterProcessLock extends this to
+several worker processes sharing one storage directory: an fcntl lock on a
+lock file, which also carries a version counter that writers bump so other
+processes know their cached data is stale. All of them record how long
+callers waited to acquire them, which is reported through get_statistics().
+"""
+
+import os
+import time
+import zlib
+from contextlib import contextmanager
+from threading import Condition, Lock
+from typing import Dict, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, single worker process only
+    fcntl = None
+
+
+class LockWaitStats:
+    """Running totals of lock acquisition wait times"""
+
+    def __init__(self):
+        """Initialize empty counters"""
+        self._lock = Lock()
+        self.acquisitions = 0
+        self.contended = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, waited: float, contended: bool):
+        """
+        Record one acquisition
+
+        Args:
+            waited: Seconds spent waiting for the lock
+            contended: Whether the lock was not immediately available
+        """
+        with self._lock:
+            self.acquisitions += 1
+            if contended:
+                self.contended += 1
+            self.total_wait += waited
+            if waited > self.max_wait:
+                self.max_wait = waited
+
+    def to_dict(self) -> Dict:
+        """Get the counters as a JSON-serializable dictionary (times in ms)"""
+        with self._lock:
+            return {
+                "acquisitions": self.acquisitions,
+                "contended": self.contended,
+                "total_wait_ms": round(self.total_wait * 1000, 3),
+                "avg_wait_ms": round(self.total_wait * 1000 / self.acquisitions, 3) if self.acquisitions else 0.0,
+                "max_wait_ms": round(self.max_wait * 1000, 3)
+            }
+
+
+class ReadWriteLock:
+    """
+    Writer-preferring reader-writer lock
+
+    Using the lock directly (``with lock:``) takes it exclusively, so code
+    written for a plain Lock keeps its semantics. Shared access goes through
+    read_locked(). The lock is not reentrant in either mode.
+    """
+
+    def __init__(self):
+        """Initialize an unlocked lock"""
+        self._cond = Condition(Lock())
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+        self.read_stats = LockWaitStats()
+        self.write_stats = LockWaitStats()
+
+    def acquire_read(self):
+        """Acquire the lock in shared mode"""
+        start = time.perf_counter()
+        contended = False
+        with self._cond:
+            while self._writer or self._writers_waiting:
+                contended = True
+                self._cond.wait()
+            self._readers += 1
+        self.read_stats.record(time.perf_counter() - start, contended)
+
+    def release_read(self):
+        """Release a shared hold"""
+        with self._cond:
+            self._readers -= 1
+            if self._readers == 0:
+                self._cond.notify_all()
+
+    def acquire_write(self):
+        """Acquire the lock exclusively"""
+        start = time.perf_counter()
+        contended = False
+        with self._cond:
+            self._writers_waiting += 1
+            try:
+                while self._writer or self._readers:
+                    contended = True
+                    self._cond.wait()
+            finally:
+                self._writers_waiting -= 1
+            self._writer = True
+        self.write_stats.record(time.perf_counter() - start, contended)
+
+    def release_write(self):
+        """Release an exclusive hold"""
+        with self._cond:
+            self._writer = False
+            self._cond.notify_all()
+
+    @contextmanager
+    def read_locked(self):
+        """Context manager for shared access"""
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write_locked(self):
+        """Context manager for exclusive access"""
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+    def __enter__(self):
+        self.acquire_write()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release_write()
+        return False
+
+    def stats(self) -> Dict:
+        """Get wait-time metrics for both modes"""
+        return {"read": self.read_stats.to_dict(), "write": self.write_stats.to_dict()}
+
+
+class StripedLock:
+    """Fixed pool of mutexes selected by key"""
+
+    def __init__(self, stripes: int = 64):
+        """
+        Initialize the pool
+
+        Args:
+            stripes: Number of underlying locks
+        """
+        self._locks: List[Lock] = [Lock() for _ in range(stripes)]
+        self.stats = LockWaitStats()
+
+    def _lock_for(self, key: str) -> Lock:
+        """Pick the stripe for a key (stable across processes)"""
+        return self._locks[zlib.crc32(str(key).encode('utf-8')) % len(self._locks)]
+
+    @contextmanager
+    def locked(self, key: str):
+        """
+        Hold the stripe for a key
+
+        Args:
+            key: Key to serialize on (e.g. a job id)
+        """
+        lock = self._lock_for(key)
+        start = time.perf_counter()
+        contended = not lock.acquire(blocking=False)
+        if contended:
+            lock.acquire()
+        self.stats.record(time.perf_counter() - start, contended)
+        try:
+            yield
+        finally:
+            lock.release()
+
+
+class InterProcessLock:
+    """
+    Shared/exclusive advisory file lock plus a cross-process version counter
+
+    flock() locks belong to the open file, so all threads of one manager
+    share a single hold: the first holder takes the OS lock and the last
+    one releases it. Callers keep threads that need different modes apart
+    with their in-process locks; a shared request while the process holds
+    the lock exclusively is satisfied by that hold.
+
+    The lock file stores a counter that writers bump (while holding the lock
+    exclusively) after every change. Comparing it with the last seen value
+    is a single read, so readers can cheaply check for foreign writes.
+
+    A forked child re-opens the lock file on first use: flock() locks on a
+    descriptor inherited across fork() would be shared with the parent.
+    """
+
+    VERSION_WIDTH = 20
+    _SHARED = fcntl.LOCK_SH if fcntl is not None else 1
+    _EXCLUSIVE = fcntl.LOCK_EX if fcntl is not None else 2
+
+    def __init__(self, path: str):
+        """
+        Open (creating if needed) the lock file
+
+        Args:
+            path: Path of the lock file
+        """
+        self.path = path
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        self._pid = os.getpid()
+        self._mutex = Lock()
+        self._io_lock = Lock()
+        self._holders = 0
+        self._mode: Optional[int] = None
+        self.stats = LockWaitStats()
+
+    def _descriptor(self) -> int:
+        """Get the lock file descriptor owned by the current process"""
+        if self._pid != os.getpid():
+            with self._io_lock:
+                if self._pid != os.getpid():
+                    # Leave the inherited descriptor (and any lock on it) to the parent
+                    self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+                    self._pid = os.getpid()
+                    self._holders = 0
+                    self._mode = None
+        return self._fd
+
+    def _acquire(self, exclusive: bool):
+        """Take (or join) the process-wide hold"""
+        start = time.perf_counter()
+        contended = False
+        fd = self._descriptor()
+        with self._mutex:
+            if self._holders:
+                if exclusive and self._mode != self._EXCLUSIVE:
+                    raise RuntimeError(f"Cannot upgrade shared lock on {self.path}")
+                self._holders += 1
+                return
+            mode = self._EXCLUSIVE if exclusive else self._SHARED
+            if fcntl is not None:
+                try:
+                    fcntl.flock(fd, mode | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    contended = True
+                    fcntl.flock(fd, mode)
+            self._mode = mode
+            self._holders = 1
+        self.stats.record(time.perf_counter() - start, contended)
+
+    def _release(self):
+        """Leave the process-wide hold"""
+        with self._mutex:
+            self._holders -= 1
+            if self._holders == 0:
+                self._mode = None
+                if fcntl is not None:
+                    fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    @contextmanager
+    def shared(self):
+        """Hold the lock in shared mode"""
+        self._acquire(exclusive=False)
+        try:
+            yield
+        finally:
+            self._release()
+
+    @contextmanager
+    def exclusive(self):
+        """Hold the lock exclusively"""
+        self._acquire(exclusive=True)
+        try:
+            yield
+        finally:
+            self._release()
+
+    def version(self) -> int:
+        """Read the shared version counter (0 if never written)"""
+        fd = self._descriptor()
+        with self._io_lock:
+            os.lseek(fd, 0, os.SEEK_SET)
+            raw = os.read(fd, self.VERSION_WIDTH)
+        try:
+            return int(raw) if raw else 0
+        except ValueError:
+            return 0
+
+    def bump(self) -> int:
+        """
+        Increment the shared version counter (caller holds the lock exclusively)
+
+        Returns:
+            The new version
+        """
+        version = self.version() + 1
+        fd = self._descriptor()
+        with self._io_lock:
+            os.lseek(fd, 0, os.SEEK_SET)
+            os.write(fd, str(version).zfill(self.VERSION_WIDTH).encode('ascii'))
+        return version
+
+    def close(self):
+        """Close the lock file"""
+        if self._fd is not None and self._pid == os.getpid():
+            os.close(self._fd)
+        self._fd = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
@@ -4,21 +4,57 @@ Manages persistent storage of scraped job data with error handling and retry mec
 Includes application status tracking with complete history management
 """
 
+import copy
 import json
 import os
 import time
+import uuid
+import base64
+import bisect
 import hashlib
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional, Set, Iterable, Iterator
 from datetime import datetime
-from threading import Lock
+from contextlib import contextmanager
+import threading
+from threading import Condition, Lock, Thread
 import logging
 
+try:
+    from mutation_log import MutationLog
+    from job_filters import JobFilter, compile_filters
+    from score_index import ScoreIndex
+    from search_index import SearchIndex, SEARCH_FIELDS
+    from status_aggregates import JobStatusAggregates, AGGREGATE_FIELDS
+    from storage_locks import ReadWriteLock, StripedLock, InterProcessLock
+except ImportError:
+    from backend.mutation_log import MutationLog
+    from backend.job_filters import JobFilter, compile_filters
+    from backend.score_index import ScoreIndex
+    from backend.search_index import SearchIndex, SEARCH_FIELDS
+    from backend.status_aggregates import JobStatusAggregates, AGGREGATE_FIELDS
+    from backend.storage_locks import ReadWriteLock, StripedLock, InterProcessLock
+
+try:
+    from metadata_buffer import MetadataBuffer
+except ImportError:
+    from backend.metadata_buffer import MetadataBuffer
+
+try:
+    from snapshot_format import (write_snapshot, read_snapshot, json_to_snapshot, snapshot_to_json,
+                                 SnapshotReader, SnapshotError)
+except ImportError:
+    from backend.snapshot_format import (write_snapshot, read_snapshot, json_to_snapshot, snapshot_to_json,
+                                         SnapshotReader, SnapshotError)
+
 # Import application status models
 try:
     from application_status import (
         ApplicationStatus, 
         ApplicationStatusManager,
         StatusHistory,
+        LazyStatusHistories,
+        summarize_history_dict,
+        days_since,
         create_status_summary
     )
 except ImportError:
@@ -26,6 +62,9 @@ except ImportError:
         ApplicationStatus, 
         ApplicationStatusManager,
         StatusHistory,
+        LazyStatusHistories,
+        summarize_history_dict,
+        days_since,
         create_status_summary
     )
 
@@ -34,40 +73,233 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def encode_cursor(payload: Dict) -> str:
+    """Encode a pagination position as an opaque URL-safe token"""
+    raw = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(token: str) -> Dict:
+    """
+    Decode a token produced by encode_cursor
+    
+    Raises:
+        ValueError: If the token is malformed
+    """
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except Exception:
+        raise ValueError(f"Invalid cursor: {token!r}")
+    if not isinstance(payload, dict):
+        raise ValueError(f"Invalid cursor: {token!r}")
+    return payload
+
+
+def copy_job(job: Dict) -> Dict:
+    """
+    Copy a job deeply enough that changes to the copy never reach the original
+    
+    Nested values ('score', 'status_history', lists) are copied too, so
+    callers may annotate the jobs they get without corrupting the cached
+    table or the indexes built from it.
+    
+    Args:
+        job: Job dictionary
+        
+    Returns:
+        New job dictionary
+    """
+    return {key: copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+            for key, value in job.items()}
+
+
+def project_job(job: Dict, fields: Optional[List[str]]) -> Dict:
+    """
+    Copy a job, keeping only the requested top-level fields (plus 'id')
+    
+    Args:
+        job: Job dictionary
+        fields: Field names to keep, or None for all fields
+        
+    Returns:
+        New job dictionary
+    """
+    if not fields:
+        return copy_job(job)
+    projected = copy_job({field: job[field] for field in fields if field in job})
+    if 'id' in job:
+        projected['id'] = job['id']
+    return projected
+
+
 class JobStorageManager:
     """Manages storage of scraped job data in JSON format"""
     
-    def __init__(self, storage_dir: str = 'data'):
+    # Snapshot file suffix per snapshot format
+    SNAPSHOT_FORMATS = {"json": ".json", "binary": ".snap"}
+    
+    # Job fields written by a status change
+    STATUS_FIELDS = ("application_status", "applied_date", "application_notes",
+                     "status_history", "last_updated")
+    
+    def __init__(self, storage_dir: str = 'data',
+                 wal_compact_bytes: int = 4 * 1024 * 1024,
+                 background_compaction: bool = True,
+                 sync_writes: bool = False,
+                 status_snapshot_events: int = 1000,
+                 metadata_durability: str = "interval",
+                 metadata_flush_interval: float = 5.0,
+                 group_commit_window: float = 0.001,
+                 snapshot_format: str = "json"):
         """
         Initialize the storage manager
         
         Args:
             storage_dir: Directory to store JSON files
-        """
+            wal_compact_bytes: Mutation log size that triggers folding it into jobs.json
+            background_compaction: Run compaction on a background thread
+            sync_writes: fsync the mutation log after every append
+            status_snapshot_events: Minimum number of status events between
+                snapshots of status_history.json (at least one per tracked job,
+                so snapshot cost stays constant per event)
+            metadata_durability: When scrape counters and the error log reach
+                disk: "sync" (every change), "interval" (background flush
+                every metadata_flush_interval seconds and at exit) or
+                "shutdown" (flush_metadata() or exit only)
+            metadata_flush_interval: Seconds between metadata flushes
+            group_commit_window: Seconds a single-job update waits for
+                concurrent ones to join its log append (only while other
+                updates are in flight; 0 disables the wait)
+            snapshot_format: "json" for indented jobs.json / status_history.json,
+                or "binary" for compressed, indexed jobs.snap /
+                status_history.snap (see snapshot_format.py); existing
+                snapshots in the other format are converted on first start
+        """
+        if snapshot_format not in self.SNAPSHOT_FORMATS:
+            raise ValueError(f"Unknown snapshot format: {snapshot_format}")
+        self.snapshot_format = snapshot_format
+        suffix = self.SNAPSHOT_FORMATS[snapshot_format]
+        
         self.storage_dir = storage_dir
-        self.jobs_file = os.path.join(storage_dir, 'jobs.json')
+        self.jobs_file = os.path.join(storage_dir, 'jobs' + suffix)
+        self.wal_file = os.path.join(storage_dir, 'jobs.wal.jsonl')
+        self.hash_index_file = os.path.join(storage_dir, 'job_hashes.idx')
         self.metadata_file = os.path.join(storage_dir, 'metadata.json')
         self.errors_file = os.path.join(storage_dir, 'scraping_errors.json')
-        self.status_history_file = os.path.join(storage_dir, 'status_history.json')
-        self.lock = Lock()  # Thread safety for concurrent access
+        self.status_history_file = os.path.join(storage_dir, 'status_history' + suffix)
+        self.status_events_file = os.path.join(storage_dir, 'status_history.events.jsonl')
+        self.lock_file = os.path.join(storage_dir, 'jobs.lock')
+        self.status_lock_file = os.path.join(storage_dir, 'status_history.lock')
+        self.metadata_lock_file = os.path.join(storage_dir, 'metadata.lock')
+        # Thread safety for concurrent access: readers share self.lock,
+        # writers take it exclusively (``with self.lock``). Single-job
+        # updates share it too and serialize per job on a striped lock;
+        # _commit_lock orders their log appends and index updates.
+        self.lock = ReadWriteLock()
+        self._job_locks = StripedLock()
+        self._commit_lock = Lock()
+        self._compaction_due = False
+        
+        # Process safety for several workers sharing storage_dir: writers hold
+        # jobs.lock exclusively and bump the version counter stored in it;
+        # a version other than the last one seen means another process wrote.
+        self._file_lock: Optional[InterProcessLock] = None
+        self._shared_version: Optional[int] = None
+        
+        # Parsed job table, reused until jobs.json or the version counter changes
+        self._jobs: Optional[List[Dict]] = None
+        self._jobs_by_id: Dict[str, Dict] = {}
+        self._jobs_by_job_id: Dict[str, Dict] = {}
+        self._jobs_stamp: Optional[tuple] = None
+        self._version = 0
+        self._cache_version = -1
+        self._cache_hits = 0
+        self._cache_misses = 0
+        
+        # Stable per-entry sequence numbers for pagination cursors
+        # (generation is unique per load, so cursors from other managers or
+        # earlier loads fall back to locating the last job by id)
+        self._seqs: List[int] = []
+        self._seq_by_id: Dict[str, int] = {}
+        self._next_seq = 0
+        self._table_generation = None
         
-        # Initialize application status manager
-        self.status_manager = ApplicationStatusManager()
+        # Score/highlight index over the job table, built on first use
+        self._scores: Optional[ScoreIndex] = None
+        
+        # Status counts / recent applications over the job table, built on first use
+        self._status_counts: Optional[JobStatusAggregates] = None
+        
+        # Full-text index over title/company/description, built on first search
+        self._search: Optional[SearchIndex] = None
+        
+        # Append-only mutation log replayed on top of jobs.json
+        self.wal = MutationLog(self.wal_file, fsync=sync_writes)
+        self.wal_compact_bytes = wal_compact_bytes
+        self.background_compaction = background_compaction
+        self._wal_seq = 0
+        self._wal_offset = 0
+        self._wal_stamp: Optional[tuple] = None
+        self._wal_pending = 0
+        self._compactions = 0
+        self._compaction_pending = False
+        
+        # Group commit: concurrent single-job updates queue their log records
+        # and one of them (the leader) appends the whole batch at once
+        self.group_commit_window = group_commit_window
+        self._group_cond = Condition(Lock())
+        self._group_queue: List[Dict] = []
+        self._group_leader = False
+        self._group_writers = 0
+        self._group_commits = 0
+        self._group_records = 0
+        self._group_largest = 0
+        
+        # Duplicate-detection hashes of stored jobs, persisted in job_hashes.idx
+        self._job_hashes: Optional[Set[str]] = None
+        self._hash_seq = 0  # log sequence number of the last add/delete in the table
+        self._hash_index_rebuilds = 0
+        
+        # Initialize application status manager. Changes are appended to an
+        # event log; status_history.json is a periodic snapshot that the log
+        # is replayed on top of (also to pick up other processes' changes).
+        self.status_manager = ApplicationStatusManager(record_events=True)
+        self._status_lock = Lock()
+        self._status_stamp: Optional[tuple] = None
+        self.status_events = MutationLog(self.status_events_file, fsync=sync_writes)
+        self.status_snapshot_events = status_snapshot_events
+        self._status_event_seq = 0
+        self._status_events_offset = 0
+        self._status_events_stamp: Optional[tuple] = None
+        self._status_events_since_snapshot = 0
+        self._status_snapshots = 0
+        self._status_loaded = False
         
         # Create storage directory if it doesn't exist
         os.makedirs(storage_dir, exist_ok=True)
+        self._file_lock = InterProcessLock(self.lock_file)
+        self._status_file_lock = InterProcessLock(self.status_lock_file)
         
         # Initialize storage files if they don't exist
-        self._initialize_storage()
+        with self._file_lock.exclusive():
+            self._initialize_storage()
+        
+        # Scrape counters and error log, served from memory and flushed
+        # to metadata.json / scraping_errors.json per metadata_durability
+        self.metadata_buffer = MetadataBuffer(
+            self.metadata_file, self.errors_file, self.metadata_lock_file,
+            write_json=self._write_json, read_json=self._read_json,
+            durability=metadata_durability, flush_interval=metadata_flush_interval
+        )
         
         # Load existing status histories
         self._load_status_histories()
     
     def _initialize_storage(self):
         """Initialize storage files with empty structures"""
-        if not os.path.exists(self.jobs_file):
-            self._write_json(self.jobs_file, {"jobs": [], "count": 0})
-        
+        self._initialize_job_store()
+
         if not os.path.exists(self.metadata_file):
             self._write_json(self.metadata_file, {
                 "created_at": datetime.now().isoformat(),
@@ -80,26 +312,225 @@ class JobStorageManager:
         if not os.path.exists(self.errors_file):
             self._write_json(self.errors_file, {"errors": []})
         
+        self._convert_snapshot(self.status_history_file)
         if not os.path.exists(self.status_history_file):
-            self._write_json(self.status_history_file, {
+            self._write_snapshot(self.status_history_file, {
                 "created_at": datetime.now().isoformat(),
                 "last_updated": datetime.now().isoformat(),
                 "histories": []
             })
-    
+
+    def _initialize_job_store(self):
+        """Initialize the job records file (overridden by alternative backends)"""
+        self._convert_snapshot(self.jobs_file)
+        if not os.path.exists(self.jobs_file):
+            self._write_snapshot(self.jobs_file, {"jobs": [], "count": 0})
+
     def _load_status_histories(self):
-        """Load existing status histories from file"""
+        """Load existing status histories (snapshot plus event log)"""
         try:
-            if os.path.exists(self.status_history_file):
-                self.status_manager.import_from_json(self.status_history_file)
+            with self._status_lock, self._status_file_lock.shared():
+                self._reload_status_histories()
                 logger.info(f"Loaded {len(self.status_manager.histories)} status histories")
         except Exception as e:
             logger.error(f"Error loading status histories: {e}")
     
+    def _reload_status_histories(self):
+        """
+        Bring the in-memory histories up to date with storage
+        
+        Events appended since the last load are replayed incrementally; a new
+        snapshot triggers a full reload. Caller holds self._status_lock and
+        the status file lock.
+        """
+        snapshot_stamp = self._file_stamp(self.status_history_file)
+        events_stamp = self.status_events.stamp()
+        if self._status_loaded and snapshot_stamp == self._status_stamp:
+            if events_stamp == self._status_events_stamp:
+                return
+            previous = self._status_events_stamp
+            if (events_stamp is not None and events_stamp[1] >= self._status_events_offset
+                    and (previous is None or events_stamp[0] == previous[0])):
+                self._replay_status_events(self._status_events_offset)
+                return
+        
+        histories = LazyStatusHistories({}, lambda job_id: None)
+        event_seq = 0
+        if snapshot_stamp is not None:
+            try:
+                loaded = self._open_status_snapshot()
+            except Exception as e:
+                logger.error(f"Failed to load {self.status_history_file}: {e}")
+                return
+            if loaded is None:
+                return
+            histories, event_seq = loaded
+        
+        self.status_manager.histories = histories
+        self._status_event_seq = event_seq
+        self._status_stamp = snapshot_stamp
+        self._status_events_since_snapshot = 0
+        self._replay_status_events(0)
+        self._status_loaded = True
+    
+    def _open_status_snapshot(self) -> Optional[tuple]:
+        """
+        Index the status history snapshot without materializing histories
+        
+        JSON snapshots are parsed but histories stay serialized; binary
+        snapshots are only opened, and each history is read from its block
+        when first accessed. The per-job summaries stored with the snapshot
+        back the aggregate queries (recomputed if missing or stale).
+        
+        Returns:
+            Tuple of (LazyStatusHistories, snapshot event_seq), or None on failure
+        """
+        if self.snapshot_format == "binary":
+            try:
+                reader = SnapshotReader(self.status_history_file)
+            except (SnapshotError, ValueError, OSError) as e:
+                logger.error(f"Error reading {self.status_history_file}: {e}")
+                return None
+            meta = reader.meta
+            keys = reader.keys
+            load = reader.get
+            records = lambda: iter(reader)
+        else:
+            data = self._read_json(self.status_history_file)
+            if data is None:
+                return None
+            meta = data
+            serialized = {history["job_id"]: history for history in data.get("histories", [])}
+            keys = list(serialized)
+            load = serialized.get
+            records = lambda: iter(serialized.values())
+        
+        stored = meta.get("summaries")
+        if isinstance(stored, dict) and len(stored) == len(keys) and all(key in stored for key in keys):
+            summaries = {job_id: tuple(summary) for job_id, summary in stored.items()}
+        else:
+            summaries = {history["job_id"]: summarize_history_dict(history) for history in records()}
+        
+        return LazyStatusHistories(summaries, load), meta.get("event_seq", 0)
+    
+    def _replay_status_events(self, offset: int):
+        """
+        Apply status events newer than the loaded snapshot
+        
+        Args:
+            offset: Byte offset in the event log to start from
+        """
+        events, end = self.status_events.read(offset)
+        for event in events:
+            if event.get('seq', 0) <= self._status_event_seq:
+                # Already folded into the snapshot
+                continue
+            try:
+                self.status_manager.apply_event(event)
+            except Exception as e:
+                logger.error(f"Skipping unreadable status event {event.get('seq')}: {e}")
+            self._status_event_seq = event['seq']
+            self._status_events_since_snapshot += 1
+        
+        self._status_events_offset = end
+        events_stamp = self.status_events.stamp()
+        self._status_events_stamp = (events_stamp[0], end) if events_stamp else None
+    
+    def _refresh_status_histories(self):
+        """Pick up status history changes written by other processes"""
+        try:
+            with self._status_lock, self._status_file_lock.shared():
+                self._reload_status_histories()
+        except Exception as e:
+            logger.error(f"Error refreshing status histories: {e}")
+    
+    @contextmanager
+    def _status_transaction(self):
+        """
+        Hold the status histories exclusively across processes
+        
+        The histories are brought up to date on entry; the change events
+        recorded inside are appended to the event log on exit, so
+        concurrent workers cannot overwrite each other and recording a
+        transition does not rewrite every history.
+        """
+        with self._status_lock, self._status_file_lock.exclusive():
+            self._reload_status_histories()
+            try:
+                yield self.status_manager
+            finally:
+                self._flush_status_events()
+    
+    def _flush_status_events(self) -> bool:
+        """
+        Append queued status events to the log, snapshotting when due
+        
+        Caller holds self._status_lock and the status file lock exclusively.
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        events = self.status_manager.drain_events()
+        if not events:
+            return True
+        
+        for event in events:
+            self._status_event_seq += 1
+            event['seq'] = self._status_event_seq
+        try:
+            end = self.status_events.append(events)
+        except Exception as e:
+            logger.error(f"Error appending to {self.status_events.path}: {e}")
+            # Fall back to a full snapshot so the changes are not lost
+            return self._save_status_histories()
+        
+        self._status_events_offset = end
+        events_stamp = self.status_events.stamp()
+        self._status_events_stamp = (events_stamp[0], end) if events_stamp else None
+        self._status_events_since_snapshot += len(events)
+        
+        # A snapshot costs O(histories), so take one at most every
+        # max(status_snapshot_events, histories) events: O(1) per event
+        threshold = max(self.status_snapshot_events, len(self.status_manager.histories))
+        if self._status_events_since_snapshot >= threshold:
+            return self._save_status_histories()
+        return True
+    
     def _save_status_histories(self) -> bool:
-        """Save current status histories to file"""
+        """
+        Write a status_history.json snapshot and reset the event log
+        
+        The snapshot records the last folded event sequence number, so a
+        crash before the log is truncated cannot apply an event twice.
+        Caller holds self._status_lock and the status file lock exclusively.
+        """
         try:
-            return self.status_manager.export_to_json(self.status_history_file)
+            histories = self.status_manager.histories
+            if isinstance(histories, LazyStatusHistories):
+                serialized = list(histories.iter_serialized())
+            else:
+                serialized = [history.to_dict() for history in histories.values()]
+            snapshot = {
+                "exported_at": datetime.now().isoformat(),
+                "total_jobs": len(serialized),
+                "event_seq": self._status_event_seq,
+                "summaries": {job_id: list(summary) for job_id, summary in self.status_manager.iter_summaries()},
+                "histories": serialized
+            }
+            if not self._write_snapshot(self.status_history_file, snapshot):
+                return False
+            self._status_stamp = self._file_stamp(self.status_history_file)
+            
+            try:
+                self.status_events.reset()
+            except Exception as e:
+                # The snapshot's event_seq makes the leftover events harmless
+                logger.error(f"Error truncating {self.status_events.path}: {e}")
+            self._status_events_offset = 0
+            self._status_events_stamp = self.status_events.stamp()
+            self._status_events_since_snapshot = 0
+            self._status_snapshots += 1
+            return True
         except Exception as e:
             logger.error(f"Error saving status histories: {e}")
             return False
@@ -149,8 +580,8 @@ class JobStorageManager:
         """
         for attempt in range(max_retries):
             try:
-                # Write to temporary file first
-                temp_filepath = f"{filepath}.tmp"
+                # Write to temporary file first (unique per process and thread)
+                temp_filepath = f"{filepath}.{os.getpid()}.{threading.get_ident()}.tmp"
                 with open(temp_filepath, 'w', encoding='utf-8') as f:
                     json.dump(data, f, indent=2, ensure_ascii=False)
                 
@@ -168,6 +599,769 @@ class JobStorageManager:
         
         return False
     
+    def _read_snapshot(self, filepath: str) -> Optional[Dict]:
+        """
+        Read a jobs / status history snapshot in the configured format
+        
+        Args:
+            filepath: Path to the snapshot file
+            
+        Returns:
+            Snapshot dictionary (same shape for both formats), or None on failure
+        """
+        if self.snapshot_format == "json":
+            return self._read_json(filepath)
+        try:
+            return read_snapshot(filepath)
+        except FileNotFoundError:
+            logger.warning(f"File not found: {filepath}")
+        except (SnapshotError, ValueError, OSError) as e:
+            logger.error(f"Error reading {filepath}: {e}")
+        return None
+    
+    def _write_snapshot(self, filepath: str, data: Dict) -> bool:
+        """
+        Atomically write a jobs / status history snapshot in the configured format
+        
+        Args:
+            filepath: Path to the snapshot file
+            data: Snapshot dictionary
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        if self.snapshot_format == "json":
+            return self._write_json(filepath, data)
+        temp_filepath = f"{filepath}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            write_snapshot(temp_filepath, data)
+            os.replace(temp_filepath, filepath)
+            return True
+        except Exception as e:
+            logger.error(f"Error writing {filepath}: {e}")
+            if os.path.exists(temp_filepath):
+                os.remove(temp_filepath)
+            return False
+    
+    def _convert_snapshot(self, filepath: str):
+        """
+        Create a missing snapshot from the same snapshot in the other format
+        
+        Args:
+            filepath: Snapshot path in the configured format
+        """
+        if os.path.exists(filepath):
+            return
+        base = os.path.splitext(filepath)[0]
+        for snapshot_format, suffix in self.SNAPSHOT_FORMATS.items():
+            source = base + suffix
+            if snapshot_format == self.snapshot_format or not os.path.exists(source):
+                continue
+            try:
+                if self.snapshot_format == "binary":
+                    count = json_to_snapshot(source, filepath)
+                else:
+                    count = snapshot_to_json(source, filepath)
+                logger.info(f"Converted {count} records from {source} to {filepath}")
+            except Exception as e:
+                logger.error(f"Error converting {source} to {filepath}: {e}")
+            return
+    
+    def _file_stamp(self, filepath: str) -> Optional[tuple]:
+        """Get (mtime_ns, size, inode) for a file, or None if it doesn't exist"""
+        try:
+            st = os.stat(filepath)
+            return (st.st_mtime_ns, st.st_size, st.st_ino)
+        except OSError:
+            return None
+    
+    def _job_table(self) -> List[Dict]:
+        """
+        Get the parsed job table, re-reading storage only when it changed
+        
+        The table is jobs.json with the mutation log replayed on top. Records
+        appended to the log by another manager are replayed incrementally;
+        a new snapshot triggers a full reload.
+        
+        The table is shared state: callers must hold self.lock exclusively
+        (or use _reading()) and must copy records before handing them out.
+        
+        Returns:
+            List of job dictionaries (live references)
+        """
+        version = self._file_lock.version()
+        stamp = self._file_stamp(self.jobs_file)
+        wal_stamp = self.wal.stamp()
+        if (self._jobs is not None and stamp == self._jobs_stamp
+                and self._cache_version == self._version):
+            if wal_stamp == self._wal_stamp and version == self._shared_version:
+                self._cache_hits += 1
+                return self._jobs
+            if (wal_stamp is not None and self._wal_stamp is not None
+                    and wal_stamp[0] == self._wal_stamp[0] and wal_stamp[1] >= self._wal_offset):
+                # Log only grew (or another process bumped the version
+                # without changing the files): replay any new records
+                self._cache_hits += 1
+                self._replay_wal(self._wal_offset)
+                self._shared_version = version
+                return self._jobs
+        
+        self._cache_misses += 1
+        with self._file_lock.shared():
+            # Re-read the stamps: another process may have written meanwhile
+            version = self._file_lock.version()
+            stamp = self._file_stamp(self.jobs_file)
+            data = self._read_snapshot(self.jobs_file)
+            if data is None:
+                self._invalidate_job_table()
+                return []
+            self._load_job_table(data, stamp, version)
+        return self._jobs
+    
+    def _load_job_table(self, data: Dict, stamp: Optional[tuple], version: int):
+        """Replace the cached table with a parsed snapshot plus the mutation log"""
+        self._jobs = data.get('jobs', [])
+        self._wal_seq = data.get('wal_seq', 0)
+        self._hash_seq = self._wal_seq
+        self._job_hashes = None
+        self._seqs = list(range(len(self._jobs)))
+        self._next_seq = len(self._jobs)
+        self._table_generation = uuid.uuid4().hex[:12]
+        self._scores = None
+        self._status_counts = None
+        self._search = None
+        self._jobs_stamp = stamp
+        self._shared_version = version
+        self._cache_version = self._version
+        self._rebuild_job_indexes()
+        self._replay_wal(0)
+    
+    def _table_is_current(self) -> bool:
+        """Check, without touching the cache, that the job table matches storage"""
+        return (self._jobs is not None
+                and self._cache_version == self._version
+                and self._file_lock.version() == self._shared_version
+                and self._file_stamp(self.jobs_file) == self._jobs_stamp
+                and self.wal.stamp() == self._wal_stamp)
+    
+    @contextmanager
+    def _reading(self):
+        """
+        Hold self.lock in shared mode over an up-to-date job table
+        
+        If the table has to be (re)loaded, that happens under the exclusive
+        lock and the body runs there instead.
+        
+        Yields:
+            List of job dictionaries (live references; copy before returning)
+        """
+        with self.lock.read_locked():
+            if self._table_is_current():
+                self._cache_hits += 1
+                yield self._jobs
+                return
+        with self.lock:
+            yield self._job_table()
+    
+    @contextmanager
+    def _writing(self):
+        """Hold self.lock exclusively and the storage file lock (across processes)"""
+        with self.lock, self._file_lock.exclusive():
+            yield
+    
+    def _replay_wal(self, offset: int):
+        """
+        Apply mutation log records newer than the loaded snapshot
+        
+        Args:
+            offset: Byte offset in the log to start from
+        """
+        records, end = self.wal.read(offset)
+        for record in records:
+            if record.get('seq', 0) <= self._wal_seq:
+                # Already folded into the snapshot
+                continue
+            self._apply_mutation(record)
+            self._wal_seq = record['seq']
+            if record.get('op') in ('add', 'delete'):
+                self._hash_seq = record['seq']
+        
+        self._wal_offset = end
+        wal_stamp = self.wal.stamp()
+        self._wal_stamp = (wal_stamp[0], end) if wal_stamp else None
+        self._wal_pending = self._wal_pending + len(records) if offset else len(records)
+    
+    def _apply_mutation(self, record: Dict):
+        """Apply a single mutation log record to the job table"""
+        op = record.get('op')
+        if op == 'add':
+            for job in record.get('jobs', []):
+                self._append_job(job)
+                if self._job_hashes is not None:
+                    self._job_hashes.add(self._generate_job_hash(job))
+        elif op == 'set':
+            job = self._jobs_by_id.get(record.get('id'))
+            if job is not None:
+                job.update(record.get('fields', {}))
+                self._reindex_job(job, record.get('fields', {}))
+        elif op == 'delete':
+            self._remove_jobs(record.get('id'))
+        else:
+            logger.warning(f"Unknown mutation log record: {op}")
+    
+    def _remove_jobs(self, job_id: str) -> List[Dict]:
+        """
+        Remove all jobs with the given id from the table and lookups
+        
+        Args:
+            job_id: Job ID (hash)
+            
+        Returns:
+            List of removed job dictionaries
+        """
+        removed = [job for job in self._jobs if job.get('id') == job_id]
+        if removed:
+            for job, seq in zip(self._jobs, self._seqs):
+                if job.get('id') == job_id:
+                    if self._scores is not None:
+                        self._scores.remove(seq)
+                    if self._status_counts is not None:
+                        self._status_counts.remove(seq)
+                    if self._search is not None:
+                        self._search.remove(seq)
+            kept = [(job, seq) for job, seq in zip(self._jobs, self._seqs) if job.get('id') != job_id]
+            self._jobs[:] = [job for job, _ in kept]
+            self._seqs = [seq for _, seq in kept]
+            self._rebuild_job_indexes()
+            if self._job_hashes is not None:
+                for job in removed:
+                    self._job_hashes.discard(self._generate_job_hash(job))
+        return removed
+    
+    def _append_job(self, job: Dict):
+        """Append a job to the table and its lookups"""
+        seq = self._next_seq
+        self._next_seq += 1
+        self._jobs.append(job)
+        self._seqs.append(seq)
+        self._index_job(job, seq)
+        if self._scores is not None and 'score' in job:
+            self._scores.add(seq, job['score'])
+        if self._status_counts is not None:
+            self._status_counts.add(seq, job)
+        if self._search is not None:
+            self._search.add(seq, job)
+    
+    def _replace_job(self, job: Dict, updated: Dict):
+        """Put an updated copy of an addressable job in its place in the table and lookups"""
+        seq = self._seq_by_id[job['id']]
+        self._jobs[bisect.bisect_left(self._seqs, seq)] = updated
+        self._jobs_by_id[job['id']] = updated
+        key = str(job.get('job_id'))
+        if self._jobs_by_job_id.get(key) is job:
+            self._jobs_by_job_id[key] = updated
+    
+    def _rebuild_job_indexes(self):
+        """Rebuild the id and job_id lookups from the job table"""
+        self._jobs_by_id = {}
+        self._jobs_by_job_id = {}
+        self._seq_by_id = {}
+        for job, seq in zip(self._jobs or [], self._seqs):
+            self._index_job(job, seq)
+    
+    def _index_job(self, job: Dict, seq: int):
+        """Add a job to the id and job_id lookups"""
+        if job.get('id') is not None:
+            self._jobs_by_id.setdefault(job['id'], job)
+            self._seq_by_id.setdefault(job['id'], seq)
+        # update_job_status matches on str(job_id) and takes the first match
+        self._jobs_by_job_id.setdefault(str(job.get('job_id')), job)
+    
+    def _score_index(self) -> ScoreIndex:
+        """
+        Get the score index for the current job table, building it if needed
+        
+        Callers must hold self.lock (exclusively, or shared plus
+        self._commit_lock) and have refreshed the table.
+        """
+        if self._scores is None:
+            scores = ScoreIndex()
+            for job, seq in zip(self._jobs or [], self._seqs):
+                if 'score' in job:
+                    scores.add(seq, job['score'])
+            self._scores = scores
+        return self._scores
+    
+    def _reindex_score(self, job: Dict):
+        """Refresh the score index entry of a job whose score changed"""
+        if self._scores is None:
+            return
+        seq = self._seq_by_id.get(job.get('id'))
+        if seq is not None:
+            self._scores.add(seq, job['score'])
+    
+    def _status_aggregates(self) -> JobStatusAggregates:
+        """
+        Get the status aggregates for the current job table, building them if needed
+        
+        Same locking rules as _score_index().
+        """
+        if self._status_counts is None:
+            counts = JobStatusAggregates()
+            for job, seq in zip(self._jobs or [], self._seqs):
+                counts.add(seq, job)
+            self._status_counts = counts
+        return self._status_counts
+    
+    def _search_index(self) -> SearchIndex:
+        """
+        Get the full-text index for the current job table, building it if needed
+        
+        Same locking rules as _score_index().
+        """
+        if self._search is None or self._search.needs_rebuild:
+            self._search = SearchIndex.build(zip(self._seqs, self._jobs or []))
+        return self._search
+    
+    def _reindex_job(self, job: Dict, fields):
+        """
+        Refresh the indexes that depend on the changed fields of a job
+        
+        Args:
+            job: Table entry that changed
+            fields: Names of the changed fields
+        """
+        if 'score' in fields:
+            self._reindex_score(job)
+        if self._status_counts is not None and any(field in fields for field in AGGREGATE_FIELDS):
+            if self._addressable(job):
+                self._status_counts.add(self._seq_by_id[job['id']], job)
+            else:
+                # Not addressable by id: recount on next use
+                self._status_counts = None
+        if self._search is not None and any(field in fields for field in SEARCH_FIELDS):
+            if self._addressable(job):
+                self._search.add(self._seq_by_id[job['id']], job)
+            else:
+                self._search = None
+    
+    def _filter_candidates(self, job_filter: JobFilter) -> Optional[List[int]]:
+        """
+        Narrow a filter down to candidate jobs using the indexes
+        
+        Equality / $in on 'id' use the id map, 'application_status' the
+        status aggregates, 'score.highlight' and numeric ranges on
+        'score.overall_score' the score index. When several apply the
+        smallest candidate set is used; every candidate still has to pass
+        the full filter. Same locking rules as _score_index().
+        
+        Args:
+            job_filter: Compiled filter
+            
+        Returns:
+            Sorted sequence numbers, or None when no index covers the filter
+        """
+        def indexed_values(field, accept):
+            # Values of an $eq / $in clause, if the index files every one of them
+            clause = job_filter.clause(field)
+            values = clause.candidate_values() if clause is not None else None
+            if values is None or not all(accept(value) for value in values):
+                return None
+            return values
+        
+        def is_name(value):
+            return isinstance(value, str) and value != ""
+        
+        options = []
+        
+        # Every job is in the id map only if ids are unique
+        values = indexed_values('id', is_name)
+        if values is not None and len(self._seq_by_id) == len(self._jobs):
+            options.append(sorted({self._seq_by_id[value] for value in values if value in self._seq_by_id}))
+        
+        values = indexed_values('application_status', is_name)
+        if values is not None:
+            aggregates = self._status_aggregates()
+            options.append(sorted({seq for value in values for seq in aggregates.jobs_with_status(value)}))
+        
+        values = indexed_values('score.highlight', lambda value: isinstance(value, str))
+        if values is not None:
+            scores = self._score_index()
+            options.append(sorted({seq for value in values for seq in scores.highlight(value)}))
+        
+        clause = job_filter.clause('score.overall_score')
+        if clause is not None:
+            bounds = None
+            values = clause.candidate_values()
+            bound = clause.lower if clause.lower is not None else clause.upper
+            if values is not None and all(isinstance(value, (int, float)) for value in values):
+                bounds = (min(values, default=0), max(values, default=-1))
+            elif clause.has_range and not isinstance(bound, str):
+                bounds = (clause.lower, clause.upper)
+            if bounds is not None:
+                options.append(self._score_index().between(*bounds))
+        
+        return min(options, key=len) if options else None
+    
+    def _filter_positions(self, job_filter: JobFilter) -> Iterable[int]:
+        """
+        Get the table positions that may match a filter, in storage order
+        
+        Callers must hold the table lock (shared or exclusive).
+        """
+        with self._commit_lock:
+            seqs = self._filter_candidates(job_filter)
+        if seqs is None:
+            return range(len(self._jobs))
+        positions = []
+        for seq in seqs:
+            position = bisect.bisect_left(self._seqs, seq)
+            if position < len(self._seqs) and self._seqs[position] == seq:
+                positions.append(position)
+        return positions
+    
+    def _jobs_at(self, seqs: List[int]) -> List[Dict]:
+        """Copy the jobs with the given sequence numbers (in the given order)"""
+        jobs = []
+        for seq in seqs:
+            position = bisect.bisect_left(self._seqs, seq)
+            if position < len(self._seqs) and self._seqs[position] == seq:
+                jobs.append(copy_job(self._jobs[position]))
+        return jobs
+    
+    def _invalidate_job_table(self):
+        """Drop the cached job table so the next read reloads from disk"""
+        self._jobs = None
+        self._scores = None
+        self._status_counts = None
+        self._search = None
+        self._jobs_by_id = {}
+        self._jobs_by_job_id = {}
+        self._seq_by_id = {}
+        self._jobs_stamp = None
+        self._wal_stamp = None
+        self._job_hashes = None
+        self._version += 1
+    
+    def _log_mutations(self, records: List[Dict], shared: bool = False) -> bool:
+        """
+        Append mutation records for changes already applied to the job table
+        
+        Shared-mode writers (single-job updates) go through a group commit:
+        each queues its records, and whichever caller finds no flush in
+        progress becomes the leader, waits group_commit_window for others
+        to join if more updates are in flight, and appends the whole queue
+        in one write (one fsync with sync_writes). Every caller returns
+        only after the batch holding its records was written.
+        
+        Args:
+            records: Mutation records ('add', 'set' or 'delete')
+            shared: True when the caller holds self.lock in shared mode; a
+                    due compaction is then left to _compact_if_due()
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        if not records:
+            return True
+        
+        if not shared:
+            with self._commit_lock:
+                return self._commit_records(records, shared=False)
+        
+        entry = {"records": records, "result": None}
+        with self._group_cond:
+            self._group_queue.append(entry)
+            while entry["result"] is None and self._group_leader:
+                self._group_cond.wait()
+            if entry["result"] is not None:
+                return entry["result"]
+            self._group_leader = True
+            wait = self.group_commit_window > 0 and self._group_writers > 1
+        
+        batch = []
+        result = False
+        try:
+            if wait:
+                time.sleep(self.group_commit_window)
+            with self._group_cond:
+                batch, self._group_queue = self._group_queue, []
+            batch_records = [record for queued in batch for record in queued["records"]]
+            with self._commit_lock:
+                result = self._commit_records(batch_records, shared=True)
+                self._group_commits += 1
+                self._group_records += len(batch_records)
+                self._group_largest = max(self._group_largest, len(batch))
+        finally:
+            with self._group_cond:
+                for queued in batch:
+                    queued["result"] = result
+                if entry["result"] is None:
+                    # Leader failed before taking the queue
+                    entry["result"] = False
+                    if entry in self._group_queue:
+                        self._group_queue.remove(entry)
+                self._group_leader = False
+                self._group_cond.notify_all()
+        return entry["result"]
+    
+    def _commit_records(self, records: List[Dict], shared: bool) -> bool:
+        """
+        Append mutation records in one write (caller holds self._commit_lock)
+        
+        Args:
+            records: Mutation records ('add', 'set' or 'delete')
+            shared: True when the caller holds self.lock in shared mode
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        for record in records:
+            self._wal_seq += 1
+            record['seq'] = self._wal_seq
+        
+        try:
+            end = self.wal.append(records)
+        except Exception as e:
+            logger.error(f"Error appending to {self.wal.path}: {e}")
+            if shared:
+                # Table may be ahead of storage: drop it once we hold the lock
+                self._version += 1
+            else:
+                self._invalidate_job_table()
+            return False
+        
+        self._wal_offset = end
+        wal_stamp = self.wal.stamp()
+        self._wal_stamp = (wal_stamp[0], end) if wal_stamp else None
+        self._wal_pending += len(records)
+        for record in records:
+            if record['op'] in ('add', 'delete'):
+                self._hash_seq = record['seq']
+        self._version += 1
+        self._cache_version = self._version
+        self._shared_version = self._file_lock.bump()
+        
+        if end >= self.wal_compact_bytes:
+            if shared and not self.background_compaction:
+                self._compaction_due = True
+            else:
+                self._schedule_compaction()
+        return True
+    
+    def _compact_if_due(self):
+        """Run a compaction deferred by a shared-mode writer (caller holds no lock)"""
+        if not self._compaction_due:
+            return
+        with self._writing():
+            if self._compaction_due:
+                self._compaction_due = False
+                self._job_table()
+                if self.wal.size() >= self.wal_compact_bytes:
+                    self._compact_locked()
+    
+    def _addressable(self, job: Dict) -> bool:
+        """Check whether a table entry can be updated through a 'set' log record"""
+        job_id = job.get('id')
+        return job_id is not None and self._jobs_by_id.get(job_id) is job
+    
+    def _log_job_changes(self, changes: List[tuple], shared: bool = False) -> bool:
+        """
+        Log field updates for jobs in the table
+        
+        Args:
+            changes: List of (job, field names) pairs
+            shared: True when the caller holds self.lock in shared mode
+                    (every job must then be addressable by id)
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        records = []
+        for job, fields in changes:
+            if not self._addressable(job):
+                # Not addressable by id in the log: write a full snapshot
+                return self._persist_jobs()
+            records.append({
+                "op": "set",
+                "id": job['id'],
+                "fields": {field: job[field] for field in fields if field in job}
+            })
+        return self._log_mutations(records, shared=shared)
+    
+    def _persist_jobs(self) -> bool:
+        """
+        Write the in-memory job table to jobs.json and reset the mutation log
+        
+        The snapshot records the last folded log sequence number, so a crash
+        between writing it and truncating the log cannot apply a record twice.
+        On failure the cache is dropped, so readers fall back to what is on disk.
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        jobs = self._jobs if self._jobs is not None else []
+        snapshot = {"jobs": jobs, "count": len(jobs), "wal_seq": self._wal_seq}
+        if not self._write_snapshot(self.jobs_file, snapshot):
+            self._invalidate_job_table()
+            return False
+        
+        try:
+            self.wal.reset()
+        except Exception as e:
+            # The snapshot's wal_seq makes the leftover records harmless
+            logger.error(f"Error truncating {self.wal.path}: {e}")
+        
+        self._wal_offset = 0
+        self._wal_stamp = self.wal.stamp()
+        self._wal_pending = 0
+        self._hash_seq = self._wal_seq
+        self._version += 1
+        self._cache_version = self._version
+        self._shared_version = self._file_lock.bump()
+        self._jobs_stamp = self._file_stamp(self.jobs_file)
+        
+        if self._job_hashes is not None:
+            self._write_hash_index()
+        return True
+    
+    def _dedup_hashes(self) -> Set[str]:
+        """
+        Get the duplicate-detection hash set for the current job table
+        
+        Loaded from job_hashes.idx when that file is in step with the table,
+        otherwise rebuilt by hashing every stored job (and written back).
+        Caller holds self.lock and has loaded the table.
+        
+        Returns:
+            Set of job hashes (live reference)
+        """
+        if self._job_hashes is None:
+            self._job_hashes = self._load_hash_index()
+            if self._job_hashes is None:
+                self._job_hashes = {self._generate_job_hash(job) for job in self._jobs or []}
+                self._hash_index_rebuilds += 1
+                self._write_hash_index()
+        return self._job_hashes
+    
+    def _load_hash_index(self) -> Optional[Set[str]]:
+        """
+        Read job_hashes.idx
+        
+        The file starts with '#<seq> <stamp>' (the log sequence number and
+        file stamp of the snapshot it was written for), followed by
+        '+<hash> <seq>' / '-<hash> <seq>' lines appended as jobs are added and
+        deleted. It is only used when it was written for the loaded snapshot
+        (so a jobs.json replaced outside the manager is rehashed) and its last
+        sequence number matches the last add/delete applied to the table.
+        
+        Returns:
+            Set of hashes, or None if the file is missing or stale
+        """
+        hashes: Set[str] = set()
+        last_seq = None
+        snapshot = None
+        try:
+            with open(self.hash_index_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.rstrip('\n')
+                    if not line:
+                        continue
+                    if line.startswith('#'):
+                        seq, _, snapshot = line[1:].partition(' ')
+                        last_seq = int(seq)
+                        continue
+                    entry, seq = line.split(' ')
+                    if entry[0] == '+':
+                        hashes.add(entry[1:])
+                    else:
+                        hashes.discard(entry[1:])
+                    last_seq = int(seq)
+        except FileNotFoundError:
+            return None
+        except (ValueError, IndexError) as e:
+            logger.warning(f"Ignoring unreadable hash index {self.hash_index_file}: {e}")
+            return None
+        
+        if snapshot != self._hash_index_stamp() or last_seq != self._hash_seq:
+            return None
+        return hashes
+    
+    def _hash_index_stamp(self) -> str:
+        """Identify the loaded snapshot in the job_hashes.idx header"""
+        if self._jobs_stamp is None:
+            return '-'
+        return ':'.join(str(part) for part in self._jobs_stamp)
+    
+    def _write_hash_index(self):
+        """Rewrite job_hashes.idx from the in-memory hash set"""
+        temp_filepath = f"{self.hash_index_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_filepath, 'w', encoding='utf-8') as f:
+                f.write(f"#{self._hash_seq} {self._hash_index_stamp()}\n")
+                for job_hash in self._job_hashes:
+                    f.write(f"+{job_hash} {self._hash_seq}\n")
+            os.replace(temp_filepath, self.hash_index_file)
+        except Exception as e:
+            logger.error(f"Error writing hash index: {e}")
+    
+    def _append_hash_index(self, added: List[str], removed: List[str]):
+        """Record hash set changes made by the last logged mutation"""
+        if self._job_hashes is None or not (added or removed):
+            return
+        lines = [f"+{h} {self._hash_seq}\n" for h in added]
+        lines += [f"-{h} {self._hash_seq}\n" for h in removed]
+        try:
+            with open(self.hash_index_file, 'a', encoding='utf-8') as f:
+                f.write(''.join(lines))
+        except Exception as e:
+            # A stale index is detected and rebuilt on the next load
+            logger.error(f"Error appending to hash index: {e}")
+    
+    def _schedule_compaction(self):
+        """Fold the mutation log into jobs.json, in the background if enabled"""
+        if not self.background_compaction:
+            self._compact_locked()
+            return
+        if self._compaction_pending:
+            return
+        
+        self._compaction_pending = True
+        Thread(target=self._background_compact, name="jobs-wal-compaction", daemon=True).start()
+    
+    def _background_compact(self):
+        """Compaction thread body"""
+        try:
+            with self._writing():
+                self._job_table()
+                if self.wal.size() >= self.wal_compact_bytes:
+                    self._compact_locked()
+        except Exception as e:
+            logger.error(f"Error compacting mutation log: {e}")
+        finally:
+            self._compaction_pending = False
+    
+    def _compact_locked(self) -> bool:
+        """Write a new snapshot (caller holds self.lock)"""
+        if self._jobs is None:
+            return False
+        success = self._persist_jobs()
+        if success:
+            self._compactions += 1
+            logger.info(f"Compacted mutation log into {self.jobs_file}")
+        return success
+    
+    def compact(self) -> bool:
+        """
+        Fold the mutation log into a fresh jobs.json snapshot
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        with self._writing():
+            self._job_table()
+            return self._compact_locked()
+    
     def _generate_job_hash(self, job: Dict) -> str:
         """
         Generate a unique hash for a job to detect duplicates
@@ -227,24 +1421,29 @@ class JobStorageManager:
         Returns:
             Dictionary with save results
         """
-        with self.lock:
+        with self._writing():
             try:
-                # Read existing data
-                data = self._read_json(self.jobs_file)
-                if data is None:
-                    data = {"jobs": [], "count": 0}
+                existing_jobs = self._job_table()
+                fresh_table = self._jobs is None
+                if fresh_table:
+                    # jobs.json missing or unreadable: start a fresh table
+                    self._jobs = existing_jobs = []
+                    self._seqs = []
+                    self._scores = None
+                    self._status_counts = None
+                    self._search = None
+                    self._job_hashes = set()
+                    self._cache_version = self._version
                 
-                existing_jobs = data.get('jobs', [])
-                
-                # Build hash set of existing jobs
-                existing_hashes: Set[str] = set()
-                if skip_duplicates:
-                    existing_hashes = {self._generate_job_hash(job) for job in existing_jobs}
+                # Hash set of existing jobs, maintained incrementally
+                existing_hashes = self._dedup_hashes()
+                added_hashes = []
                 
                 # Process new jobs
                 added_count = 0
                 skipped_count = 0
                 invalid_count = 0
+                new_jobs = []
                 
                 for job in jobs:
                     # Validate job
@@ -265,17 +1464,23 @@ class JobStorageManager:
                     job['scraped_at'] = datetime.now().isoformat()
                     job['id'] = job_hash
                     
-                    # Add to list
-                    existing_jobs.append(job)
+                    # Add to table (a copy, so later changes by the caller don't leak in)
+                    stored_job = copy_job(job)
+                    self._append_job(stored_job)
+                    new_jobs.append(stored_job)
                     existing_hashes.add(job_hash)
+                    added_hashes.append(job_hash)
                     added_count += 1
                 
-                # Update data
-                data['jobs'] = existing_jobs
-                data['count'] = len(existing_jobs)
+                # Only the new jobs are appended to the log
+                if fresh_table:
+                    written = self._persist_jobs()
+                else:
+                    written = self._log_mutations([{"op": "add", "jobs": new_jobs}] if new_jobs else [])
+                    if written:
+                        self._append_hash_index(added_hashes, [])
                 
-                # Write to file
-                if not self._write_json(self.jobs_file, data):
+                if not written:
                     return {
                         "success": False,
                         "error": "Failed to write jobs to storage",
@@ -294,11 +1499,12 @@ class JobStorageManager:
                     "added": added_count,
                     "skipped": skipped_count,
                     "invalid": invalid_count,
-                    "total": data['count']
+                    "total": len(existing_jobs)
                 }
                 
             except Exception as e:
                 logger.error(f"Error saving jobs: {e}")
+                self._invalidate_job_table()
                 self._update_metadata(success=False)
                 self._log_error("save_jobs", str(e))
                 return {
@@ -313,39 +1519,113 @@ class JobStorageManager:
         """
         Retrieve all stored jobs with optional filtering
         
+        Filters are compiled once (see job_filters) and answered from the
+        id, score and status indexes when one covers a filtered field, so
+        only the candidate jobs are checked.
+        
+        Args:
+            filters: Optional filter criteria: a dictionary of field to value
+                     (e.g., {'source': 'indeed', 'location': 'New York'}) or
+                     to operators ({'score.overall_score': {'$gte': 70}}),
+                     or a compiled JobFilter
+        
+        Returns:
+            List of job dictionaries
+        """
+        try:
+            job_filter = compile_filters(filters)
+            with self._reading() as jobs:
+                # Copies keep callers from mutating the cached table
+                if job_filter is None:
+                    return [copy_job(job) for job in jobs]
+                return [copy_job(jobs[index]) for index in self._filter_positions(job_filter)
+                        if job_filter(jobs[index])]
+                
+        except Exception as e:
+            logger.error(f"Error retrieving jobs: {e}")
+            return []
+    
+    def get_jobs_page(self, limit: Optional[int] = 50, cursor: Optional[str] = None,
+                      fields: Optional[List[str]] = None,
+                      filters: Optional[Dict] = None, offset: int = 0) -> Dict:
+        """
+        Retrieve one page of stored jobs
+        
+        Only the jobs on the page are copied (and projected), so the cost
+        of a request does not grow with the size of the store.
+        
         Args:
-            filters: Optional dictionary with filter criteria
-                     (e.g., {'source': 'indeed', 'location': 'New York'})
-        
+            limit: Maximum number of jobs to return (None for all remaining)
+            cursor: Token from a previous page's next_cursor
+            fields: Optional list of top-level fields to return ('id' is always kept)
+            filters: Optional filters, as in get_all_jobs
+            offset: Number of matching jobs to skip (ignored when a cursor is given)
+            
         Returns:
-            List of job dictionaries
+            Dict with jobs, count, total and next_cursor (None on the last page)
+            
+        Raises:
+            ValueError: If the cursor or the filters are invalid, or the cursor
+                        is no longer resolvable
         """
-        with self.lock:
-            try:
-                data = self._read_json(self.jobs_file)
-                if data is None:
-                    return []
-                
-                jobs = data.get('jobs', [])
-                
-                # Apply filters if provided
-                if filters:
-                    filtered_jobs = []
-                    for job in jobs:
-                        match = True
-                        for key, value in filters.items():
-                            if key not in job or job[key] != value:
-                                match = False
-                                break
-                        if match:
-                            filtered_jobs.append(job)
-                    return filtered_jobs
-                
-                return jobs
-                
-            except Exception as e:
-                logger.error(f"Error retrieving jobs: {e}")
-                return []
+        if limit is not None and limit < 1:
+            raise ValueError("limit must be a positive integer")
+        position = decode_cursor(cursor) if cursor else None
+        job_filter = compile_filters(filters)
+        
+        with self._reading() as jobs:
+            start = 0
+            if position is not None:
+                start = self._resolve_cursor(position)
+            
+            if job_filter is None:
+                total = len(jobs)
+                candidates = range(start, len(jobs))
+            else:
+                positions = self._filter_positions(job_filter)
+                matching = [index for index in positions if job_filter(jobs[index])]
+                total = len(matching)
+                candidates = matching[bisect.bisect_left(matching, start):]
+            skip = offset if position is None else 0
+            
+            page = []
+            next_cursor = None
+            last_index = None
+            for index in candidates:
+                job = jobs[index]
+                if skip:
+                    skip -= 1
+                    continue
+                if limit is not None and len(page) >= limit:
+                    # There is at least one more match: hand out a cursor
+                    last = jobs[last_index]
+                    next_cursor = encode_cursor({
+                        "s": self._seqs[last_index],
+                        "id": last.get('id'),
+                        "g": self._table_generation
+                    })
+                    break
+                page.append(project_job(job, fields))
+                last_index = index
+            
+            return {
+                "jobs": page,
+                "count": len(page),
+                "total": total,
+                "next_cursor": next_cursor
+            }
+    
+    def _resolve_cursor(self, position: Dict) -> int:
+        """Map a decoded cursor to the table index to resume from"""
+        if position.get("g") == self._table_generation and "s" in position:
+            return bisect.bisect_right(self._seqs, position["s"])
+        
+        # The table was reloaded since the cursor was issued: resume after
+        # the last job handed out, if it still exists
+        for index, job in enumerate(self._jobs or []):
+            if job.get('id') == position.get("id"):
+                return index + 1
+        raise ValueError("Cursor has expired; restart pagination from the first page")
     
     def get_job_by_id(self, job_id: str) -> Optional[Dict]:
         """
@@ -357,11 +1637,13 @@ class JobStorageManager:
         Returns:
             Job dictionary or None if not found
         """
-        jobs = self.get_all_jobs()
-        for job in jobs:
-            if job.get('id') == job_id:
-                return job
-        return None
+        try:
+            with self._reading():
+                job = self._jobs_by_id.get(job_id)
+                return copy_job(job) if job is not None else None
+        except Exception as e:
+            logger.error(f"Error retrieving job {job_id}: {e}")
+            return None
     
     def delete_job(self, job_id: str) -> bool:
         """
@@ -373,29 +1655,27 @@ class JobStorageManager:
         Returns:
             True if successful, False otherwise
         """
-        with self.lock:
+        with self._writing():
             try:
-                data = self._read_json(self.jobs_file)
-                if data is None:
+                self._job_table()
+                if self._jobs is None:
                     return False
                 
-                jobs = data.get('jobs', [])
-                initial_count = len(jobs)
-                
-                # Filter out the job to delete
-                jobs = [job for job in jobs if job.get('id') != job_id]
-                
-                if len(jobs) == initial_count:
+                if job_id not in self._jobs_by_id:
                     logger.warning(f"Job {job_id} not found")
                     return False
                 
-                data['jobs'] = jobs
-                data['count'] = len(jobs)
+                # Filter out the job to delete
+                removed = self._remove_jobs(job_id)
                 
-                return self._write_json(self.jobs_file, data)
+                if not self._log_mutations([{"op": "delete", "id": job_id}]):
+                    return False
+                self._append_hash_index([], [self._generate_job_hash(job) for job in removed])
+                return True
                 
             except Exception as e:
                 logger.error(f"Error deleting job: {e}")
+                self._invalidate_job_table()
                 return False
     
     def clear_all_jobs(self) -> bool:
@@ -405,12 +1685,19 @@ class JobStorageManager:
         Returns:
             True if successful, False otherwise
         """
-        with self.lock:
+        with self._writing():
             try:
-                data = {"jobs": [], "count": 0}
-                return self._write_json(self.jobs_file, data)
+                self._jobs = []
+                self._seqs = []
+                self._scores = None
+                self._status_counts = None
+                self._search = None
+                self._rebuild_job_indexes()
+                self._job_hashes = set()
+                return self._persist_jobs()
             except Exception as e:
                 logger.error(f"Error clearing jobs: {e}")
+                self._invalidate_job_table()
                 return False
     
     def get_statistics(self) -> Dict:
@@ -420,13 +1707,8 @@ class JobStorageManager:
         Returns:
             Dictionary with statistics
         """
-        with self.lock:
-            try:
-                data = self._read_json(self.jobs_file)
-                metadata = self._read_json(self.metadata_file)
-                errors = self._read_json(self.errors_file)
-                
-                jobs = data.get('jobs', []) if data else []
+        try:
+            with self._reading() as jobs:
                 
                 # Calculate statistics
                 sources = {}
@@ -437,14 +1719,60 @@ class JobStorageManager:
                 return {
                     "total_jobs": len(jobs),
                     "jobs_by_source": sources,
-                    "metadata": metadata,
-                    "error_count": len(errors.get('errors', [])) if errors else 0,
-                    "storage_size_bytes": os.path.getsize(self.jobs_file) if os.path.exists(self.jobs_file) else 0
+                    "metadata": self.metadata_buffer.metadata(),
+                    "error_count": self.metadata_buffer.error_count(),
+                    "storage_size_bytes": (os.path.getsize(self.jobs_file) if os.path.exists(self.jobs_file) else 0) + self.wal.size(),
+                    "cache": {
+                        "hits": self._cache_hits,
+                        "misses": self._cache_misses,
+                        "version": self._version
+                    },
+                    "wal": {
+                        "size_bytes": self.wal.size(),
+                        "pending_records": self._wal_pending,
+                        "compactions": self._compactions
+                    },
+                    "dedup_index": {
+                        "loaded": self._job_hashes is not None,
+                        "hashes": len(self._job_hashes) if self._job_hashes is not None else 0,
+                        "rebuilds": self._hash_index_rebuilds
+                    },
+                    "status_events": {
+                        "size_bytes": self.status_events.size(),
+                        "since_snapshot": self._status_events_since_snapshot,
+                        "last_seq": self._status_event_seq,
+                        "snapshots": self._status_snapshots,
+                        "histories": len(self.status_manager.histories),
+                        "materialized": getattr(self.status_manager.histories, "materialized",
+                                                len(self.status_manager.histories))
+                    },
+                    "metadata_buffer": self.metadata_buffer.stats(),
+                    "locks": self.get_lock_statistics()
                 }
                 
-            except Exception as e:
-                logger.error(f"Error getting statistics: {e}")
-                return {}
+        except Exception as e:
+            logger.error(f"Error getting statistics: {e}")
+            return {}
+    
+    def get_lock_statistics(self) -> Dict:
+        """
+        Get lock wait-time metrics
+        
+        Returns:
+            Dict with acquisition counts and wait times (ms) for shared reads,
+            exclusive writes, per-job locks and the cross-process file lock
+        """
+        stats = self.lock.stats()
+        stats["job"] = self._job_locks.stats.to_dict()
+        stats["process"] = self._file_lock.stats.to_dict()
+        with self._group_cond:
+            stats["group_commit"] = {
+                "commits": self._group_commits,
+                "records": self._group_records,
+                "largest_batch": self._group_largest,
+                "avg_batch": round(self._group_records / self._group_commits, 2) if self._group_commits else 0.0
+            }
+        return stats
     
     def _update_metadata(self, success: bool = True):
         """
@@ -454,50 +1782,20 @@ class JobStorageManager:
             success: Whether the operation was successful
         """
         try:
-            metadata = self._read_json(self.metadata_file)
-            if metadata is None:
-                metadata = {}
-            
-            metadata['last_updated'] = datetime.now().isoformat()
-            metadata['total_scrapes'] = metadata.get('total_scrapes', 0) + 1
-            
-            if success:
-                metadata['successful_scrapes'] = metadata.get('successful_scrapes', 0) + 1
-            else:
-                metadata['failed_scrapes'] = metadata.get('failed_scrapes', 0) + 1
-            
-            self._write_json(self.metadata_file, metadata)
-            
+            self.metadata_buffer.record_scrape(success)
         except Exception as e:
             logger.error(f"Error updating metadata: {e}")
     
     def _log_error(self, operation: str, error_message: str):
         """
-        Log scraping errors
+        Log scraping errors (the last 100 are kept)
         
         Args:
             operation: Operation that failed
             error_message: Error message
         """
         try:
-            errors = self._read_json(self.errors_file)
-            if errors is None:
-                errors = {"errors": []}
-            
-            error_entry = {
-                "timestamp": datetime.now().isoformat(),
-                "operation": operation,
-                "error": error_message
-            }
-            
-            errors['errors'].append(error_entry)
-            
-            # Keep only last 100 errors
-            if len(errors['errors']) > 100:
-                errors['errors'] = errors['errors'][-100:]
-            
-            self._write_json(self.errors_file, errors)
-            
+            self.metadata_buffer.record_error(operation, error_message)
         except Exception as e:
             logger.error(f"Error logging error: {e}")
     
@@ -512,21 +1810,94 @@ class JobStorageManager:
             List of error dictionaries
         """
         try:
-            errors = self._read_json(self.errors_file)
-            if errors is None:
-                return []
-            
-            error_list = errors.get('errors', [])
-            return error_list[-limit:] if error_list else []
-            
+            return self.metadata_buffer.errors(limit)
         except Exception as e:
             logger.error(f"Error retrieving errors: {e}")
             return []
     
+    def flush_metadata(self) -> bool:
+        """
+        Write buffered scrape counters and errors to disk now
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        return self.metadata_buffer.flush()
+    
+    def iter_jobs(self, filters: Optional[Dict] = None, batch_size: int = 1000) -> Iterator[Dict]:
+        """
+        Iterate over stored jobs in storage order, one batch at a time
+        
+        The table lock is held only while a batch is copied, so writers are
+        not blocked for the whole iteration and at most batch_size copies are
+        alive at once. Jobs appended while iterating are included.
+        
+        Args:
+            filters: Optional filters, as in get_all_jobs
+            batch_size: Number of jobs copied per lock acquisition
+            
+        Yields:
+            Job dictionaries (copies)
+            
+        Raises:
+            ValueError: If the filters are invalid, or the table was reloaded
+                        and the last job handed out no longer exists
+        """
+        job_filter = compile_filters(filters)
+        position = None
+        while True:
+            with self._reading() as jobs:
+                start = self._resolve_cursor(position) if position else 0
+                batch = []
+                index = start
+                while index < len(jobs) and len(batch) < batch_size:
+                    job = jobs[index]
+                    if job_filter is None or job_filter(job):
+                        batch.append(copy_job(job))
+                    index += 1
+                if index > start:
+                    position = {"s": self._seqs[index - 1], "id": jobs[index - 1].get('id'),
+                                "g": self._table_generation}
+                finished = index >= len(jobs)
+            
+            yield from batch
+            if finished:
+                return
+    
+    def iter_ndjson(self, filters: Optional[Dict] = None, batch_size: int = 1000) -> Iterator[str]:
+        """
+        Serialize stored jobs as NDJSON, one line per job
+        
+        Args:
+            filters: Optional filters to apply
+            batch_size: Number of jobs copied per lock acquisition
+            
+        Yields:
+            Lines of JSON (each ending in a newline)
+        """
+        for job in self.iter_jobs(filters, batch_size):
+            yield json.dumps(job, ensure_ascii=False) + "\n"
+    
+    def _export_lines(self, output_file: str, lines: Iterable[str]) -> bool:
+        """Write lines to a temporary file and move it into place"""
+        temp_filepath = f"{output_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_filepath, 'w', encoding='utf-8') as f:
+                f.writelines(lines)
+            os.replace(temp_filepath, output_file)
+            return True
+        except Exception:
+            if os.path.exists(temp_filepath):
+                os.remove(temp_filepath)
+            raise
+    
     def export_to_json(self, output_file: str, filters: Optional[Dict] = None) -> bool:
         """
         Export jobs to a separate JSON file
         
+        Jobs are written as they are read, so the export never holds the
+        whole filtered list in memory.
+        
         Args:
             output_file: Path to output file
             filters: Optional filters to apply
@@ -535,21 +1906,119 @@ class JobStorageManager:
             True if successful, False otherwise
         """
         try:
-            jobs = self.get_all_jobs(filters)
-            
-            export_data = {
-                "exported_at": datetime.now().isoformat(),
-                "total_jobs": len(jobs),
-                "filters": filters,
-                "jobs": jobs
-            }
+            counter = {"jobs": 0}
+            
+            def lines():
+                yield "{\n"
+                yield f'  "exported_at": {json.dumps(datetime.now().isoformat())},\n'
+                yield f'  "filters": {json.dumps(filters, ensure_ascii=False)},\n'
+                yield '  "jobs": ['
+                for job in self.iter_jobs(filters):
+                    encoded = json.dumps(job, indent=2, ensure_ascii=False).replace("\n", "\n    ")
+                    yield ("," if counter["jobs"] else "") + "\n    " + encoded
+                    counter["jobs"] += 1
+                yield "\n  ],\n" if counter["jobs"] else "],\n"
+                yield f'  "total_jobs": {counter["jobs"]}\n}}\n'
+            
+            return self._export_lines(output_file, lines())
             
-            return self._write_json(output_file, export_data)
+        except Exception as e:
+            logger.error(f"Error exporting jobs: {e}")
+            return False
+    
+    def export_to_ndjson(self, output_file: str, filters: Optional[Dict] = None) -> bool:
+        """
+        Export jobs to an NDJSON file (one JSON object per line)
+        
+        Args:
+            output_file: Path to output file
+            filters: Optional filters to apply
             
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            return self._export_lines(output_file, self.iter_ndjson(filters))
         except Exception as e:
             logger.error(f"Error exporting jobs: {e}")
             return False
     
+    def import_ndjson(self, lines: Iterable, source: Optional[str] = None,
+                      batch_size: int = 1000, skip_duplicates: bool = True) -> Dict:
+        """
+        Import jobs from NDJSON, saving them in fixed-size batches
+        
+        Lines are parsed as they are read and handed to save_jobs() every
+        batch_size jobs, so the input is never held in memory as a whole.
+        
+        Args:
+            lines: Iterable of NDJSON lines (str or bytes), e.g. an open file
+            source: Source to record for every job (default: each job's own
+                    'source' field, or 'import')
+            batch_size: Number of jobs per save_jobs() call
+            skip_duplicates: Whether to skip duplicate jobs
+            
+        Returns:
+            Dictionary with import results
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+        
+        result = {
+            "success": True,
+            "lines": 0,
+            "added": 0,
+            "skipped": 0,
+            "invalid": 0,
+            "malformed": 0,
+            "batches": 0,
+            "errors": []
+        }
+        
+        def note_error(line_number, message):
+            if len(result["errors"]) < 20:
+                result["errors"].append({"line": line_number, "error": message})
+        
+        def save(batch):
+            groups = {}
+            for line_number, job in batch:
+                groups.setdefault(source or job.get('source') or 'import', []).append(job)
+            for group_source, jobs in groups.items():
+                saved = self.save_jobs(jobs, source=group_source, skip_duplicates=skip_duplicates)
+                for key in ("added", "skipped", "invalid"):
+                    result[key] += saved.get(key, 0)
+                if not saved.get("success"):
+                    result["success"] = False
+                    note_error(batch[0][0], saved.get("error", "save failed"))
+            result["batches"] += 1
+        
+        batch = []
+        for line_number, line in enumerate(lines, 1):
+            result["lines"] = line_number
+            if isinstance(line, bytes):
+                line = line.decode('utf-8')
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                job = json.loads(line)
+            except ValueError as e:
+                job = e
+            if not isinstance(job, dict):
+                result["malformed"] += 1
+                note_error(line_number, str(job) if isinstance(job, ValueError) else "not a JSON object")
+                continue
+            batch.append((line_number, job))
+            if len(batch) >= batch_size:
+                save(batch)
+                batch = []
+        if batch:
+            save(batch)
+        
+        logger.info(f"Imported NDJSON: {result['added']} added, {result['skipped']} skipped, "
+                    f"{result['invalid']} invalid, {result['malformed']} malformed")
+        return result
+    
     def update_job_score(self, job_id: str, score_data: Dict) -> bool:
         """
         Update the score and highlight for a specific job.
@@ -561,40 +2030,108 @@ class JobStorageManager:
         Returns:
             True if successful, False otherwise
         """
-        with self.lock:
-            try:
-                data = self._read_json(self.jobs_file)
-                if data is None:
-                    logger.error("Failed to read jobs file")
-                    return False
-                
-                jobs = data.get('jobs', [])
-                job_found = False
-                
-                # Find and update the job
-                for job in jobs:
-                    if job.get('id') == job_id:
-                        job['score'] = score_data
-                        job['scored_at'] = datetime.now().isoformat()
-                        job_found = True
-                        break
-                
-                if not job_found:
-                    logger.warning(f"Job {job_id} not found for score update")
-                    return False
-                
-                # Write updated data
-                data['jobs'] = jobs
-                success = self._write_json(self.jobs_file, data)
-                
-                if success:
-                    logger.info(f"Updated score for job {job_id}")
-                
-                return success
-                
-            except Exception as e:
-                logger.error(f"Error updating job score: {e}")
+        def apply(job):
+            job['score'] = copy.deepcopy(score_data)
+            job['scored_at'] = datetime.now().isoformat()
+        
+        try:
+            success = self._update_one_job(lambda: self._jobs_by_id.get(job_id), apply,
+                                           ('score', 'scored_at'))
+            if success is None:
+                logger.warning(f"Job {job_id} not found for score update")
                 return False
+            
+            if success:
+                logger.info(f"Updated score for job {job_id}")
+            
+            return success
+            
+        except Exception as e:
+            logger.error(f"Error updating job score: {e}")
+            with self.lock:
+                self._invalidate_job_table()
+            return False
+    
+    def _update_one_job(self, lookup, apply, fields: tuple) -> Optional[bool]:
+        """
+        Apply and log a change to a single job
+        
+        Runs with self.lock shared plus the job's stripe, so updates of
+        different jobs, and reads, proceed in parallel. Readers may be copying
+        the entry meanwhile, so the change is applied to a copy that then
+        replaces the entry (see _update_shared). The storage file lock
+        is held exclusively (shared by this process's concurrent updaters) so
+        other processes cannot write in between. If another process has
+        written since the table was loaded, or the entry cannot be addressed
+        by id in the log, the update falls back to the exclusive lock.
+        
+        Args:
+            lookup: Callable returning the table entry to change (or None)
+            apply: Callable that modifies the given job dictionary in place
+            fields: Names of the fields the change touches
+            
+        Returns:
+            None if the job was not found, otherwise whether the change was stored
+        """
+        with self._reading():
+            job = lookup()
+            if job is None:
+                return None
+            success = None
+            if self._addressable(job):
+                with self._group_cond:
+                    self._group_writers += 1
+                try:
+                    success = self._update_shared(job, apply, fields)
+                finally:
+                    with self._group_cond:
+                        self._group_writers -= 1
+        
+        if success is None:
+            with self._writing():
+                self._job_table()
+                job = lookup()
+                if job is None:
+                    return None
+                apply(job)
+                self._reindex_job(job, fields)
+                success = self._log_job_changes([(job, fields)])
+        
+        self._compact_if_due()
+        return success
+    
+    def _update_shared(self, job: Dict, apply, fields: tuple) -> Optional[bool]:
+        """
+        Apply and log a change while holding self.lock in shared mode
+        
+        The entry itself is never modified: the change is applied to a copy,
+        which replaces the entry in the table and lookups under
+        self._commit_lock, so readers see either the old or the new job.
+        
+        Args:
+            job: Addressable table entry to change
+            apply: Callable that modifies the given job dictionary in place
+            fields: Names of the fields the change touches
+            
+        Returns:
+            None if the table is stale (retry exclusively), otherwise whether
+            the change was stored
+        """
+        with self._file_lock.exclusive():
+            with self._commit_lock:
+                current = self._table_is_current()
+            if not current:
+                return None
+            with self._job_locks.locked(job['id']):
+                with self._commit_lock:
+                    # An earlier update of this job may have replaced the entry
+                    job = self._jobs_by_id[job['id']]
+                updated = copy_job(job)
+                apply(updated)
+                with self._commit_lock:
+                    self._replace_job(job, updated)
+                    self._reindex_job(updated, fields)
+                return self._log_job_changes([(updated, fields)], shared=True)
     
     def update_jobs_scores(self, job_scores: Dict[str, Dict]) -> Dict:
         """
@@ -606,10 +2143,10 @@ class JobStorageManager:
         Returns:
             Dictionary with update results
         """
-        with self.lock:
+        with self._writing():
             try:
-                data = self._read_json(self.jobs_file)
-                if data is None:
+                jobs = self._job_table()
+                if self._jobs is None:
                     return {
                         "success": False,
                         "error": "Failed to read jobs file",
@@ -617,26 +2154,24 @@ class JobStorageManager:
                         "not_found": 0
                     }
                 
-                jobs = data.get('jobs', [])
                 updated_count = 0
-                not_found_count = 0
+                changes = []
                 
                 # Update jobs with scores
                 for job in jobs:
                     job_id = job.get('id')
                     if job_id in job_scores:
-                        job['score'] = job_scores[job_id]
+                        job['score'] = copy.deepcopy(job_scores[job_id])
                         job['scored_at'] = datetime.now().isoformat()
+                        self._reindex_score(job)
+                        changes.append((job, ('score', 'scored_at')))
                         updated_count += 1
                 
                 # Check for job IDs that weren't found
-                for job_id in job_scores:
-                    if not any(job.get('id') == job_id for job in jobs):
-                        not_found_count += 1
+                not_found_count = sum(1 for job_id in job_scores if job_id not in self._jobs_by_id)
                 
                 # Write updated data
-                data['jobs'] = jobs
-                if not self._write_json(self.jobs_file, data):
+                if not self._log_job_changes(changes):
                     return {
                         "success": False,
                         "error": "Failed to write jobs file",
@@ -655,6 +2190,7 @@ class JobStorageManager:
                 
             except Exception as e:
                 logger.error(f"Error updating job scores: {e}")
+                self._invalidate_job_table()
                 return {
                     "success": False,
                     "error": str(e),
@@ -673,42 +2209,131 @@ class JobStorageManager:
             List of jobs with the specified highlight
         """
         try:
-            all_jobs = self.get_all_jobs()
-            return [job for job in all_jobs if job.get('score', {}).get('highlight') == highlight]
+            with self._reading():
+                with self._commit_lock:
+                    seqs = self._score_index().highlight(highlight)
+                return self._jobs_at(seqs)
         except Exception as e:
             logger.error(f"Error getting jobs by highlight: {e}")
             return []
     
     def get_scored_jobs(self, min_score: Optional[float] = None, 
-                        max_score: Optional[float] = None) -> List[Dict]:
+                        max_score: Optional[float] = None,
+                        top_k: Optional[int] = None) -> List[Dict]:
         """
         Get jobs filtered by score range.
         
+        Served from the sorted score index, so unscored jobs are never visited.
+        
         Args:
             min_score: Minimum score (inclusive)
             max_score: Maximum score (inclusive)
+            top_k: If given, return only the top_k highest-scoring jobs
+                   (best first; jobs without an overall_score are not ranked)
             
         Returns:
-            List of jobs within the score range
+            List of jobs within the score range (in storage order unless top_k is given)
         """
         try:
-            all_jobs = self.get_all_jobs()
-            scored_jobs = [job for job in all_jobs if 'score' in job]
-            
-            if min_score is not None:
-                scored_jobs = [job for job in scored_jobs 
-                              if job['score'].get('overall_score', 0) >= min_score]
-            
-            if max_score is not None:
-                scored_jobs = [job for job in scored_jobs 
-                              if job['score'].get('overall_score', 100) <= max_score]
-            
-            return scored_jobs
+            with self._reading():
+                with self._commit_lock:
+                    scores = self._score_index()
+                    if top_k is not None:
+                        seqs = scores.top_k(top_k, min_score, max_score)
+                    else:
+                        seqs = scores.range(min_score, max_score)
+                return self._jobs_at(seqs)
             
         except Exception as e:
             logger.error(f"Error getting scored jobs: {e}")
             return []
     
+    def search_jobs(self, query: str, limit: int = 20, offset: int = 0,
+                    fields: Optional[List[str]] = None, filters: Optional[Dict] = None) -> Dict:
+        """
+        Full-text search over job title, company and description
+        
+        Jobs matching any query term are ranked by BM25 (see search_index);
+        the index is built on the first search and then kept up to date as
+        jobs are added, changed and deleted.
+        
+        Args:
+            query: Free-text query
+            limit: Maximum number of jobs to return
+            offset: Number of ranked jobs to skip
+            fields: Optional list of top-level fields to return ('id' is always kept)
+            filters: Optional filters, as in get_all_jobs
+            
+        Returns:
+            Dict with jobs (best first, each with a search_score), count and total
+            
+        Raises:
+            ValueError: If limit, offset or the filters are invalid
+        """
+        if limit < 1:
+            raise ValueError("limit must be a positive integer")
+        if offset < 0:
+            raise ValueError("offset must not be negative")
+        job_filter = compile_filters(filters)
+        
+        with self._reading():
+            def job_at(seq):
+                position = bisect.bisect_left(self._seqs, seq)
+                return self._jobs[position]
+            
+            accept = None
+            if job_filter is not None:
+                accept = lambda seq: job_filter(job_at(seq))
+            with self._commit_lock:
+                ranked, total = self._search_index().search(query, limit, offset, accept)
+            
+            page = []
+            for seq, score in ranked:
+                job = project_job(job_at(seq), fields)
+                job['search_score'] = round(score, 4)
+                page.append(job)
+            return {
+                "jobs": page,
+                "count": len(page),
+                "total": total
+            }
+    
+    def _apply_status_update(self, job: Dict, status: str,
+                             applied_date: Optional[str] = None,
+                             notes: Optional[str] = None,
+                             timestamp: Optional[str] = None):
+        """
+        Apply a status change to a job record in place
+        
+        Args:
+            job: Job dictionary to modify
+            status: New application status
+            applied_date: Date when applied (ISO format)
+            notes: Additional notes about the application
+            timestamp: Time of the change (ISO format, defaults to now)
+        """
+        old_status = job.get("application_status")
+        
+        job["application_status"] = status
+        
+        if applied_date:
+            job["applied_date"] = applied_date
+            
+        if notes:
+            job["application_notes"] = notes
+            
+        if "status_history" not in job:
+            job["status_history"] = []
+            
+        job["status_history"].append({
+            "old_status": old_status,
+            "new_status": status,
+            "timestamp": timestamp or datetime.now().isoformat(),
+            "notes": notes
+        })
+        
+        job["last_updated"] = datetime.now().isoformat()
+    
     def update_job_status(self, job_id: str, status: str, 
                          applied_date: Optional[str] = None,
                          notes: Optional[str] = None) -> Dict:
@@ -724,65 +2349,39 @@ class JobStorageManager:
         Returns:
             Dict with success status and details
         """
-        with self.lock:
-            try:
-                data = self._read_json(self.jobs_file)
-                jobs = data.get("jobs", [])
-                
-                # Find the job
-                job_found = False
-                for job in jobs:
-                    if str(job.get("job_id")) == str(job_id):
-                        job_found = True
-                        
-                        # Store old status for history
-                        old_status = job.get("application_status")
-                        
-                        # Update status
-                        job["application_status"] = status
-                        
-                        if applied_date:
-                            job["applied_date"] = applied_date
-                            
-                        if notes:
-                            job["application_notes"] = notes
-                            
-                        # Add to status history
-                        if "status_history" not in job:
-                            job["status_history"] = []
-                            
-                        job["status_history"].append({
-                            "old_status": old_status,
-                            "new_status": status,
-                            "timestamp": datetime.now().isoformat(),
-                            "notes": notes
-                        })
-                        
-                        job["last_updated"] = datetime.now().isoformat()
-                        break
-                
-                if not job_found:
-                    return {
-                        "success": False,
-                        "error": f"Job not found: {job_id}"
-                    }
-                
-                # Save updated data
-                self._write_json(self.jobs_file, data)
-                
+        try:
+            # Find the job and save the updated record
+            found = self._update_one_job(
+                lambda: self._jobs_by_job_id.get(str(job_id)),
+                lambda job: self._apply_status_update(job, status, applied_date, notes),
+                self.STATUS_FIELDS
+            )
+            if found is None:
                 return {
-                    "success": True,
-                    "job_id": job_id,
-                    "status": status,
-                    "message": "Status updated successfully"
+                    "success": False,
+                    "error": f"Job not found: {job_id}"
                 }
-                
-            except Exception as e:
-                logger.error(f"Error updating job status: {e}")
+            if not found:
                 return {
                     "success": False,
-                    "error": str(e)
+                    "error": "Failed to write job status to storage"
                 }
+            
+            return {
+                "success": True,
+                "job_id": job_id,
+                "status": status,
+                "message": "Status updated successfully"
+            }
+            
+        except Exception as e:
+            logger.error(f"Error updating job status: {e}")
+            with self.lock:
+                self._invalidate_job_table()
+            return {
+                "success": False,
+                "error": str(e)
+            }
     
     def batch_update_job_statuses(self, status_updates: List[Dict]) -> Dict:
         """
@@ -794,17 +2393,15 @@ class JobStorageManager:
         Returns:
             Dict with batch update results
         """
-        with self.lock:
+        with self._writing():
             try:
-                data = self._read_json(self.jobs_file)
-                jobs = data.get("jobs", [])
-                
-                # Create job lookup
-                jobs_lookup = {str(job.get("job_id")): job for job in jobs}
+                self._job_table()
+                jobs_lookup = self._jobs_by_job_id
                 
                 updated_count = 0
                 not_found = []
                 errors = []
+                changes = []
                 
                 for update in status_updates:
                     job_id = str(update.get("job_id"))
@@ -814,36 +2411,23 @@ class JobStorageManager:
                     
                     if job_id in jobs_lookup:
                         job = jobs_lookup[job_id]
-                        old_status = job.get("application_status")
-                        
-                        # Update status
-                        job["application_status"] = status
-                        
-                        if applied_date:
-                            job["applied_date"] = applied_date
-                            
-                        if notes:
-                            job["application_notes"] = notes
-                            
-                        # Add to status history
-                        if "status_history" not in job:
-                            job["status_history"] = []
-                            
-                        job["status_history"].append({
-                            "old_status": old_status,
-                            "new_status": status,
-                            "timestamp": update.get("timestamp", datetime.now().isoformat()),
-                            "notes": notes
-                        })
-                        
-                        job["last_updated"] = datetime.now().isoformat()
+                        self._apply_status_update(
+                            job, status, applied_date, notes,
+                            timestamp=update.get("timestamp")
+                        )
+                        self._reindex_job(job, self.STATUS_FIELDS)
+                        changes.append((job, self.STATUS_FIELDS))
                         updated_count += 1
                     else:
                         not_found.append(job_id)
                 
                 # Save updated data
-                if updated_count > 0:
-                    self._write_json(self.jobs_file, data)
+                if updated_count > 0 and not self._log_job_changes(changes):
+                    return {
+                        "success": False,
+                        "error": "Failed to write job statuses to storage",
+                        "updated": 0
+                    }
                 
                 return {
                     "success": True,
@@ -855,6 +2439,7 @@ class JobStorageManager:
                 
             except Exception as e:
                 logger.error(f"Error in batch status update: {e}")
+                self._invalidate_job_table()
                 return {
                     "success": False,
                     "error": str(e),
@@ -871,58 +2456,43 @@ class JobStorageManager:
         Returns:
             List of jobs with the specified status
         """
-        try:
-            all_jobs = self.get_all_jobs()
-            return [job for job in all_jobs if job.get("application_status") == status]
-        except Exception as e:
-            logger.error(f"Error getting jobs by status: {e}")
-            return []
+        return self.get_all_jobs({"application_status": status})
     
     def get_status_summary(self) -> Dict:
         """
         Get summary of application statuses across all jobs
         
+        Served from the status aggregates, so jobs are not visited per call.
+        
         Returns:
             Dict with status counts and statistics
         """
         try:
-            all_jobs = self.get_all_jobs()
-            
-            summary = {
-                "total_jobs": len(all_jobs),
-                "status_counts": {},
-                "jobs_with_status": 0,
-                "jobs_without_status": 0,
-                "recent_applications": []
-            }
-            
-            # Count statuses
-            for job in all_jobs:
-                status = job.get("application_status")
-                if status:
-                    summary["status_counts"][status] = summary["status_counts"].get(status, 0) + 1
-                    summary["jobs_with_status"] += 1
-                else:
-                    summary["jobs_without_status"] += 1
-                    
-                # Track recent applications
-                if job.get("applied_date"):
-                    summary["recent_applications"].append({
+            with self._reading() as jobs:
+                with self._commit_lock:
+                    counts = self._status_aggregates()
+                    status_counts = counts.status_counts()
+                    recent_seqs = counts.recent(10)
+                total_jobs = len(jobs)
+                recent_jobs = self._jobs_at(recent_seqs)
+            
+            jobs_with_status = sum(status_counts.values())
+            return {
+                "total_jobs": total_jobs,
+                "status_counts": status_counts,
+                "jobs_with_status": jobs_with_status,
+                "jobs_without_status": total_jobs - jobs_with_status,
+                "recent_applications": [
+                    {
                         "job_id": job.get("job_id"),
                         "title": job.get("title"),
                         "company": job.get("company"),
-                        "status": status,
+                        "status": job.get("application_status"),
                         "applied_date": job.get("applied_date")
-                    })
-            
-            # Sort recent applications by date
-            summary["recent_applications"].sort(
-                key=lambda x: x.get("applied_date", ""), 
-                reverse=True
-            )
-            summary["recent_applications"] = summary["recent_applications"][:10]
-            
-            return summary
+                    }
+                    for job in recent_jobs
+                ]
+            }
             
         except Exception as e:
             logger.error(f"Error getting status summary: {e}")
@@ -947,8 +2517,8 @@ class JobStorageManager:
         """
         try:
             status = ApplicationStatus.from_string(initial_status)
-            self.status_manager.create_history(job_id, status)
-            self._save_status_histories()
+            with self._status_transaction() as status_manager:
+                status_manager.create_history(job_id, status)
             return True
         except Exception as e:
             logger.error(f"Error creating status history for {job_id}: {e}")
@@ -979,14 +2549,15 @@ class JobStorageManager:
             # Convert status string to enum
             status_enum = ApplicationStatus.from_string(new_status)
             
-            # Update in status manager
-            success = self.status_manager.update_status(
-                job_id, 
-                status_enum, 
-                notes=notes, 
-                user_id=user_id,
-                create_if_missing=True
-            )
+            # Update in status manager (saved on leaving the transaction)
+            with self._status_transaction() as status_manager:
+                success = status_manager.update_status(
+                    job_id, 
+                    status_enum, 
+                    notes=notes, 
+                    user_id=user_id,
+                    create_if_missing=True
+                )
             
             if not success:
                 return {
@@ -995,9 +2566,6 @@ class JobStorageManager:
                     "job_id": job_id
                 }
             
-            # Save status histories
-            self._save_status_histories()
-            
             # Optionally update the job record itself
             if update_job_record:
                 update_data = {
@@ -1045,6 +2613,7 @@ class JobStorageManager:
             Status history dict or None
         """
         try:
+            self._refresh_status_histories()
             history = self.status_manager.get_history(job_id)
             if history:
                 return create_status_summary(history)
@@ -1061,6 +2630,7 @@ class JobStorageManager:
             List of status history summaries
         """
         try:
+            self._refresh_status_histories()
             return [
                 create_status_summary(history) 
                 for history in self.status_manager.histories.values()
@@ -1080,11 +2650,9 @@ class JobStorageManager:
             Results summary
         """
         try:
-            # Use status manager's bulk update
-            results = self.status_manager.bulk_update(updates)
-            
-            # Save status histories
-            self._save_status_histories()
+            # Use status manager's bulk update (saved on leaving the transaction)
+            with self._status_transaction() as status_manager:
+                results = status_manager.bulk_update(updates)
             
             # Optionally update job records
             for update in updates:
@@ -1119,6 +2687,7 @@ class JobStorageManager:
         """
         try:
             status_enum = ApplicationStatus.from_string(status)
+            self._refresh_status_histories()
             job_ids = self.status_manager.get_jobs_by_status(status_enum)
             
             result = []
@@ -1147,6 +2716,7 @@ class JobStorageManager:
             basic_summary = self.get_status_summary()
             
             # Get status manager statistics
+            self._refresh_status_histories()
             manager_stats = self.status_manager.get_statistics()
             
             # Combine summaries
@@ -1165,23 +2735,27 @@ class JobStorageManager:
                 "error": str(e)
             }
     
-    def get_status_timeline(self, job_id: str) -> List[Dict]:
+    def get_status_timeline(self, job_id: str, since: Optional[datetime] = None,
+                            until: Optional[datetime] = None) -> List[Dict]:
         """
         Get timeline of status changes for a job
         
         Args:
             job_id: Job identifier
+            since: Only include changes at or after this time
+            until: Only include changes at or before this time
             
         Returns:
             List of status transitions with timestamps
         """
         try:
+            self._refresh_status_histories()
             history = self.status_manager.get_history(job_id)
             if not history:
                 return []
             
             timeline = []
-            for transition in history.transitions:
+            for transition in history.get_transitions_between(since, until):
                 timeline.append({
                     "from_status": transition.from_status.value if transition.from_status else None,
                     "to_status": transition.to_status.value,
@@ -1201,32 +2775,31 @@ class JobStorageManager:
         """
         Get jobs that have been in current status for too long
         
+        Only the stale histories are visited: the status manager keeps them
+        ordered by when their current status started.
+        
         Args:
             days_threshold: Number of days to consider as "too long"
             
         Returns:
-            List of jobs needing attention
+            List of jobs needing attention, longest in their status first
         """
         try:
             pending_jobs = []
             
-            for job_id, history in self.status_manager.histories.items():
-                days_in_status = history.get_days_in_current_status()
-                
-                if days_in_status >= days_threshold:
-                    job = self.get_job_by_id(job_id)
-                    if job:
-                        pending_jobs.append({
-                            "job_id": job_id,
-                            "title": job.get("title"),
-                            "company": job.get("company"),
-                            "current_status": history.current_status.value,
-                            "days_in_status": days_in_status,
-                            "last_updated": history.updated_at.isoformat()
-                        })
-            
-            # Sort by days in status (descending)
-            pending_jobs.sort(key=lambda x: x["days_in_status"], reverse=True)
+            self._refresh_status_histories()
+            stale = self.status_manager.get_stale_histories(days_threshold)
+            for job_id, (status, _, since, updated_at) in stale:
+                job = self.get_job_by_id(job_id)
+                if job:
+                    pending_jobs.append({
+                        "job_id": job_id,
+                        "title": job.get("title"),
+                        "company": job.get("company"),
+                        "current_status": status,
+                        "days_in_status": days_since(since),
+                        "last_updated": updated_at
+                    })
             
             return pending_jobs
             
@@ -1270,3 +2843,44 @@ class JobStorageManager:
         except Exception as e:
             logger.error(f"Error exporting status report: {e}")
             return False
+
+
+# ========== Shared Manager Registry ==========
+
+_storage_managers: Dict[tuple, JobStorageManager] = {}
+_storage_managers_lock = Lock()
+
+
+def get_storage_manager(storage_dir: str = 'data', manager_class: Optional[type] = None) -> JobStorageManager:
+    """
+    Get the process-wide storage manager for a directory
+    
+    The manager is created on first use and then reused, so callers get a
+    warm job table and status histories instead of re-initializing storage
+    and re-reading every history from disk on each request.
+    
+    Args:
+        storage_dir: Storage directory
+        manager_class: JobStorageManager or a subclass (default JobStorageManager)
+        
+    Returns:
+        Shared manager instance
+    """
+    manager_class = manager_class or JobStorageManager
+    key = (os.path.abspath(storage_dir), manager_class)
+    manager = _storage_managers.get(key)
+    if manager is None:
+        with _storage_managers_lock:
+            manager = _storage_managers.get(key)
+            if manager is None:
+                manager = manager_class(storage_dir=storage_dir)
+                _storage_managers[key] = manager
+    return manager
+
+
+def clear_storage_managers():
+    """Forget all shared managers (e.g. between tests or after removing a storage directory)"""
+    with _storage_managers_lock:
+        for manager in _storage_managers.values():
+            manager.flush_metadata()
+        _storage_managers.clear()
@@ -16,7 +16,7 @@ import unittest
 import os
 import json
 import tempfile
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from application_status import (
     ApplicationStatus,
     StatusTransition,
@@ -276,6 +276,136 @@ class TestStatusHistory(unittest.TestCase):
         self.assertEqual(new_history.current_status, self.history.current_status)
         self.assertEqual(len(new_history.transitions), len(self.history.transitions))
 
+    def test_compact_round_trip(self):
+        """Test that the compact representation keeps every field exactly"""
+        data = {
+            "job_id": "job_456",
+            "current_status": "Interview",
+            "created_at": "2025-11-01T09:00:00.123456",
+            "updated_at": "2025-11-03T14:30:00.000001",
+            "transitions": [
+                {"from_status": None, "to_status": "Applied", "timestamp": "2025-11-02T10:00:00.500000",
+                 "notes": "Submitted", "user_id": None},
+                {"from_status": "Applied", "to_status": "Interview", "timestamp": "2025-11-03T14:30:00.000001",
+                 "notes": None, "user_id": "user_1"}
+            ]
+        }
+        history = StatusHistory.from_dict(data)
+
+        self.assertEqual(history.to_dict(), data)
+        self.assertIsNone(history.transitions[0].from_status)
+        self.assertEqual(history.transitions[-1].timestamp, datetime(2025, 11, 3, 14, 30, 0, 1))
+        self.assertEqual([t.to_status for t in history.transitions[:2]],
+                         [ApplicationStatus.APPLIED, ApplicationStatus.INTERVIEW])
+        self.assertEqual(history, StatusHistory.from_dict(history.to_dict()))
+        self.assertEqual(history.get_status_at_date(datetime(2025, 11, 2, 12)), ApplicationStatus.APPLIED)
+
+    def test_status_at_date_and_ranges(self):
+        """Test as-of and range queries over the transition timestamps"""
+        start = datetime(2025, 11, 1, 9, 0)
+        history = StatusHistory(job_id="job_789", created_at=start, updated_at=start)
+        history.transitions = [
+            StatusTransition(from_status=ApplicationStatus.PENDING, to_status=status,
+                             timestamp=start + timedelta(days=day))
+            for day, status in ((1, ApplicationStatus.APPLIED), (3, ApplicationStatus.INTERVIEW),
+                                (3, ApplicationStatus.OFFER), (7, ApplicationStatus.REJECTED))
+        ]
+
+        self.assertIsNone(history.get_status_at_date(start - timedelta(seconds=1)))
+        self.assertEqual(history.get_status_at_date(start), ApplicationStatus.PENDING)
+        self.assertEqual(history.get_status_at_date(start + timedelta(days=1)), ApplicationStatus.APPLIED)
+        self.assertEqual(history.get_status_at_date(start + timedelta(days=3)), ApplicationStatus.OFFER)
+        self.assertEqual(history.get_status_at_date(start + timedelta(days=30)), ApplicationStatus.REJECTED)
+
+        between = history.get_transitions_between(start + timedelta(days=1), start + timedelta(days=3))
+        self.assertEqual([t.to_status for t in between],
+                         [ApplicationStatus.APPLIED, ApplicationStatus.INTERVIEW, ApplicationStatus.OFFER])
+        self.assertEqual(len(history.get_transitions_between(start + timedelta(days=2))), 3)
+        self.assertEqual(len(history.get_transitions_between(end=start)), 0)
+        self.assertEqual(len(history.get_transitions_between()), 4)
+
+    def test_transitions_assignment(self):
+        """Test replacing and appending transitions"""
+        transition = StatusTransition(
+            from_status=ApplicationStatus.PENDING,
+            to_status=ApplicationStatus.APPLIED,
+            notes="Applied online"
+        )
+        self.history.transitions = [transition]
+        self.history.transitions.append(StatusTransition(
+            from_status=ApplicationStatus.APPLIED,
+            to_status=ApplicationStatus.REJECTED
+        ))
+
+        self.assertEqual(len(self.history.transitions), 2)
+        self.assertEqual(self.history.transitions[0], transition)
+        self.assertIsNone(self.history.transitions[1].notes)
+        with self.assertRaises(IndexError):
+            self.history.transitions[2]
+
+    def test_transition_changes_are_written_back(self):
+        """Test that changing a transition read from the history changes the history"""
+        self.history.add_transition(ApplicationStatus.APPLIED, notes="Applied online")
+        self.history.add_transition(ApplicationStatus.INTERVIEW)
+
+        self.history.transitions[-1].notes = "Phone screen"
+        self.history.transitions[0].user_id = "user_1"
+        self.history.transitions[-1].to_status = ApplicationStatus.REJECTED
+
+        self.assertEqual(self.history.transitions[-1].notes, "Phone screen")
+        self.assertEqual(self.history.transitions[0].user_id, "user_1")
+        self.assertEqual(self.history.transitions[-1].to_status, ApplicationStatus.REJECTED)
+        self.assertEqual(self.history.to_dict()["transitions"][-1]["notes"], "Phone screen")
+
+        # A transition read before the transitions were replaced no longer writes back
+        stale = self.history.transitions[0]
+        self.history.transitions = list(self.history.transitions)
+        stale.notes = "Ignored"
+        self.assertEqual(self.history.transitions[0].notes, "Applied online")
+
+    def test_timezone_aware_timestamps(self):
+        """Test that timezone-aware timestamps keep their timezone"""
+        zone = timezone(timedelta(hours=-5))
+        start = datetime(2025, 11, 1, 9, 0, tzinfo=zone)
+        history = StatusHistory(job_id="job_tz", created_at=start, updated_at=start)
+        history.transitions.append(StatusTransition(
+            from_status=ApplicationStatus.PENDING,
+            to_status=ApplicationStatus.APPLIED,
+            timestamp=start + timedelta(days=1)
+        ))
+        history.add_transition(ApplicationStatus.INTERVIEW)
+
+        self.assertEqual(history.created_at, start)
+        self.assertEqual(history.created_at.tzinfo, zone)
+        self.assertEqual(history.transitions[0].timestamp.tzinfo, zone)
+        self.assertIsNone(history.transitions[1].timestamp.tzinfo)
+        self.assertEqual(history.get_status_at_date(start + timedelta(days=1)), ApplicationStatus.APPLIED)
+
+        restored = StatusHistory.from_dict(json.loads(json.dumps(history.to_dict())))
+        self.assertEqual(restored, history)
+        self.assertEqual(restored.transitions[0].timestamp, start + timedelta(days=1))
+        self.assertEqual(restored.transitions[0].timestamp.tzinfo, zone)
+
+    def test_transitions_kept_in_time_order(self):
+        """Test that out-of-order transitions are sorted and out-of-order edits rejected"""
+        start = datetime(2025, 11, 1, 9, 0)
+        history = StatusHistory(job_id="job_order", created_at=start, updated_at=start)
+        for day, status in ((1, ApplicationStatus.APPLIED), (5, ApplicationStatus.REJECTED),
+                            (3, ApplicationStatus.INTERVIEW)):
+            history.transitions.append(StatusTransition(
+                from_status=None, to_status=status, timestamp=start + timedelta(days=day), notes=status.value
+            ))
+
+        self.assertEqual([t.to_status for t in history.transitions],
+                         [ApplicationStatus.APPLIED, ApplicationStatus.INTERVIEW, ApplicationStatus.REJECTED])
+        self.assertEqual([t.notes for t in history.transitions], ["Applied", "Interview", "Rejected"])
+        self.assertEqual(history.get_status_at_date(start + timedelta(days=4)), ApplicationStatus.INTERVIEW)
+
+        with self.assertRaises(ValueError):
+            history.transitions[0].timestamp = start + timedelta(days=4)
+        history.transitions[1].timestamp = start + timedelta(days=2)
+        self.assertEqual(history.get_status_at_date(start + timedelta(days=2)), ApplicationStatus.INTERVIEW)
+
 
 class TestApplicationStatusManager(unittest.TestCase):
     """Test ApplicationStatusManager class"""
@@ -409,6 +539,36 @@ class TestApplicationStatusManager(unittest.TestCase):
         self.assertEqual(stats["status_counts"]["Interview"], 1)
         self.assertIn("average_transitions", stats)
     
+    def test_statistics_follow_direct_changes(self):
+        """Test that statistics see histories changed without going through the manager"""
+        self.manager.create_history("job_1")
+        self.assertEqual(self.manager.get_statistics()["status_counts"]["Pending"], 1)
+        
+        self.manager.get_history("job_1").add_transition(ApplicationStatus.APPLIED)
+        stats = self.manager.get_statistics()
+        counts = stats["status_counts"]
+        self.assertEqual(counts.get("Applied", 0), 1)
+        self.assertEqual(counts.get("Pending", 0), 0)
+        
+        self.manager.histories["job_2"] = StatusHistory(job_id="job_2", current_status=ApplicationStatus.OFFER)
+        self.manager.get_history("job_1").transitions[-1].to_status = ApplicationStatus.INTERVIEW
+        self.manager.get_history("job_1").current_status = ApplicationStatus.INTERVIEW
+        stats = self.manager.get_statistics()
+        counts = stats["status_counts"]
+        self.assertEqual(stats["total_jobs"], 2)
+        self.assertEqual((counts.get("Applied", 0), counts.get("Interview", 0),
+                          counts.get("Offer", 0)), (0, 1, 1))
+        
+        # A replaced or removed history no longer counts
+        replaced = self.manager.histories["job_2"]
+        self.manager.histories["job_2"] = StatusHistory(job_id="job_2")
+        replaced.current_status = ApplicationStatus.REJECTED
+        del self.manager.histories["job_1"]
+        stats = self.manager.get_statistics()
+        counts = stats["status_counts"]
+        self.assertEqual(stats["total_jobs"], 1)
+        self.assertEqual((counts.get("Pending", 0), counts.get("Rejected", 0)), (1, 0))
+    
     def test_get_jobs_by_status(self):
         """Test getting jobs by status"""
         self.manager.create_history("job_1")
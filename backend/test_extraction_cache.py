@@ -0,0 +1,189 @@
+"""
+Test suite for the keyword extraction result cache
+Tests ExtractionCache (LRU eviction, statistics, disk tier) and its use by KeywordExtractor.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+
+# Add backend directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from extraction_cache import ExtractionCache
+from keyword_extractor import KeywordExtractor
+
+
+class TestExtractionCache(unittest.TestCase):
+    """Test cases for ExtractionCache."""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.test_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Clean up test environment"""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_keys(self):
+        """Keys depend on the pipeline, kind, options and text"""
+        key = ExtractionCache.make_key("v1:regex", "keywords", (20, True), "python developer")
+        self.assertEqual(key, ExtractionCache.make_key("v1:regex", "keywords", (20, True), "python developer"))
+        for other in (("v1:en_core_web_sm-3.7.1", "keywords", (20, True), "python developer"),
+                      ("v1:regex", "skills", (20, True), "python developer"),
+                      ("v1:regex", "keywords", (10, True), "python developer"),
+                      ("v1:regex", "keywords", (20, True), "python developers")):
+            self.assertNotEqual(key, ExtractionCache.make_key(*other))
+
+    def test_lru_eviction_and_stats(self):
+        """The least recently used entry is evicted; hits and misses are counted"""
+        cache = ExtractionCache(max_entries=2)
+        cache.put("a", {"n": 1})
+        cache.put("b", {"n": 2})
+        self.assertEqual(cache.get("a"), {"n": 1})
+        cache.put("c", {"n": 3})
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), {"n": 1})
+        self.assertEqual(cache.get("c"), {"n": 3})
+        stats = cache.stats()
+        self.assertEqual((stats["entries"], stats["hits"], stats["misses"], stats["evictions"]), (2, 3, 1, 1))
+        self.assertEqual(stats["hit_rate"], 0.75)
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.stats()["hits"], 0)
+
+    def test_results_are_copies(self):
+        """Changing a returned or stored result does not change the cache"""
+        cache = ExtractionCache()
+        value = {"technical_skills": ["python"]}
+        cache.put("k", value)
+        value["technical_skills"].append("java")
+        cache.get("k")["technical_skills"].append("sql")
+        self.assertEqual(cache.get("k"), {"technical_skills": ["python"]})
+
+    def test_disk_tier(self):
+        """Results on disk survive a restart and the disk tier stays bounded"""
+        path = os.path.join(self.test_dir, "cache", "keywords.db")
+        cache = ExtractionCache(max_entries=2, disk_path=path, max_disk_entries=10)
+        for n in range(15):
+            cache.put(f"k{n}", [n])
+        self.assertLessEqual(cache.stats()["disk_entries"], 10)
+        cache.close()
+
+        reopened = ExtractionCache(max_entries=2, disk_path=path, max_disk_entries=10)
+        self.assertEqual(reopened.get("k14"), [14])
+        self.assertIsNone(reopened.get("k0"))
+        stats = reopened.stats()
+        self.assertEqual((stats["hits"], stats["disk_hits"], stats["misses"]), (0, 1, 1))
+        self.assertEqual(reopened.get("k14"), [14])
+        self.assertEqual(reopened.stats()["hits"], 1)
+        reopened.close()
+
+    def test_failed_disk_write_is_rolled_back(self):
+        """A failed insert or prune leaves no open transaction for the next put to commit"""
+        path = os.path.join(self.test_dir, "keywords.db")
+        cache = ExtractionCache(max_entries=2, disk_path=path, max_disk_entries=2)
+        cache.put("k0", [0])
+        cache.put("k1", [1])
+        cache._conn.execute("CREATE TRIGGER fail_prune BEFORE DELETE ON extraction_cache "
+                            "BEGIN SELECT RAISE(ABORT, 'disk full'); END")
+        cache._conn.commit()
+
+        # The insert succeeds, the prune that follows fails
+        cache.put("k2", [2])
+        self.assertFalse(cache._conn.in_transaction)
+        self.assertEqual(cache.stats()["disk_entries"], 2)
+        cache._conn.execute("DROP TRIGGER fail_prune")
+        cache._conn.commit()
+        cache.close()
+
+        reopened = ExtractionCache(max_entries=0, disk_path=path)
+        self.assertIsNone(reopened.get("k2"))
+        self.assertEqual(reopened.get("k1"), [1])
+        reopened.close()
+
+    def test_concurrent_access(self):
+        """Concurrent readers and writers keep the cache consistent"""
+        cache = ExtractionCache(max_entries=50, disk_path=os.path.join(self.test_dir, "keywords.db"))
+        errors = []
+
+        def worker(offset):
+            try:
+                for n in range(200):
+                    key = f"k{(offset + n) % 80}"
+                    result = cache.get(key)
+                    if result is None:
+                        cache.put(key, {"key": key})
+                    elif result != {"key": key}:
+                        errors.append(result)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(n * 7,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        stats = cache.stats()
+        self.assertEqual(stats["hits"] + stats["disk_hits"] + stats["misses"], 1600)
+        self.assertLessEqual(stats["entries"], 50)
+        cache.close()
+
+
+class TestKeywordExtractorCache(unittest.TestCase):
+    """Test cases for cached keyword extraction."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures that are used by all tests."""
+        cls.extractor = KeywordExtractor(cache_size=16)
+
+    def setUp(self):
+        """Start every test with an empty cache"""
+        self.extractor.cache.clear()
+
+    def test_repeated_extraction_hits_cache(self):
+        """The same preprocessed text is extracted once"""
+        job = {'title': 'Python Developer', 'description': 'Django, AWS and leadership.'}
+        first = self.extractor.extract_job_keywords(job)
+        # Same text after preprocessing
+        second = self.extractor.extract_job_keywords({'title': 'PYTHON Developer!',
+                                                      'description': 'Django, AWS and leadership.'})
+        self.assertEqual(first, second)
+        stats = self.extractor.cache_stats()
+        self.assertTrue(stats['enabled'])
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+
+        # Options are part of the key
+        self.extractor.extract_keywords('Django and AWS', top_n=5)
+        self.extractor.extract_keywords('Django and AWS', top_n=10)
+        self.assertEqual(self.extractor.cache_stats()['misses'], 3)
+
+    def test_batch_extracts_only_misses(self):
+        """Batch extraction reuses cached jobs and caches the rest"""
+        jobs = [{'title': f'Engineer {n}', 'description': 'Python and SQL'} for n in range(4)]
+        self.extractor.extract_job_keywords(jobs[1])
+
+        results = self.extractor.extract_job_keywords_many(jobs)
+        stats = self.extractor.cache_stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 4))
+        self.assertEqual(results[1], self.extractor.extract_job_keywords(jobs[1]))
+
+    def test_cache_disabled(self):
+        """cache_size=0 without a path turns caching off"""
+        extractor = KeywordExtractor(cache_size=0)
+        extractor.nlp = self.extractor.nlp
+        self.assertIsNone(extractor.cache)
+        self.assertEqual(extractor.cache_stats(), {'enabled': False})
+        self.assertEqual(extractor.extract_skills('python'), self.extractor.extract_skills('python'))
+
+
+if __name__ == '__main__':
+    unittest.main()
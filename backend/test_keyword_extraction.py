@@ -126,7 +126,45 @@ class TestKeywordExtractor(unittest.TestCase):
         print(f"  Total keywords: {result['keyword_count']}")
         print(f"  Technical skills: {result['technical_skills']}")
         print(f"  Title keywords: {[kw['keyword'] for kw in result['title_keywords'][:3]]}")
-    
+
+    def test_extract_job_keywords_many(self):
+        """Test that batch extraction matches one-at-a-time extraction."""
+        jobs = [
+            {'title': 'Senior Python Developer', 'description': 'Django, Flask and AWS. Strong leadership.'},
+            {'title': 'Data Scientist', 'description': 'Machine learning with pandas and scikit-learn.'},
+            {'title': '', 'description': 'Docker and Kubernetes operations.'},
+            {'title': 'Frontend Engineer'},
+        ]
+
+        results = self.extractor.extract_job_keywords_many(jobs, batch_size=2)
+        self.extractor.cache.clear()
+
+        self.assertEqual(len(results), len(jobs))
+        for job, result in zip(jobs, results):
+            self.assertEqual(result, self.extractor.extract_job_keywords(job))
+
+        # Plain strings are job descriptions
+        self.assertEqual(self.extractor.extract_job_keywords_many(['Python and SQL']),
+                         [self.extractor.extract_job_keywords({'description': 'Python and SQL'})])
+        self.assertEqual(self.extractor.extract_job_keywords_many([]), [])
+        print("✓ Batch job keyword extraction matches single extraction")
+
+    def test_single_parse_per_text(self):
+        """Test that job and resume extraction parse their text once."""
+        job_data = {'title': 'Python Engineer', 'description': 'Build data pipelines with SQL and AWS.'}
+        self.extractor.cache.clear()
+
+        with patch.object(KeywordExtractor, '_parse', autospec=True,
+                          side_effect=KeywordExtractor._parse) as parse:
+            result = self.extractor.extract_job_keywords(job_data)
+            self.assertEqual(parse.call_count, 1)
+            self.extractor.extract_resume_keywords("Python developer with SQL and leadership experience")
+            self.assertEqual(parse.call_count, 2)
+
+        self.assertIn('python', result['technical_skills'])
+        self.assertIn('python', [kw['keyword'] for kw in result['title_keywords']])
+        print("✓ Each text parsed once")
+
     def test_extract_resume_keywords(self):
         """Test resume keyword extraction."""
         resume_text = """
@@ -244,6 +282,18 @@ class TestKeywordExtractor(unittest.TestCase):
         self.assertIs(instance1, instance2)
         print("✓ Singleton pattern working correctly")
 
+    def test_pipeline_tiers(self):
+        """Test tier selection and that unused spaCy components are not loaded."""
+        self.assertEqual(self.extractor.tier, KeywordExtractor.DEFAULT_TIER)
+        with self.assertRaises(ValueError):
+            KeywordExtractor(tier='turbo')
+
+        if self.extractor.nlp:
+            self.assertIn(self.extractor.model_name, KeywordExtractor.PIPELINE_TIERS['fast'])
+            for component in KeywordExtractor.UNUSED_COMPONENTS:
+                self.assertNotIn(component, self.extractor.nlp.pipe_names)
+        print("✓ Pipeline tiers working")
+
 
 class TestKeywordExtractionAPI(unittest.TestCase):
     """Test cases for keyword extraction API endpoints."""
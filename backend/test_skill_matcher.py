@@ -0,0 +1,80 @@
+"""
+Test suite for the skill phrase matcher
+Tests SkillMatcher (word-boundary matching, multi-word phrases, lookups) and its use by KeywordExtractor.
+"""
+
+import os
+import sys
+import unittest
+
+# Add backend directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from skill_matcher import SkillMatcher
+from keyword_extractor import KeywordExtractor
+
+
+class TestSkillMatcher(unittest.TestCase):
+    """Test cases for SkillMatcher."""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.matcher = SkillMatcher({
+            'technical': {'ai', 'java', 'javascript', 'sql', 'c++', 'node.js', 'scikit-learn',
+                          'machine learning', 'power bi'},
+            'soft_skill': {'leadership', 'problem solving'}
+        })
+
+    def test_word_boundaries(self):
+        """Phrases only match whole words"""
+        self.assertEqual(self.matcher.find("maintain the email of a javascript mysql team"),
+                         [(5, 6, 'javascript', 'technical')])
+        self.assertEqual([match[2] for match in self.matcher.find("AI, Java and SQL")], ['ai', 'java', 'sql'])
+
+    def test_multi_word_and_symbol_phrases(self):
+        """Phrases spanning several words, separators and symbols are matched"""
+        text = "Machine learning with scikit learn, Node.js, C++ and problem-solving; machine vision"
+        self.assertEqual(self.matcher.find(text), [
+            (0, 2, 'machine learning', 'technical'),
+            (3, 5, 'scikit-learn', 'technical'),
+            (5, 7, 'node.js', 'technical'),
+            (7, 8, 'c++', 'technical'),
+            (9, 11, 'problem solving', 'soft_skill'),
+        ])
+        self.assertEqual(self.matcher.find("power"), [])
+        self.assertEqual(self.matcher.find(""), [])
+
+    def test_lookups(self):
+        """Exact phrase and fragment lookups"""
+        self.assertEqual(self.matcher.phrase_category("Node.js"), 'technical')
+        self.assertEqual(self.matcher.phrase_category("leadership"), 'soft_skill')
+        self.assertIsNone(self.matcher.phrase_category("machine"))
+        self.assertIsNone(self.matcher.phrase_category(""))
+
+        self.assertTrue(self.matcher.is_fragment("learning", 'technical'))
+        self.assertTrue(self.matcher.is_fragment("problem"))
+        self.assertFalse(self.matcher.is_fragment("problem", 'technical'))
+        self.assertFalse(self.matcher.is_fragment("and"))
+        self.assertEqual((self.matcher.size, self.matcher.max_words), (11, 2))
+
+
+class TestKeywordExtractorSkills(unittest.TestCase):
+    """Test cases for skill matching in KeywordExtractor."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures that are used by all tests."""
+        cls.extractor = KeywordExtractor(cache_size=0)
+
+    def test_no_substring_matches(self):
+        """Skills hidden inside other words are not reported"""
+        skills = self.extractor.extract_skills("Maintain digital JavaScript apps on MySQL and pandas")
+        self.assertEqual(skills['technical_skills'], ['javascript', 'mysql', 'pandas'])
+        self.assertEqual(self.extractor._categorize_keyword('and'), 'general')
+        self.assertEqual(self.extractor._categorize_keyword('email'), 'general')
+        self.assertEqual(self.extractor._categorize_keyword('python developer'), 'technical')
+        self.assertEqual(self.extractor._categorize_keyword('learning'), 'technical')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,327 @@
+"""
+Test Suite for the SQLite Job Storage Backend
+Checks that SQLiteJobStorageManager matches the JSON backend's public API
+and that existing jobs.json data migrates correctly
+"""
+
+import unittest
+import os
+import json
+import shutil
+import sqlite3
+import tempfile
+
+from storage_manager import JobStorageManager
+from sqlite_storage import SQLiteJobStorageManager, migrate_json_to_sqlite
+
+
+def create_test_job(index, **extra):
+    """Create a test job dictionary"""
+    job = {
+        "job_id": f"job_{index:03d}",
+        "title": f"Software Engineer {index}",
+        "company": f"Company {index}",
+        "location": "New York, NY" if index % 2 == 0 else "Austin, TX",
+        "link": f"https://example.com/job/{index}",
+        "description": "Python and AWS",
+    }
+    job.update(extra)
+    return job
+
+
+class TestSQLiteStorage(unittest.TestCase):
+    """Test SQLiteJobStorageManager operations"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.test_dir = tempfile.mkdtemp()
+        self.storage = SQLiteJobStorageManager(storage_dir=self.test_dir)
+        self.storage.save_jobs([create_test_job(i) for i in range(6)], source="indeed")
+
+    def tearDown(self):
+        """Clean up test environment"""
+        self.storage.store.close()
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def test_save_and_duplicates(self):
+        """Duplicates are detected through the primary key"""
+        result = self.storage.save_jobs([create_test_job(1), create_test_job(10)], source="indeed")
+        self.assertEqual(result["added"], 1)
+        self.assertEqual(result["skipped"], 1)
+        self.assertEqual(result["total"], 7)
+        self.assertFalse(os.path.exists(os.path.join(self.test_dir, "jobs.json")))
+
+    def test_save_without_skipping_duplicates(self):
+        """A duplicate refreshes the stored job but keeps its status, score and position"""
+        job_id = self.storage.get_all_jobs({"job_id": "job_001"})[0]["id"]
+        self.storage.update_job_status("job_001", "Applied", notes="Sent")
+        self.storage.update_job_score(job_id, {"overall_score": 85, "highlight": "green"})
+
+        result = self.storage.save_jobs([create_test_job(1, description="Python, AWS and Go"),
+                                         create_test_job(10)], source="linkedin", skip_duplicates=False)
+        self.assertEqual((result["added"], result["updated"], result["skipped"], result["total"]), (1, 1, 0, 7))
+
+        jobs = self.storage.get_all_jobs()
+        self.assertEqual(jobs[1]["id"], job_id)
+        self.assertEqual(jobs[1]["description"], "Python, AWS and Go")
+        self.assertEqual(jobs[1]["source"], "linkedin")
+        self.assertEqual(jobs[1]["application_status"], "Applied")
+        self.assertEqual(jobs[1]["score"]["overall_score"], 85)
+        self.assertEqual(len(self.storage.get_jobs_by_highlight("green")), 1)
+
+    def test_get_all_jobs_with_filters(self):
+        """Indexed and non-indexed filters both apply"""
+        self.assertEqual(len(self.storage.get_all_jobs()), 6)
+        self.assertEqual(len(self.storage.get_all_jobs({"location": "Austin, TX"})), 3)
+        self.assertEqual(len(self.storage.get_all_jobs({"title": "Software Engineer 2"})), 1)
+        self.assertEqual(self.storage.get_all_jobs()[0]["job_id"], "job_000")
+
+    def test_get_and_delete_job(self):
+        """Jobs can be fetched and deleted by id"""
+        job = self.storage.get_all_jobs()[0]
+        self.assertEqual(self.storage.get_job_by_id(job["id"])["title"], job["title"])
+        self.assertTrue(self.storage.delete_job(job["id"]))
+        self.assertFalse(self.storage.delete_job(job["id"]))
+        self.assertIsNone(self.storage.get_job_by_id(job["id"]))
+
+    def test_scores_and_highlights(self):
+        """Score updates are reflected in the indexed columns"""
+        jobs = self.storage.get_all_jobs()
+        self.assertTrue(self.storage.update_job_score(jobs[0]["id"], {"overall_score": 85, "highlight": "red"}))
+        result = self.storage.update_jobs_scores({
+            jobs[1]["id"]: {"overall_score": 55, "highlight": "yellow"},
+            "missing": {"overall_score": 10, "highlight": "white"}
+        })
+        self.assertEqual(result["updated"], 1)
+        self.assertEqual(result["not_found"], 1)
+
+        self.assertEqual(len(self.storage.get_scored_jobs()), 2)
+        self.assertEqual(len(self.storage.get_scored_jobs(min_score=60)), 1)
+        self.assertEqual(len(self.storage.get_scored_jobs(max_score=60)), 1)
+        self.assertEqual(self.storage.get_jobs_by_highlight("red")[0]["id"], jobs[0]["id"])
+        self.assertEqual([job["id"] for job in self.storage.get_scored_jobs(top_k=2)],
+                         [jobs[0]["id"], jobs[1]["id"]])
+
+    def test_status_updates(self):
+        """Status updates find jobs by job_id and keep the job history"""
+        result = self.storage.update_job_status("job_002", "Applied", notes="Sent")
+        self.assertTrue(result["success"])
+        job = self.storage.get_all_jobs({"job_id": "job_002"})[0]
+        self.assertEqual(job["application_status"], "Applied")
+        self.assertEqual(len(job["status_history"]), 1)
+
+        batch = self.storage.batch_update_job_statuses([
+            {"job_id": "job_003", "status": "Interview"},
+            {"job_id": "nope", "status": "Offer"}
+        ])
+        self.assertEqual(batch["updated"], 1)
+        self.assertEqual(batch["not_found_ids"], ["nope"])
+        self.assertEqual(len(self.storage.get_jobs_by_status("Interview")), 1)
+        self.assertEqual(self.storage.get_status_summary()["jobs_with_status"], 2)
+
+    def test_statistics(self):
+        """Statistics are computed in SQL"""
+        stats = self.storage.get_statistics()
+        self.assertEqual(stats["total_jobs"], 6)
+        self.assertEqual(stats["jobs_by_source"], {"indeed": 6})
+        self.assertEqual(stats["backend"], "sqlite")
+
+    def test_jobs_page(self):
+        """Pages resume by row sequence and project the requested fields"""
+        first = self.storage.get_jobs_page(limit=4, fields=["title"])
+        self.assertEqual(first["total"], 6)
+        self.assertEqual(set(first["jobs"][0].keys()), {"id", "title"})
+
+        self.storage.delete_job(first["jobs"][0]["id"])
+        rest = self.storage.get_jobs_page(limit=4, cursor=first["next_cursor"])
+        self.assertEqual([job["job_id"] for job in rest["jobs"]], ["job_004", "job_005"])
+        self.assertIsNone(rest["next_cursor"])
+
+        filtered = self.storage.get_jobs_page(limit=1, filters={"title": "Software Engineer 3"})
+        self.assertEqual(filtered["total"], 1)
+        self.assertIsNone(filtered["next_cursor"])
+
+    def test_ndjson_round_trip(self):
+        """NDJSON export reads rows in batches and imports into another backend"""
+        self.assertEqual(len(list(self.storage.iter_jobs(batch_size=4))), 6)
+        lines = list(self.storage.iter_ndjson({"location": "Austin, TX"}, batch_size=2))
+        self.assertEqual([json.loads(line)["job_id"] for line in lines], ["job_001", "job_003", "job_005"])
+
+        target = JobStorageManager(storage_dir=os.path.join(self.test_dir, "copy"))
+        result = target.import_ndjson(self.storage.iter_ndjson(), batch_size=4)
+        self.assertEqual((result["added"], result["batches"]), (6, 2))
+        self.assertEqual({job["source"] for job in target.get_all_jobs()}, {"indeed"})
+
+    def test_filter_operators(self):
+        """Operator filters give the same jobs whether evaluated in SQL or Python"""
+        self.storage.update_job_score(self.storage.get_all_jobs()[2]["id"], {"overall_score": 80, "highlight": "red"})
+        cases = [
+            ({"location": {"$in": ["Austin, TX"]}}, ["job_001", "job_003", "job_005"]),
+            ({"job_id": {"$gte": "job_002", "$lt": "job_004"}}, ["job_002", "job_003"]),
+            ({"job_id": {"$prefix": "job_00"}, "title": {"$prefix": "Software Engineer 4"}}, ["job_004"]),
+            ({"score.overall_score": {"$gt": 50}, "score.highlight": "red"}, ["job_002"]),
+            ({"score": {"$exists": True}}, ["job_002"]),
+        ]
+        for filters, expected in cases:
+            with self.subTest(filters=filters):
+                self.assertEqual([job["job_id"] for job in self.storage.get_all_jobs(filters)], expected)
+                page = self.storage.get_jobs_page(limit=2, filters=filters)
+                self.assertEqual(page["total"], len(expected))
+        with self.assertRaises(ValueError):
+            self.storage.get_jobs_page(filters={"job_id": {"$like": "job"}})
+
+    def test_non_string_fields_filter_like_json_backend(self):
+        """A job_id that is not a string only matches filters with the same value"""
+        jobs = [create_test_job(20, job_id=123), create_test_job(21, job_id=12.5)]
+        self.storage.save_jobs(jobs, source="linkedin")
+        json_storage = JobStorageManager(storage_dir=os.path.join(self.test_dir, "json"))
+        json_storage.save_jobs([create_test_job(i) for i in range(6)], source="indeed")
+        json_storage.save_jobs(jobs, source="linkedin")
+
+        cases = [{"job_id": "123"}, {"job_id": 123}, {"job_id": {"$prefix": "1"}},
+                 {"job_id": {"$in": ["123", "job_001"]}}, {"job_id": {"$gte": "1", "$lt": "2"}},
+                 {"job_id": {"$gt": 100}}, {"job_id": {"$exists": True}}]
+        for filters in cases:
+            with self.subTest(filters=filters):
+                expected = [job["title"] for job in json_storage.get_all_jobs(filters)]
+                self.assertEqual([job["title"] for job in self.storage.get_all_jobs(filters)], expected)
+                self.assertEqual(self.storage.get_jobs_page(limit=2, filters=filters)["total"], len(expected))
+
+        # Status updates still look job_ids up as strings, first match first
+        self.assertTrue(self.storage.update_job_status(123, "Applied")["success"])
+        applied = self.storage.get_jobs_by_status("Applied")
+        self.assertEqual([job["title"] for job in applied], ["Software Engineer 20"])
+
+    def test_version_1_database_is_migrated(self):
+        """Rows written with str() of non-string values are re-mirrored on open"""
+        self.storage.save_jobs([create_test_job(20, job_id=123)], source="linkedin")
+        self.storage.store.close()
+        conn = sqlite3.connect(self.storage.db_path)
+        conn.execute("DROP INDEX idx_jobs_untyped")
+        conn.execute("ALTER TABLE jobs DROP COLUMN untyped")
+        conn.execute("UPDATE jobs SET job_id = CAST(json_extract(data, '$.job_id') AS TEXT)")
+        conn.execute("UPDATE schema_info SET value = '1' WHERE key = 'version'")
+        conn.commit()
+        conn.close()
+
+        self.storage = SQLiteJobStorageManager(storage_dir=self.test_dir)
+        self.assertEqual(self.storage.get_all_jobs({"job_id": "123"}), [])
+        self.assertEqual(len(self.storage.get_all_jobs({"job_id": 123})), 1)
+        self.assertEqual(len(self.storage.get_all_jobs({"job_id": "job_001"})), 1)
+
+    def test_search(self):
+        """Full-text search ranks with FTS5 and follows inserts and deletes"""
+        self.storage.save_jobs([
+            create_test_job(10, title="Senior Python Developer"),
+            create_test_job(11, title="C++ Engineer", company="Python Labs", description="Embedded"),
+        ], source="linkedin")
+        result = self.storage.search_jobs("python", limit=3)
+        self.assertEqual(result["total"], 8)
+        self.assertEqual([job["job_id"] for job in result["jobs"][:2]], ["job_010", "job_011"])
+        self.assertEqual([job["job_id"] for job in self.storage.search_jobs("c++")["jobs"]], ["job_011"])
+
+        filtered = self.storage.search_jobs("python", filters={"source": "indeed", "title": {"$prefix": "Software"}})
+        self.assertEqual(filtered["total"], 6)
+        self.storage.delete_job(self.storage.get_all_jobs({"job_id": "job_010"})[0]["id"])
+        self.assertEqual(self.storage.search_jobs("senior")["total"], 0)
+
+    def test_search_without_fts(self):
+        """Without FTS5, search ranks with an in-memory index and gives the same results"""
+        self.storage.save_jobs([
+            create_test_job(10, title="Senior Python Developer"),
+            create_test_job(11, title="C++ Engineer", company="Python Labs", description="Embedded"),
+        ], source="linkedin")
+        filters = {"source": "indeed", "title": {"$prefix": "Software"}}
+        with_fts = [self.storage.search_jobs("python", limit=3), self.storage.search_jobs("c++"),
+                    self.storage.search_jobs("python", filters=filters)]
+
+        self.storage.store.searchable = False
+        without_fts = [self.storage.search_jobs("python", limit=3), self.storage.search_jobs("c++"),
+                       self.storage.search_jobs("python", filters=filters)]
+        for fts, fallback in zip(with_fts, without_fts):
+            self.assertEqual(fallback["total"], fts["total"])
+            self.assertEqual([job["job_id"] for job in fallback["jobs"]], [job["job_id"] for job in fts["jobs"]])
+
+    def test_search_non_ascii_matches_json_backend(self):
+        """Accented and non-Latin words are searched the same way as on the JSON backend"""
+        jobs = [
+            create_test_job(10, title="Barista", company="Café Zürich", description="Résumé required"),
+            create_test_job(11, title="Ingénieur logiciel", description="東京 オフィス"),
+        ]
+        self.storage.save_jobs(jobs, source="linkedin")
+        json_storage = JobStorageManager(storage_dir=os.path.join(self.test_dir, "json"))
+        json_storage.save_jobs([create_test_job(i) for i in range(6)], source="indeed")
+        json_storage.save_jobs(jobs, source="linkedin")
+
+        cases = [("café", ["job_010"]), ("CAFE", ["job_010"]), ("zurich", ["job_010"]),
+                 ("résumé", ["job_010"]), ("ingenieur", ["job_011"]), ("東京", ["job_011"]),
+                 ("rich", []), ("sum", []), ("caf", [])]
+        for query, expected in cases:
+            with self.subTest(query=query):
+                for storage in (self.storage, json_storage):
+                    result = storage.search_jobs(query)
+                    self.assertEqual([job["job_id"] for job in result["jobs"]], expected)
+                    self.assertEqual(result["total"], len(expected))
+
+    def test_indexes_exist(self):
+        """Lookup columns are indexed"""
+        conn = sqlite3.connect(self.storage.db_path)
+        indexes = {row[1] for row in conn.execute("PRAGMA index_list('jobs')")}
+        conn.close()
+        for column in ("job_id", "source", "location", "application_status", "overall_score", "highlight"):
+            self.assertIn(f"idx_jobs_{column}", indexes)
+
+
+class TestJSONMigration(unittest.TestCase):
+    """Test migration from jobs.json"""
+
+    def setUp(self):
+        """Create a JSON store to migrate"""
+        self.test_dir = tempfile.mkdtemp()
+        json_storage = JobStorageManager(storage_dir=self.test_dir)
+        json_storage.save_jobs([create_test_job(i) for i in range(4)], source="glassdoor")
+        json_storage.update_job_score(json_storage.get_all_jobs()[0]["id"], {"overall_score": 90, "highlight": "red"})
+        self.json_jobs = json_storage.get_all_jobs()
+
+    def tearDown(self):
+        """Clean up test environment"""
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def test_migration_function(self):
+        """migrate_json_to_sqlite copies every job and is idempotent"""
+        result = migrate_json_to_sqlite(self.test_dir)
+        self.assertTrue(result["success"])
+        self.assertEqual(result["migrated"], 4)
+
+        again = migrate_json_to_sqlite(self.test_dir)
+        self.assertEqual(again["migrated"], 0)
+        self.assertEqual(again["total"], 4)
+
+    def test_migration_reports_duplicate_ids(self):
+        """Records sharing an id are counted and logged as skipped"""
+        jobs_file = os.path.join(self.test_dir, "jobs.json")
+        with open(jobs_file, encoding="utf-8") as f:
+            data = json.load(f)
+        data["jobs"].append(dict(self.json_jobs[1], title="Copy"))
+        with open(jobs_file, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+        with self.assertLogs("sqlite_storage", level="WARNING") as logs:
+            result = migrate_json_to_sqlite(self.test_dir)
+        self.assertEqual((result["migrated"], result["skipped"], result["total"]), (4, 1, 4))
+        self.assertIn(self.json_jobs[1]["id"], logs.output[0])
+
+    def test_automatic_migration(self):
+        """Opening an empty database imports jobs.json with ids intact"""
+        storage = SQLiteJobStorageManager(storage_dir=self.test_dir)
+        try:
+            self.assertEqual(storage.get_all_jobs(), self.json_jobs)
+            self.assertEqual(len(storage.get_jobs_by_highlight("red")), 1)
+        finally:
+            storage.store.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,1475 @@
+"""
+Test Suite for JobStorageManager internals
+Covers the in-memory job table, its invalidation rules, the mutation log,
+the persistent duplicate-detection index, paged reads, the score index
+and concurrent access from threads and processes
+"""
+
+import sys
+import unittest
+import os
+import json
+import shutil
+import tempfile
+import threading
+import multiprocessing
+import time
+
+from storage_manager import JobStorageManager, get_storage_manager, clear_storage_managers
+from storage_locks import ReadWriteLock
+from datetime import datetime, timedelta
+
+from application_status import ApplicationStatus, ApplicationStatusManager
+from status_aggregates import HistoryAggregates
+from job_filters import parse_query_filters
+from snapshot_format import (write_snapshot, read_snapshot, SnapshotReader, SnapshotError,
+                             is_snapshot, json_to_snapshot, snapshot_to_json)
+
+
+def create_test_job(index, **extra):
+    """Create a test job dictionary"""
+    job = {
+        "job_id": f"job_{index:03d}",
+        "title": f"Software Engineer {index}",
+        "company": f"Company {index}",
+        "location": "New York, NY" if index % 2 == 0 else "Austin, TX",
+        "link": f"https://example.com/job/{index}",
+        "description": "Python and AWS",
+    }
+    job.update(extra)
+    return job
+
+
+def status_worker(storage_dir, worker, rounds):
+    """Process body for the multi-process test: hammer update_job_status"""
+    storage = JobStorageManager(storage_dir=storage_dir, wal_compact_bytes=4096,
+                                background_compaction=False)
+    for n in range(rounds):
+        storage.update_job_status(f"job_{worker:03d}", "Applied", notes=f"{worker}-{n}")
+        storage.update_job_status("job_007", "Interview", notes=f"{worker}-{n}")
+        storage.get_jobs_by_status("Applied")
+    for n in range(5):
+        storage.create_status_history(f"history_{worker}_{n}")
+
+
+def shared_manager_worker(storage, rounds):
+    """Process body: keep using a manager inherited from the parent"""
+    for n in range(rounds):
+        storage.update_job_status("job_003", "Applied", notes=f"child {n}")
+
+
+class TestJobTableCache(unittest.TestCase):
+    """Test the parsed job table cache"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.test_dir = tempfile.mkdtemp()
+        self.storage = JobStorageManager(storage_dir=self.test_dir)
+        self.storage.save_jobs([create_test_job(i) for i in range(5)], source="indeed")
+
+    def tearDown(self):
+        """Clean up test environment"""
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def test_repeated_reads_hit_cache(self):
+        """Reads after a write are served without re-parsing jobs.json"""
+        before = self.storage.get_statistics()["cache"]
+        self.storage.get_all_jobs()
+        self.storage.get_scored_jobs()
+        self.storage.get_job_by_id(self.storage.get_all_jobs()[0]["id"])
+        after = self.storage.get_statistics()["cache"]
+        self.assertEqual(after["misses"], before["misses"])
+        self.assertGreater(after["hits"], before["hits"])
+
+    def test_returned_jobs_are_copies(self):
+        """Mutating a returned job does not leak into the cache"""
+        job = self.storage.get_all_jobs()[0]
+        job["title"] = "Changed"
+        job["status_history"] = "bogus"
+        fresh = self.storage.get_job_by_id(job["id"])
+        self.assertNotEqual(fresh["title"], "Changed")
+        self.assertNotIn("status_history", fresh)
+
+    def test_nested_fields_of_returned_jobs_are_copies(self):
+        """Mutating a nested field of a returned job does not leak into the cache or the indexes"""
+        job_id = self.storage.get_all_jobs()[1]["id"]
+        score = {"overall_score": 80, "highlight": "green"}
+        self.storage.update_job_score(job_id, score)
+        self.storage.update_job_status("job_001", "Applied")
+        score["overall_score"] = 5
+
+        for job in (self.storage.get_job_by_id(job_id),
+                    self.storage.get_all_jobs({"id": job_id})[0],
+                    next(job for job in self.storage.iter_jobs() if job["id"] == job_id),
+                    self.storage.get_scored_jobs()[0]):
+            job["score"]["overall_score"] = 1
+            job["status_history"].append({"status": "Bogus"})
+
+        fresh = self.storage.get_job_by_id(job_id)
+        self.assertEqual(fresh["score"]["overall_score"], 80)
+        self.assertEqual(len(fresh["status_history"]), 1)
+        self.assertEqual([job["id"] for job in self.storage.get_scored_jobs(min_score=50)], [job_id])
+
+    def test_external_write_invalidates_cache(self):
+        """A write through another manager is picked up via the file stamp"""
+        other = JobStorageManager(storage_dir=self.test_dir)
+        other.save_jobs([create_test_job(99)], source="glassdoor")
+        self.assertEqual(len(self.storage.get_all_jobs()), 6)
+
+        other.update_job_status("job_001", "Applied")
+        job = self.storage.get_all_jobs({"job_id": "job_001"})[0]
+        self.assertEqual(job["application_status"], "Applied")
+
+    def test_writes_update_table_in_place(self):
+        """Write paths keep the cached table and file in sync"""
+        job_id = self.storage.get_all_jobs()[2]["id"]
+        self.storage.update_job_score(job_id, {"overall_score": 75, "highlight": "yellow"})
+        self.storage.delete_job(self.storage.get_all_jobs()[0]["id"])
+
+        reloaded = JobStorageManager(storage_dir=self.test_dir)
+        self.assertEqual(reloaded.get_all_jobs(), self.storage.get_all_jobs())
+        self.assertEqual(len(reloaded.get_jobs_by_highlight("yellow")), 1)
+
+    def test_corrupted_file_is_not_cached(self):
+        """An unreadable jobs.json yields no jobs and is retried on the next read"""
+        with open(self.storage.jobs_file, 'w') as f:
+            f.write("{ corrupted")
+        self.assertEqual(self.storage.get_all_jobs(), [])
+        self.assertIsNone(self.storage._jobs)
+
+
+class TestMutationLog(unittest.TestCase):
+    """Test the append-only job mutation log"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.test_dir = tempfile.mkdtemp()
+        self.storage = JobStorageManager(storage_dir=self.test_dir, background_compaction=False)
+        self.storage.save_jobs([create_test_job(i) for i in range(5)], source="indeed")
+
+    def tearDown(self):
+        """Clean up test environment"""
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def test_single_updates_append_to_log(self):
+        """Score and status updates leave jobs.json untouched"""
+        snapshot_before = os.stat(self.storage.jobs_file).st_mtime_ns
+        job_id = self.storage.get_all_jobs()[0]["id"]
+        self.assertTrue(self.storage.update_job_score(job_id, {"overall_score": 80, "highlight": "red"}))
+        self.assertTrue(self.storage.update_job_status("job_002", "Applied")["success"])
+        self.assertTrue(self.storage.delete_job(self.storage.get_all_jobs()[4]["id"]))
+
+        self.assertEqual(os.stat(self.storage.jobs_file).st_mtime_ns, snapshot_before)
+        self.assertGreater(os.path.getsize(self.storage.wal_file), 0)
+
+    def test_log_is_replayed_on_load(self):
+        """A new manager sees snapshot plus logged changes"""
+        job_id = self.storage.get_all_jobs()[1]["id"]
+        self.storage.update_job_score(job_id, {"overall_score": 42, "highlight": "white"})
+        self.storage.update_job_status("job_003", "Interview", notes="Phone screen")
+        self.storage.save_jobs([create_test_job(50)], source="glassdoor")
+        self.storage.delete_job(self.storage.get_all_jobs()[0]["id"])
+
+        reloaded = JobStorageManager(storage_dir=self.test_dir)
+        self.assertEqual(reloaded.get_all_jobs(), self.storage.get_all_jobs())
+        self.assertEqual(len(reloaded.get_all_jobs()), 5)
+
+    def test_compaction_folds_log_into_snapshot(self):
+        """Passing the size threshold rewrites jobs.json and empties the log"""
+        self.storage.wal_compact_bytes = 1
+        self.storage.update_job_status("job_001", "Applied")
+
+        self.assertEqual(os.path.getsize(self.storage.wal_file), 0)
+        self.assertEqual(self.storage.get_statistics()["wal"]["compactions"], 1)
+        with open(self.storage.jobs_file) as f:
+            data = json.load(f)
+        applied = [job for job in data["jobs"] if job.get("application_status") == "Applied"]
+        self.assertEqual(len(applied), 1)
+
+    def test_already_folded_records_are_skipped(self):
+        """Records at or below the snapshot's wal_seq are not applied twice"""
+        self.storage.save_jobs([create_test_job(60)], source="indeed")
+        with open(self.storage.wal_file) as f:
+            leftover = f.read()
+        self.storage.compact()
+
+        # Simulate a crash between writing the snapshot and truncating the log
+        with open(self.storage.wal_file, 'w') as f:
+            f.write(leftover)
+        reloaded = JobStorageManager(storage_dir=self.test_dir)
+        self.assertEqual(len(reloaded.get_all_jobs()), 6)
+
+    def test_torn_trailing_record_is_ignored(self):
+        """An incomplete last line from an interrupted append is skipped"""
+        self.storage.update_job_status("job_001", "Applied")
+        with open(self.storage.wal_file, 'a') as f:
+            f.write('{"op": "delete", "id": "')
+        reloaded = JobStorageManager(storage_dir=self.test_dir)
+        self.assertEqual(len(reloaded.get_all_jobs()), 5)
+        self.assertEqual(reloaded.get_jobs_by_status("Applied")[0]["job_id"], "job_001")
+
+    def test_failed_append_fails_batch_status_update(self):
+        """A batch status update whose log append fails reports the failure"""
+        def failing_append(records):
+            raise OSError("disk full")
+
+        self.storage.wal.append = failing_append
+        result = self.storage.batch_update_job_statuses([
+            {"job_id": "job_001", "status": "Applied"},
+            {"job_id": "job_002", "status": "Applied"},
+        ])
+        self.assertFalse(result["success"])
+        self.assertEqual(result["updated"], 0)
+
+        del self.storage.wal.append
+        self.assertEqual(self.storage.get_jobs_by_status("Applied"), [])
+
+    def test_append_after_torn_record_survives_reload(self):
+        """A record appended after a torn tail is not lost on the next load"""
+        with open(self.storage.wal_file, 'a') as f:
+            f.write('{"op": "delete", "id": "')
+        result = self.storage.save_jobs([create_test_job(70)], source="indeed")
+        self.assertEqual(result["added"], 1)
+
+        reloaded = JobStorageManager(storage_dir=self.test_dir)
+        self.assertEqual(len(reloaded.get_all_jobs()), 6)
+        with open(self.storage.wal_file) as f:
+            lines = f.read().splitlines()
+        self.assertTrue(all(json.loads(line) for line in lines))
+
+    def test_status_event_after_torn_record_survives_reload(self):
+        """The status event log drops a torn tail before appending too"""
+        self.storage.create_status_history("job_001")
+        with open(self.storage.status_events_file, 'a') as f:
+            f.write('{"op": "trans')
+        self.storage.update_job_status_with_history("job_001", "Applied", update_job_record=False)
+
+        reloaded = JobStorageManager(storage_dir=self.test_dir)
+        history = reloaded.get_job_status_history("job_001")
+        self.assertEqual(history["current_status"], "Applied")
+
+
+class TestDedupHashIndex(unittest.TestCase):
+    """Test the persisted duplicate-detection hash index"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.test_dir = tempfile.mkdtemp()
+        self.storage = JobStorageManager(storage_dir=self.test_dir)
+        self.storage.save_jobs([create_test_job(i) for i in range(5)], source="indeed")
+
+    def tearDown(self):
+        """Clean up test environment"""
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def test_index_reused_across_restarts(self):
+        """A fresh manager loads the sidecar instead of rehashing every job"""
+        self.storage.save_jobs([create_test_job(10)], source="indeed")
+        self.storage.delete_job(self.storage.get_all_jobs()[0]["id"])
+
+        reloaded = JobStorageManager(storage_dir=self.test_dir)
+        reloaded._generate_job_hash = self._counting_hash(reloaded)
+        result = reloaded.save_jobs([create_test_job(1), create_test_job(0), create_test_job(11)], source="indeed")
+
+        self.assertEqual(result["skipped"], 1)
+        self.assertEqual(result["added"], 2)
+        self.assertEqual(reloaded.get_statistics()["dedup_index"]["rebuilds"], 0)
+        # Only the incoming batch was hashed
+        self.assertEqual(self.hash_calls, 3)
+
+    def test_stale_index_is_rebuilt(self):
+        """An index that lags behind the job table is ignored and rewritten"""
+        other = JobStorageManager(storage_dir=self.test_dir)
+        other.delete_job(other.get_all_jobs()[0]["id"])  # hash set not loaded: index goes stale
+
+        reloaded = JobStorageManager(storage_dir=self.test_dir)
+        result = reloaded.save_jobs([create_test_job(0), create_test_job(1)], source="indeed")
+        self.assertEqual(result["added"], 1)
+        self.assertEqual(result["skipped"], 1)
+        self.assertEqual(reloaded.get_statistics()["dedup_index"]["rebuilds"], 1)
+
+    def test_index_survives_compaction(self):
+        """Compaction rewrites the index for the new snapshot"""
+        self.storage.save_jobs([create_test_job(20)], source="indeed")
+        self.storage.compact()
+
+        reloaded = JobStorageManager(storage_dir=self.test_dir)
+        result = reloaded.save_jobs([create_test_job(20)], source="indeed")
+        self.assertEqual(result["skipped"], 1)
+        self.assertEqual(reloaded.get_statistics()["dedup_index"]["rebuilds"], 0)
+
+    def test_index_rebuilt_when_snapshot_replaced(self):
+        """A jobs.json replaced outside the manager does not keep the old hashes"""
+        self.storage.compact()
+        with open(self.storage.jobs_file) as f:
+            data = json.load(f)
+        data["jobs"] = []
+        with open(self.storage.jobs_file, 'w') as f:
+            json.dump(data, f)
+
+        result = self.storage.save_jobs([create_test_job(0)], source="indeed")
+        self.assertEqual(result["added"], 1)
+        self.assertEqual(len(self.storage.get_all_jobs()), 1)
+        reloaded = JobStorageManager(storage_dir=self.test_dir)
+        self.assertEqual([job["job_id"] for job in reloaded.get_all_jobs()], ["job_000"])
+
+    def _counting_hash(self, storage):
+        """Wrap _generate_job_hash to count calls"""
+        self.hash_calls = 0
+        original = storage._generate_job_hash
+
+        def counting(job):
+            self.hash_calls += 1
+            return original(job)
+        return counting
+
+
+class TestJobPagination(unittest.TestCase):
+    """Test cursor-based paging with field projection"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.test_dir = tempfile.mkdtemp()
+        self.storage = JobStorageManager(storage_dir=self.test_dir)
+        self.storage.save_jobs([create_test_job(i) for i in range(7)], source="indeed")
+
+    def tearDown(self):
+        """Clean up test environment"""
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def _collect(self, storage, **kwargs):
+        """Follow next_cursor until the last page"""
+        jobs, cursor = [], None
+        while True:
+            page = storage.get_jobs_page(cursor=cursor, **kwargs)
+            jobs.extend(page["jobs"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                return jobs
+
+    def test_pages_cover_all_jobs(self):
+        """Walking the cursors yields every job once, in storage order"""
+        page = self.storage.get_jobs_page(limit=3)
+        self.assertEqual(page["count"], 3)
+        self.assertEqual(page["total"], 7)
+        self.assertIsNotNone(page["next_cursor"])
+
+        jobs = self._collect(self.storage, limit=3)
+        self.assertEqual(jobs, self.storage.get_all_jobs())
+        self.assertIsNone(self.storage.get_jobs_page(limit=7)["next_cursor"])
+
+    def test_projection_and_filters(self):
+        """Only requested fields (plus id) are returned; filters narrow the total"""
+        page = self.storage.get_jobs_page(limit=2, fields=["title"], filters={"location": "Austin, TX"})
+        self.assertEqual(page["total"], 3)
+        self.assertEqual(set(page["jobs"][0].keys()), {"id", "title"})
+        titles = [job["title"] for job in self._collect(self.storage, limit=2, fields=["title"],
+                                                        filters={"location": "Austin, TX"})]
+        self.assertEqual(titles, ["Software Engineer 1", "Software Engineer 3", "Software Engineer 5"])
+
+    def test_offset(self):
+        """Legacy offset paging still works without a cursor"""
+        page = self.storage.get_jobs_page(limit=2, offset=5)
+        self.assertEqual([job["job_id"] for job in page["jobs"]], ["job_005", "job_006"])
+        self.assertIsNone(page["next_cursor"])
+
+    def test_cursor_survives_writes(self):
+        """Deletes before the cursor and appends after it do not shift the page"""
+        first = self.storage.get_jobs_page(limit=3)
+        self.storage.delete_job(first["jobs"][0]["id"])
+        self.storage.save_jobs([create_test_job(20)], source="indeed")
+
+        rest = self._collect(self.storage, limit=3)
+        second = self.storage.get_jobs_page(limit=10, cursor=first["next_cursor"])
+        self.assertEqual([job["job_id"] for job in second["jobs"]],
+                         ["job_003", "job_004", "job_005", "job_006", "job_020"])
+        self.assertEqual(len(rest), 7)
+
+    def test_cursor_after_reload(self):
+        """A cursor from one manager resumes on another by the last job id"""
+        first = self.storage.get_jobs_page(limit=4)
+        other = JobStorageManager(storage_dir=self.test_dir)
+        page = other.get_jobs_page(limit=10, cursor=first["next_cursor"])
+        self.assertEqual(page["jobs"][0]["job_id"], "job_004")
+
+        other.delete_job(first["jobs"][-1]["id"])
+        third = JobStorageManager(storage_dir=self.test_dir)
+        with self.assertRaises(ValueError):
+            third.get_jobs_page(limit=10, cursor=first["next_cursor"])
+
+    def test_invalid_arguments(self):
+        """Malformed cursors and non-positive limits are rejected"""
+        with self.assertRaises(ValueError):
+            self.storage.get_jobs_page(cursor="not a cursor")
+        with self.assertRaises(ValueError):
+            self.storage.get_jobs_page(limit=0)
+
+
+class TestBinarySnapshots(unittest.TestCase):
+    """Test the binary snapshot format and the manager's binary mode"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.test_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Clean up test environment"""
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def test_round_trip_and_lazy_lookup(self):
+        """Records and metadata survive; single records load by key"""
+        jobs = [dict(create_test_job(i), id=f"id_{i}", description="Café ☕ " * i) for i in range(600)]
+        path = os.path.join(self.test_dir, "jobs.snap")
+        write_snapshot(path, {"jobs": jobs, "count": 600, "wal_seq": 7})
+
+        self.assertTrue(is_snapshot(path))
+        self.assertEqual(read_snapshot(path), {"jobs": jobs, "count": 600, "wal_seq": 7})
+        with SnapshotReader(path) as reader:
+            self.assertEqual(len(reader), 600)
+            self.assertEqual(reader.meta["wal_seq"], 7)
+            self.assertEqual(reader.get("id_517"), jobs[517])
+            self.assertIsNone(reader.get("missing"))
+            reader.get("id_517")["title"] = "changed"
+            self.assertEqual(reader.record(517)["title"], jobs[517]["title"])
+
+    def test_rejects_bad_files(self):
+        """Non-snapshot and truncated files raise SnapshotError"""
+        path = os.path.join(self.test_dir, "jobs.snap")
+        write_snapshot(path, {"jobs": [create_test_job(1)], "count": 1})
+        with open(path, "rb") as f:
+            data = f.read()
+        with open(path, "wb") as f:
+            f.write(data[:-4])
+        with self.assertRaises(SnapshotError):
+            SnapshotReader(path)
+        with open(path, "w") as f:
+            json.dump({"jobs": []}, f)
+        with self.assertRaises(SnapshotError):
+            SnapshotReader(path)
+
+    def test_json_converters(self):
+        """JSON and binary snapshots convert into each other"""
+        source = os.path.join(self.test_dir, "status_history.json")
+        data = {"event_seq": 3, "histories": [{"job_id": "job_001", "current_status": "Applied"}]}
+        with open(source, "w") as f:
+            json.dump(data, f)
+
+        binary = os.path.join(self.test_dir, "status_history.snap")
+        self.assertEqual(json_to_snapshot(source, binary), 1)
+        exported = os.path.join(self.test_dir, "export.json")
+        self.assertEqual(snapshot_to_json(binary, exported), 1)
+        with open(exported) as f:
+            self.assertEqual(json.load(f), data)
+
+    def test_manager_binary_mode(self):
+        """A binary-mode manager persists jobs and histories across restarts"""
+        storage = JobStorageManager(storage_dir=self.test_dir, snapshot_format="binary",
+                                    status_snapshot_events=1)
+        storage.save_jobs([create_test_job(i) for i in range(5)], source="indeed")
+        storage.update_job_status("job_002", "Applied")
+        storage.compact()
+        storage.update_job_status_with_history("job_002", "Applied", update_job_record=False)
+
+        self.assertTrue(is_snapshot(storage.jobs_file))
+        self.assertTrue(is_snapshot(storage.status_history_file))
+        self.assertFalse(os.path.exists(os.path.join(self.test_dir, "jobs.json")))
+
+        reloaded = JobStorageManager(storage_dir=self.test_dir, snapshot_format="binary")
+        self.assertEqual(len(reloaded.get_all_jobs()), 5)
+        self.assertEqual(len(reloaded.get_jobs_by_status("Applied")), 1)
+        self.assertEqual(reloaded.get_job_status_history("job_002")["current_status"], "Applied")
+
+    def test_existing_json_store_is_converted(self):
+        """Switching formats converts the existing snapshots on first start"""
+        storage = JobStorageManager(storage_dir=self.test_dir)
+        storage.save_jobs([create_test_job(i) for i in range(3)], source="indeed")
+        storage.compact()
+        storage.update_job_status("job_001", "Interview")
+
+        binary = JobStorageManager(storage_dir=self.test_dir, snapshot_format="binary")
+        self.assertEqual(len(binary.get_all_jobs()), 3)
+        self.assertEqual(binary.get_jobs_by_status("Interview")[0]["job_id"], "job_001")
+
+        with self.assertRaises(ValueError):
+            JobStorageManager(storage_dir=self.test_dir, snapshot_format="xml")
+
+
+class TestScoreIndex(unittest.TestCase):
+    """Test the sorted score and highlight index"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.test_dir = tempfile.mkdtemp()
+        self.storage = JobStorageManager(storage_dir=self.test_dir)
+        self.storage.save_jobs([create_test_job(i) for i in range(8)], source="indeed")
+        self.ids = [job["id"] for job in self.storage.get_all_jobs()]
+        self.storage.update_jobs_scores({
+            self.ids[0]: {"overall_score": 80, "highlight": "red"},
+            self.ids[2]: {"overall_score": 55, "highlight": "yellow"},
+            self.ids[3]: {"overall_score": 80, "highlight": "red"},
+            self.ids[5]: {"overall_score": 20, "highlight": "white"},
+            self.ids[6]: {"highlight": "white"},  # scored, but no overall_score
+        })
+
+    def tearDown(self):
+        """Clean up test environment"""
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def _scan(self, min_score=None, max_score=None):
+        """Reference implementation: full scan of all jobs"""
+        jobs = [job for job in self.storage.get_all_jobs() if 'score' in job]
+        if min_score is not None:
+            jobs = [job for job in jobs if job['score'].get('overall_score', 0) >= min_score]
+        if max_score is not None:
+            jobs = [job for job in jobs if job['score'].get('overall_score', 100) <= max_score]
+        return jobs
+
+    def test_range_matches_full_scan(self):
+        """Range queries return the same jobs, in the same order, as a scan"""
+        for bounds in [(None, None), (50, None), (None, 60), (20, 80), (0, 100), (81, None), (-5, 200)]:
+            self.assertEqual(self.storage.get_scored_jobs(*bounds), self._scan(*bounds), bounds)
+
+    def test_top_k(self):
+        """top_k returns the best scores first, ties in storage order"""
+        top = self.storage.get_scored_jobs(top_k=3)
+        self.assertEqual([job["id"] for job in top], [self.ids[0], self.ids[3], self.ids[2]])
+        top = self.storage.get_scored_jobs(max_score=60, top_k=5)
+        self.assertEqual([job["id"] for job in top], [self.ids[2], self.ids[5]])
+
+    def test_highlight_sets(self):
+        """Highlight lookups use the per-color sets"""
+        self.assertEqual([job["id"] for job in self.storage.get_jobs_by_highlight("red")],
+                         [self.ids[0], self.ids[3]])
+        self.assertEqual(len(self.storage.get_jobs_by_highlight("white")), 2)
+        self.assertEqual(self.storage.get_jobs_by_highlight("green"), [])
+
+    def test_index_follows_updates(self):
+        """Rescoring, deleting and adding jobs keep the index in sync"""
+        self.storage.update_job_score(self.ids[0], {"overall_score": 10, "highlight": "white"})
+        self.storage.delete_job(self.ids[3])
+        self.storage.save_jobs([create_test_job(30, score={"overall_score": 95, "highlight": "red"})],
+                               source="indeed")
+
+        self.assertEqual(self.storage.get_scored_jobs(top_k=1)[0]["job_id"], "job_030")
+        self.assertEqual([job["job_id"] for job in self.storage.get_jobs_by_highlight("red")], ["job_030"])
+        self.assertEqual(self.storage.get_scored_jobs(min_score=50), self._scan(50))
+
+    def test_external_updates_are_indexed(self):
+        """Score changes logged by another manager reach the index"""
+        self.storage.get_scored_jobs()  # build the index
+        other = JobStorageManager(storage_dir=self.test_dir)
+        other.update_job_score(self.ids[1], {"overall_score": 99, "highlight": "red"})
+        self.assertEqual(self.storage.get_scored_jobs(top_k=1)[0]["id"], self.ids[1])
+        self.assertEqual(len(self.storage.get_jobs_by_highlight("red")), 3)
+
+
+class TestConcurrentAccess(unittest.TestCase):
+    """Test reader-writer locking and per-job lock striping"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.test_dir = tempfile.mkdtemp()
+        self.storage = JobStorageManager(storage_dir=self.test_dir)
+        self.storage.save_jobs([create_test_job(i) for i in range(8)], source="indeed")
+
+    def tearDown(self):
+        """Clean up test environment"""
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def test_readers_share_lock(self):
+        """Two readers can hold the lock at the same time; a writer cannot"""
+        lock = ReadWriteLock()
+        both_inside = threading.Barrier(2, timeout=5)
+
+        def reader():
+            with lock.read_locked():
+                both_inside.wait()
+
+        threads = [threading.Thread(target=reader) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertFalse(both_inside.broken)
+
+        with lock.read_locked():
+            writer = threading.Thread(target=lambda: lock.acquire_write() or lock.release_write())
+            writer.start()
+            writer.join(0.2)
+            self.assertTrue(writer.is_alive())
+        writer.join(5)
+        self.assertFalse(writer.is_alive())
+        self.assertEqual(lock.stats()["write"]["contended"], 1)
+
+    def test_parallel_updates_are_not_lost(self):
+        """Concurrent single-job updates and reads keep every change"""
+        ids = [job["id"] for job in self.storage.get_all_jobs()]
+        rounds = 20
+
+        def status_worker(index):
+            for n in range(rounds):
+                self.storage.update_job_status(f"job_{index:03d}", "Applied", notes=f"note {n}")
+                self.storage.update_job_status("job_007", "Interview", notes=f"{index}-{n}")
+
+        def score_worker(index):
+            for n in range(rounds):
+                self.storage.update_job_score(ids[index], {"overall_score": n, "highlight": "white"})
+                self.storage.get_scored_jobs(min_score=0)
+                self.storage.get_all_jobs()
+
+        threads = [threading.Thread(target=status_worker, args=(i,)) for i in range(4)]
+        threads += [threading.Thread(target=score_worker, args=(i,)) for i in range(4, 7)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for storage in (self.storage, JobStorageManager(storage_dir=self.test_dir)):
+            jobs = {job["job_id"]: job for job in storage.get_all_jobs()}
+            for index in range(4):
+                self.assertEqual(len(jobs[f"job_{index:03d}"]["status_history"]), rounds)
+            self.assertEqual(len(jobs["job_007"]["status_history"]), 4 * rounds)
+            self.assertEqual(len(storage.get_scored_jobs(min_score=rounds - 1)), 3)
+
+    def test_readers_never_see_partial_updates(self):
+        """Reads during single-job updates return every job, each fully updated or not at all"""
+        ids = [job["id"] for job in self.storage.get_all_jobs()]
+        stop = threading.Event()
+        errors = []
+
+        def writer(index):
+            for n in range(100):
+                self.storage.update_job_status(f"job_{index:03d}", "Applied", notes=f"note {n}")
+                self.storage.update_job_score(ids[index], {"overall_score": n, "highlight": "white"})
+
+        def reader():
+            while not stop.is_set():
+                jobs = self.storage.get_all_jobs()
+                if len(jobs) != 8:
+                    errors.append(f"read {len(jobs)} jobs")
+                for job in jobs:
+                    history = job.get("status_history")
+                    if history and history[-1]["notes"] != job.get("application_notes"):
+                        errors.append(f"partial update of {job['job_id']}")
+                    if "score" in job and "scored_at" not in job:
+                        errors.append(f"score without scored_at on {job['job_id']}")
+
+        old_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            readers = [threading.Thread(target=reader) for _ in range(3)]
+            writers = [threading.Thread(target=writer, args=(i,)) for i in range(4)]
+            for thread in readers + writers:
+                thread.start()
+            for thread in writers:
+                thread.join()
+            stop.set()
+            for thread in readers:
+                thread.join()
+        finally:
+            sys.setswitchinterval(old_interval)
+
+        self.assertEqual(errors[:5], [])
+        for job in self.storage.get_all_jobs({"job_id": {"$in": ["job_000", "job_003"]}}):
+            self.assertEqual(len(job["status_history"]), 100)
+            self.assertEqual(job["score"]["overall_score"], 99)
+
+    def test_lock_metrics_reported(self):
+        """Statistics include lock wait times"""
+        self.storage.update_job_status("job_001", "Applied")
+        locks = self.storage.get_statistics()["locks"]
+        self.assertGreater(locks["read"]["acquisitions"], 0)
+        self.assertGreater(locks["job"]["acquisitions"], 0)
+        self.assertIn("max_wait_ms", locks["write"])
+
+
+class TestGroupCommit(unittest.TestCase):
+    """Test grouping of concurrent single-job log appends"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.test_dir = tempfile.mkdtemp()
+        self.storage = JobStorageManager(storage_dir=self.test_dir, group_commit_window=0.01)
+        self.storage.save_jobs([create_test_job(i) for i in range(16)], source="indeed")
+        self.ids = {job["job_id"]: job["id"] for job in self.storage.get_all_jobs()}
+
+    def tearDown(self):
+        """Clean up test environment"""
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def run_writers(self, body, count=16):
+        """Run body(index) on `count` threads started together"""
+        start = threading.Barrier(count, timeout=5)
+        results = [None] * count
+
+        def writer(index):
+            start.wait()
+            results[index] = body(index)
+
+        threads = [threading.Thread(target=writer, args=(index,)) for index in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_concurrent_updates_share_appends(self):
+        """Concurrent updates are written in fewer appends and none is lost"""
+        append = self.storage.wal.append
+
+        def slow_append(records):
+            # Stand-in for a slow fsync: later updates queue up meanwhile
+            time.sleep(0.02)
+            return append(records)
+
+        self.storage.wal.append = slow_append
+
+        def body(index):
+            job_id = f"job_{index:03d}"
+            ok = self.storage.update_job_score(self.ids[job_id], {"overall_score": index, "highlight": "white"})
+            return ok and self.storage.update_job_status(job_id, "Applied", notes=str(index))["success"]
+
+        self.assertTrue(all(self.run_writers(body)))
+        group = self.storage.get_lock_statistics()["group_commit"]
+        self.assertEqual(group["records"], 32)
+        self.assertLess(group["commits"], 32)
+        self.assertGreater(group["largest_batch"], 1)
+
+        reloaded = JobStorageManager(storage_dir=self.test_dir)
+        for index in range(16):
+            job = reloaded.get_job_by_id(self.ids[f"job_{index:03d}"])
+            self.assertEqual(job["score"]["overall_score"], index)
+            self.assertEqual(job["application_notes"], str(index))
+
+    def test_failed_append_fails_whole_batch(self):
+        """Every caller in a batch whose append failed is told so"""
+        def failing_append(records):
+            raise OSError("disk full")
+
+        self.storage.wal.append = failing_append
+        results = self.run_writers(
+            lambda index: self.storage.update_job_score(self.ids[f"job_{index:03d}"], {"overall_score": 1}),
+            count=8
+        )
+        self.assertEqual(results, [False] * 8)
+        results = self.run_writers(
+            lambda index: self.storage.update_job_status(f"job_{index:03d}", "Applied")["success"],
+            count=8
+        )
+        self.assertEqual(results, [False] * 8)
+
+        del self.storage.wal.append
+        self.assertEqual(self.storage.get_jobs_by_status("Applied"), [])
+        self.assertTrue(self.storage.update_job_score(self.ids["job_001"], {"overall_score": 2}))
+
+
+class TestMultiProcessAccess(unittest.TestCase):
+    """Test several worker processes sharing one storage directory"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.test_dir = tempfile.mkdtemp()
+        self.storage = JobStorageManager(storage_dir=self.test_dir)
+        self.storage.save_jobs([create_test_job(i) for i in range(8)], source="indeed")
+
+    def tearDown(self):
+        """Clean up test environment"""
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def test_no_lost_updates(self):
+        """Status updates from several processes are all kept"""
+        workers, rounds = 4, 25
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("fork" if "fork" in methods else "spawn")
+        processes = [
+            context.Process(target=status_worker, args=(self.test_dir, worker, rounds))
+            for worker in range(workers)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(120)
+            self.assertEqual(process.exitcode, 0)
+
+        # The manager created before the workers ran must see their writes
+        for storage in (self.storage, JobStorageManager(storage_dir=self.test_dir)):
+            jobs = {job["job_id"]: job for job in storage.get_all_jobs()}
+            for worker in range(workers):
+                self.assertEqual(len(jobs[f"job_{worker:03d}"]["status_history"]), rounds)
+            self.assertEqual(len(jobs["job_007"]["status_history"]), workers * rounds)
+            self.assertEqual(len(storage.get_all_status_histories()), workers * 5)
+
+    @unittest.skipUnless("fork" in multiprocessing.get_all_start_methods(), "requires fork")
+    def test_manager_shared_across_fork(self):
+        """A manager created before fork() still excludes its forked copy"""
+        storage = get_storage_manager(self.test_dir)
+        try:
+            storage.get_all_jobs()
+            child = multiprocessing.get_context("fork").Process(
+                target=shared_manager_worker, args=(storage, 30))
+            child.start()
+            for n in range(30):
+                storage.update_job_status("job_003", "Applied", notes=f"parent {n}")
+            child.join(60)
+            self.assertEqual(child.exitcode, 0)
+            job = storage.get_all_jobs({"job_id": "job_003"})[0]
+            self.assertEqual(len(job["status_history"]), 60)
+        finally:
+            clear_storage_managers()
+
+    def test_version_stamp_detects_foreign_writes(self):
+        """A write by another manager changes the shared version"""
+        self.storage.get_all_jobs()
+        self.assertTrue(self.storage._table_is_current())
+        other = JobStorageManager(storage_dir=self.test_dir)
+        other.update_job_status("job_001", "Applied")
+        self.assertFalse(self.storage._table_is_current())
+        self.assertEqual(self.storage.get_jobs_by_status("Applied")[0]["job_id"], "job_001")
+
+
+class TestStorageManagerRegistry(unittest.TestCase):
+    """Test the process-wide manager registry"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.test_dir = tempfile.mkdtemp()
+        clear_storage_managers()
+
+    def tearDown(self):
+        """Clean up test environment"""
+        clear_storage_managers()
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def test_one_manager_per_directory(self):
+        """The same directory (however spelled) maps to one warm manager"""
+        storage = get_storage_manager(self.test_dir)
+        relative = os.path.relpath(self.test_dir)
+        self.assertIs(get_storage_manager(relative), storage)
+        self.assertIsNot(get_storage_manager(os.path.join(self.test_dir, "other")), storage)
+
+        storage.save_jobs([create_test_job(1)], source="indeed")
+        misses = storage.get_statistics()["cache"]["misses"]
+        get_storage_manager(self.test_dir).get_all_jobs()
+        self.assertEqual(storage.get_statistics()["cache"]["misses"], misses)
+
+    def test_concurrent_first_use(self):
+        """Threads racing on first use all get the same instance"""
+        managers = []
+        threads = [
+            threading.Thread(target=lambda: managers.append(get_storage_manager(self.test_dir)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len({id(manager) for manager in managers}), 1)
+
+
+class TestStatusEventLog(unittest.TestCase):
+    """Test append-only persistence of status histories"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.test_dir = tempfile.mkdtemp()
+        self.storage = JobStorageManager(storage_dir=self.test_dir, status_snapshot_events=20)
+
+    def tearDown(self):
+        """Clean up test environment"""
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def test_transitions_append_without_snapshot(self):
+        """Transitions go to the event log and leave the snapshot alone"""
+        snapshot = os.path.getmtime(self.storage.status_history_file), os.path.getsize(self.storage.status_history_file)
+        self.storage.update_job_status_with_history("job_001", "Applied", update_job_record=False)
+        self.storage.update_job_status_with_history("job_001", "Interview", update_job_record=False)
+
+        self.assertEqual(
+            (os.path.getmtime(self.storage.status_history_file), os.path.getsize(self.storage.status_history_file)),
+            snapshot
+        )
+        events, _ = self.storage.status_events.read()
+        self.assertEqual([event["op"] for event in events], ["create", "transition", "transition"])
+        self.assertEqual([event["seq"] for event in events], [1, 2, 3])
+
+    def test_replay_on_load(self):
+        """A new manager rebuilds the histories from snapshot plus events"""
+        self.storage.update_job_status_with_history("job_001", "Applied", notes="sent", update_job_record=False)
+        self.storage.update_job_status_with_history("job_001", "Interview", update_job_record=False)
+        self.storage.create_status_history("job_002")
+
+        reloaded = JobStorageManager(storage_dir=self.test_dir)
+        history = reloaded.get_job_status_history("job_001")
+        self.assertEqual(history["current_status"], "Interview")
+        self.assertEqual(history["total_transitions"], 2)
+        self.assertIsNotNone(reloaded.get_job_status_history("job_002"))
+
+    def test_snapshot_folds_events(self):
+        """Enough events trigger a snapshot and truncate the log"""
+        for n in range(10):
+            self.storage.update_job_status_with_history(f"job_{n:03d}", "Applied", update_job_record=False)
+
+        stats = self.storage.get_statistics()["status_events"]
+        self.assertEqual(stats["snapshots"], 1)
+        self.assertEqual(stats["size_bytes"], 0)
+        with open(self.storage.status_history_file) as f:
+            data = json.load(f)
+        self.assertEqual(data["event_seq"], 20)
+        self.assertEqual(data["total_jobs"], 10)
+
+        reloaded = JobStorageManager(storage_dir=self.test_dir)
+        self.assertEqual(len(reloaded.get_all_status_histories()), 10)
+
+    def test_events_already_in_snapshot_are_skipped(self):
+        """Events left behind by a crash after the snapshot are not applied twice"""
+        self.storage.update_job_status_with_history("job_001", "Applied", update_job_record=False)
+        events, _ = self.storage.status_events.read()
+        with self.storage._status_lock, self.storage._status_file_lock.exclusive():
+            self.storage._save_status_histories()
+        self.storage.status_events.append(events)
+
+        reloaded = JobStorageManager(storage_dir=self.test_dir)
+        self.assertEqual(reloaded.get_job_status_history("job_001")["total_transitions"], 1)
+
+    def test_other_manager_sees_appended_events(self):
+        """A second manager on the same directory replays new events incrementally"""
+        other = JobStorageManager(storage_dir=self.test_dir)
+        self.storage.update_job_status_with_history("job_001", "Applied", update_job_record=False)
+        self.assertEqual(other.get_job_status_history("job_001")["current_status"], "Applied")
+
+        self.storage.update_job_status_with_history("job_001", "Interview", update_job_record=False)
+        other.update_job_status_with_history("job_001", "Offer", update_job_record=False)
+        self.assertEqual(self.storage.get_job_status_history("job_001")["total_transitions"], 3)
+        events, _ = self.storage.status_events.read()
+        self.assertEqual(len({event["seq"] for event in events}), len(events))
+
+
+class TestLazyStatusHistories(unittest.TestCase):
+    """Test on-demand materialization of status histories"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.test_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Clean up test environment"""
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def populate(self, **options):
+        """Track 20 jobs (half of them applied) and write a snapshot"""
+        storage = JobStorageManager(storage_dir=self.test_dir, status_snapshot_events=1, **options)
+        storage.save_jobs([create_test_job(i) for i in range(20)], source="indeed")
+        for n in range(20):
+            storage.create_status_history(f"job_{n:03d}")
+        for n in range(10):
+            storage.update_job_status_with_history(f"job_{n:03d}", "Applied", update_job_record=False)
+        return storage
+
+    def check_lazy(self, **options):
+        """Aggregates run from summaries; single lookups materialize one history"""
+        self.populate(**options)
+        storage = JobStorageManager(storage_dir=self.test_dir, **options)
+        histories = storage.status_manager.histories
+        self.assertEqual(len(histories), 20)
+        self.assertEqual(histories.materialized, 0)
+
+        stats = storage.get_enhanced_status_summary()["history_stats"]
+        self.assertEqual(stats["status_counts"], {"Applied": 10, "Pending": 10})
+        self.assertEqual(stats["average_transitions"], 0.5)
+        self.assertIsInstance(storage.get_jobs_pending_action(days_threshold=0), list)
+        self.assertEqual(len(storage.status_manager.get_jobs_by_status(ApplicationStatus.APPLIED)), 10)
+        self.assertEqual(histories.materialized, 0)
+
+        self.assertEqual(storage.get_status_timeline("job_003")[0]["to_status"], "Applied")
+        self.assertEqual(histories.materialized, 1)
+
+        storage.update_job_status_with_history("job_015", "Interview", update_job_record=False)
+        self.assertEqual(storage.status_manager.get_statistics()["status_counts"],
+                         {"Applied": 10, "Pending": 9, "Interview": 1})
+
+    def test_lazy_json_snapshot(self):
+        """JSON snapshots are indexed without building StatusHistory objects"""
+        self.check_lazy()
+
+    def test_lazy_binary_snapshot(self):
+        """Binary snapshots are read per history on demand"""
+        self.check_lazy(snapshot_format="binary")
+
+    def test_missing_summaries_are_recomputed(self):
+        """Snapshots without (or with stale) summaries still load correctly"""
+        storage = self.populate()
+        with open(storage.status_history_file) as f:
+            data = json.load(f)
+        self.assertEqual(len(data["summaries"]), 20)
+        del data["summaries"]
+        with open(storage.status_history_file, "w") as f:
+            json.dump(data, f)
+
+        reloaded = JobStorageManager(storage_dir=self.test_dir)
+        self.assertEqual(reloaded.status_manager.get_statistics()["status_counts"], {"Applied": 10, "Pending": 10})
+        self.assertEqual(reloaded.status_manager.histories.materialized, 0)
+
+
+class TestMetadataBuffer(unittest.TestCase):
+    """Test buffered scrape counters and error log"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.test_dir = tempfile.mkdtemp()
+        self.storage = JobStorageManager(storage_dir=self.test_dir, metadata_durability="shutdown")
+
+    def tearDown(self):
+        """Clean up test environment"""
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def read_file(self, path):
+        """Load a JSON file from the storage directory"""
+        with open(path) as f:
+            return json.load(f)
+
+    def test_counters_served_from_memory(self):
+        """save_jobs counts are visible at once but only written on flush"""
+        self.storage.save_jobs([create_test_job(1)], source="indeed")
+        self.storage.save_jobs([create_test_job(2)], source="indeed")
+
+        self.assertEqual(self.storage.get_statistics()["metadata"]["successful_scrapes"], 2)
+        self.assertEqual(self.read_file(self.storage.metadata_file)["total_scrapes"], 0)
+
+        self.assertTrue(self.storage.flush_metadata())
+        self.assertEqual(self.read_file(self.storage.metadata_file)["total_scrapes"], 2)
+        self.assertEqual(self.storage.get_statistics()["metadata_buffer"]["pending_scrapes"], 0)
+
+    def test_error_ring_buffer(self):
+        """Only the last 100 errors are kept, in memory and on disk"""
+        for n in range(105):
+            self.storage._log_error("save_jobs", f"error {n}")
+
+        recent = self.storage.get_recent_errors(3)
+        self.assertEqual([e["error"] for e in recent], ["error 102", "error 103", "error 104"])
+        self.assertEqual(self.storage.get_statistics()["error_count"], 100)
+
+        self.storage.flush_metadata()
+        errors = self.read_file(self.storage.errors_file)["errors"]
+        self.assertEqual(len(errors), 100)
+        self.assertEqual(errors[0]["error"], "error 5")
+
+    def test_flush_merges_other_managers(self):
+        """Flushes add to what other managers already wrote"""
+        other = JobStorageManager(storage_dir=self.test_dir, metadata_durability="shutdown")
+        self.storage._update_metadata(success=True)
+        other._update_metadata(success=False)
+        other._log_error("save_jobs", "boom")
+        other.flush_metadata()
+        self.storage.flush_metadata()
+
+        metadata = self.read_file(self.storage.metadata_file)
+        self.assertEqual((metadata["total_scrapes"], metadata["successful_scrapes"], metadata["failed_scrapes"]), (2, 1, 1))
+        self.assertEqual(self.storage.get_statistics()["metadata"]["total_scrapes"], 2)
+        self.assertEqual(self.storage.get_recent_errors()[0]["error"], "boom")
+
+    def test_durability_modes(self):
+        """sync writes through; interval flushes in the background"""
+        sync = JobStorageManager(storage_dir=self.test_dir, metadata_durability="sync")
+        sync._update_metadata(success=True)
+        self.assertEqual(self.read_file(self.storage.metadata_file)["total_scrapes"], 1)
+
+        timed = JobStorageManager(storage_dir=self.test_dir, metadata_durability="interval",
+                                  metadata_flush_interval=0.05)
+        timed._update_metadata(success=True)
+        for _ in range(100):
+            if self.read_file(self.storage.metadata_file)["total_scrapes"] == 2:
+                break
+            time.sleep(0.02)
+        self.assertEqual(self.read_file(self.storage.metadata_file)["total_scrapes"], 2)
+
+        with self.assertRaises(ValueError):
+            JobStorageManager(storage_dir=self.test_dir, metadata_durability="never")
+
+
+class TestStatusAggregates(unittest.TestCase):
+    """Test the running aggregates behind the status summaries"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.test_dir = tempfile.mkdtemp()
+        self.storage = JobStorageManager(storage_dir=self.test_dir)
+        self.storage.save_jobs([create_test_job(i) for i in range(15)], source="indeed")
+
+    def tearDown(self):
+        """Clean up test environment"""
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def _scan(self, storage):
+        """Reference implementation: count over all jobs"""
+        jobs = storage.get_all_jobs()
+        counts = {}
+        applied = []
+        for job in jobs:
+            if job.get("application_status"):
+                counts[job["application_status"]] = counts.get(job["application_status"], 0) + 1
+            if job.get("applied_date"):
+                applied.append((job["job_id"], job["applied_date"]))
+        applied.sort(key=lambda entry: entry[1], reverse=True)
+        return len(jobs), counts, applied[:10]
+
+    def assertMatchesScan(self, storage):
+        summary = storage.get_status_summary()
+        total, counts, recent = self._scan(storage)
+        self.assertEqual(summary["total_jobs"], total)
+        self.assertEqual(summary["status_counts"], counts)
+        self.assertEqual(summary["jobs_with_status"], sum(counts.values()))
+        self.assertEqual(summary["jobs_without_status"], total - sum(counts.values()))
+        self.assertEqual([(job["job_id"], job["applied_date"]) for job in summary["recent_applications"]], recent)
+
+    def test_summary_follows_updates(self):
+        """Single, batch and deleted updates are reflected in the summary"""
+        self.assertMatchesScan(self.storage)
+        for n in range(12):
+            self.storage.update_job_status(f"job_{n:03d}", "Applied", applied_date=f"2025-11-{n % 5 + 1:02d}")
+        self.assertMatchesScan(self.storage)
+
+        self.storage.batch_update_job_statuses([
+            {"job_id": "job_001", "status": "Interview"},
+            {"job_id": "job_013", "status": "Rejected", "applied_date": "2025-12-01"},
+        ])
+        self.storage.delete_job(self.storage.get_all_jobs()[4]["id"])
+        self.storage.save_jobs([create_test_job(20, application_status="Offer", applied_date="2025-10-01")])
+        self.assertMatchesScan(self.storage)
+
+        # Changes made by another manager arrive through the mutation log
+        other = JobStorageManager(storage_dir=self.test_dir)
+        self.assertMatchesScan(other)
+        other.update_job_status("job_002", "Offer", applied_date="2026-01-15")
+        self.assertMatchesScan(self.storage)
+        self.assertEqual(self.storage.get_status_summary()["recent_applications"][0]["job_id"], "job_002")
+
+    def test_history_statistics(self):
+        """Manager statistics match a full pass over the summaries"""
+        manager = ApplicationStatusManager()
+        for n in range(30):
+            manager.create_history(f"job_{n}")
+            if n % 3:
+                manager.update_status(f"job_{n}", ApplicationStatus.APPLIED)
+            if n % 5 == 0:
+                manager.update_status(f"job_{n}", ApplicationStatus.REJECTED)
+        stats = manager.get_statistics()
+        summaries = [summary for _, summary in manager.iter_summaries()]
+        self.assertEqual(stats["total_jobs"], 30)
+        self.assertEqual(sum(stats["status_counts"].values()), 30)
+        self.assertEqual(stats["average_transitions"], round(sum(s[1] for s in summaries) / 30, 2))
+
+        manager.update_status("job_1", ApplicationStatus.INTERVIEW)
+        self.assertEqual(manager.get_statistics()["status_counts"]["Interview"], 1)
+
+        # Replacing the histories rebuilds the aggregates
+        manager.histories = {}
+        self.assertEqual(manager.get_statistics()["total_jobs"], 0)
+
+    def test_pending_action_queue(self):
+        """Stale histories come out longest-waiting first, and only those"""
+        now = datetime.now()
+        self.storage.create_status_history("job_000")
+        histories = self.storage.status_manager
+        ids = {job["job_id"]: job["id"] for job in self.storage.get_all_jobs()}
+        for n, days in enumerate((2, 10, 40, 9)):
+            started = (now - timedelta(days=days, hours=1)).isoformat()
+            histories.apply_event({"op": "create", "history": {
+                "job_id": ids[f"job_{n:03d}"], "current_status": "Applied",
+                "created_at": started, "updated_at": started,
+                "transitions": [{"from_status": "Pending", "to_status": "Applied", "timestamp": started}]
+            }})
+
+        stale = self.storage.get_jobs_pending_action(days_threshold=9)
+        self.assertEqual([job["days_in_status"] for job in stale], [40, 10, 9])
+        self.assertEqual(stale[0]["title"], "Software Engineer 2")
+        self.assertEqual(len(self.storage.get_jobs_pending_action(days_threshold=41)), 0)
+
+        histories.update_status(ids["job_002"], ApplicationStatus.INTERVIEW)
+        self.assertEqual([job["days_in_status"] for job in self.storage.get_jobs_pending_action(9)], [10, 9])
+
+    def test_total_days(self):
+        """Whole-day sums equal per-history day counts, at any time of day"""
+        now = time.time()
+        aggregates = HistoryAggregates()
+        starts = [now - offset for offset in (0, 3600, 86399, 86400, 86401, 5 * 86400 + 7, 40 * 86400 - 1)]
+        for n, since in enumerate(starts):
+            aggregates.set(f"job_{n}", ("Applied", 1, since, ""))
+        for later in (0, 1, 43200, 86399, 10 * 86400 + 5):
+            expected = sum(int((now + later - since) // 86400) for since in starts)
+            self.assertEqual(aggregates.total_days(now + later), expected)
+
+        aggregates.discard("job_6")
+        aggregates.set("job_0", ("Offer", 2, now - 2 * 86400, ""))
+        stats = aggregates.statistics(now)
+        self.assertEqual(stats["status_counts"], {"Applied": 5, "Offer": 1})
+        self.assertEqual(stats["total_jobs"], 6)
+
+
+class TestNdjsonTransfer(unittest.TestCase):
+    """Test streaming NDJSON export and batched import"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.test_dir = tempfile.mkdtemp()
+        self.storage = JobStorageManager(storage_dir=self.test_dir)
+        self.storage.save_jobs([create_test_job(i) for i in range(25)], source="indeed")
+
+    def tearDown(self):
+        """Clean up test environment"""
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def test_iter_jobs_batches(self):
+        """Jobs come out in storage order, across writes between batches"""
+        iterator = self.storage.iter_jobs(batch_size=10)
+        first = [next(iterator) for _ in range(10)]
+        all_jobs = self.storage.get_all_jobs()
+        self.storage.delete_job(all_jobs[3]["id"])
+        self.storage.delete_job(all_jobs[12]["id"])
+        self.storage.save_jobs([create_test_job(30)], source="indeed")
+        rest = list(iterator)
+
+        self.assertEqual([job["job_id"] for job in first], [f"job_{n:03d}" for n in range(10)])
+        self.assertNotIn("job_012", [job["job_id"] for job in rest])
+        self.assertEqual(rest[-1]["job_id"], "job_030")
+        self.assertEqual(len(rest), 15)
+
+        filtered = list(self.storage.iter_jobs({"location": "Austin, TX"}, batch_size=3))
+        self.assertEqual(len(filtered), len(self.storage.get_all_jobs({"location": "Austin, TX"})))
+
+    def test_export_files(self):
+        """JSON and NDJSON exports contain every (filtered) job"""
+        json_path = os.path.join(self.test_dir, "export.json")
+        ndjson_path = os.path.join(self.test_dir, "export.ndjson")
+        self.assertTrue(self.storage.export_to_json(json_path, {"location": "New York, NY"}))
+        self.assertTrue(self.storage.export_to_ndjson(ndjson_path))
+
+        with open(json_path) as f:
+            exported = json.load(f)
+        self.assertEqual(exported["total_jobs"], 13)
+        self.assertEqual(exported["jobs"], self.storage.get_all_jobs({"location": "New York, NY"}))
+        self.assertEqual(exported["filters"], {"location": "New York, NY"})
+
+        with open(ndjson_path) as f:
+            self.assertEqual([json.loads(line) for line in f], self.storage.get_all_jobs())
+
+        empty = os.path.join(self.test_dir, "empty.json")
+        self.assertTrue(self.storage.export_to_json(empty, {"location": "Nowhere"}))
+        with open(empty) as f:
+            self.assertEqual(json.load(f)["jobs"], [])
+
+    def test_import_batches(self):
+        """Import saves in fixed-size batches and reports bad lines"""
+        ndjson_path = os.path.join(self.test_dir, "export.ndjson")
+        self.storage.export_to_ndjson(ndjson_path)
+        with open(ndjson_path, "a") as f:
+            f.write("\n{not json\n[1, 2]\n")
+            f.write(json.dumps(create_test_job(99, title="")) + "\n")
+
+        target = JobStorageManager(storage_dir=os.path.join(self.test_dir, "copy"))
+        with open(ndjson_path, "rb") as f:
+            result = target.import_ndjson(f, batch_size=10)
+
+        self.assertTrue(result["success"])
+        self.assertEqual((result["added"], result["invalid"], result["malformed"]), (25, 1, 2))
+        self.assertEqual(result["batches"], 3)
+        self.assertEqual([error["line"] for error in result["errors"]], [27, 28])
+        self.assertEqual(len(target.get_all_jobs()), 25)
+
+        # Importing the same file again only finds duplicates
+        with open(ndjson_path, "rb") as f:
+            again = target.import_ndjson(f, source="backup", batch_size=100)
+        self.assertEqual((again["added"], again["skipped"]), (0, 25))
+
+
+class TestJobFilters(unittest.TestCase):
+    """Test compiled filter expressions and index-backed filtering"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.test_dir = tempfile.mkdtemp()
+        self.storage = JobStorageManager(storage_dir=self.test_dir)
+        self.storage.save_jobs([create_test_job(i) for i in range(20)], source="indeed")
+        self.jobs = self.storage.get_all_jobs()
+        for n, job in enumerate(self.jobs[:12]):
+            self.storage.update_job_score(job["id"], {"overall_score": n * 10,
+                                                      "highlight": "red" if n >= 8 else "white"})
+        self.storage.update_job_status("job_004", "Applied", applied_date="2025-11-02")
+        self.storage.update_job_status("job_005", "Interview")
+
+    def tearDown(self):
+        """Clean up test environment"""
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def scan(self, predicate):
+        """job_ids selected by a plain Python predicate"""
+        return [job["job_id"] for job in self.storage.get_all_jobs() if predicate(job)]
+
+    def test_operators(self):
+        """in, range, prefix, exists and nested fields select the right jobs"""
+        cases = [
+            ({"job_id": {"$in": ["job_001", "job_019", "job_404"]}},
+             lambda job: job["job_id"] in ("job_001", "job_019")),
+            ({"score.overall_score": {"$gte": 30, "$lt": 70}},
+             lambda job: "score" in job and 30 <= job["score"]["overall_score"] < 70),
+            ({"score.overall_score": 50}, lambda job: job.get("score", {}).get("overall_score") == 50),
+            ({"score.highlight": {"$in": ["red"]}, "location": "Austin, TX"},
+             lambda job: job.get("score", {}).get("highlight") == "red" and job["location"] == "Austin, TX"),
+            ({"title": {"$prefix": "Software Engineer 1"}}, lambda job: job["title"].startswith("Software Engineer 1")),
+            ({"applied_date": {"$exists": True}}, lambda job: "applied_date" in job),
+            ({"score": {"$exists": False}}, lambda job: "score" not in job),
+            ({"application_status": {"$in": ["Applied", "Interview"]}},
+             lambda job: job.get("application_status") in ("Applied", "Interview")),
+            ({"id": self.jobs[7]["id"], "job_id": "job_007"}, lambda job: job["job_id"] == "job_007"),
+        ]
+        for filters, predicate in cases:
+            with self.subTest(filters=filters):
+                expected = self.scan(predicate)
+                self.assertTrue(expected)
+                self.assertEqual([job["job_id"] for job in self.storage.get_all_jobs(filters)], expected)
+
+        self.assertEqual(self.storage.get_all_jobs({"score.overall_score": {"$gt": "50"}}), [])
+
+    def test_indexes_follow_updates(self):
+        """Index-backed filters see score and status changes"""
+        job = self.jobs[15]
+        self.storage.update_job_score(job["id"], {"overall_score": 95, "highlight": "red"})
+        self.storage.update_job_status("job_004", "Offer")
+
+        self.assertIn("job_015", [j["job_id"] for j in self.storage.get_all_jobs({"score.overall_score": {"$gt": 90}})])
+        self.assertEqual(self.storage.get_all_jobs({"application_status": "Applied"}), [])
+        self.assertEqual([j["job_id"] for j in self.storage.get_jobs_by_status("Offer")], ["job_004"])
+
+    def test_pages_and_invalid_filters(self):
+        """Paged listings accept operators; malformed filters are rejected"""
+        filters = {"score.overall_score": {"$gte": 20}}
+        first = self.storage.get_jobs_page(limit=4, filters=filters)
+        second = self.storage.get_jobs_page(limit=4, cursor=first["next_cursor"], filters=filters)
+        self.assertEqual(first["total"], 10)
+        self.assertEqual([job["job_id"] for job in first["jobs"] + second["jobs"]],
+                         [f"job_{n:03d}" for n in range(2, 10)])
+
+        for filters in ({"title": {"$regex": "x"}}, {"title": {"$prefix": 3}}, {"job_id": {"$in": "job_001"}}):
+            with self.subTest(filters=filters):
+                with self.assertRaises(ValueError):
+                    self.storage.get_jobs_page(filters=filters)
+                self.assertEqual(self.storage.get_all_jobs(filters), [])
+
+    def test_query_string_filters(self):
+        """field[op]=value query arguments become filter operators"""
+        filters = parse_query_filters({"source": "indeed", "score.overall_score[gte]": "70",
+                                       "job_id[in]": "job_008,job_009", "applied_date[exists]": "false",
+                                       "limit": "5"}, plain_fields=("source", "location"))
+        self.assertEqual(filters, {"source": "indeed", "score.overall_score": {"$gte": 70},
+                                   "job_id": {"$in": ["job_008", "job_009"]},
+                                   "applied_date": {"$exists": False}})
+        self.assertEqual([job["job_id"] for job in self.storage.get_all_jobs(filters)], ["job_008", "job_009"])
+        with self.assertRaises(ValueError):
+            parse_query_filters({"title[like]": "x"})
+
+    def test_query_string_numeric_operands(self):
+        """eq and in operands that look like numbers match numeric fields"""
+        filters = parse_query_filters({"score.overall_score[eq]": "50"})
+        self.assertEqual(filters, {"score.overall_score": {"$in": ["50", 50]}})
+        self.assertEqual([job["job_id"] for job in self.storage.get_all_jobs(filters)], ["job_005"])
+
+        filters = parse_query_filters({"score.overall_score[in]": "80,90.0", "score.highlight[in]": "red"})
+        self.assertEqual(filters, {"score.overall_score": {"$in": ["80", 80, "90.0", 90.0]},
+                                   "score.highlight": {"$in": ["red"]}})
+        self.assertEqual([job["job_id"] for job in self.storage.get_all_jobs(filters)], ["job_008", "job_009"])
+
+    def test_query_string_digit_strings(self):
+        """eq and in operands made of digits still match string fields holding them"""
+        self.storage.save_jobs([create_test_job(30, job_id="123", location="10001")], source="indeed")
+        for args in ({"job_id[eq]": "123"}, {"job_id[in]": "123,456"}, {"location[in]": "10001"},
+                     {"job_id[eq]": "123", "job_id[in]": "123,job_001"}):
+            with self.subTest(args=args):
+                jobs = self.storage.get_all_jobs(parse_query_filters(args))
+                self.assertEqual([job["title"] for job in jobs], ["Software Engineer 30"])
+        self.assertEqual(self.storage.get_all_jobs(parse_query_filters({"job_id[eq]": "123", "job_id[in]": "456"})), [])
+
+
+class TestJobSearch(unittest.TestCase):
+    """Test BM25 full-text search over stored jobs"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.test_dir = tempfile.mkdtemp()
+        self.storage = JobStorageManager(storage_dir=self.test_dir)
+        self.storage.save_jobs([
+            create_test_job(0, title="Senior Python Developer", description="Django services"),
+            create_test_job(1, title="Data Analyst", description="SQL, Python and dashboards"),
+            create_test_job(2, title="Frontend Engineer", description="React and TypeScript"),
+            create_test_job(3, title="C++ Engineer", company="Python Labs", description="Embedded systems"),
+        ] + [create_test_job(i, description="Go and Kubernetes") for i in range(4, 12)], source="indeed")
+
+    def tearDown(self):
+        """Clean up test environment"""
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def search_ids(self, query, **kwargs):
+        """job_ids returned by a search, best first"""
+        return [job["job_id"] for job in self.storage.search_jobs(query, **kwargs)["jobs"]]
+
+    def test_ranking(self):
+        """Title matches outrank company matches, which outrank description matches"""
+        result = self.storage.search_jobs("python")
+        self.assertEqual(result["total"], 3)
+        self.assertEqual([job["job_id"] for job in result["jobs"]], ["job_000", "job_003", "job_001"])
+        scores = [job["search_score"] for job in result["jobs"]]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+        self.assertEqual(self.search_ids("c++"), ["job_003"])
+        self.assertEqual(self.search_ids("the and"), [])
+        self.assertEqual(self.storage.search_jobs("cobol")["total"], 0)
+
+    def test_index_follows_writes(self):
+        """Saved and deleted jobs are reflected without a rebuild"""
+        self.assertEqual(self.search_ids("rust"), [])
+        self.storage.save_jobs([create_test_job(20, title="Rust Engineer", description="Systems")], source="indeed")
+        self.assertEqual(self.search_ids("rust"), ["job_020"])
+
+        job = self.storage.get_all_jobs({"job_id": "job_000"})[0]
+        self.storage.delete_job(job["id"])
+        self.assertEqual(self.search_ids("python"), ["job_003", "job_001"])
+
+        other = JobStorageManager(storage_dir=self.test_dir)
+        other.save_jobs([create_test_job(21, title="Python Intern", description="Scripting")], source="linkedin")
+        self.assertEqual(self.search_ids("python"), ["job_021", "job_003", "job_001"])
+
+    def test_pagination_fields_and_filters(self):
+        """Pages, projections and filters combine with ranking"""
+        ranked = self.search_ids("kubernetes engineer", limit=50)
+        self.assertEqual(len(ranked), 10)
+        first = self.search_ids("kubernetes engineer", limit=4)
+        second = self.search_ids("kubernetes engineer", limit=4, offset=4)
+        self.assertEqual(first + second, ranked[:8])
+
+        result = self.storage.search_jobs("python", fields=["title"], filters={"location": "Austin, TX"})
+        self.assertEqual(result["total"], 2)
+        self.assertEqual(set(result["jobs"][0]), {"id", "title", "search_score"})
+        self.assertEqual(self.search_ids("python", filters={"title": {"$prefix": "Data"}}), ["job_001"])
+
+        for kwargs in ({"limit": 0}, {"offset": -1}, {"filters": {"title": {"$like": "x"}}}):
+            with self.subTest(kwargs=kwargs):
+                with self.assertRaises(ValueError):
+                    self.storage.search_jobs("python", **kwargs)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,13 @@ import StatusBadge from './StatusBadge';
 import StatusUpdateModal from './StatusUpdateModal';
 import './JobDashboard.css';
 
+// Jobs requested per page and the fields the dashboard renders
+const PAGE_SIZE = 500;
+const DASHBOARD_FIELDS = [
+  'job_id', 'title', 'company', 'location', 'link', 'url', 'description',
+  'job_type', 'salary', 'score', 'highlight', 'status', 'resume_tips', 'scraped_at'
+];
+
 const JobDashboard = ({ userId = 'default_user' }) => {
   const [jobs, setJobs] = useState([]);
   const [filteredJobs, setFilteredJobs] = useState([]);
@@ -51,16 +58,27 @@ const JobDashboard = ({ userId = 'default_user' }) => {
       setLoading(true);
       setError(null);
       
-      // Fetch jobs from backend
-      const response = await fetch(`http://localhost:5000/api/jobs/stored/${userId}`);
-      
-      if (!response.ok) {
-        throw new Error(`Failed to fetch jobs: ${response.statusText}`);
-      }
+      // Fetch jobs from backend page by page, requesting only the fields the dashboard renders
+      const allJobs = [];
+      let cursor = null;
+      do {
+        const params = new URLSearchParams({ limit: PAGE_SIZE, fields: DASHBOARD_FIELDS.join(',') });
+        if (cursor) {
+          params.set('cursor', cursor);
+        }
+        const response = await fetch(`http://localhost:5000/api/jobs/stored/${userId}?${params}`);
+        
+        if (!response.ok) {
+          throw new Error(`Failed to fetch jobs: ${response.statusText}`);
+        }
+        
+        const data = await response.json();
+        allJobs.push(...(data.jobs || []));
+        cursor = data.next_cursor;
+      } while (cursor);
       
-      const data = await response.json();
-      setJobs(data.jobs || []);
-      calculateStats(data.jobs || []);
+      setJobs(allJobs);
+      calculateStats(allJobs);
     } catch (err) {
       setError(err.message);
       console.error('Error fetching jobs:', err);